@@ -29,7 +29,6 @@ from collections import namedtuple
 # external packages
 import PyQt5
 from skyfield.api import Angle
-from astropy.io import fits
 from astropy.wcs import WCS
 import astropy.wcs
 import numpy as np
@@ -38,8 +37,15 @@ import numpy as np
 from mw4.base.loggerMW import CustomLogger
 from mw4.base import tpool
 from mw4.base import transform
+from mw4.base import fitsAccess
 from mw4.astrometry.astrometryNET import AstrometryNET
 from mw4.astrometry.astrometryASTAP import AstrometryASTAP
+from mw4.base.metrics import registry
+
+solveTime = registry.histogram('mw4_solve_seconds',
+                               'duration of plate solving',
+                               ['framework', 'success'],
+                               buckets=(1, 2, 5, 10, 15, 20, 30, 45, 60, 90, 120, 180))
 
 
 class AstrometrySignals(PyQt5.QtCore.QObject):
@@ -96,6 +102,7 @@ class Astrometry:
 
         self.signals = AstrometrySignals()
         self.mutexSolve = PyQt5.QtCore.QMutex()
+        self.solveStart = None
 
         self.solverEnviron = {}
         self.setSolverEnviron()
@@ -208,17 +215,16 @@ class Astrometry:
         :return: raHint, decHint, scaleHint
         """
 
-        with fits.open(fitsPath) as fitsHDU:
-            fitsHeader = fitsHDU[0].header
+        fitsHeader = fitsAccess.readHeader(fitsPath)
 
-            # todo: there might be the necessity to read more alternative header info
-            # todo: the actual definition is OK for EKOS
+        # todo: there might be the necessity to read more alternative header info
+        # todo: the actual definition is OK for EKOS
 
-            scaleHint = float(fitsHeader.get('SCALE', 0))
-            ra = fitsHeader.get('RA', 0)
-            dec = fitsHeader.get('DEC', 0)
-            raHint = transform.convertToAngle(ra, isHours=True)
-            decHint = transform.convertToAngle(dec, isHours=False)
+        scaleHint = float(fitsHeader.get('SCALE', 0))
+        ra = fitsHeader.get('RA', 0)
+        dec = fitsHeader.get('DEC', 0)
+        raHint = transform.convertToAngle(ra, isHours=True)
+        decHint = transform.convertToAngle(dec, isHours=False)
 
         self.log.info(f'RA: {raHint} ({ra}), DEC: {decHint} ({dec}), Scale: {scaleHint}')
 
@@ -324,11 +330,50 @@ class Astrometry:
 
         return solve, fitsHeader
 
+    def solutionFromFits(self, fitsPath='', wcsHeader=None, updateFits=False):
+        """
+        solutionFromFits reads the header of the solved image, calculates the solution
+        from the wcs header and writes the updated header back to the image, if
+        updateFits is set. it is used by all solver implementations.
+
+        :param fitsPath: full path to fits file
+        :param wcsHeader:
+        :param updateFits:
+        :return: solve
+        """
+
+        fitsHeader = fitsAccess.readHeader(fitsPath)
+        solve, header = self.getSolutionFromWCS(fitsHeader=fitsHeader,
+                                                wcsHeader=wcsHeader,
+                                                updateFits=updateFits)
+        if updateFits:
+            fitsAccess.writeHeader(fitsPath, header)
+
+        return solve
+
+    @staticmethod
+    def checkCancelled(token=None, result=None):
+        """
+        checkCancelled is called by the solver implementations between their steps. if
+        the solve was cancelled through the executor, the message is set in the result
+        and the solve is left with TaskCancelled.
+
+        :param token: cancel token of the executor or None
+        :param result: result dict of the solver
+        :return: nothing
+        """
+
+        if token is None or not token.cancelled:
+            return
+
+        result['message'] = 'solve aborted'
+        token.check()
+
     def solveClear(self):
         """
         the cyclic or long lasting tasks for solving the image should not run
         twice for the same data at the same time. so there is a mutex to prevent this
-        behaviour.
+        behaviour. the duration of the solve is added to the metrics.
 
         :return: true for test purpose
         """
@@ -339,6 +384,12 @@ class Astrometry:
         solverEnviron = self.solverEnviron[self.framework]
         solver = solverEnviron['solver']
 
+        if self.solveStart is not None:
+            solveTime.observe(time.perf_counter() - self.solveStart,
+                              framework=self.framework,
+                              success=bool(solver.result.get('success')))
+            self.solveStart = None
+
         self.mutexSolve.unlock()
         self.signals.done.emit(solver.result)
         self.signals.message.emit('')
@@ -348,10 +399,11 @@ class Astrometry:
     def solveThreading(self, fitsPath='', raHint=None, decHint=None, scaleHint=None,
                        radius=2, timeout=30, updateFits=False):
         """
-        solveThreading is the wrapper for doing the solve process in a threadpool
-        environment of Qt. Otherwise the HMI would be stuck all the time during solving.
+        solveThreading is the wrapper for doing the solve process in the compute lane of
+        the executor. Otherwise the HMI would be stuck all the time during solving.
         it is done with an securing mutex to avoid starting solving twice. to solveClear
-        is the partner of solve Threading
+        is the partner of solve Threading. the worker gets a cancel token, so abort could
+        stop a queued solve or a solve between its steps.
 
         :param fitsPath: full path to the fits image file to be solved
         :param raHint:  ra dest to look for solve in J2000
@@ -378,6 +430,8 @@ class Astrometry:
             return False
 
         self.signals.message.emit('solving')
+        self.solveStart = time.perf_counter()
+        token = tpool.CancelToken()
         worker = tpool.Worker(solver.solve,
                               solver=solverEnviron,
                               fitsPath=fitsPath,
@@ -387,21 +441,30 @@ class Astrometry:
                               radius=radius,
                               timeout=timeout,
                               updateFits=updateFits,
+                              token=token,
                               )
         worker.signals.finished.connect(self.solveClear)
-        self.threadPool.start(worker)
+        suc = self.app.executor.start(worker, lane='compute', key='solve')
+        if not suc:
+            self.solveStart = None
+            self.mutexSolve.unlock()
+            self.signals.done.emit(solver.result)
+            return False
 
         return True
 
     def abort(self):
         """
+        abort cancels a queued or running solve in the executor and kills the running
+        solver process.
 
-        :return:
+        :return: success
         """
 
         if self.framework not in self.solverEnviron:
             return False
 
+        self.app.executor.cancel('solve')
         solverEnviron = self.solverEnviron[self.framework]
         solver = solverEnviron['solver']
         suc = solver.abort()
@@ -58,7 +58,8 @@ class AstrometryASTAP(object):
         self.data = parent.data
         self.tempDir = parent.tempDir
         self.readFitsData = parent.readFitsData
-        self.getSolutionFromWCS = parent.getSolutionFromWCS
+        self.solutionFromFits = parent.solutionFromFits
+        self.checkCancelled = parent.checkCancelled
 
         self.result = {'success': False}
         self.process = None
@@ -137,7 +138,7 @@ class AstrometryASTAP(object):
         return wcsHeader
 
     def solve(self, solver={}, fitsPath='', raHint=None, decHint=None, scaleHint=None,
-              radius=2, timeout=30, updateFits=False):
+              radius=2, timeout=30, updateFits=False, token=None):
         """
         Solve uses the astap solver capabilities. The intention is to use an
         offline solving capability, so we need a installed instance. As we go multi
@@ -153,6 +154,7 @@ class AstrometryASTAP(object):
         :param radius:  search radius around target coordinates
         :param timeout: time after the subprocess will be killed.
         :param updateFits:  if true update Fits image file with wcsHeader data
+        :param token: cancel token of the executor
 
         :return: success
         """
@@ -193,6 +195,8 @@ class AstrometryASTAP(object):
                    '0',
                    ]
 
+        self.checkCancelled(token=token, result=self.result)
+
         suc = self.runASTAP(binPath=binPathASTAP,
                             fitsPath=fitsPath,
                             tempFile=tempFile,
@@ -212,11 +216,9 @@ class AstrometryASTAP(object):
         with open(wcsPath) as wcsTextFile:
             wcsHeader = self.getWCSHeader(wcsTextFile=wcsTextFile)
 
-        with fits.open(fitsPath, mode='update') as fitsHDU:
-            solve, header = self.getSolutionFromWCS(fitsHeader=fitsHDU[0].header,
-                                                    wcsHeader=wcsHeader,
-                                                    updateFits=updateFits)
-            fitsHDU[0].header = header
+        solve = self.solutionFromFits(fitsPath=fitsPath,
+                                      wcsHeader=wcsHeader,
+                                      updateFits=updateFits)
 
         self.result = {
             'success': True,
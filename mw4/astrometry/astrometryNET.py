@@ -58,7 +58,8 @@ class AstrometryNET(object):
         self.data = parent.data
         self.tempDir = parent.tempDir
         self.readFitsData = parent.readFitsData
-        self.getSolutionFromWCS = parent.getSolutionFromWCS
+        self.solutionFromFits = parent.solutionFromFits
+        self.checkCancelled = parent.checkCancelled
 
         self.result = {'success': False}
         self.process = None
@@ -179,7 +180,7 @@ class AstrometryNET(object):
         return wcsHeader
 
     def solve(self, solver={}, fitsPath='', raHint=None, decHint=None, scaleHint=None,
-              radius=2, timeout=30, updateFits=False):
+              radius=2, timeout=30, updateFits=False, token=None):
         """
         Solve uses the astrometry.net solver capabilities. The intention is to use an
         offline solving capability, so we need a installed instance. As we go multi
@@ -203,6 +204,7 @@ class AstrometryNET(object):
         :param radius:  search radius around target coordinates
         :param timeout: time after the subprocess will be killed.
         :param updateFits:  if true update Fits image file with wcsHeader data
+        :param token: cancel token of the executor
 
         :return: success
         """
@@ -255,6 +257,8 @@ class AstrometryNET(object):
             self.result['message'] = 'image2xy failed'
             return False
 
+        self.checkCancelled(token=token, result=self.result)
+
         raFITS, decFITS, scaleFITS, _, _ = self.readFitsData(fitsPath=fitsPath)
 
         # if parameters are passed, they have priority
@@ -312,11 +316,9 @@ class AstrometryNET(object):
         with fits.open(wcsPath) as wcsHDU:
             wcsHeader = self.getWCSHeader(wcsHDU=wcsHDU)
 
-        with fits.open(fitsPath, mode='update') as fitsHDU:
-            solve, header = self.getSolutionFromWCS(fitsHeader=fitsHDU[0].header,
-                                                    wcsHeader=wcsHeader,
-                                                    updateFits=updateFits)
-            fitsHDU[0].header = header
+        solve = self.solutionFromFits(fitsPath=fitsPath,
+                                      wcsHeader=wcsHeader,
+                                      updateFits=updateFits)
 
         self.result = {
             'success': True,
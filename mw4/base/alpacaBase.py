@@ -22,11 +22,21 @@ import logging
 from dateutil.parser import parser
 import datetime
 import uuid
+import time
 # external packages
 import PyQt5.QtCore
 import requests
 # local imports
 from mw4.base.loggerMW import CustomLogger
+from mw4.base.traceRecorder import recorder
+from mw4.base.metrics import registry
+
+requestTime = registry.histogram('mw4_alpaca_request_seconds',
+                                 'duration of alpaca http requests',
+                                 ['device', 'kind'])
+requestErrors = registry.counter('mw4_alpaca_request_errors_total',
+                                 'failed alpaca http requests',
+                                 ['device'])
 
 
 class AlpacaSignals(PyQt5.QtCore.QObject):
@@ -131,6 +141,33 @@ class AlpacaBase(object):
     def protocol(self, value):
         self._protocol = value
 
+    def traceRequest(self, attr, kind, timeStart, response=None, status=0):
+        """
+        traceRequest adds the request to the trace recorder and the metrics. for a
+        response the status is the http status code, failed requests have negative
+        status and write the trace for later analysis.
+
+        :param attr: attr of the request
+        :param kind: get or put
+        :param timeStart: perf counter at the start of the request
+        :param response: response of the request or None
+        :param status: status of a failed request
+        :return: true for test purpose
+        """
+
+        latency = time.perf_counter() - timeStart
+        requestTime.observe(latency, device=self.name, kind=kind)
+        if response is not None:
+            recorder.record(self.name, attr, kind=kind, latency=latency,
+                            size=len(getattr(response, 'content', None) or b''),
+                            status=response.status_code)
+        else:
+            recorder.record(self.name, attr, kind=kind, latency=latency, status=status)
+            requestErrors.inc(device=self.name)
+            recorder.dumpOnError(reason=f'{self.name} {attr} failed')
+
+        return True
+
     def get(self, attr: str, **data):
         """
         Send an HTTP GET request to an Alpaca server and check response for errors.
@@ -145,22 +182,27 @@ class AlpacaBase(object):
         uid = uuid.uuid4().int % 2**32
         data['ClientTransactionID'] = uid
 
-        self.log.debug(f'[{uid:10d}] {self.baseUrl}, attr:[{attr}]')
+        self.log.debug('[%10d] %s, attr:[%s]', uid, self.baseUrl, attr)
 
+        timeStart = time.perf_counter()
         try:
             response = requests.get(f'{self.baseUrl}/{attr}', data=data, timeout=5)
         except requests.exceptions.Timeout:
             self.log.critical(f'[{uid:10d}] timeout')
+            self.traceRequest(attr, 'get', timeStart, status=-1)
             return None
         except requests.exceptions.ConnectionError:
             self.log.critical(f'[{uid:10d}] connection error')
+            self.traceRequest(attr, 'get', timeStart, status=-2)
             return None
         except Exception as e:
             self.log.critical(f'[{uid:10d}] error in request: {e}')
             return None
 
+        self.traceRequest(attr, 'get', timeStart, response=response)
+
         if response.status_code == 400 or response.status_code == 500:
-            self.log.info(f'{response.text}')
+            self.log.info('[%10d] %.500s', uid, response.text)
             return None
 
         response = response.json()
@@ -170,7 +212,7 @@ class AlpacaBase(object):
                            f',{response["ErrorMessage"]}')
             return None
 
-        self.log.debug(f'[{uid:10d}] response:{response}')
+        self.log.debug('[%10d] response:%.500s', uid, response)
         return response['Value']
 
     def put(self, attr: str, **data):
@@ -187,22 +229,27 @@ class AlpacaBase(object):
         uid = uuid.uuid4().int % 2**32
         data['ClientTransactionID'] = uid
 
-        self.log.debug(f'[{uid:08d}] {self.baseUrl}, attr:[{attr}]')
+        self.log.debug('[%10d] %s, attr:[%s]', uid, self.baseUrl, attr)
 
+        timeStart = time.perf_counter()
         try:
             response = requests.put(f'{self.baseUrl}/{attr}', data=data, timeout=5)
         except requests.exceptions.Timeout:
             self.log.critical(f'[{uid:10d}] timeout')
+            self.traceRequest(attr, 'put', timeStart, status=-1)
             return None
         except requests.exceptions.ConnectionError:
             self.log.critical(f'[{uid:10d}] connection error')
+            self.traceRequest(attr, 'put', timeStart, status=-2)
             return None
         except Exception as e:
             self.log.critical(f'[{uid:10d}] Error in request: {e}')
             return None
 
+        self.traceRequest(attr, 'put', timeStart, response=response)
+
         if response.status_code == 400 or response.status_code == 500:
-            self.log.info(f'[{uid:10d}] {response.text}')
+            self.log.info('[%10d] %.500s', uid, response.text)
             return None
 
         response = response.json()
@@ -211,7 +258,7 @@ class AlpacaBase(object):
             self.log.error(f'err:{response["ErrorNumber"]},{response["ErrorMessage"]}')
             return None
 
-        self.log.debug(f'[{uid:10d}] response:{response}')
+        self.log.debug('[%10d] response:%.500s', uid, response)
 
         return response
 
@@ -28,6 +28,11 @@ import requests
 from mw4.base.loggerMW import CustomLogger
 from mw4.base.tpool import Worker
 from mw4.base.alpacaBase import AlpacaBase
+from mw4.base.metrics import registry
+
+pollTime = registry.histogram('mw4_device_poll_seconds',
+                              'duration of polling device data',
+                              ['framework', 'device'])
 
 
 class AlpacaClass(object):
@@ -197,8 +202,21 @@ class AlpacaClass(object):
     def workerPollData(self):
         pass
 
+    def workerPollDataTimed(self):
+        """
+        workerPollDataTimed runs workerPollData of the device and adds the duration to
+        the metrics
+
+        :return: result of workerPollData
+        """
+
+        with pollTime.time(framework='alpaca', device=self.name):
+            return self.workerPollData()
+
     def pollData(self):
         """
+        pollData starts the polling of the device data in the control lane of the
+        executor. if the last poll of the device is still running, no new one is started.
 
         :return: success
         """
@@ -206,34 +224,36 @@ class AlpacaClass(object):
         if not self.deviceConnected:
             return False
 
-        worker = Worker(self.workerPollData)
+        worker = Worker(self.workerPollDataTimed)
         worker.signals.result.connect(self.emitData)
-        self.threadPool.start(worker)
-        return True
+        suc = self.app.executor.start(worker, lane='control', key=f'{self.name}:pollData')
+        return suc
 
     def startPollStatus(self):
         """
-        startPollStatus starts a thread every 1 second for polling.
+        startPollStatus starts a thread every 1 second for polling in the control lane
+        of the executor.
 
         :return: success
         """
         worker = Worker(self.pollStatus)
-        self.threadPool.start(worker)
+        suc = self.app.executor.start(worker, lane='control', key=f'{self.name}:pollStatus')
 
-        return True
+        return suc
 
     def startCommunication(self):
         """
-        startCommunication starts cycling of the polling.
+        startCommunication starts cycling of the polling. the initial configuration is
+        read in the control lane of the executor.
 
         :return: True for connecting to server
         """
 
         worker = Worker(self.getInitialConfig)
         worker.signals.finished.connect(self.startTimer)
-        self.threadPool.start(worker)
+        suc = self.app.executor.start(worker, lane='control', key=f'{self.name}:connect')
 
-        return True
+        return suc
 
     def stopCommunication(self):
         """
@@ -250,6 +270,6 @@ class AlpacaClass(object):
         self.app.message.emit(f'Alpaca device remove:[{self.name}]', 0)
 
         worker = Worker(self.client.connected, Connected=False)
-        self.threadPool.start(worker)
+        self.app.executor.start(worker, lane='control', key=f'{self.name}:disconnect')
 
         return True
@@ -0,0 +1,88 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+# external packages
+from astropy.io import fits
+# local import
+
+__all__ = [
+    'readHeader',
+    'readImage',
+    'writeHeader',
+]
+
+
+def readHeader(fitsPath, hdu=0):
+    """
+    readHeader reads only the header of the given hdu. the pixel data is never read,
+    so this could be used for all operations, which only need the meta data (renaming,
+    solver hints, indexing).
+
+    :param fitsPath: path to fits file
+    :param hdu: number of the hdu
+    :return: header
+    """
+
+    with fits.open(fitsPath, mode='readonly', memmap=True, lazy_load_hdus=True) as fitsHDU:
+        header = fitsHDU[hdu].header.copy()
+
+    return header
+
+
+def readImage(fitsPath, hdu=0):
+    """
+    readImage opens the fits file read only and memory mapped. the returned data stays
+    mapped after closing the file, so only the pages, which are accessed, are read from
+    disk. scaled data (e.g. 16 bit unsigned with BZERO) could not be memory mapped by
+    astropy, so in this case the file is read in normally.
+
+    :param fitsPath: path to fits file
+    :param hdu: number of the hdu
+    :return: data, header
+    """
+
+    try:
+        with fits.open(fitsPath, mode='readonly', memmap=True) as fitsHDU:
+            data = fitsHDU[hdu].data
+            header = fitsHDU[hdu].header.copy()
+    except ValueError:
+        with fits.open(fitsPath, mode='readonly', memmap=False) as fitsHDU:
+            data = fitsHDU[hdu].data
+            header = fitsHDU[hdu].header.copy()
+
+    return data, header
+
+
+def writeHeader(fitsPath, header, hdu=0):
+    """
+    writeHeader replaces the header of the given hdu. the data is not loaded. as long as
+    the new header fits into the existing header blocks, only the header is written,
+    otherwise astropy moves the data in the file.
+
+    :param fitsPath: path to fits file
+    :param header: new header
+    :param hdu: number of the hdu
+    :return: true for test purpose
+    """
+
+    with fits.open(fitsPath, mode='update', memmap=True) as fitsHDU:
+        fitsHDU[hdu].header = header
+
+    return True
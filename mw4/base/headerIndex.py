@@ -0,0 +1,542 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import logging
+import os
+import sqlite3
+from pathlib import Path
+from threading import Lock
+# external packages
+import PyQt5.QtCore
+import numpy as np
+# local imports
+from mw4.base.loggerMW import CustomLogger
+from mw4.base.tpool import Worker
+from mw4.base import fitsAccess
+from mw4.base import transform
+
+__all__ = ['HeaderIndex',
+           ]
+
+
+class HeaderIndex(PyQt5.QtCore.QObject):
+    """
+    The class HeaderIndex keeps an index of the fits headers of all images in the
+    watched directories in a small sqlite database. the index is updated incrementally:
+    only files with changed size or modification time are read again and only their
+    header is read. directories are watched with a file system watcher, changes are
+    collected for a short time and then processed in a thread.
+
+    queries for date, object, filter, solve status and position run on the database
+    without touching any image file.
+
+        >>> index = HeaderIndex(app=app, dbPath=dbPath)
+        >>> index.watchDir(pathDir)
+        >>> frames = index.query(solved=True, ra=83.8, dec=-5.4, radius=2)
+    """
+
+    __all__ = ['HeaderIndex',
+               'updateFile',
+               'removeFile',
+               'updateDir',
+               'watchDir',
+               'updateSolved',
+               'query',
+               ]
+
+    logger = logging.getLogger(__name__)
+    log = CustomLogger(logger, {})
+
+    # column name, fits keyword, type
+    COLUMNS = [('dateObs', 'DATE-OBS', 'TEXT'),
+               ('object', 'OBJECT', 'TEXT'),
+               ('filter', 'FILTER', 'TEXT'),
+               ('expTime', 'EXPTIME', 'REAL'),
+               ('ccdTemp', 'CCD-TEMP', 'REAL'),
+               ('scale', 'SCALE', 'REAL'),
+               ('angle', 'ANGLE', 'REAL'),
+               ]
+    SEARCH = '**/*.fit*'
+    # waiting time for collecting file changes in ms
+    DELAY_UPDATE = 1000
+
+    updated = PyQt5.QtCore.pyqtSignal()
+
+    def __init__(self, app=None, dbPath=':memory:'):
+        super().__init__()
+        self.app = app
+        self.lock = Lock()
+        self.watcher = None
+        self.changedDirs = set()
+        self.changedTrees = set()
+
+        self.db = sqlite3.connect(dbPath, check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.createTables()
+
+        self.timerUpdate = PyQt5.QtCore.QTimer()
+        self.timerUpdate.setSingleShot(True)
+        self.timerUpdate.timeout.connect(self.processChanges)
+
+    def createTables(self):
+        """
+        createTables sets up the table and the indices if they are not present
+
+        :return: true for test purpose
+        """
+
+        columns = ', '.join(f'{name} {kind}' for name, _, kind in self.COLUMNS)
+        with self.lock, self.db:
+            self.db.execute('CREATE TABLE IF NOT EXISTS frames ('
+                            'path TEXT PRIMARY KEY, dir TEXT, mtime REAL, size INTEGER, '
+                            f'{columns}, ra REAL, dec REAL, solved INTEGER, '
+                            'raSolved REAL, decSolved REAL)')
+            self.db.execute('CREATE INDEX IF NOT EXISTS idxDir ON frames (dir)')
+            self.db.execute('CREATE INDEX IF NOT EXISTS idxDate ON frames (dateObs)')
+            self.db.execute('CREATE INDEX IF NOT EXISTS idxDec ON frames (dec)')
+        return True
+
+    @staticmethod
+    def convertCoordinates(header):
+        """
+        convertCoordinates reads the mount coordinates and the coordinates of a solve
+        (wcs reference point) from the header in degrees.
+
+        :param header: fits header
+        :return: ra, dec, solved, raSolved, decSolved
+        """
+
+        ra = transform.convertToAngle(header.get('RA'), isHours=True) \
+            if 'RA' in header else None
+        dec = transform.convertToAngle(header.get('DEC'), isHours=False) \
+            if 'DEC' in header else None
+        ra = ra.degrees if ra is not None else None
+        dec = dec.degrees if dec is not None else None
+
+        solved = 'CRVAL1' in header and 'CRVAL2' in header
+        raSolved = float(header['CRVAL1']) if solved else None
+        decSolved = float(header['CRVAL2']) if solved else None
+        return ra, dec, int(solved), raSolved, decSolved
+
+    @staticmethod
+    def subDirPattern(pathDir):
+        """
+        subDirPattern builds the pattern for a LIKE condition, which matches all sub
+        directories of the directory. the wildcards of LIKE and the escape character
+        itself could be part of a directory name, so they are escaped. the condition has
+        to be used with ESCAPE '\\'.
+
+        :param pathDir: directory
+        :return: pattern
+        """
+
+        pattern = os.path.join(pathDir, '')
+        for char in ('\\', '%', '_'):
+            pattern = pattern.replace(char, '\\' + char)
+        return pattern + '%'
+
+    def buildRow(self, path, stat, header):
+        """
+        buildRow collects all values of a database row from the header
+
+        :param path: file path
+        :param stat: os stat result of the file
+        :param header: fits header
+        :return: tuple of values
+        """
+
+        values = [path, os.path.dirname(path), stat.st_mtime, stat.st_size]
+        for _, key, kind in self.COLUMNS:
+            value = header.get(key)
+            if value is not None and kind == 'REAL':
+                try:
+                    value = float(value)
+                except (ValueError, TypeError):
+                    value = None
+            elif value is not None:
+                value = str(value).strip()
+            values.append(value)
+
+        try:
+            values.extend(self.convertCoordinates(header))
+        except Exception as e:
+            self.log.warning(f'Coordinates in [{path}] not readable: {e}')
+            values.extend([None, None, 0, None, None])
+        return tuple(values)
+
+    def isCurrent(self, path, stat):
+        """
+        isCurrent checks if the index entry of the file is up to date
+
+        :param path: file path
+        :param stat: os stat result of the file
+        :return: status
+        """
+
+        with self.lock:
+            row = self.db.execute('SELECT mtime, size FROM frames WHERE path = ?',
+                                  (path, )).fetchone()
+        if row is None:
+            return False
+        return row['mtime'] == stat.st_mtime and row['size'] == stat.st_size
+
+    def updateFile(self, path):
+        """
+        updateFile reads the header of the file and stores it in the index, if the file
+        is new or changed since the last update.
+
+        :param path: file path
+        :return: true if the index was changed
+        """
+
+        path = os.path.abspath(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return self.removeFile(path)
+
+        if self.isCurrent(path, stat):
+            return False
+
+        try:
+            header = fitsAccess.readHeader(path)
+        except Exception as e:
+            self.log.warning(f'Cannot read header of [{path}]: {e}')
+            return False
+
+        row = self.buildRow(path, stat, header)
+        marks = ', '.join('?' * len(row))
+        with self.lock, self.db:
+            self.db.execute(f'INSERT OR REPLACE INTO frames VALUES ({marks})', row)
+        return True
+
+    def removeFile(self, path):
+        """
+        removeFile deletes the entry of the file from the index
+
+        :param path: file path
+        :return: true if an entry was removed
+        """
+
+        path = os.path.abspath(path)
+        with self.lock, self.db:
+            cursor = self.db.execute('DELETE FROM frames WHERE path = ?', (path, ))
+        return cursor.rowcount > 0
+
+    def updateDir(self, pathDir, recursive=True):
+        """
+        updateDir synchronizes the index with the files in the directory: new and
+        changed files are read, entries of deleted files are removed.
+
+        :param pathDir: directory
+        :param recursive: include sub directories
+        :return: number of changed entries
+        """
+
+        pathDir = os.path.abspath(pathDir)
+        search = self.SEARCH if recursive else '*.fit*'
+        files = {str(x) for x in Path(pathDir).glob(search) if x.is_file()}
+
+        with self.lock:
+            if recursive:
+                rows = self.db.execute('SELECT path FROM frames WHERE dir = ? '
+                                       "OR dir LIKE ? ESCAPE '\\'",
+                                       (pathDir, self.subDirPattern(pathDir)))
+            else:
+                rows = self.db.execute('SELECT path FROM frames WHERE dir = ?',
+                                       (pathDir, ))
+            indexed = {row['path'] for row in rows.fetchall()}
+
+        number = 0
+        for path in indexed - files:
+            number += self.removeFile(path)
+        for path in sorted(files):
+            number += self.updateFile(path)
+
+        return number
+
+    def watchDir(self, pathDir):
+        """
+        watchDir adds the directory and its sub directories to the file system watcher
+        and starts a first synchronisation in a thread.
+
+        :param pathDir: directory
+        :return: success
+        """
+
+        if not os.path.isdir(pathDir):
+            return False
+
+        if self.watcher is None:
+            self.watcher = PyQt5.QtCore.QFileSystemWatcher()
+            self.watcher.directoryChanged.connect(self.dirChanged)
+
+        self.addTree(pathDir)
+        self.changedDirs.add(os.path.abspath(pathDir))
+        self.timerUpdate.start(self.DELAY_UPDATE)
+        return True
+
+    def addTree(self, pathDir):
+        """
+        addTree adds the directory and all its sub directories to the watcher
+
+        :param pathDir: directory
+        :return: true for test purpose
+        """
+
+        dirs = [pathDir] + [str(x) for x in Path(pathDir).glob('**/') if x.is_dir()]
+        self.watcher.addPaths(sorted({os.path.abspath(x) for x in dirs}))
+        return True
+
+    def newSubDirs(self, pathDir):
+        """
+        newSubDirs returns the sub directories of a changed directory, which are not
+        watched yet, e.g. the folder of a new model run.
+
+        :param pathDir: directory
+        :return: list of directories
+        """
+
+        if self.watcher is None or not os.path.isdir(pathDir):
+            return []
+
+        watched = set(self.watcher.directories())
+        try:
+            entries = [x.path for x in os.scandir(pathDir) if x.is_dir()]
+        except OSError:
+            return []
+        return [x for x in map(os.path.abspath, entries) if x not in watched]
+
+    def dirChanged(self, pathDir):
+        """
+        dirChanged collects the changed directories. as an image is written in several
+        steps, the update is delayed until no changes come in anymore. new sub
+        directories are added to the watcher and are updated completely, as they might
+        already contain files before they were watched.
+
+        :param pathDir: directory
+        :return: true for test purpose
+        """
+
+        pathDir = os.path.abspath(pathDir)
+        for subDir in self.newSubDirs(pathDir):
+            self.addTree(subDir)
+            self.changedTrees.add(subDir)
+
+        self.changedDirs.add(pathDir)
+        self.timerUpdate.start(self.DELAY_UPDATE)
+        return True
+
+    def updateDirs(self, dirs, trees=None):
+        """
+        updateDirs runs in a thread and updates all changed directories
+
+        :param dirs: list of directories
+        :param trees: list of directories to be updated including sub directories
+        :return: number of changed entries
+        """
+
+        number = 0
+        for pathDir in dirs:
+            if os.path.isdir(pathDir):
+                number += self.updateDir(pathDir, recursive=False)
+            else:
+                number += self.removeDir(pathDir)
+        for pathDir in trees or list():
+            number += self.updateDir(pathDir, recursive=True)
+        return number
+
+    def removeDir(self, pathDir):
+        """
+        removeDir deletes all entries of the directory and its sub directories from the
+        index, as a removed directory takes its whole tree with it.
+
+        :param pathDir: directory
+        :return: number of removed entries
+        """
+
+        pathDir = os.path.abspath(pathDir)
+        with self.lock, self.db:
+            cursor = self.db.execute("DELETE FROM frames WHERE dir = ? OR dir LIKE ? ESCAPE '\\'",
+                                     (pathDir, self.subDirPattern(pathDir)))
+        return cursor.rowcount
+
+    def updateSolved(self, result=None):
+        """
+        updateSolved refreshes the entry of a solved image, as writing the solution to
+        the header does not change the directory and is not seen by the watcher. the
+        header is read in a thread as the slot runs in the gui thread.
+
+        :param result: result dict of astrometry
+        :return: success
+        """
+
+        if not result or not result.get('success'):
+            return False
+
+        path = os.path.abspath(result['solvedPath'])
+        worker = Worker(self.updateFile, path)
+        worker.signals.result.connect(self.updateResult)
+        return self.app.executor.start(worker, lane='io', key=f'headerIndex:{path}')
+
+    def updateResult(self, number):
+        """
+        updateResult emits the updated signal if the index was changed
+
+        :param number: number of changed entries
+        :return: true for test purpose
+        """
+
+        if number:
+            self.updated.emit()
+        return True
+
+    def processChanges(self):
+        """
+        processChanges starts the update of all collected directories in a thread
+
+        :return: success
+        """
+
+        if not self.changedDirs and not self.changedTrees:
+            return False
+
+        # the changes are kept and checked again until the running update is finished
+        if self.app.executor.isActive('headerIndex'):
+            self.timerUpdate.start(self.DELAY_UPDATE)
+            return False
+
+        dirs = sorted(self.changedDirs)
+        trees = sorted(self.changedTrees)
+        self.changedDirs = set()
+        self.changedTrees = set()
+        worker = Worker(self.updateDirs, dirs, trees)
+        worker.signals.result.connect(self.updateResult)
+        self.app.executor.start(worker, lane='io', key='headerIndex')
+        return True
+
+    @staticmethod
+    def buildConditions(solved=None, dateFrom=None, dateTo=None, objectName=None,
+                        filterName=None, pathDir=None):
+        """
+        buildConditions translates the search parameters, which could be checked directly
+        in the database, to sql conditions with their values.
+
+        :param solved: only solved (True) or unsolved (False) frames
+        :param dateFrom: first date as iso string
+        :param dateTo: last date as iso string
+        :param objectName: object name
+        :param filterName: filter name
+        :param pathDir: directory including sub directories
+        :return: list of conditions, list of values
+        """
+
+        conditions = list()
+        values = list()
+        if solved is not None:
+            conditions.append('solved = ?')
+            values.append(int(solved))
+        if dateFrom is not None:
+            conditions.append('dateObs >= ?')
+            values.append(dateFrom)
+        if dateTo is not None:
+            conditions.append('dateObs <= ?')
+            values.append(dateTo)
+        if objectName is not None:
+            conditions.append('object = ?')
+            values.append(objectName)
+        if filterName is not None:
+            conditions.append('filter = ?')
+            values.append(filterName)
+        if pathDir is not None:
+            pathDir = os.path.abspath(pathDir)
+            conditions.append("(dir = ? OR dir LIKE ? ESCAPE '\\')")
+            values.extend([pathDir, HeaderIndex.subDirPattern(pathDir)])
+        return conditions, values
+
+    def query(self, solved=None, ra=None, dec=None, radius=None, dateFrom=None,
+              dateTo=None, objectName=None, filterName=None, pathDir=None):
+        """
+        query searches the index. all given conditions have to be fulfilled. for the
+        position the coordinates of the solve are used if present, otherwise the mount
+        coordinates from the header. dates are compared as iso strings like in DATE-OBS.
+
+        :param solved: only solved (True) or unsolved (False) frames
+        :param ra: right ascension of search center in degrees
+        :param dec: declination of search center in degrees
+        :param radius: search radius in degrees
+        :param dateFrom: first date as iso string
+        :param dateTo: last date as iso string
+        :param objectName: object name
+        :param filterName: filter name
+        :param pathDir: directory including sub directories
+        :return: list of dicts with the index entries
+        """
+
+        conditions, values = self.buildConditions(solved=solved,
+                                                  dateFrom=dateFrom,
+                                                  dateTo=dateTo,
+                                                  objectName=objectName,
+                                                  filterName=filterName,
+                                                  pathDir=pathDir)
+
+        hasPosition = ra is not None and dec is not None and radius is not None
+        if hasPosition:
+            conditions.append('COALESCE(decSolved, dec) BETWEEN ? AND ?')
+            values.extend([dec - radius, dec + radius])
+
+        sql = 'SELECT * FROM frames'
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        sql += ' ORDER BY dateObs'
+
+        with self.lock:
+            rows = [dict(row) for row in self.db.execute(sql, values).fetchall()]
+
+        if not hasPosition:
+            return rows
+
+        result = list()
+        for row in rows:
+            raFrame = row['raSolved'] if row['solved'] else row['ra']
+            decFrame = row['decSolved'] if row['solved'] else row['dec']
+            if raFrame is None or decFrame is None:
+                continue
+            cosDist = (np.sin(np.radians(dec)) * np.sin(np.radians(decFrame))
+                       + np.cos(np.radians(dec)) * np.cos(np.radians(decFrame))
+                       * np.cos(np.radians(ra - raFrame)))
+            if np.degrees(np.arccos(np.clip(cosDist, -1, 1))) <= radius:
+                result.append(row)
+        return result
+
+    def close(self):
+        """
+        close stops the watcher and closes the database
+
+        :return: true for test purpose
+        """
+
+        self.timerUpdate.stop()
+        if self.watcher is not None:
+            self.watcher.directoryChanged.disconnect(self.dirChanged)
+            self.watcher = None
+        with self.lock:
+            self.db.close()
+        return True
@@ -26,6 +26,12 @@ import numpy as np
 from indibase import qtIndiBase
 # local imports
 from mw4.base.loggerMW import CustomLogger
+from mw4.base.traceRecorder import recorder
+from mw4.base.metrics import registry
+
+updateCount = registry.counter('mw4_indi_updates_total',
+                               'received indi property updates',
+                               ['device', 'kind'])
 
 
 class IndiClass(object):
@@ -244,6 +250,9 @@ class IndiClass(object):
         if deviceName != self.name:
             return False
 
+        recorder.record(deviceName, propertyName)
+        updateCount.inc(device=deviceName, kind='number')
+
         for element, value in self.device.getNumber(propertyName).items():
             key = propertyName + '.' + element
             self.data[key] = value
@@ -267,6 +276,9 @@ class IndiClass(object):
         if deviceName != self.name:
             return False
 
+        recorder.record(deviceName, propertyName)
+        updateCount.inc(device=deviceName, kind='switch')
+
         for element, value in self.device.getSwitch(propertyName).items():
             key = propertyName + '.' + element
             self.data[key] = value
@@ -290,6 +302,9 @@ class IndiClass(object):
         if deviceName != self.name:
             return False
 
+        recorder.record(deviceName, propertyName)
+        updateCount.inc(device=deviceName, kind='text')
+
         for element, value in self.device.getText(propertyName).items():
             key = propertyName + '.' + element
             self.data[key] = value
@@ -312,6 +327,9 @@ class IndiClass(object):
         if deviceName != self.name:
             return False
 
+        recorder.record(deviceName, propertyName)
+        updateCount.inc(device=deviceName, kind='light')
+
         for element, value in self.device.getLight(propertyName).items():
             key = propertyName + '.' + element
             self.data[key] = value
@@ -335,6 +353,9 @@ class IndiClass(object):
         if deviceName != self.name:
             return False
 
+        recorder.record(deviceName, propertyName)
+        updateCount.inc(device=deviceName, kind='blob')
+
         return True
 
     @staticmethod
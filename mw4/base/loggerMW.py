@@ -19,31 +19,156 @@
 ###########################################################
 # standard libraries
 import logging
+import logging.handlers
 import warnings
 import datetime
+import atexit
+import gzip
+import os
+import queue
+import shutil
 # external packages
 # local imports
 
+# the listener writes the log records in its own thread
+listener = None
 
-def setupLogging():
+
+class LogFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    The class LogFileHandler writes the log file of the day (mw4-YYYY-MM-DD.log). if
+    the file reaches maxBytes, it is rotated and compressed to mw4-YYYY-MM-DD.log.1.gz
+    and so on, keeping backupCount files. when the day changes, the file of the
+    finished day is compressed and a new file is started.
+
+        >>> handler = LogFileHandler(pathDir='.', maxBytes=100000000, backupCount=10)
+    """
+
+    __all__ = ['LogFileHandler',
+               ]
+
+    def __init__(self, pathDir='.', maxBytes=0, backupCount=0):
+        self.pathDir = pathDir
+        self.day = self.today()
+        super().__init__(self.fileName(self.day),
+                         maxBytes=maxBytes,
+                         backupCount=backupCount,
+                         delay=True,
+                         )
+        self.namer = self.compressedName
+        self.rotator = self.compress
+
+    @staticmethod
+    def today():
+        return datetime.datetime.now().strftime('%Y-%m-%d')
+
+    def fileName(self, day):
+        return os.path.join(self.pathDir, f'mw4-{day}.log')
+
+    @staticmethod
+    def compressedName(name):
+        return name + '.gz'
+
+    @staticmethod
+    def compress(source, dest):
+        """
+        compress writes the source file as gzip archive and removes it
+
+        :param source:
+        :param dest:
+        :return: true for test purpose
+        """
+
+        if not os.path.isfile(source):
+            return False
+        with open(source, 'rb') as inFile:
+            with gzip.open(dest, 'wb') as outFile:
+                shutil.copyfileobj(inFile, outFile)
+        os.remove(source)
+        return True
+
+    def shouldRollover(self, record):
+        if self.today() != self.day:
+            return True
+        return super().shouldRollover(record)
+
+    def doRollover(self):
+        day = self.today()
+        if day == self.day:
+            super().doRollover()
+            return
+
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        self.rotate(self.baseFilename, self.rotation_filename(self.baseFilename))
+        self.day = day
+        self.baseFilename = os.path.abspath(self.fileName(day))
+
+
+def stopLogging():
     """
-    setupLogging defines the logger and formats and disables unnecessary library logging
+    stopLogging writes all queued records and stops the writer thread
 
     :return: true for test purpose
     """
+
+    global listener
+    if listener is None:
+        return False
+
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+    listener = None
+    return True
+
+
+atexit.register(stopLogging)
+
+
+def setupLogging(pathDir='.', maxBytes=100000000, backupCount=10):
+    """
+    setupLogging defines the logger and formats and disables unnecessary library logging.
+    the records are put into a queue by the calling thread and written to the file by
+    a separate thread, so logging does not block polling or the gui. the message is
+    only formatted if the level of the record is enabled.
+
+    :param pathDir: dir of the log files
+    :param maxBytes: size of the log file before it is rotated
+    :param backupCount: number of compressed files kept per day
+    :return: true for test purpose
+    """
+    global listener
+
     warnings.filterwarnings('ignore')
-    name = 'mw4-{0}.log'.format(datetime.datetime.now().strftime("%Y-%m-%d"))
-    logging.basicConfig(level=logging.DEBUG,
-                        format='[%(asctime)s]'
-                               '[%(levelname)1.1s]'
-                               # '[%(threadName)-.2s]'
-                               # '[%(funcName)4.4s]'
-                               '[%(filename)15.15s]'
-                               '[%(lineno)4s]'
-                               ' %(message)s',
-                        handlers=[logging.FileHandler(name)],
-                        datefmt='%Y-%m-%d %H:%M:%S',
-                        )
+    stopLogging()
+
+    fileHandler = LogFileHandler(pathDir=pathDir,
+                                 maxBytes=maxBytes,
+                                 backupCount=backupCount,
+                                 )
+    fileHandler.setFormatter(logging.Formatter('[%(asctime)s]'
+                                               '[%(levelname)1.1s]'
+                                               # '[%(threadName)-.2s]'
+                                               # '[%(funcName)4.4s]'
+                                               '[%(filename)15.15s]'
+                                               '[%(lineno)4s]'
+                                               ' %(message)s',
+                                               datefmt='%Y-%m-%d %H:%M:%S',
+                                               ))
+
+    logQueue = queue.Queue()
+    queueHandler = logging.handlers.QueueHandler(logQueue)
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        if isinstance(handler, logging.handlers.QueueHandler):
+            root.removeHandler(handler)
+    root.addHandler(queueHandler)
+    root.setLevel(logging.DEBUG)
+
+    listener = logging.handlers.QueueListener(logQueue, fileHandler)
+    listener.start()
     #
     # setting different log level for the internal libraries we shift one step up
     # standard ERROR    will be CRITICAL    logging hard error statements without solution
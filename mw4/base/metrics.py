@@ -0,0 +1,550 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import logging
+import time
+import bisect
+import threading
+import contextlib
+import socketserver
+import http.server
+# external packages
+# local imports
+from mw4.base.loggerMW import CustomLogger
+
+__all__ = ['Counter',
+           'Gauge',
+           'Histogram',
+           'MetricsRegistry',
+           'MetricsServer',
+           'registry',
+           ]
+
+
+class Metric(object):
+    """
+    The class Metric is the base of all metric types. a metric has a name, a help text
+    and the names of its labels. for each combination of label values there is one
+    value, which is stored under the tuple of the label values. instead of a value, a
+    function could be given, which is called when the metric is read. this is used for
+    queue depths and thread counts, which are then only calculated on request.
+    """
+
+    __all__ = ['Metric',
+               'labelKey',
+               'setFunction',
+               'samples',
+               ]
+
+    TYPE = 'untyped'
+
+    def __init__(self, name, helpText='', labels=()):
+        self.name = name
+        self.helpText = helpText
+        self.labels = tuple(labels)
+        self.values = dict()
+        self.functions = dict()
+        self.lock = threading.Lock()
+
+    def labelKey(self, labels):
+        """
+        labelKey returns the label values in the order of the label names. missing
+        labels are empty, unknown labels are ignored.
+
+        :param labels: dict of label names and values
+        :return: tuple of label values
+        """
+
+        return tuple(str(labels.get(label, '')) for label in self.labels)
+
+    def labelDict(self, key):
+        return dict(zip(self.labels, key))
+
+    def setFunction(self, function, **labels):
+        """
+        setFunction sets a function, which returns the value when the metric is read
+
+        :param function: callable without parameters
+        :param labels:
+        :return: true for test purpose
+        """
+
+        key = self.labelKey(labels)
+        with self.lock:
+            self.functions[key] = function
+        return True
+
+    @staticmethod
+    def callFunction(function):
+        try:
+            return float(function())
+        except Exception:
+            return float('nan')
+
+    def value(self, **labels):
+        key = self.labelKey(labels)
+        function = self.functions.get(key)
+        if function is None:
+            return self.values.get(key, 0)
+        return self.callFunction(function)
+
+    def samples(self):
+        """
+        samples returns all values of the metric
+
+        :return: list of name, label dict, value
+        """
+
+        with self.lock:
+            values = list(self.values.items())
+            functions = list(self.functions.items())
+        samples = [(self.name, self.labelDict(key), value) for key, value in values]
+        for key, function in functions:
+            samples.append((self.name, self.labelDict(key), self.callFunction(function)))
+        return samples
+
+
+class Counter(Metric):
+    """
+    The class Counter counts events. the value only goes up.
+
+        >>> requests = registry.counter('mw4_requests_total', 'requests', ['device'])
+        >>> requests.inc(device='dome')
+    """
+
+    __all__ = ['Counter',
+               'inc',
+               ]
+
+    TYPE = 'counter'
+
+    def inc(self, amount=1, **labels):
+        """
+        inc adds amount to the counter
+
+        :param amount:
+        :param labels:
+        :return: true for test purpose
+        """
+
+        key = self.labelKey(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+        return True
+
+
+class Gauge(Metric):
+    """
+    The class Gauge holds a value, which goes up and down.
+
+        >>> depth = registry.gauge('mw4_queue_depth', 'items in queue', ['queue'])
+        >>> depth.setFunction(slewQueue.qsize, queue='slew')
+    """
+
+    __all__ = ['Gauge',
+               'set',
+               'inc',
+               'dec',
+               ]
+
+    TYPE = 'gauge'
+
+    def set(self, value, **labels):
+        """
+        set sets the value of the gauge
+
+        :param value:
+        :param labels:
+        :return: true for test purpose
+        """
+
+        key = self.labelKey(labels)
+        with self.lock:
+            self.values[key] = value
+        return True
+
+    def inc(self, amount=1, **labels):
+        key = self.labelKey(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+        return True
+
+    def dec(self, amount=1, **labels):
+        return self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    """
+    The class Histogram counts observed values (mostly durations in seconds) in buckets.
+    beside the buckets the sum and the number of values are stored, so mean values and
+    percentiles could be calculated by the monitoring system.
+
+        >>> solveTime = registry.histogram('mw4_solve_seconds', 'solve time')
+        >>> with solveTime.time():
+        >>>     solve()
+    """
+
+    __all__ = ['Histogram',
+               'observe',
+               'time',
+               'count',
+               'sum',
+               'percentile',
+               ]
+
+    TYPE = 'histogram'
+    BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+               1, 2.5, 5, 10, 30, 60, 120)
+
+    def __init__(self, name, helpText='', labels=(), buckets=None):
+        super().__init__(name, helpText=helpText, labels=labels)
+        self.buckets = tuple(sorted(buckets or self.BUCKETS))
+
+    def observe(self, value, **labels):
+        """
+        observe adds the value to the bucket with the smallest upper bound, which is
+        larger or equal to the value.
+
+        :param value:
+        :param labels:
+        :return: true for test purpose
+        """
+
+        key = self.labelKey(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            if key not in self.values:
+                self.values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry = self.values[key]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+        return True
+
+    @contextlib.contextmanager
+    def time(self, **labels):
+        """
+        time observes the duration of the with block
+
+        :param labels:
+        :return: nothing
+        """
+
+        timeStart = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - timeStart, **labels)
+
+    def count(self, **labels):
+        entry = self.values.get(self.labelKey(labels))
+        return entry[2] if entry else 0
+
+    def sum(self, **labels):
+        entry = self.values.get(self.labelKey(labels))
+        return entry[1] if entry else 0
+
+    def percentile(self, fraction, **labels):
+        """
+        percentile estimates the percentile from the buckets. the result is the upper
+        bound of the bucket, which contains the percentile.
+
+        :param fraction: e.g. 0.95
+        :param labels:
+        :return: upper bound or None
+        """
+
+        entry = self.values.get(self.labelKey(labels))
+        if not entry:
+            return None
+
+        limit = fraction * entry[2]
+        total = 0
+        for index, count in enumerate(entry[0]):
+            total += count
+            if total >= limit and count:
+                break
+        if index < len(self.buckets):
+            return self.buckets[index]
+        return float('inf')
+
+    def samples(self):
+        with self.lock:
+            values = [(key, list(entry[0]), entry[1], entry[2])
+                      for key, entry in self.values.items()]
+
+        samples = list()
+        for key, counts, total, number in values:
+            labels = self.labelDict(key)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'), ), counts):
+                cumulative += count
+                bucketLabels = dict(labels, le=formatValue(bound))
+                samples.append((self.name + '_bucket', bucketLabels, cumulative))
+            samples.append((self.name + '_sum', labels, total))
+            samples.append((self.name + '_count', labels, number))
+        return samples
+
+
+def formatValue(value):
+    """
+    formatValue writes a value as needed in the prometheus text format
+
+    :param value:
+    :return: text
+    """
+
+    if value == float('inf'):
+        return '+Inf'
+    if value == float('-inf'):
+        return '-Inf'
+    if value != value:
+        return 'NaN'
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def escapeLabel(value):
+    return value.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+class MetricsRegistry(object):
+    """
+    The class MetricsRegistry keeps all metrics of mw4. metrics are created once on
+    module level of the instrumented code, asking for an existing name returns the
+    existing metric. the registry writes all values in the prometheus text format and
+    gives a summary for the diagnostics window.
+
+        >>> registry = MetricsRegistry()
+        >>> pollTime = registry.histogram('mw4_poll_seconds', 'poll time', ['device'])
+        >>> text = registry.text()
+    """
+
+    __all__ = ['MetricsRegistry',
+               'counter',
+               'gauge',
+               'histogram',
+               'text',
+               'summary',
+               'clear',
+               ]
+
+    logger = logging.getLogger(__name__)
+    log = CustomLogger(logger, {})
+
+    def __init__(self):
+        self.metrics = dict()
+        self.lock = threading.Lock()
+
+    def register(self, metricClass, name, helpText, labels, **kwargs):
+        with self.lock:
+            metric = self.metrics.get(name)
+            if metric is None:
+                metric = metricClass(name, helpText=helpText, labels=labels, **kwargs)
+                self.metrics[name] = metric
+            elif not isinstance(metric, metricClass):
+                raise ValueError(f'metric {name} already registered as {metric.TYPE}')
+        return metric
+
+    def counter(self, name, helpText='', labels=()):
+        return self.register(Counter, name, helpText, labels)
+
+    def gauge(self, name, helpText='', labels=()):
+        return self.register(Gauge, name, helpText, labels)
+
+    def histogram(self, name, helpText='', labels=(), buckets=None):
+        return self.register(Histogram, name, helpText, labels, buckets=buckets)
+
+    def text(self):
+        """
+        text writes all metrics in the prometheus text format version 0.0.4
+
+        :return: text
+        """
+
+        with self.lock:
+            metrics = sorted(self.metrics.items())
+
+        lines = list()
+        for name, metric in metrics:
+            lines.append(f'# HELP {name} {metric.helpText}')
+            lines.append(f'# TYPE {name} {metric.TYPE}')
+            for sampleName, labels, value in metric.samples():
+                if labels:
+                    labelText = ','.join(f'{key}="{escapeLabel(str(val))}"'
+                                         for key, val in labels.items())
+                    sampleName = f'{sampleName}{{{labelText}}}'
+                lines.append(f'{sampleName} {formatValue(value)}')
+
+        return '\n'.join(lines) + '\n'
+
+    def summary(self):
+        """
+        summary returns one row per metric and label values for showing in the gui.
+        histograms show number, mean and estimated 95% percentile.
+
+        :return: list of name, labels text, value text
+        """
+
+        with self.lock:
+            metrics = sorted(self.metrics.items())
+
+        rows = list()
+        for name, metric in metrics:
+            if isinstance(metric, Histogram):
+                with metric.lock:
+                    keys = list(metric.values)
+                for key in keys:
+                    labels = metric.labelDict(key)
+                    number = metric.count(**labels)
+                    mean = metric.sum(**labels) / number if number else 0
+                    p95 = metric.percentile(0.95, **labels)
+                    value = f'n={number} mean={mean:.3f}s p95<={p95:g}s'
+                    rows.append((name, self.labelText(labels), value))
+                continue
+
+            for _, labels, value in metric.samples():
+                rows.append((name, self.labelText(labels), f'{value:g}'))
+
+        return rows
+
+    @staticmethod
+    def labelText(labels):
+        return ', '.join(f'{key}={val}' for key, val in labels.items())
+
+    def clear(self):
+        """
+        clear removes all metrics
+
+        :return: true for test purpose
+        """
+
+        with self.lock:
+            self.metrics = dict()
+        return True
+
+
+class MetricsHandler(http.server.BaseHTTPRequestHandler):
+    """
+    The class MetricsHandler answers GET /metrics with the text of the registry
+    """
+
+    registry = None
+
+    def do_GET(self):
+        if self.path.split('?')[0] not in ['/', '/metrics']:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        content = self.registry.text().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+class ThreadingHTTPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    # http.server.ThreadingHTTPServer is only available from python 3.7
+    daemon_threads = True
+
+
+class MetricsServer(object):
+    """
+    The class MetricsServer serves the metrics of the registry in the prometheus text
+    format on http://host:port/metrics. the server runs in its own daemon thread and is
+    bound to localhost by default, so it is only reachable from other machines, if host
+    is set explicitly.
+
+        >>> server = MetricsServer(registry=registry)
+        >>> server.start(port=9464)
+    """
+
+    __all__ = ['MetricsServer',
+               'start',
+               'stop',
+               ]
+
+    logger = logging.getLogger(__name__)
+    log = CustomLogger(logger, {})
+
+    def __init__(self, registry=None):
+        self.registry = registry
+        self.server = None
+        self.thread = None
+
+    @property
+    def port(self):
+        if self.server is None:
+            return 0
+        return self.server.server_port
+
+    def start(self, port=9464, host='127.0.0.1'):
+        """
+        start runs the http server. if the port is already used, the server is not
+        started and a warning is logged.
+
+        :param port: port number, 0 for a free port
+        :param host: address to bind to
+        :return: success
+        """
+
+        if self.server is not None:
+            return False
+
+        handler = type('Handler', (MetricsHandler, ), {'registry': self.registry})
+        try:
+            self.server = ThreadingHTTPServer((host, port), handler)
+        except OSError as e:
+            self.log.warning(f'Cannot start metrics server on [{host}:{port}]: {e}')
+            return False
+
+        self.thread = threading.Thread(target=self.server.serve_forever,
+                                       name='metricsServer',
+                                       daemon=True)
+        self.thread.start()
+        self.log.info(f'Metrics served on [http://{host}:{self.port}/metrics]')
+        return True
+
+    def stop(self):
+        """
+        stop shuts the http server down
+
+        :return: true for test purpose
+        """
+
+        if self.server is None:
+            return True
+
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join(timeout=1)
+        self.server = None
+        self.thread = None
+        return True
+
+
+# one registry for all metrics of the process
+registry = MetricsRegistry()
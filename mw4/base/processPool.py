@@ -0,0 +1,330 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import logging
+import os
+import multiprocessing
+import concurrent.futures
+import threading
+# external packages
+import numpy as np
+# local imports
+from mw4.base.loggerMW import CustomLogger
+from mw4.base.tpool import Worker
+
+# shared memory is available from python 3.8 on, before the arrays are pickled
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
+__all__ = ['ProcessPool',
+           'SharedArray',
+           ]
+
+
+class SharedArray(object):
+    """
+    The class SharedArray describes a numpy array, which is stored in shared memory.
+    only the descriptor (name, shape, dtype) is pickled and sent to the other process,
+    which maps the same memory without copying it.
+
+        >>> shared, memory = SharedArray.share(array)
+        >>> array, memory = shared.attach()
+    """
+
+    __all__ = ['SharedArray',
+               'share',
+               'attach',
+               ]
+
+    # smaller arrays are cheaper to pickle
+    MIN_SIZE = 1 << 20
+
+    def __init__(self, name='', shape=(), dtype=''):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+    @classmethod
+    def share(cls, array):
+        """
+        share copies the array into a new block of shared memory
+
+        :param array: numpy array
+        :return: descriptor, shared memory
+        """
+
+        memory = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        view = np.ndarray(array.shape, dtype=array.dtype, buffer=memory.buf)
+        view[...] = array
+        return cls(memory.name, array.shape, array.dtype.str), memory
+
+    def attach(self):
+        """
+        attach maps the shared memory of the descriptor
+
+        :return: array, shared memory
+        """
+
+        memory = shared_memory.SharedMemory(name=self.name)
+        array = np.ndarray(self.shape, dtype=np.dtype(self.dtype), buffer=memory.buf)
+        return array, memory
+
+
+def pack(value, memories, copy=False):
+    """
+    pack replaces large numpy arrays in value (also inside of tuples, lists and dicts)
+    by descriptors of shared memory copies.
+
+    :param value:
+    :param memories: list, which gets the created shared memory blocks
+    :param copy: if true, small arrays are copied, so they do not refer to other memory
+    :return: packed value
+    """
+
+    if isinstance(value, np.ndarray):
+        isSmall = value.nbytes < SharedArray.MIN_SIZE
+        if shared_memory is None or isSmall or value.dtype.hasobject:
+            return np.array(value) if copy else value
+        shared, memory = SharedArray.share(value)
+        memories.append(memory)
+        return shared
+
+    if isinstance(value, (tuple, list)):
+        return type(value)(pack(item, memories, copy) for item in value)
+
+    if isinstance(value, dict):
+        return {key: pack(item, memories, copy) for key, item in value.items()}
+
+    return value
+
+
+def unpack(value, memories, copy=False):
+    """
+    unpack replaces the descriptors in value by the arrays in shared memory.
+
+    :param value:
+    :param memories: list, which gets the attached shared memory blocks
+    :param copy: if true, the arrays are copied, so the memory could be released
+    :return: unpacked value
+    """
+
+    if isinstance(value, SharedArray):
+        array, memory = value.attach()
+        memories.append(memory)
+        return np.array(array) if copy else array
+
+    if isinstance(value, (tuple, list)):
+        return type(value)(unpack(item, memories, copy) for item in value)
+
+    if isinstance(value, dict):
+        return {key: unpack(item, memories, copy) for key, item in value.items()}
+
+    return value
+
+
+def release(memories, unlink=False):
+    """
+    release closes the shared memory blocks and removes them if requested
+
+    :param memories: list of shared memory blocks
+    :param unlink: remove the blocks from the system
+    :return: true for test purpose
+    """
+
+    for memory in memories:
+        try:
+            memory.close()
+        except BufferError:
+            # an array still refers to the memory, it is closed by garbage collection
+            pass
+        if unlink:
+            try:
+                memory.unlink()
+            except FileNotFoundError:
+                pass
+    return True
+
+
+def runTask(fn, args, kwargs):
+    """
+    runTask is executed in the worker process. it maps the arguments from shared memory,
+    runs the function and copies large arrays of the result to new shared memory. all
+    arrays of the result are copied, so they do not refer to the input memory, which is
+    closed afterwards. the new memory is removed by the caller.
+
+    :param fn: function
+    :param args:
+    :param kwargs:
+    :return: packed result
+    """
+
+    attached = list()
+    created = list()
+    try:
+        args = unpack(args, attached)
+        kwargs = unpack(kwargs, attached)
+        result = pack(fn(*args, **kwargs), created, copy=True)
+    finally:
+        args = kwargs = None
+        release(created)
+        release(attached)
+
+    return result
+
+
+class ProcessPool(object):
+    """
+    The class ProcessPool runs cpu bound numeric functions in separate processes, so
+    they do not hold the GIL of the gui process. large numpy arrays in arguments and
+    results are transferred through shared memory instead of being pickled.
+
+    the functions have to be defined on module level and work only on their
+    arguments. the pool is started on first use. if there is only one cpu, if the
+    pool is disabled with workers=0 or if the pool could not be started, the functions
+    run in the calling thread instead.
+
+    run blocks until the result is there and is meant to be called from a worker
+    thread. worker returns a worker for the task executor:
+
+        >>> pool = ProcessPool()
+        >>> worker = pool.worker(findPasses, line1, line2)
+        >>> worker.signals.result.connect(self.showPasses)
+        >>> app.executor.start(worker, lane='compute')
+    """
+
+    __all__ = ['ProcessPool',
+               'run',
+               'worker',
+               'close',
+               ]
+
+    logger = logging.getLogger(__name__)
+    log = CustomLogger(logger, {})
+
+    def __init__(self, workers=None):
+        # one cpu is left for the gui process
+        if workers is None:
+            workers = (os.cpu_count() or 1) - 1
+        self.workers = workers
+        self.enabled = workers > 0
+        self.pool = None
+        self.lock = threading.Lock()
+
+    def startPool(self):
+        """
+        startPool starts the worker processes. spawn is used on all platforms, as
+        forking a process with running qt threads is not safe.
+
+        :return: pool or None
+        """
+
+        with self.lock:
+            if self.pool is not None or not self.enabled:
+                return self.pool
+            try:
+                context = multiprocessing.get_context('spawn')
+                self.pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=context)
+            except Exception as e:
+                self.log.critical(f'Cannot start process pool, using threads: {e}')
+                self.enabled = False
+                self.pool = None
+            else:
+                self.log.info(f'Process pool started with [{self.workers}] workers')
+        return self.pool
+
+    def disable(self, error):
+        """
+        disable switches to running the functions in threads after the pool broke
+
+        :param error:
+        :return: true for test purpose
+        """
+
+        self.log.critical(f'Process pool failed, using threads: {error}')
+        with self.lock:
+            self.enabled = False
+            pool = self.pool
+            self.pool = None
+        if pool is not None:
+            pool.shutdown(wait=False)
+        return True
+
+    def run(self, fn, *args, **kwargs):
+        """
+        run executes the function in a worker process and waits for the result.
+        exceptions of the function are raised in the caller.
+
+        :param fn: function on module level
+        :param args:
+        :param kwargs:
+        :return: result of fn
+        """
+
+        pool = self.startPool()
+        if pool is None:
+            return fn(*args, **kwargs)
+
+        created = list()
+        try:
+            packed = pack((args, kwargs), created)
+            future = pool.submit(runTask, fn, *packed)
+            result = future.result()
+        except concurrent.futures.process.BrokenProcessPool as e:
+            self.disable(e)
+            return fn(*args, **kwargs)
+        finally:
+            release(created, unlink=True)
+
+        attached = list()
+        try:
+            result = unpack(result, attached, copy=True)
+        finally:
+            release(attached, unlink=True)
+
+        return result
+
+    def worker(self, fn, *args, **kwargs):
+        """
+        worker returns a worker, which runs the function in the pool
+
+        :param fn: function on module level
+        :param args:
+        :param kwargs:
+        :return: worker
+        """
+
+        return Worker(self.run, fn, *args, **kwargs)
+
+    def close(self):
+        """
+        close stops the worker processes
+
+        :return: true for test purpose
+        """
+
+        with self.lock:
+            pool = self.pool
+            self.pool = None
+        if pool is not None:
+            pool.shutdown(wait=False)
+        return True
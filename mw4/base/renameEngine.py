@@ -0,0 +1,278 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import logging
+import os
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+# external packages
+# local imports
+from mw4.base.loggerMW import CustomLogger
+from mw4.base import fitsAccess
+
+__all__ = ['RenameEngine',
+           ]
+
+
+class RenameEngine(object):
+    """
+    The class RenameEngine renames a batch of fits files based on their header entries.
+    the work is split in three steps: the headers (only the primary header block, no
+    pixel data) are read in parallel, a complete rename plan is built and checked for
+    conflicts and finally the plan is applied in one go. the plan could be inspected
+    before applying it (dry run).
+
+    applying is atomic: all files are first moved to temporary names and then to their
+    targets. if any step fails, all done steps are reverted. the last applied plan is
+    kept as journal and could be undone.
+
+        >>> engine = RenameEngine()
+        >>> plan = engine.buildPlan(files, nameFunc)
+        >>> engine.apply(plan)
+        >>> engine.undo()
+    """
+
+    __all__ = ['RenameEngine',
+               'scanFiles',
+               'readHeaders',
+               'buildPlan',
+               'hasConflicts',
+               'apply',
+               'undo',
+               ]
+
+    logger = logging.getLogger(__name__)
+    log = CustomLogger(logger, {})
+
+    NUMBER_THREADS = 8
+    TEMP_EXT = '.mw4rename'
+
+    def __init__(self):
+        self.plan = list()
+        self.journal = list()
+        self.progress = 0
+
+    @staticmethod
+    def scanFiles(pathDir='', search=''):
+        """
+        scanFiles collects all files matching the search pattern in one pass
+
+        :param pathDir: path to root directory to be scanned
+        :param search: search string
+        :return: sorted list of file names
+        """
+
+        if not pathDir or not search:
+            return list()
+        if not os.path.isdir(pathDir):
+            return list()
+
+        return sorted(str(file) for file in Path(pathDir).glob(search) if file.is_file())
+
+    @staticmethod
+    def readHeader(fileName):
+        """
+        readHeader reads the primary header of a file. errors are logged and result in
+        no header.
+
+        :param fileName: fits file
+        :return: header or None
+        """
+
+        try:
+            header = fitsAccess.readHeader(fileName)
+        except Exception as e:
+            RenameEngine.log.warning(f'Cannot read header of [{fileName}]: {e}')
+            header = None
+        return header
+
+    def readHeaders(self, files):
+        """
+        readHeaders reads the headers of all files in a thread pool. reading headers is
+        dominated by file access, so threads give the speed up.
+
+        :param files: list of file names
+        :return: list of headers in the same order, None for unreadable files
+        """
+
+        headers = list()
+        number = max(len(files), 1)
+        with ThreadPoolExecutor(max_workers=self.NUMBER_THREADS) as executor:
+            for i, header in enumerate(executor.map(self.readHeader, files)):
+                headers.append(header)
+                self.progress = 100 * (i + 1) / number
+
+        return headers
+
+    def buildPlan(self, files, nameFunc, headers=None):
+        """
+        buildPlan generates the rename plan. each entry holds source, target and status:
+
+            rename:    file will be renamed
+            unchanged: file has already the right name
+            error:     header could not be read or name could not be built
+            conflict:  target is used twice or an existing file would be overwritten
+
+        :param files: list of file names
+        :param nameFunc: function which returns the new file name for a header
+        :param headers: list of headers, if not given they will be read
+        :return: plan
+        """
+
+        if headers is None:
+            headers = self.readHeaders(files)
+
+        plan = list()
+        for source, header in zip(files, headers):
+            entry = {'source': source, 'target': '', 'status': 'error'}
+            plan.append(entry)
+            if header is None:
+                continue
+            try:
+                newName = nameFunc(header)
+            except Exception as e:
+                self.log.warning(f'Cannot build name for [{source}]: {e}')
+                continue
+            if not newName:
+                continue
+
+            entry['target'] = os.path.join(os.path.dirname(source), newName)
+            if os.path.normcase(entry['target']) == os.path.normcase(source):
+                entry['status'] = 'unchanged'
+            else:
+                entry['status'] = 'rename'
+
+        self.checkConflicts(plan)
+        self.plan = plan
+        return plan
+
+    @staticmethod
+    def checkConflicts(plan):
+        """
+        checkConflicts marks all entries as conflict, which share their target with
+        another entry or which would overwrite an existing file, that is not renamed
+        itself.
+
+        :param plan: rename plan
+        :return: number of conflicts
+        """
+
+        movedAway = {os.path.normcase(x['source']) for x in plan if x['status'] == 'rename'}
+        targets = dict()
+        for entry in plan:
+            if entry['status'] in ['rename', 'unchanged']:
+                key = os.path.normcase(entry['target'])
+                targets.setdefault(key, list()).append(entry)
+
+        number = 0
+        for key, entries in targets.items():
+            duplicate = len(entries) > 1
+            for entry in entries:
+                if entry['status'] != 'rename':
+                    continue
+                occupied = os.path.exists(entry['target']) and key not in movedAway
+                if duplicate or occupied:
+                    entry['status'] = 'conflict'
+                    number += 1
+
+        return number
+
+    @staticmethod
+    def hasConflicts(plan):
+        """
+        hasConflicts checks if a plan could be applied
+
+        :param plan: rename plan
+        :return: status
+        """
+
+        return any(entry['status'] == 'conflict' for entry in plan)
+
+    def renameAll(self, pairs):
+        """
+        renameAll renames all pairs of (source, target) in two steps over temporary
+        names, so chains and swaps of names are possible. if one rename fails, all done
+        renames are reverted in reverse order.
+
+        :param pairs: list of tuples (source, target)
+        :return: success
+        """
+
+        done = list()
+        try:
+            temps = list()
+            for i, (source, target) in enumerate(pairs):
+                temp = f'{source}.{i}{self.TEMP_EXT}'
+                os.rename(source, temp)
+                done.append((source, temp))
+                temps.append(temp)
+            for temp, (source, target) in zip(temps, pairs):
+                if os.path.exists(target):
+                    raise FileExistsError(f'{target} exists')
+                os.rename(temp, target)
+                done.append((temp, target))
+
+        except Exception as e:
+            self.log.critical(f'Rename failed, reverting {len(done)} steps: {e}')
+            for source, target in reversed(done):
+                try:
+                    os.rename(target, source)
+                except Exception as e:
+                    self.log.critical(f'Cannot revert [{target}] -> [{source}]: {e}')
+            return False
+
+        return True
+
+    def apply(self, plan=None):
+        """
+        apply renames all files of the plan with status rename. a plan with conflicts is
+        not applied at all.
+
+        :param plan: rename plan, if not given the last built plan
+        :return: success
+        """
+
+        if plan is None:
+            plan = self.plan
+        if self.hasConflicts(plan):
+            self.log.warning('Rename plan has conflicts, nothing renamed')
+            return False
+
+        pairs = [(x['source'], x['target']) for x in plan if x['status'] == 'rename']
+        suc = self.renameAll(pairs)
+        if suc:
+            self.journal = pairs
+        return suc
+
+    def undo(self):
+        """
+        undo reverts the last applied plan
+
+        :return: success
+        """
+
+        if not self.journal:
+            return False
+
+        pairs = [(target, source) for source, target in reversed(self.journal)]
+        suc = self.renameAll(pairs)
+        if suc:
+            self.journal = list()
+        return suc
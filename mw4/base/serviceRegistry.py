@@ -0,0 +1,194 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import logging
+import time
+import importlib
+import threading
+# external packages
+# local imports
+from mw4.base.loggerMW import CustomLogger
+
+__all__ = ['ServiceRegistry',
+           'StartupTimeline',
+           ]
+
+
+class StartupTimeline(object):
+    """
+    The class StartupTimeline collects time marks during the start of mw4. the timeline
+    is written to the log, so slow steps of the startup could be found on the target
+    hardware.
+
+        >>> timeline = StartupTimeline()
+        >>> timeline.mark('config loaded')
+        >>> timeline.logTimeline()
+    """
+
+    __all__ = ['StartupTimeline',
+               'mark',
+               'logTimeline',
+               ]
+
+    logger = logging.getLogger(__name__)
+    log = CustomLogger(logger, {})
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.marks = list()
+        self.lock = threading.Lock()
+
+    def mark(self, label):
+        """
+        mark stores the time since start for the label
+
+        :param label: name of the step
+        :return: seconds since start
+        """
+
+        elapsed = time.perf_counter() - self.start
+        with self.lock:
+            self.marks.append((label, elapsed))
+        return elapsed
+
+    def logTimeline(self):
+        """
+        logTimeline writes all marks with the time since start and the time of the step
+        to the log.
+
+        :return: true for test purpose
+        """
+
+        with self.lock:
+            marks = list(self.marks)
+
+        last = 0
+        for label, elapsed in marks:
+            self.log.info(f'Startup: {elapsed:7.3f}s (+{elapsed - last:6.3f}s) {label}')
+            last = elapsed
+
+        return True
+
+
+class ServiceRegistry(object):
+    """
+    The class ServiceRegistry builds services on first use. a service is registered with
+    a factory, which is only called when the service is requested for the first time.
+    for classes of rarely used windows, lazyClass returns a factory, which imports the
+    module only when the class is needed. the build times are added to the startup
+    timeline.
+
+        >>> registry = ServiceRegistry(timeline=timeline)
+        >>> registry.register('ImageWindow', lazyClass('mw4.gui.imageW.ImageWindow'))
+        >>> imageWindow = registry.get('ImageWindow')
+    """
+
+    __all__ = ['ServiceRegistry',
+               'lazyClass',
+               'register',
+               'isLoaded',
+               'get',
+               ]
+
+    logger = logging.getLogger(__name__)
+    log = CustomLogger(logger, {})
+
+    def __init__(self, timeline=None):
+        self.timeline = timeline
+        self.factories = dict()
+        self.services = dict()
+        self.lock = threading.RLock()
+
+    @staticmethod
+    def lazyClass(path):
+        """
+        lazyClass returns a factory, which imports the module of the class given in
+        dotted notation and returns the class.
+
+        :param path: module path and class name, e.g. mw4.gui.imageW.ImageWindow
+        :return: factory
+        """
+
+        modulePath, className = path.rsplit('.', 1)
+
+        def factory():
+            module = importlib.import_module(modulePath)
+            return getattr(module, className)
+
+        return factory
+
+    def register(self, name, factory):
+        """
+        register adds a factory for a service. an already built service is replaced on
+        the next request.
+
+        :param name: name of the service
+        :param factory: callable without parameters, which builds the service
+        :return: true for test purpose
+        """
+
+        with self.lock:
+            self.factories[name] = factory
+            self.services.pop(name, None)
+        return True
+
+    def isLoaded(self, name):
+        """
+        isLoaded checks, if the service was already built
+
+        :param name: name of the service
+        :return: status
+        """
+
+        return name in self.services
+
+    def get(self, name):
+        """
+        get returns the service and builds it on the first request. requests from
+        different threads wait for the first build. if the build fails, the error is
+        logged and None is returned, so the next request tries it again.
+
+        :param name: name of the service
+        :return: service or None
+        """
+
+        with self.lock:
+            if name in self.services:
+                return self.services[name]
+
+            if name not in self.factories:
+                self.log.warning(f'Service [{name}] not registered')
+                return None
+
+            timeStart = time.perf_counter()
+            try:
+                service = self.factories[name]()
+            except Exception as e:
+                self.log.critical(f'Cannot build service [{name}], error: {e}')
+                return None
+
+            self.services[name] = service
+
+        duration = time.perf_counter() - timeStart
+        self.log.info(f'Service [{name}] built in {duration:6.3f}s')
+        if self.timeline is not None:
+            self.timeline.mark(f'{name} built')
+
+        return service
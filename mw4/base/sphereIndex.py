@@ -0,0 +1,365 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import logging
+import math
+# external packages
+# local imports
+from mw4.base.loggerMW import CustomLogger
+
+__all__ = ['SphereIndex',
+           'altAzToVector',
+           ]
+
+
+def altAzToVector(alt, az):
+    """
+    altAzToVector converts a horizontal position into a unit vector. all distances in
+    the index are calculated on these vectors, so azimuth wrap around and the
+    convergence of the meridians to zenith are handled without special cases.
+
+    :param alt: altitude in degrees
+    :param az: azimuth in degrees
+    :return: tuple of x, y, z
+    """
+
+    alt = math.radians(alt)
+    az = math.radians(az)
+    cosAlt = math.cos(alt)
+    return cosAlt * math.cos(az), cosAlt * math.sin(az), math.sin(alt)
+
+
+def chordFromAngle(angle):
+    """
+    chordFromAngle converts a great circle distance into the length of the chord between
+    the two points on the unit sphere. the chord length is monotonic to the angle, so the
+    tree could compare plain euclidean distances.
+
+    :param angle: distance in degrees
+    :return: chord length
+    """
+
+    angle = min(max(angle, 0), 180)
+    return 2 * math.sin(math.radians(angle) / 2)
+
+
+class _Node(object):
+    """
+    _Node is a single element of the kd tree. deleted nodes stay in the tree as long as
+    the tree is not rebuilt, they are only skipped when searching.
+    """
+
+    __slots__ = ['vector', 'key', 'axis', 'left', 'right', 'deleted']
+
+    def __init__(self, vector, key, axis):
+        self.vector = vector
+        self.key = key
+        self.axis = axis
+        self.left = None
+        self.right = None
+        self.deleted = False
+
+
+class SphereIndex(object):
+    """
+    The class SphereIndex implements a kd tree on unit vectors for horizontal positions
+    (alt, az). it supports incremental adding and removing of points and answers
+    nearest neighbour queries with a maximum search radius in log time. each point carries
+    a key, which is given back from the queries. if no key is given, the point itself is
+    used as key.
+
+    the tree is rebuilt in a balanced way, if too many points were removed or the
+    incremental adding made it too deep.
+
+        >>> index = SphereIndex()
+        >>> index.build([(45, 180), (30, 90)])
+        >>> index.nearest(44, 181, radius=2)
+    """
+
+    __all__ = ['SphereIndex',
+               'build',
+               'clear',
+               'add',
+               'remove',
+               'nearest',
+               'inRadius',
+               ]
+
+    logger = logging.getLogger(__name__)
+    log = CustomLogger(logger, {})
+
+    # allowed depth of the tree in relation to the optimum before rebalancing
+    DEPTH_FACTOR = 2
+    DEPTH_OFFSET = 4
+
+    def __init__(self):
+        self.root = None
+        self.nodes = dict()
+        self.number = 0
+        self.numberDeleted = 0
+
+    def __len__(self):
+        return self.number
+
+    def clear(self):
+        """
+        clear removes all points from the index
+
+        :return: true for test purpose
+        """
+
+        self.root = None
+        self.nodes = dict()
+        self.number = 0
+        self.numberDeleted = 0
+        return True
+
+    def _buildTree(self, items, depth):
+        """
+        _buildTree builds a balanced sub tree from the list of items by splitting at the
+        median of the actual axis.
+
+        :param items: list of tuples (vector, key)
+        :param depth: depth of the sub tree root
+        :return: root node of the sub tree
+        """
+
+        if not items:
+            return None
+
+        axis = depth % 3
+        items.sort(key=lambda x: x[0][axis])
+        median = len(items) // 2
+        vector, key = items[median]
+        node = _Node(vector, key, axis)
+        self.nodes.setdefault(key, list()).append(node)
+        node.left = self._buildTree(items[:median], depth + 1)
+        node.right = self._buildTree(items[median + 1:], depth + 1)
+        return node
+
+    def build(self, points, keys=None):
+        """
+        build replaces the content of the index with the given points and builds a
+        balanced tree out of them.
+
+        :param points: iterable of tuples (alt, az) in degrees
+        :param keys: iterable of keys in the same order as points or None
+        :return: true for test purpose
+        """
+
+        points = list(points)
+        if keys is None:
+            keys = points
+        items = [(altAzToVector(*point), key) for point, key in zip(points, keys)]
+
+        self.clear()
+        self.root = self._buildTree(items, 0)
+        self.number = len(items)
+        return True
+
+    def _rebuild(self):
+        """
+        _rebuild collects all valid nodes and builds a balanced tree out of them.
+
+        :return: nothing
+        """
+
+        items = [(node.vector, node.key)
+                 for nodeList in self.nodes.values()
+                 for node in nodeList]
+        self.nodes = dict()
+        self.root = self._buildTree(items, 0)
+        self.number = len(items)
+        self.numberDeleted = 0
+
+    def add(self, point, key=None):
+        """
+        add inserts a new point into the tree without rebuilding it. if the new leaf is
+        too deep in relation to the number of points, the tree will be rebalanced.
+
+        :param point: tuple (alt, az) in degrees
+        :param key: key of the point, if None the point itself is used
+        :return: true for test purpose
+        """
+
+        if key is None:
+            key = point
+        vector = altAzToVector(*point)
+
+        self.number += 1
+        if self.root is None:
+            node = _Node(vector, key, 0)
+            self.root = node
+            self.nodes.setdefault(key, list()).append(node)
+            return True
+
+        parent = self.root
+        depth = 1
+        while True:
+            axis = parent.axis
+            if vector[axis] < parent.vector[axis]:
+                if parent.left is None:
+                    node = _Node(vector, key, depth % 3)
+                    parent.left = node
+                    break
+                parent = parent.left
+            else:
+                if parent.right is None:
+                    node = _Node(vector, key, depth % 3)
+                    parent.right = node
+                    break
+                parent = parent.right
+            depth += 1
+
+        self.nodes.setdefault(key, list()).append(node)
+        total = self.number + self.numberDeleted
+        maxDepth = self.DEPTH_FACTOR * math.log2(total + 1) + self.DEPTH_OFFSET
+        if depth > maxDepth:
+            self._rebuild()
+        return True
+
+    def remove(self, key):
+        """
+        remove deletes one point with the given key from the index. the node itself is
+        only marked as deleted. if more than half of the nodes are deleted, the tree will
+        be rebuilt.
+
+        :param key: key of the point, for points without key the point itself
+        :return: success
+        """
+
+        nodeList = self.nodes.get(key)
+        if not nodeList:
+            return False
+
+        node = nodeList.pop()
+        if not nodeList:
+            del self.nodes[key]
+        node.deleted = True
+        self.number -= 1
+        self.numberDeleted += 1
+
+        if self.numberDeleted > self.number:
+            self._rebuild()
+        return True
+
+    def _search(self, node, vector, best):
+        """
+        _search walks the tree recursively and keeps the best result in the list best,
+        which holds the squared distance and the found node. subtrees on the far side of
+        the split plane are only visited if the plane is closer than the best result.
+
+        :param node: root node of the sub tree
+        :param vector: search vector
+        :param best: list of squared distance and node
+        :return: nothing
+        """
+
+        if node is None:
+            return
+
+        axis = node.axis
+        if not node.deleted:
+            dist = ((node.vector[0] - vector[0]) ** 2
+                    + (node.vector[1] - vector[1]) ** 2
+                    + (node.vector[2] - vector[2]) ** 2)
+            if dist <= best[0]:
+                best[0] = dist
+                best[1] = node
+
+        diff = vector[axis] - node.vector[axis]
+        if diff < 0:
+            near, far = node.left, node.right
+        else:
+            near, far = node.right, node.left
+
+        self._search(near, vector, best)
+        if diff ** 2 <= best[0]:
+            self._search(far, vector, best)
+
+    def _collect(self, node, vector, limit, result):
+        """
+        _collect walks the tree recursively and collects all nodes with a squared distance
+        not larger than limit.
+
+        :param node: root node of the sub tree
+        :param vector: search vector
+        :param limit: squared chord distance
+        :param result: list of tuples (squared distance, key)
+        :return: nothing
+        """
+
+        if node is None:
+            return
+
+        axis = node.axis
+        if not node.deleted:
+            dist = ((node.vector[0] - vector[0]) ** 2
+                    + (node.vector[1] - vector[1]) ** 2
+                    + (node.vector[2] - vector[2]) ** 2)
+            if dist <= limit:
+                result.append((dist, node.key))
+
+        diff = vector[axis] - node.vector[axis]
+        if diff < 0 or diff ** 2 <= limit:
+            self._collect(node.left, vector, limit, result)
+        if diff >= 0 or diff ** 2 <= limit:
+            self._collect(node.right, vector, limit, result)
+
+    def nearest(self, alt, az, radius=180):
+        """
+        nearest searches the point which is closest to the given position. if the closest
+        point is more than radius away, no point is returned.
+
+        :param alt: altitude of search position in degrees
+        :param az: azimuth of search position in degrees
+        :param radius: max great circle distance in degrees
+        :return: key of the nearest point or None
+        """
+
+        if not self.number:
+            return None
+
+        vector = altAzToVector(alt, az)
+        best = [chordFromAngle(radius) ** 2, None]
+        self._search(self.root, vector, best)
+        if best[1] is None:
+            return None
+        return best[1].key
+
+    def inRadius(self, alt, az, radius):
+        """
+        inRadius searches all points which are in a distance up to radius from the given
+        position.
+
+        :param alt: altitude of search position in degrees
+        :param az: azimuth of search position in degrees
+        :param radius: max great circle distance in degrees
+        :return: list of keys sorted by distance
+        """
+
+        if not self.number:
+            return list()
+
+        vector = altAzToVector(alt, az)
+        result = list()
+        self._collect(self.root, vector, chordFromAngle(radius) ** 2, result)
+        result.sort(key=lambda x: x[0])
+        return [key for _, key in result]
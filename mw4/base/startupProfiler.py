@@ -0,0 +1,448 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import logging
+import os
+import sys
+import json
+import time
+import io
+import cProfile
+import pstats
+import argparse
+import contextlib
+import importlib.abc
+# external packages
+# local imports
+from mw4.base.loggerMW import CustomLogger
+
+__all__ = ['StartupProfiler',
+           'ImportTimer',
+           'parseArguments',
+           ]
+
+
+def parseArguments(argv):
+    """
+    parseArguments reads the command line options of mw4. unknown options are left for
+    Qt.
+
+    :param argv: list of command line arguments without program name
+    :return: options
+    """
+
+    parser = argparse.ArgumentParser(prog='mountwizzard4', add_help=False)
+    parser.add_argument('--profile-startup',
+                        dest='profileStartup',
+                        action='store_true',
+                        help='write a profile of the startup')
+    parser.add_argument('--profile-baseline',
+                        dest='profileBaseline',
+                        action='store_true',
+                        help='store the startup profile as new baseline')
+    options, _ = parser.parse_known_args(argv)
+    return options
+
+
+class ImportLoader(object):
+    """
+    The class ImportLoader wraps the loader of a module and measures the time for
+    creating and executing the module. all other attributes are taken from the original
+    loader.
+    """
+
+    def __init__(self, loader, name, timer):
+        self.loader = loader
+        self.name = name
+        self.timer = timer
+
+    def __getattr__(self, item):
+        return getattr(self.loader, item)
+
+    def create_module(self, spec):
+        self.timer.enter(self.name)
+        try:
+            return self.loader.create_module(spec)
+        except Exception:
+            self.timer.leave(self.name)
+            raise
+
+    def exec_module(self, module):
+        if not self.timer.isActive(self.name):
+            self.timer.enter(self.name)
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.timer.leave(self.name)
+
+
+class ImportTimer(importlib.abc.MetaPathFinder):
+    """
+    The class ImportTimer measures the import time of each module, which is imported
+    while it is installed. it sits in front of sys.meta_path, asks the other finders
+    for the module spec and wraps its loader. like python -X importtime, it records
+    the self time (without the imports made by the module) and the cumulative time.
+
+        >>> timer = ImportTimer()
+        >>> timer.install()
+        >>> import numpy
+        >>> timer.uninstall()
+    """
+
+    __all__ = ['ImportTimer',
+               'install',
+               'uninstall',
+               'top',
+               ]
+
+    def __init__(self):
+        self.times = dict()
+        self.stack = list()
+        self.searching = set()
+
+    def install(self):
+        """
+        install puts the timer in front of the finders
+
+        :return: true for test purpose
+        """
+
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+        return True
+
+    def uninstall(self):
+        """
+        uninstall removes the timer from the finders
+
+        :return: true for test purpose
+        """
+
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+        return True
+
+    def find_spec(self, name, path, target=None):
+        if name in self.searching:
+            return None
+
+        self.searching.add(name)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, 'find_spec'):
+                    continue
+                spec = finder.find_spec(name, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self.searching.discard(name)
+
+        if spec.loader is None or not hasattr(spec.loader, 'exec_module'):
+            return spec
+
+        spec.loader = ImportLoader(spec.loader, name, self)
+        return spec
+
+    def isActive(self, name):
+        """
+        isActive checks, if the module is the one actually measured
+
+        :param name: module name
+        :return: status
+        """
+
+        return bool(self.stack) and self.stack[-1][0] == name
+
+    def enter(self, name):
+        """
+        enter starts the time measurement of a module
+
+        :param name: module name
+        :return: true for test purpose
+        """
+
+        self.stack.append([name, time.perf_counter(), 0.0])
+        return True
+
+    def leave(self, name):
+        """
+        leave stops the time measurement of a module. the cumulative time is added to
+        the children time of the importing module.
+
+        :param name: module name
+        :return: true for test purpose
+        """
+
+        if not self.isActive(name):
+            return False
+
+        name, timeStart, children = self.stack.pop()
+        cumulative = time.perf_counter() - timeStart
+        self.times[name] = {'self': cumulative - children,
+                            'cumulative': cumulative,
+                            }
+        if self.stack:
+            self.stack[-1][2] += cumulative
+        return True
+
+    def top(self, number=30):
+        """
+        top returns the modules with the longest self time
+
+        :param number: number of modules
+        :return: list of dicts
+        """
+
+        items = sorted(self.times.items(), key=lambda x: x[1]['self'], reverse=True)
+        return [{'module': name,
+                 'self': round(value['self'], 6),
+                 'cumulative': round(value['cumulative'], 6),
+                 }
+                for name, value in items[:number]]
+
+
+class StartupProfiler(object):
+    """
+    The class StartupProfiler records where the time goes during the start of mw4. it
+    is enabled with the command line option --profile-startup and collects the wall time
+    of the startup phases, the import time of the modules and the functions with the
+    longest cumulative time. the result is written as json report and compared against
+    a stored baseline, so regressions after updates of dependencies could be seen. with
+    --profile-baseline the actual report is stored as new baseline. when disabled, all
+    methods return without doing anything.
+
+        >>> profiler = StartupProfiler(enabled=True)
+        >>> profiler.start()
+        >>> with profiler.phase('setupLogging'):
+        >>>     setupLogging()
+        >>> profiler.stop()
+        >>> profiler.writeReport(pathDir=workDir)
+    """
+
+    __all__ = ['StartupProfiler',
+               'start',
+               'stop',
+               'phase',
+               'addMarks',
+               'compareBaseline',
+               'writeReport',
+               ]
+
+    logger = logging.getLogger(__name__)
+    log = CustomLogger(logger, {})
+
+    REPORT = 'startup-profile.json'
+    BASELINE = 'startup-baseline.json'
+    # a phase is a regression if it is slower by factor and by absolute seconds
+    TOLERANCE_FACTOR = 1.25
+    TOLERANCE_TIME = 0.2
+    NUMBER_TOP = 30
+
+    def __init__(self, enabled=False, updateBaseline=False):
+        self.enabled = enabled
+        self.updateBaseline = updateBaseline
+        self.timeStart = None
+        self.duration = 0
+        self.phases = list()
+        self.imports = ImportTimer()
+        self.profile = None
+
+    def start(self):
+        """
+        start begins the time measurement, the import timing and the function
+        profiling
+
+        :return: success
+        """
+
+        if not self.enabled:
+            return False
+
+        self.timeStart = time.perf_counter()
+        self.imports.install()
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+        return True
+
+    def stop(self):
+        """
+        stop ends all measurements
+
+        :return: success
+        """
+
+        if not self.enabled or self.timeStart is None:
+            return False
+
+        self.profile.disable()
+        self.imports.uninstall()
+        self.duration = time.perf_counter() - self.timeStart
+        return True
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """
+        phase measures the wall time of the code in the with block
+
+        :param name: name of the phase
+        :return: nothing
+        """
+
+        if not self.enabled:
+            yield
+            return
+
+        timeStart = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - timeStart))
+
+    def addMarks(self, marks, prefix=''):
+        """
+        addMarks adds the marks of a startup timeline as phases. the marks store the
+        time since start of the timeline, so the phase time is the difference to the
+        previous mark.
+
+        :param marks: list of label, elapsed time
+        :param prefix: prefix for the phase names
+        :return: success
+        """
+
+        if not self.enabled:
+            return False
+
+        last = 0
+        for label, elapsed in marks:
+            self.phases.append((f'{prefix}{label}', elapsed - last))
+            last = elapsed
+        return True
+
+    def topFunctions(self):
+        """
+        topFunctions returns the functions with the longest cumulative time
+
+        :return: list of dicts
+        """
+
+        if self.profile is None:
+            return list()
+
+        stats = pstats.Stats(self.profile, stream=io.StringIO())
+        stats.sort_stats('cumulative')
+        result = list()
+        for func in stats.fcn_list[:self.NUMBER_TOP]:
+            calls, _, selfTime, cumulative, _ = stats.stats[func]
+            fileName, line, name = func
+            result.append({'function': f'{fileName}:{line}({name})',
+                           'calls': calls,
+                           'self': round(selfTime, 6),
+                           'cumulative': round(cumulative, 6),
+                           })
+        return result
+
+    def report(self):
+        """
+        report collects all measurements
+
+        :return: report as dict
+        """
+
+        report = {'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+                  'python': sys.version.split()[0],
+                  'total': round(self.duration, 6),
+                  'phases': {name: round(value, 6) for name, value in self.phases},
+                  'imports': self.imports.top(self.NUMBER_TOP),
+                  'functions': self.topFunctions(),
+                  }
+        return report
+
+    def compareBaseline(self, report, baseline):
+        """
+        compareBaseline checks the total time and the time of each phase against the
+        baseline.
+
+        :param report:
+        :param baseline:
+        :return: list of regressions
+        """
+
+        actual = dict(report['phases'], total=report['total'])
+        reference = dict(baseline.get('phases', {}), total=baseline.get('total', 0))
+
+        regressions = list()
+        for name, value in actual.items():
+            if name not in reference:
+                continue
+            limit = max(reference[name] * self.TOLERANCE_FACTOR,
+                        reference[name] + self.TOLERANCE_TIME)
+            if value <= limit:
+                continue
+            regressions.append({'phase': name,
+                                'baseline': reference[name],
+                                'actual': value,
+                                })
+            self.log.warning(f'Startup regression [{name}]: '
+                             f'{reference[name]:6.3f}s -> {value:6.3f}s')
+        return regressions
+
+    def writeReport(self, pathDir=''):
+        """
+        writeReport writes the report and compares it against the baseline. if there is
+        no baseline yet or an update of the baseline is requested, the report is stored
+        as baseline.
+
+        :param pathDir: directory for report and baseline
+        :return: report or None
+        """
+
+        if not self.enabled:
+            return None
+
+        report = self.report()
+        baselinePath = os.path.join(pathDir, self.BASELINE)
+        baseline = None
+        if os.path.isfile(baselinePath) and not self.updateBaseline:
+            try:
+                with open(baselinePath, 'r') as inFile:
+                    baseline = json.load(inFile)
+            except (OSError, ValueError) as e:
+                self.log.warning(f'Cannot read startup baseline: {e}')
+
+        if baseline is not None:
+            report['regressions'] = self.compareBaseline(report, baseline)
+        else:
+            report['regressions'] = list()
+
+        try:
+            with open(os.path.join(pathDir, self.REPORT), 'w') as outFile:
+                json.dump(report, outFile, indent=4)
+            if baseline is None:
+                with open(baselinePath, 'w') as outFile:
+                    json.dump(report, outFile, indent=4)
+        except OSError as e:
+            self.log.warning(f'Cannot write startup profile: {e}')
+            return None
+
+        self.log.info(f'Startup profile: {report["total"]:6.3f}s, '
+                      f'{len(report["regressions"])} regressions')
+        return report
@@ -0,0 +1,336 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import bisect
+import collections
+# external packages
+# local imports
+
+__all__ = ['RunningMean',
+           'ExponentialMean',
+           'MedianFilter',
+           'OutlierFilter',
+           'FilterChain',
+           ]
+
+
+class RunningMean(object):
+    """
+    The class RunningMean calculates the mean over the last size values. the values are
+    kept in a ring buffer together with their sum, so adding a value and reading the
+    mean are O(1). the first value fills the whole window, so the mean starts with the
+    first value and not with an average against zeros.
+
+        >>> mean = RunningMean(size=100)
+        >>> value = mean.add(10)
+    """
+
+    __all__ = ['RunningMean',
+               'reset',
+               'add',
+               'value',
+               ]
+
+    def __init__(self, size=100):
+        self.size = size
+        self.buffer = [0.0] * size
+        self.index = 0
+        self.sum = 0.0
+        self.count = 0
+
+    def reset(self):
+        """
+        reset clears the filter
+
+        :return: true for test purpose
+        """
+
+        self.index = 0
+        self.sum = 0.0
+        self.count = 0
+        return True
+
+    @property
+    def value(self):
+        if not self.count:
+            return None
+        return self.sum / self.size
+
+    def add(self, value):
+        """
+        add puts a new value into the ring buffer and updates the sum. to avoid drifting
+        of the sum by rounding errors, it is recalculated once per round of the buffer.
+
+        :param value:
+        :return: mean value
+        """
+
+        if not self.count:
+            self.buffer = [value] * self.size
+            self.sum = value * self.size
+        else:
+            self.sum += value - self.buffer[self.index]
+            self.buffer[self.index] = value
+
+        self.count += 1
+        self.index = (self.index + 1) % self.size
+        if not self.index:
+            self.sum = sum(self.buffer)
+
+        return self.value
+
+
+class ExponentialMean(object):
+    """
+    The class ExponentialMean calculates an exponential moving average with the weight
+    alpha for the new value.
+
+        >>> mean = ExponentialMean(alpha=0.1)
+        >>> value = mean.add(10)
+    """
+
+    __all__ = ['ExponentialMean',
+               'reset',
+               'add',
+               'value',
+               ]
+
+    def __init__(self, alpha=0.1):
+        self.alpha = alpha
+        self.value = None
+
+    def reset(self):
+        """
+        reset clears the filter
+
+        :return: true for test purpose
+        """
+
+        self.value = None
+        return True
+
+    def add(self, value):
+        """
+        add updates the average with a new value
+
+        :param value:
+        :return: mean value
+        """
+
+        if self.value is None:
+            self.value = value
+        else:
+            self.value += self.alpha * (value - self.value)
+
+        return self.value
+
+
+class MedianFilter(object):
+    """
+    The class MedianFilter calculates the median of the last size values. beside the
+    ring buffer the values are kept in a sorted list, so the median is available without
+    sorting. the filter is meant for small windows.
+
+        >>> median = MedianFilter(size=5)
+        >>> value = median.add(10)
+    """
+
+    __all__ = ['MedianFilter',
+               'reset',
+               'add',
+               'value',
+               ]
+
+    def __init__(self, size=5):
+        self.size = size
+        self.buffer = collections.deque()
+        self.sorted = list()
+
+    def __len__(self):
+        return len(self.buffer)
+
+    def reset(self):
+        """
+        reset clears the filter
+
+        :return: true for test purpose
+        """
+
+        self.buffer.clear()
+        self.sorted = list()
+        return True
+
+    @property
+    def value(self):
+        number = len(self.sorted)
+        if not number:
+            return None
+        middle = number // 2
+        if number % 2:
+            return self.sorted[middle]
+        return (self.sorted[middle - 1] + self.sorted[middle]) / 2
+
+    def add(self, value):
+        """
+        add puts a new value into the window and removes the oldest one, if the window
+        is full.
+
+        :param value:
+        :return: median value
+        """
+
+        if len(self.buffer) == self.size:
+            old = self.buffer.popleft()
+            del self.sorted[bisect.bisect_left(self.sorted, old)]
+
+        self.buffer.append(value)
+        bisect.insort(self.sorted, value)
+        return self.value
+
+
+class OutlierFilter(object):
+    """
+    The class OutlierFilter rejects single glitches of a sensor. a value is rejected,
+    if it deviates from the median of the last accepted values by more than kappa times
+    the spread of these values (median absolute deviation, scaled to sigma). the spread
+    has a lower limit minDeviation, so a constant signal does not reject its own noise.
+    if maxReject values in a row are rejected, the signal has a real step and the
+    filter restarts with the new value.
+
+        >>> outlier = OutlierFilter(size=15, kappa=5, minDeviation=0.5)
+        >>> value = outlier.add(10)
+    """
+
+    __all__ = ['OutlierFilter',
+               'reset',
+               'add',
+               'value',
+               ]
+
+    # scale of median absolute deviation to sigma of a normal distribution
+    MAD_SCALE = 1.4826
+    # number of values needed before values are rejected
+    MIN_VALUES = 3
+
+    def __init__(self, size=15, kappa=5, minDeviation=0, maxReject=5):
+        self.median = MedianFilter(size=size)
+        self.kappa = kappa
+        self.minDeviation = minDeviation
+        self.maxReject = maxReject
+        self.numberReject = 0
+        self.value = None
+
+    def reset(self):
+        """
+        reset clears the filter
+
+        :return: true for test purpose
+        """
+
+        self.median.reset()
+        self.numberReject = 0
+        self.value = None
+        return True
+
+    def isOutlier(self, value):
+        """
+        isOutlier checks the value against the accepted values
+
+        :param value:
+        :return: status
+        """
+
+        if len(self.median) < self.MIN_VALUES:
+            return False
+
+        center = self.median.value
+        deviation = sorted(abs(x - center) for x in self.median.sorted)
+        mad = deviation[len(deviation) // 2] * self.MAD_SCALE
+        limit = self.kappa * max(mad, self.minDeviation)
+        return abs(value - center) > limit
+
+    def add(self, value):
+        """
+        add checks the new value and stores it, if it is accepted
+
+        :param value:
+        :return: value if accepted, otherwise None
+        """
+
+        if self.isOutlier(value):
+            self.numberReject += 1
+            if self.numberReject < self.maxReject:
+                return None
+            self.median.reset()
+
+        self.numberReject = 0
+        self.median.add(value)
+        self.value = value
+        return value
+
+
+class FilterChain(object):
+    """
+    The class FilterChain runs a value through a list of filters. if a filter rejects
+    the value (returns None), the following filters are not updated and the output of
+    the chain stays unchanged.
+
+        >>> chain = FilterChain(OutlierFilter(), RunningMean(size=100))
+        >>> value = chain.add(10)
+    """
+
+    __all__ = ['FilterChain',
+               'reset',
+               'add',
+               'value',
+               ]
+
+    def __init__(self, *filters):
+        self.filters = filters
+
+    def reset(self):
+        """
+        reset clears all filters of the chain
+
+        :return: true for test purpose
+        """
+
+        for item in self.filters:
+            item.reset()
+        return True
+
+    @property
+    def value(self):
+        return self.filters[-1].value
+
+    def add(self, value):
+        """
+        add runs the value through all filters
+
+        :param value:
+        :return: output of the chain or None, if the value was rejected
+        """
+
+        for item in self.filters:
+            value = item.add(value)
+            if value is None:
+                return None
+
+        return value
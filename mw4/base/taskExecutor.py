@@ -0,0 +1,247 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import logging
+import threading
+# external packages
+import PyQt5.QtCore
+# local imports
+from mw4.base.loggerMW import CustomLogger
+
+__all__ = ['TaskExecutor',
+           ]
+
+
+class ExecutorTask(PyQt5.QtCore.QRunnable):
+    """
+    The class ExecutorTask runs a worker inside a lane of the executor and reports the
+    start and the end of the worker back to the executor.
+    """
+
+    def __init__(self, executor, worker, lane, key):
+        super().__init__()
+        self.executor = executor
+        self.worker = worker
+        self.lane = lane
+        self.key = key
+
+    def run(self):
+        self.executor.taskStarted(self)
+        try:
+            self.worker.run()
+        finally:
+            self.executor.taskFinished(self)
+
+
+class TaskExecutor(object):
+    """
+    The class TaskExecutor runs workers in lanes with their own thread pools, so long
+    running tasks do not block the short ones:
+
+        control: fast status polls and commands of devices
+        io:      downloads and other blocking network or file access
+        compute: solving, image processing and calculations
+
+    each lane has a limit of concurrent threads. inside a lane, tasks with higher
+    priority are started first. a task could be started with a key: as long as a task
+    with the same key is queued or running, a new one is not started. this avoids
+    piling up polls, if a device answers slowly. tasks are cancelled through the cancel
+    token of their worker.
+
+        >>> executor = TaskExecutor()
+        >>> worker = Worker(self.pollWorker)
+        >>> worker.signals.result.connect(self.pollResult)
+        >>> executor.start(worker, lane='control', key='pollStatus')
+    """
+
+    __all__ = ['TaskExecutor',
+               'start',
+               'isActive',
+               'cancel',
+               'cancelAll',
+               'metrics',
+               'activeThreadCount',
+               'waitForDone',
+               ]
+
+    logger = logging.getLogger(__name__)
+    log = CustomLogger(logger, {})
+
+    LANES = {
+        'control': 4,
+        'io': 8,
+        'compute': max(2, PyQt5.QtCore.QThread.idealThreadCount()),
+    }
+
+    def __init__(self, lanes=None):
+        lanes = lanes or self.LANES
+        self.lock = threading.Lock()
+        self.pools = dict()
+        self.stats = dict()
+        for lane, limit in lanes.items():
+            pool = PyQt5.QtCore.QThreadPool()
+            pool.setMaxThreadCount(limit)
+            self.pools[lane] = pool
+            self.stats[lane] = {'limit': limit,
+                                'queued': 0,
+                                'running': 0,
+                                'maxQueued': 0,
+                                'finished': 0,
+                                'rejected': 0,
+                                }
+        self.active = dict()
+
+    def start(self, worker, lane='io', key=None, priority=0):
+        """
+        start queues the worker in the lane. if a task with the same key is queued or
+        running, the worker is not started.
+
+        :param worker: worker object
+        :param lane: name of the lane
+        :param key: key for deduplication or None
+        :param priority: higher priority starts first inside the lane
+        :return: success
+        """
+
+        if lane not in self.pools:
+            self.log.critical(f'Lane [{lane}] not available')
+            return False
+
+        with self.lock:
+            stats = self.stats[lane]
+            if key is not None and key in self.active:
+                stats['rejected'] += 1
+                self.log.debug(f'Task [{key}] still active, not started')
+                return False
+
+            task = ExecutorTask(self, worker, lane, key)
+            if key is not None:
+                self.active[key] = task
+            stats['queued'] += 1
+            stats['maxQueued'] = max(stats['maxQueued'], stats['queued'])
+
+        self.pools[lane].start(task, priority)
+        return True
+
+    def taskStarted(self, task):
+        """
+        taskStarted is called from the thread, when the task starts
+
+        :param task:
+        :return: true for test purpose
+        """
+
+        with self.lock:
+            stats = self.stats[task.lane]
+            stats['queued'] -= 1
+            stats['running'] += 1
+        return True
+
+    def taskFinished(self, task):
+        """
+        taskFinished is called from the thread, when the task ends. the key is freed for
+        the next task.
+
+        :param task:
+        :return: true for test purpose
+        """
+
+        with self.lock:
+            stats = self.stats[task.lane]
+            stats['running'] -= 1
+            stats['finished'] += 1
+            if task.key is not None and self.active.get(task.key) is task:
+                del self.active[task.key]
+        return True
+
+    def isActive(self, key):
+        """
+        isActive checks, if a task with the key is queued or running
+
+        :param key:
+        :return: status
+        """
+
+        with self.lock:
+            return key in self.active
+
+    def cancel(self, key):
+        """
+        cancel sets the cancel token of the task with the key. a queued task will not
+        run, a running task stops at its next check of the token.
+
+        :param key:
+        :return: success
+        """
+
+        with self.lock:
+            task = self.active.get(key)
+        if task is None:
+            return False
+
+        task.worker.cancel()
+        return True
+
+    def cancelAll(self):
+        """
+        cancelAll cancels all tasks with a key. this is used when closing mw4.
+
+        :return: true for test purpose
+        """
+
+        with self.lock:
+            tasks = list(self.active.values())
+        for task in tasks:
+            task.worker.cancel()
+        return True
+
+    def metrics(self):
+        """
+        metrics returns the counters of all lanes: limit of threads, actual queue depth,
+        running tasks, max queue depth, finished tasks and tasks not started because of
+        deduplication.
+
+        :return: dict of lanes with dict of counters
+        """
+
+        with self.lock:
+            return {lane: dict(stats) for lane, stats in self.stats.items()}
+
+    def activeThreadCount(self):
+        """
+        activeThreadCount returns the number of running threads of all lanes
+
+        :return: number of threads
+        """
+
+        return sum(pool.activeThreadCount() for pool in self.pools.values())
+
+    def waitForDone(self, timeout=-1):
+        """
+        waitForDone waits for all lanes to finish
+
+        :param timeout: in milliseconds per lane, -1 for no timeout
+        :return: success
+        """
+
+        suc = True
+        for pool in self.pools.values():
+            suc = pool.waitForDone(timeout) and suc
+        return suc
@@ -20,16 +20,70 @@
 # standard libraries
 import logging
 import sys
+import threading
 # external packages
-import PyQt5
+import PyQt5.QtCore
 # local imports
 from mw4.base.loggerMW import CustomLogger
 
 
 __all__ = ['Worker',
+           'CancelToken',
+           'TaskCancelled',
            ]
 
 
+class TaskCancelled(Exception):
+    """
+    TaskCancelled is raised by CancelToken.check() to leave a cancelled task
+    """
+
+
+class CancelToken(object):
+    """
+    The CancelToken class is used for cooperative cancellation of a task. the task
+    checks the token at suitable points and stops, when the token is cancelled. a
+    worker, which is cancelled before it starts, is not run at all.
+
+        >>> token = CancelToken()
+        >>> worker = Worker(fn, token=token)
+        >>> token.cancel()
+    """
+
+    __all__ = ['CancelToken',
+               'cancel',
+               'cancelled',
+               'check',
+               ]
+
+    def __init__(self):
+        self.event = threading.Event()
+
+    def cancel(self):
+        """
+        cancel sets the token to cancelled
+
+        :return: true for test purpose
+        """
+
+        self.event.set()
+        return True
+
+    @property
+    def cancelled(self):
+        return self.event.is_set()
+
+    def check(self):
+        """
+        check raises TaskCancelled, if the token is cancelled
+
+        :return: nothing
+        """
+
+        if self.event.is_set():
+            raise TaskCancelled
+
+
 class WorkerSignals(PyQt5.QtCore.QObject):
     """
     The WorkerSignals class offers a list of signals to be used and instantiated by the Worker
@@ -42,15 +96,19 @@ class WorkerSignals(PyQt5.QtCore.QObject):
     finished = PyQt5.QtCore.pyqtSignal()
     error = PyQt5.QtCore.pyqtSignal(object)
     result = PyQt5.QtCore.pyqtSignal(object)
+    cancelled = PyQt5.QtCore.pyqtSignal()
 
 
 class Worker(PyQt5.QtCore.QRunnable):
     """
     The Worker class offers a generic interface to allow any function to be executed as
-    a thread in an threadpool
+    a thread in an threadpool. each worker has a cancel token. if the function should
+    be cancelled cooperatively, the token is given as keyword argument token and the
+    function checks it.
     """
 
     __all__ = ['Worker',
+               'cancel',
                'run']
 
     logger = logging.getLogger(__name__)
@@ -65,6 +123,16 @@ class Worker(PyQt5.QtCore.QRunnable):
         # the worker signal must not be a class variable, but instance otherwise
         # we get trouble when having multiple threads running
         self.signals = WorkerSignals()
+        self.token = kwargs.get('token') or CancelToken()
+
+    def cancel(self):
+        """
+        cancel sets the cancel token of the worker
+
+        :return: true for test purpose
+        """
+
+        return self.token.cancel()
 
     @PyQt5.QtCore.pyqtSlot()
     def run(self):
@@ -74,8 +142,16 @@ class Worker(PyQt5.QtCore.QRunnable):
         :return: nothing, but sends results and status as signals
         """
 
+        if self.token.cancelled:
+            self.signals.cancelled.emit()
+            self.signals.finished.emit()
+            return
+
         try:
             result = self.fn(*self.args, **self.kwargs)
+        except TaskCancelled:
+            self.log.info(f'Task {getattr(self.fn, "__name__", self.fn)} cancelled')
+            self.signals.cancelled.emit()
         except Exception:
             # as we want to send a clear message to the log file
             exc_type, exc_value, exc_traceback = sys.exc_info()
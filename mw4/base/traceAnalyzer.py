@@ -0,0 +1,144 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import sys
+import argparse
+# external packages
+import numpy as np
+# local imports
+from mw4.base.traceRecorder import loadTrace
+
+__all__ = ['analyzeTrace',
+           'formatReport',
+           'main',
+           ]
+
+# bin edges of the latency histograms in seconds
+LATENCY_BINS = [0, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05,
+                0.1, 0.2, 0.5, 1, 2, 5, np.inf]
+
+
+def analyzeTrace(trace):
+    """
+    analyzeTrace calculates per device the number of events and errors, the payload
+    bytes, the throughput and the latency percentiles and histograms. events with no
+    latency (like indi property updates) are counted, but not added to the histograms.
+
+    :param trace: dict from loadTrace
+    :return: dict of device name and statistics
+    """
+
+    records = trace['records']
+    report = dict()
+    if not len(records):
+        return report
+
+    for index, device in enumerate(trace['devices']):
+        data = records[records['device'] == index]
+        if not len(data):
+            continue
+
+        duration = float(data['time'][-1] - data['time'][0])
+        latency = data['latency'][data['latency'] > 0].astype(np.float64)
+        histogram, _ = np.histogram(latency, bins=LATENCY_BINS)
+        kinds = {trace['kinds'][kind]: int(np.sum(data['kind'] == kind))
+                 for kind in np.unique(data['kind'])}
+        stats = {'events': len(data),
+                 'errors': int(np.sum(data['status'] < 0)),
+                 'bytes': int(np.sum(data['size'], dtype=np.uint64)),
+                 'duration': duration,
+                 'eventsPerSecond': len(data) / duration if duration else 0,
+                 'bytesPerSecond': float(np.sum(data['size'])) / duration
+                 if duration else 0,
+                 'kinds': kinds,
+                 'histogram': histogram.tolist(),
+                 }
+        if len(latency):
+            p50, p95, p99 = np.percentile(latency, [50, 95, 99])
+            stats.update({'p50': float(p50),
+                          'p95': float(p95),
+                          'p99': float(p99),
+                          'max': float(latency.max()),
+                          })
+        report[device] = stats
+
+    return report
+
+
+def formatReport(report):
+    """
+    formatReport returns the report of analyzeTrace as text
+
+    :param report:
+    :return: text
+    """
+
+    lines = list()
+    for device, stats in sorted(report.items()):
+        lines.append(f'{device}: {stats["events"]} events, {stats["errors"]} errors, '
+                     f'{stats["bytes"]} bytes in {stats["duration"]:.1f}s '
+                     f'({stats["eventsPerSecond"]:.1f} ev/s, '
+                     f'{stats["bytesPerSecond"]:.0f} B/s)')
+        if 'p50' not in stats:
+            continue
+        lines.append(f'    latency p50 {stats["p50"] * 1000:.1f}ms, '
+                     f'p95 {stats["p95"] * 1000:.1f}ms, '
+                     f'p99 {stats["p99"] * 1000:.1f}ms, '
+                     f'max {stats["max"] * 1000:.1f}ms')
+        maxCount = max(stats['histogram'])
+        for i, count in enumerate(stats['histogram']):
+            if not count:
+                continue
+            bar = '#' * max(1, int(40 * count / maxCount))
+            label = f'<{LATENCY_BINS[i + 1] * 1000:g}ms'
+            if LATENCY_BINS[i + 1] == np.inf:
+                label = f'>{LATENCY_BINS[i] * 1000:g}ms'
+            lines.append(f'    {label:>9} {count:7d} {bar}')
+
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    """
+    main prints the report for a trace file
+
+        python -m mw4.base.traceAnalyzer trace-2020-10-19-22-00-00.bin
+
+    :param argv:
+    :return: exit code
+    """
+
+    parser = argparse.ArgumentParser(description='analyze a mw4 device trace')
+    parser.add_argument('filePath', help='trace file written by mw4')
+    args = parser.parse_args(argv)
+
+    try:
+        trace = loadTrace(args.filePath)
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    print(f'{args.filePath}: {len(trace["records"])} events, reason: {trace["reason"]}')
+    print(formatReport(analyzeTrace(trace)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
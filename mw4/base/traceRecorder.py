@@ -0,0 +1,329 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import logging
+import os
+import json
+import time
+import struct
+import signal
+import threading
+# external packages
+import numpy as np
+# local imports
+from mw4.base.loggerMW import CustomLogger
+
+__all__ = ['TraceRecorder',
+           'loadTrace',
+           'recorder',
+           ]
+
+
+class TraceRecorder(object):
+    """
+    The class TraceRecorder keeps the last device events in a ring buffer. each event
+    stores time, device, property, kind (get, put, event, poll, command), latency,
+    payload size and status as one record of a numpy structured array, so recording
+    costs only some microseconds and no memory is allocated. device and property names
+    are stored once in a table and referenced by index.
+
+    the buffer could be written to a compact binary file on demand (dump or SIGUSR1)
+    or automatically on errors (at most once per MIN_DUMP_INTERVAL). the files are read
+    with loadTrace and analysed with mw4.base.traceAnalyzer.
+
+        >>> recorder = TraceRecorder(size=65536)
+        >>> recorder.record('telescope', 'rightascension', kind='get',
+        >>>                 latency=0.012, size=120)
+        >>> recorder.dump('trace.bin')
+    """
+
+    __all__ = ['TraceRecorder',
+               'record',
+               'snapshot',
+               'dump',
+               'dumpOnError',
+               'enableSignalDump',
+               'signalDump',
+               'clear',
+               ]
+
+    logger = logging.getLogger(__name__)
+    log = CustomLogger(logger, {})
+
+    MAGIC = b'MW4TRACE'
+    VERSION = 1
+    KINDS = ['get', 'put', 'event', 'poll', 'command']
+    DTYPE = np.dtype([('time', '<f8'),
+                      ('latency', '<f4'),
+                      ('size', '<u4'),
+                      ('device', '<u2'),
+                      ('property', '<u2'),
+                      ('kind', 'u1'),
+                      ('status', '<i2'),
+                      ])
+    MAX_NAMES = 65535
+    # name for all names, which do not fit into a full table
+    OVERFLOW = '<overflow>'
+    # min time between two dumps on error in seconds and max number of these dumps
+    MIN_DUMP_INTERVAL = 600
+    MAX_ERROR_DUMPS = 10
+
+    def __init__(self, size=65536, pathDir=''):
+        self.size = size
+        self.pathDir = pathDir
+        self.enabled = True
+        self.buffer = np.zeros(size, dtype=self.DTYPE)
+        self.index = 0
+        self.count = 0
+        self.names = {'device': dict(), 'property': dict()}
+        self.kinds = {kind: i for i, kind in enumerate(self.KINDS)}
+        self.lastDump = 0
+        self.numberDumps = 0
+        self.lock = threading.Lock()
+        self.pipeRead = None
+        self.pipeWrite = None
+
+    def nameIndex(self, table, name):
+        """
+        nameIndex returns the index of the name in the table and adds it if necessary.
+        the last index of the table is reserved for OVERFLOW, which is used for all new
+        names once the table is full, so every index has its entry in the table.
+
+        :param table: 'device' or 'property'
+        :param name:
+        :return: index
+        """
+
+        names = self.names[table]
+        index = names.get(name)
+        if index is not None:
+            return index
+        if len(names) >= self.MAX_NAMES - 1:
+            return names.setdefault(self.OVERFLOW, len(names))
+        index = len(names)
+        names[name] = index
+        return index
+
+    def record(self, device, prop, kind='event', latency=0, size=0, status=0):
+        """
+        record stores one event in the ring buffer
+
+        :param device: name of the device
+        :param prop: name of the property or command
+        :param kind: one of KINDS
+        :param latency: in seconds
+        :param size: payload size in bytes
+        :param status: status code, negative values are errors
+        :return: success
+        """
+
+        if not self.enabled:
+            return False
+
+        with self.lock:
+            self.buffer[self.index] = (time.time(),
+                                       latency,
+                                       min(size, 0xFFFFFFFF),
+                                       self.nameIndex('device', device),
+                                       self.nameIndex('property', prop),
+                                       self.kinds.get(kind, 0),
+                                       status,
+                                       )
+            self.index = (self.index + 1) % self.size
+            self.count += 1
+        return True
+
+    def snapshot(self):
+        """
+        snapshot returns a copy of the recorded events in the order of recording and the
+        name tables
+
+        :return: records, devices, properties
+        """
+
+        with self.lock:
+            if self.count < self.size:
+                records = self.buffer[:self.index].copy()
+            else:
+                records = np.concatenate((self.buffer[self.index:],
+                                          self.buffer[:self.index]))
+            devices = sorted(self.names['device'], key=self.names['device'].get)
+            properties = sorted(self.names['property'],
+                                key=self.names['property'].get)
+        return records, devices, properties
+
+    def dump(self, filePath='', reason='manual'):
+        """
+        dump writes the events to a binary file. the file starts with MAGIC, version and
+        the length of a json header with the name tables, followed by the raw records.
+
+        :param filePath: path of the file, default is trace-<time>.bin in pathDir
+        :param reason: reason of the dump, stored in the header
+        :return: file path or None
+        """
+
+        records, devices, properties = self.snapshot()
+        if not filePath:
+            name = time.strftime('trace-%Y-%m-%d-%H-%M-%S.bin')
+            filePath = os.path.join(self.pathDir, name)
+
+        header = json.dumps({'created': time.time(),
+                             'reason': reason,
+                             'devices': devices,
+                             'properties': properties,
+                             'kinds': self.KINDS,
+                             'dtype': self.DTYPE.descr,
+                             }).encode('utf-8')
+        try:
+            with open(filePath, 'wb') as outFile:
+                outFile.write(self.MAGIC)
+                outFile.write(struct.pack('<HI', self.VERSION, len(header)))
+                outFile.write(header)
+                outFile.write(records.tobytes())
+        except OSError as e:
+            self.log.warning(f'Cannot write trace: {e}')
+            return None
+
+        self.log.info(f'Trace with [{len(records)}] events written to [{filePath}]')
+        return filePath
+
+    def dumpOnError(self, reason=''):
+        """
+        dumpOnError writes the events when an error occurred. to avoid filling the disk
+        when a device is permanently failing, there is at most one dump in
+        MIN_DUMP_INTERVAL and MAX_ERROR_DUMPS in one session.
+
+        :param reason: description of the error
+        :return: file path or None
+        """
+
+        if not self.enabled or not self.pathDir:
+            return None
+
+        now = time.time()
+        with self.lock:
+            if now - self.lastDump < self.MIN_DUMP_INTERVAL:
+                return None
+            if self.numberDumps >= self.MAX_ERROR_DUMPS:
+                return None
+            self.lastDump = now
+            self.numberDumps += 1
+
+        return self.dump(reason=reason)
+
+    def enableSignalDump(self):
+        """
+        enableSignalDump writes the trace on demand, when the process gets SIGUSR1
+        (kill -USR1 <pid>). the signal is not available on windows. the dump itself is
+        done in a separate thread, which waits on a pipe for the handler.
+
+        :return: success
+        """
+
+        if not hasattr(signal, 'SIGUSR1'):
+            return False
+
+        if self.pipeWrite is None:
+            self.pipeRead, self.pipeWrite = os.pipe()
+            os.set_blocking(self.pipeWrite, False)
+            thread = threading.Thread(target=self.signalDumpWorker,
+                                      name='traceDump',
+                                      daemon=True)
+            thread.start()
+
+        signal.signal(signal.SIGUSR1, self.signalDump)
+        return True
+
+    def signalDump(self, signum, frame):
+        """
+        signalDump is the handler for SIGUSR1. python runs it in the main thread between
+        two bytecodes, maybe while the main thread holds the lock of the recorder or of
+        the logging queue. therefore the handler takes no lock, does no file i/o and no
+        logging: it only writes one byte to the pipe to wake up signalDumpWorker.
+
+        :param signum:
+        :param frame:
+        :return: success
+        """
+
+        try:
+            os.write(self.pipeWrite, b'\x00')
+        except (OSError, TypeError):
+            # pipe full means a dump is pending already, no pipe means not enabled
+            return False
+        return True
+
+    def signalDumpWorker(self):
+        """
+        signalDumpWorker runs in its own thread and writes a dump for every request of
+        the signal handler until the pipe is closed.
+
+        :return: true for test purpose
+        """
+
+        while True:
+            try:
+                data = os.read(self.pipeRead, 64)
+            except OSError:
+                break
+            if not data:
+                break
+            self.dump(reason='signal')
+        return True
+
+    def clear(self):
+        """
+        clear removes all events and names
+
+        :return: true for test purpose
+        """
+
+        with self.lock:
+            self.index = 0
+            self.count = 0
+            self.names = {'device': dict(), 'property': dict()}
+        return True
+
+
+def loadTrace(filePath):
+    """
+    loadTrace reads a file written by TraceRecorder.dump
+
+    :param filePath:
+    :return: dict with header data and records
+    """
+
+    with open(filePath, 'rb') as inFile:
+        magic = inFile.read(len(TraceRecorder.MAGIC))
+        if magic != TraceRecorder.MAGIC:
+            raise ValueError(f'{filePath} is not a trace file')
+        version, length = struct.unpack('<HI', inFile.read(6))
+        if version != TraceRecorder.VERSION:
+            raise ValueError(f'trace version {version} not supported')
+        header = json.loads(inFile.read(length).decode('utf-8'))
+        dtype = np.dtype([tuple(item) for item in header['dtype']])
+        records = np.frombuffer(inFile.read(), dtype=dtype)
+
+    header['records'] = records
+    return header
+
+
+# one recorder for all devices of the process
+recorder = TraceRecorder()
@@ -0,0 +1,375 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import logging
+import os
+import json
+import time
+import hashlib
+import threading
+import urllib.parse
+# external packages
+import requests
+# local imports
+from mw4.base.loggerMW import CustomLogger
+from mw4.base.tpool import Worker
+from mw4.base.taskExecutor import TaskExecutor
+
+__all__ = ['WebCache',
+           'CachedResponse',
+           ]
+
+
+class CachedResponse(object):
+    """
+    The class CachedResponse holds a response, which was read from the cache. it offers
+    the same attributes as a requests response, which are used in mw4, so callers could
+    not see a difference between a fresh download and a cached one.
+
+        >>> response = CachedResponse(url=url, content=content, headers=headers)
+    """
+
+    __all__ = ['CachedResponse',
+               'text',
+               'json',
+               ]
+
+    def __init__(self,
+                 url='',
+                 content=b'',
+                 headers=None,
+                 stale=False,
+                 ):
+
+        self.url = url
+        self.status_code = 200
+        self.content = content
+        self.headers = headers or dict()
+        self.stale = stale
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class WebCache(object):
+    """
+    The class WebCache is the shared download layer for all web data sources (online
+    weather, clear outside, pypi, celestrak). responses are stored on disk together
+    with their validators (ETag, Last-Modified). each source has a time to live: as long
+    as an entry is fresh, no request is made at all. after that the entry is served
+    stale for a limited time while it is revalidated in the background and beyond that
+    it is revalidated with a conditional request before returning. if the server is not
+    reachable, the last stored response is returned as offline fallback.
+
+        >>> cache = WebCache(app=app, pathDir=pathDir)
+        >>> response = cache.get(url, source='weather')
+    """
+
+    __all__ = ['WebCache',
+               'get',
+               'clear',
+               ]
+
+    logger = logging.getLogger(__name__)
+    log = CustomLogger(logger, {})
+
+    # time to live and stale time in seconds per source
+    TTL = {
+        'weather': (600, 3600),
+        'clearOutside': (1500, 3600),
+        'pypi': (3600, 86400),
+        'tle': (7200, 86400),
+    }
+    DEFAULT_TTL = (600, 0)
+    TIMEOUT = 30
+    # query parameters holding credentials, which are never written to disk or log
+    SECRETS = ['appid', 'apikey', 'api_key', 'key', 'token', 'password']
+
+    def __init__(self,
+                 app=None,
+                 pathDir='',
+                 ):
+
+        self.app = app
+        if app is not None:
+            self.executor = app.executor
+        else:
+            self.executor = TaskExecutor()
+        self.pathDir = pathDir
+        self.lock = threading.Lock()
+
+        if pathDir:
+            os.makedirs(pathDir, exist_ok=True)
+
+    def publicUrl(self, url):
+        """
+        publicUrl removes the credentials from the url: the user info and all query
+        parameters, which hold an api key or a password. only this form of the url is
+        used for the cache key and the log.
+
+        :param url:
+        :return: url without credentials
+        """
+
+        parts = urllib.parse.urlsplit(url)
+        netloc = parts.netloc.rpartition('@')[2]
+        query = [(key, value)
+                 for key, value in urllib.parse.parse_qsl(parts.query,
+                                                          keep_blank_values=True)
+                 if key.lower() not in self.SECRETS]
+        query = urllib.parse.urlencode(query)
+        return urllib.parse.urlunsplit(parts._replace(netloc=netloc, query=query))
+
+    def hideSecrets(self, text, url):
+        """
+        hideSecrets replaces the credentials of the url in a text, e.g. in the message of
+        an exception of requests, which contains the query.
+
+        :param text:
+        :param url:
+        :return: text without credentials
+        """
+
+        parts = urllib.parse.urlsplit(url)
+        secrets = [value
+                   for key, value in urllib.parse.parse_qsl(parts.query)
+                   if key.lower() in self.SECRETS]
+        if parts.password:
+            secrets.append(parts.password)
+        for secret in secrets:
+            text = text.replace(secret, '***')
+        return text
+
+    def entryKey(self, url):
+        """
+        entryKey returns the key of the cache entry, which is the hash of the url
+        without credentials. changing the api key does not invalidate the cache.
+
+        :param url:
+        :return: key
+        """
+
+        return hashlib.sha1(self.publicUrl(url).encode('utf-8')).hexdigest()
+
+    def entryPath(self, url):
+        """
+        entryPath returns the file path of the cache entry without extension. the name
+        is the key of the entry.
+
+        :param url:
+        :return: path
+        """
+
+        return os.path.join(self.pathDir, self.entryKey(url))
+
+    def loadEntry(self, url):
+        """
+        loadEntry reads the meta data and the content of a cache entry.
+
+        :param url:
+        :return: meta, content or None, None
+        """
+
+        path = self.entryPath(url)
+        try:
+            with self.lock:
+                with open(path + '.json', 'r') as metaFile:
+                    meta = json.load(metaFile)
+                with open(path + '.data', 'rb') as dataFile:
+                    content = dataFile.read()
+        except (OSError, ValueError):
+            return None, None
+
+        if meta.get('key') != self.entryKey(url):
+            return None, None
+
+        return meta, content
+
+    def storeEntry(self, url, content, headers):
+        """
+        storeEntry writes the content and the meta data of a response. both files are
+        written to temporary files first and moved in place, so a reader never sees a
+        partly written entry.
+
+        :param url:
+        :param content:
+        :param headers:
+        :return: meta
+        """
+
+        meta = {'key': self.entryKey(url),
+                'fetched': time.time(),
+                'headers': {key: headers[key]
+                            for key in ['ETag', 'Last-Modified', 'Content-Type']
+                            if headers.get(key)},
+                }
+        path = self.entryPath(url)
+        try:
+            with self.lock:
+                with open(path + '.data.tmp', 'wb') as dataFile:
+                    dataFile.write(content)
+                with open(path + '.json.tmp', 'w') as metaFile:
+                    json.dump(meta, metaFile)
+                os.replace(path + '.data.tmp', path + '.data')
+                os.replace(path + '.json.tmp', path + '.json')
+        except OSError as e:
+            self.log.warning(f'Cannot store {self.publicUrl(url)} in cache: {e}')
+
+        return meta
+
+    def touchEntry(self, url, meta):
+        """
+        touchEntry marks an entry as fresh again after the server confirmed with 304,
+        that it did not change.
+
+        :param url:
+        :param meta:
+        :return: true for test purpose
+        """
+
+        meta['fetched'] = time.time()
+        path = self.entryPath(url)
+        try:
+            with self.lock:
+                with open(path + '.json.tmp', 'w') as metaFile:
+                    json.dump(meta, metaFile)
+                os.replace(path + '.json.tmp', path + '.json')
+        except OSError as e:
+            self.log.warning(f'Cannot update {self.publicUrl(url)} in cache: {e}')
+
+        return True
+
+    def fetch(self, url, meta=None, content=None):
+        """
+        fetch makes the request. if there is a cache entry, the request is made
+        conditional with the stored validators. a 304 answer returns the cached content,
+        a 200 answer is stored, if it has content. in case of an error the cached content
+        is returned as fallback.
+
+        :param url:
+        :param meta: meta data of the cache entry or None
+        :param content: content of the cache entry or None
+        :return: response or None
+        """
+
+        name = self.publicUrl(url)
+        headers = dict()
+        stored = meta.get('headers', dict()) if meta else dict()
+        if stored.get('ETag'):
+            headers['If-None-Match'] = stored['ETag']
+        if stored.get('Last-Modified'):
+            headers['If-Modified-Since'] = stored['Last-Modified']
+
+        try:
+            response = requests.get(url, headers=headers, timeout=self.TIMEOUT)
+        except Exception as e:
+            self.log.warning(f'{name} not reachable: {self.hideSecrets(str(e), url)}')
+            response = None
+
+        if response is not None and response.status_code == 304 and meta:
+            self.log.debug('%s: not modified', name)
+            self.touchEntry(url, meta)
+            return CachedResponse(url=url, content=content, headers=stored)
+
+        if response is not None and response.status_code == 200:
+            self.log.debug('%s: %s', name, response.status_code)
+            data = getattr(response, 'content', None)
+            if isinstance(data, (bytes, bytearray)):
+                self.storeEntry(url, bytes(data), getattr(response, 'headers', dict()))
+            return response
+
+        if response is not None:
+            self.log.error(f'{name}: status {response.status_code}')
+
+        if meta:
+            self.log.warning(f'{name}: using cached data as fallback')
+            return CachedResponse(url=url, content=content, headers=stored, stale=True)
+
+        return None
+
+    def revalidate(self, url, meta, content):
+        """
+        revalidate starts the background refresh of an entry in the io lane of the
+        executor. the task is keyed by the entry, so if there is already one running for
+        the url, no second one is started.
+
+        :param url:
+        :param meta:
+        :param content:
+        :return: success
+        """
+
+        worker = Worker(self.fetch, url, meta=meta, content=content)
+        suc = self.executor.start(worker, lane='io', key=f'webCache:{self.entryKey(url)}')
+        return suc
+
+    def get(self, url='', source=''):
+        """
+        get returns the response for url. a fresh cache entry is returned without any
+        request. an entry, which is expired for less than the stale time of the source
+        is returned and revalidated in the background. otherwise a (conditional) request
+        is made.
+
+        :param url:
+        :param source: name of the source for looking up the time to live
+        :return: response or None
+        """
+
+        if not url:
+            return None
+
+        ttl, staleTime = self.TTL.get(source, self.DEFAULT_TTL)
+        meta, content = self.loadEntry(url)
+        if meta is None:
+            return self.fetch(url)
+
+        age = time.time() - meta.get('fetched', 0)
+        headers = meta.get('headers', dict())
+        if 0 <= age < ttl:
+            self.log.debug('%s: fresh in cache', self.publicUrl(url))
+            return CachedResponse(url=url, content=content, headers=headers)
+
+        if 0 <= age < ttl + staleTime:
+            self.log.debug('%s: stale in cache, revalidating', self.publicUrl(url))
+            self.revalidate(url, meta, content)
+            return CachedResponse(url=url, content=content, headers=headers, stale=True)
+
+        return self.fetch(url, meta=meta, content=content)
+
+    def clear(self):
+        """
+        clear removes all entries from the cache
+
+        :return: true for test purpose
+        """
+
+        if not os.path.isdir(self.pathDir):
+            return True
+
+        with self.lock:
+            for name in os.listdir(self.pathDir):
+                if name.endswith(('.json', '.data', '.tmp')):
+                    os.remove(os.path.join(self.pathDir, name))
+
+        return True
@@ -0,0 +1,149 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import logging
+import time
+# external packages
+import numpy as np
+# local imports
+from mw4.base.loggerMW import CustomLogger
+
+__all__ = ['ForecastSeries',
+           ]
+
+
+class ForecastSeries(object):
+    """
+    The class ForecastSeries keeps the complete forecast of openweathermap (5 days in
+    steps of 3 hours) as numpy arrays. the values could be interpolated linearly for any
+    timestamp inside the forecast, so the refraction parameters change smoothly between
+    two downloads instead of jumping to the next forecast entry.
+
+        >>> forecast = ForecastSeries()
+        >>> forecast.update(data['list'], getDewPoint)
+        >>> values = forecast.interpolate(time.time())
+    """
+
+    __all__ = ['ForecastSeries',
+               'clear',
+               'update',
+               'interpolate',
+               ]
+
+    logger = logging.getLogger(__name__)
+    log = CustomLogger(logger, {})
+
+    KEYS = ['temperature', 'pressure', 'humidity', 'dewPoint']
+    # max time in seconds outside the forecast, where the border values are used
+    MAX_GAP = 3 * 3600
+
+    def __init__(self):
+        self.time = np.zeros(0)
+        self.values = {key: np.zeros(0) for key in self.KEYS}
+
+    def __len__(self):
+        return len(self.time)
+
+    def clear(self):
+        """
+        clear removes the forecast
+
+        :return: true for test purpose
+        """
+
+        self.time = np.zeros(0)
+        self.values = {key: np.zeros(0) for key in self.KEYS}
+        return True
+
+    @staticmethod
+    def parseEntry(entry, getDewPoint):
+        """
+        parseEntry converts one entry of the forecast list into the timestamp and the
+        values in the units used in mw4.
+
+        :param entry: dict of one forecast entry
+        :param getDewPoint: function for calculating the dew point
+        :return: timestamp, tuple of values or None, None
+        """
+
+        try:
+            timestamp = float(entry['dt'])
+            temp = entry['main']['temp'] - 273.15
+            press = entry['main']['grnd_level']
+            humidity = entry['main']['humidity']
+        except (KeyError, TypeError, ValueError):
+            return None, None
+
+        dewPoint = getDewPoint(temp, humidity)
+        return timestamp, (temp, press, humidity, dewPoint)
+
+    def update(self, entries, getDewPoint):
+        """
+        update replaces the forecast with the entries of a new download. entries without
+        timestamp or values are skipped.
+
+        :param entries: list of forecast entries
+        :param getDewPoint: function for calculating the dew point
+        :return: success
+        """
+
+        rows = list()
+        for entry in entries:
+            timestamp, values = self.parseEntry(entry, getDewPoint)
+            if timestamp is None:
+                continue
+            rows.append((timestamp, ) + values)
+
+        if not rows:
+            self.clear()
+            return False
+
+        data = np.array(sorted(rows), dtype=np.float64)
+        self.time = data[:, 0]
+        for i, key in enumerate(self.KEYS):
+            self.values[key] = data[:, i + 1]
+
+        self.log.debug(f'Forecast with [{len(self.time)}] entries')
+        return True
+
+    def interpolate(self, timestamp=None):
+        """
+        interpolate returns the linear interpolated values for timestamp. outside of the
+        forecast the border values are used up to MAX_GAP, beyond that there are no
+        values.
+
+        :param timestamp: unix timestamp, None for now
+        :return: dict of values or None
+        """
+
+        if not len(self.time):
+            return None
+
+        if timestamp is None:
+            timestamp = time.time()
+
+        if timestamp < self.time[0] - self.MAX_GAP:
+            return None
+        if timestamp > self.time[-1] + self.MAX_GAP:
+            return None
+
+        values = {key: float(np.interp(timestamp, self.time, self.values[key]))
+                  for key in self.KEYS}
+        return values
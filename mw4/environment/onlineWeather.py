@@ -22,10 +22,10 @@ import logging
 # external packages
 import PyQt5.QtCore
 import numpy as np
-import requests
 # local imports
 from mw4.base.loggerMW import CustomLogger
 from mw4.base.tpool import Worker
+from mw4.environment.forecastSeries import ForecastSeries
 
 
 class WeatherSignals(PyQt5.QtCore.QObject):
@@ -80,6 +80,7 @@ class OnlineWeather(PyQt5.QtCore.QObject):
         self.name = ''
 
         self.data = {}
+        self.forecast = ForecastSeries()
         self.running = False
 
         self._keyAPI = ''
@@ -128,6 +129,7 @@ class OnlineWeather(PyQt5.QtCore.QObject):
 
         self.running = False
         self.data.clear()
+        self.forecast.clear()
 
         return True
 
@@ -179,6 +181,7 @@ class OnlineWeather(PyQt5.QtCore.QObject):
 
         val = data['list'][0]
         self.log.debug(f'onlineWeatherData:[{val}]')
+        self.forecast.update(data['list'], self.getDewPoint)
 
         if 'main' in val:
             self.data['temperature'] = val['main']['temp'] - 273.15
@@ -200,7 +203,8 @@ class OnlineWeather(PyQt5.QtCore.QObject):
 
     def getOpenWeatherMapDataWorker(self, url=''):
         """
-        getOpenWeatherMapDataWorker fetches a given url and does the error handling.
+        getOpenWeatherMapDataWorker fetches a given url through the shared web cache,
+        which does the conditional requests and the error handling.
 
         :param url:
         :return: data
@@ -209,20 +213,17 @@ class OnlineWeather(PyQt5.QtCore.QObject):
         if not url:
             return None
 
-        try:
-            data = requests.get(url, timeout=30)
-        except TimeoutError:
-            self.log.error(f'{url} not reachable')
+        data = self.app.webCache.get(url=url, source='weather')
+        if data is None:
             return None
+
+        try:
+            value = data.json()
         except Exception as e:
             self.log.critical(f'{url} general exception: {e}')
             return None
 
-        if data.status_code != 200:
-            self.log.error(f'{url}: status nok')
-            return None
-
-        return data.json()
+        return value
 
     def getOpenWeatherMapData(self, url=''):
         """
@@ -234,9 +235,9 @@ class OnlineWeather(PyQt5.QtCore.QObject):
 
         worker = Worker(self.getOpenWeatherMapDataWorker, url)
         worker.signals.result.connect(self.updateOpenWeatherMapDataWorker)
-        self.threadPool.start(worker)
+        suc = self.app.executor.start(worker, lane='io', key='onlineWeather')
 
-        return True
+        return suc
 
     def updateOpenWeatherMapData(self):
         """
@@ -0,0 +1,165 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2019
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import logging
+
+# external packages
+import PyQt5.QtWidgets
+
+# local import
+from mw4.base.loggerMW import CustomLogger
+from mw4.base.metrics import registry
+from mw4.gui import widget
+from mw4.gui.widgets import diagnostics_ui
+
+
+class DiagnosticsWindow(widget.MWidget):
+    """
+    the diagnostics window class shows the actual values of all metrics, which are
+    served in prometheus format as well. the table is refreshed every second.
+
+    """
+
+    __all__ = ['DiagnosticsWindow',
+               ]
+
+    logger = logging.getLogger(__name__)
+    log = CustomLogger(logger, {})
+
+    def __init__(self, app):
+        super().__init__()
+        self.app = app
+        self.ui = diagnostics_ui.Ui_DiagnosticsDialog()
+        self.ui.setupUi(self)
+        self.initUI()
+
+        header = self.ui.metrics.horizontalHeader()
+        header.setSectionResizeMode(0, PyQt5.QtWidgets.QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(1, PyQt5.QtWidgets.QHeaderView.ResizeToContents)
+
+        self.initConfig()
+
+    def initConfig(self):
+        """
+        initConfig read the key out of the configuration dict and stores it to the gui
+        elements. if some initialisations have to be proceeded with the loaded persistent
+        data, they will be launched as well in this method.
+
+        :return: True for test purpose
+        """
+
+        if 'diagnosticsW' not in self.app.config:
+            self.app.config['diagnosticsW'] = {}
+        config = self.app.config['diagnosticsW']
+        x = config.get('winPosX', 100)
+        y = config.get('winPosY', 100)
+        if x > self.screenSizeX:
+            x = 0
+        if y > self.screenSizeY:
+            y = 0
+        self.move(x, y)
+        height = config.get('height', 600)
+        self.resize(800, height)
+        self.ui.filterText.setText(config.get('filterText', ''))
+        self.showWindow()
+
+        return True
+
+    def storeConfig(self):
+        """
+        storeConfig writes the keys to the configuration dict and stores. if some
+        saving has to be proceeded to persistent data, they will be launched as
+        well in this method.
+
+        :return: True for test purpose
+        """
+        if 'diagnosticsW' not in self.app.config:
+            self.app.config['diagnosticsW'] = {}
+        config = self.app.config['diagnosticsW']
+        config['winPosX'] = self.pos().x()
+        config['winPosY'] = self.pos().y()
+        config['height'] = self.height()
+        config['filterText'] = self.ui.filterText.text()
+
+        return True
+
+    def closeEvent(self, closeEvent):
+        self.storeConfig()
+
+        # gui signals
+        self.ui.dumpTrace.clicked.disconnect(self.dumpTrace)
+        self.ui.filterText.textChanged.disconnect(self.updateMetrics)
+        self.app.update1s.disconnect(self.updateMetrics)
+
+        super().closeEvent(closeEvent)
+
+    def showWindow(self):
+        self.show()
+        self.updateMetrics()
+
+        # gui signals
+        self.ui.dumpTrace.clicked.connect(self.dumpTrace)
+        self.ui.filterText.textChanged.connect(self.updateMetrics)
+        self.app.update1s.connect(self.updateMetrics)
+
+    def updateMetrics(self):
+        """
+        updateMetrics writes the summary of all metrics to the table. rows are filtered
+        by the text of the filter field.
+
+        :return: number of rows shown
+        """
+
+        port = self.app.metricsServer.port
+        if port:
+            self.ui.metricsUrl.setText(f'http://localhost:{port}/metrics')
+        else:
+            self.ui.metricsUrl.setText('metrics server not running')
+
+        filterText = self.ui.filterText.text().lower()
+        rows = [row for row in registry.summary()
+                if filterText in row[0].lower() or filterText in row[1].lower()]
+
+        table = self.ui.metrics
+        table.setRowCount(len(rows))
+        for i, row in enumerate(rows):
+            for j, text in enumerate(row):
+                item = table.item(i, j)
+                if item is None:
+                    item = PyQt5.QtWidgets.QTableWidgetItem()
+                    table.setItem(i, j, item)
+                item.setText(text)
+
+        return len(rows)
+
+    def dumpTrace(self):
+        """
+        dumpTrace writes the trace of the device communication to the work dir
+
+        :return: success
+        """
+
+        filePath = self.app.dumpTrace()
+        if filePath is None:
+            self.app.message.emit('Device trace could not be written', 2)
+            return False
+
+        self.app.message.emit(f'Device trace written to [{filePath}]', 0)
+        return True
@@ -20,6 +20,7 @@
 # standard libraries
 import logging
 import gc
+import time
 # external packages
 import PyQt5
 import numpy as np
@@ -28,6 +29,7 @@ import matplotlib.patches as mpatches
 import matplotlib.pyplot as plt
 # local import
 from mw4.base.loggerMW import CustomLogger
+from mw4.base.tpool import Worker
 from mw4.gui import widget
 from mw4.gui.widgets import hemisphere_ui
 from mw4.gui.hemisphereWext import HemisphereWindowExt
@@ -93,6 +95,9 @@ class HemisphereWindow(widget.MWidget, HemisphereWindowExt):
         self.pointsBuildAnnotate = list()
         self.starsAlign = None
         self.starsAlignAnnotate = list()
+        self.starsAlignPos = None
+        self.starsCatalog = None
+        self.starsCatalogPos = None
         self.horizonFill = None
         self.horizonMarker = None
         self.meridianSlew = None
@@ -368,6 +373,8 @@ class HemisphereWindow(widget.MWidget, HemisphereWindowExt):
         if self.hemisphereMat.figure.axes and self.hemisphereBack:
             axe = self.hemisphereMat.figure.axes[0]
             axe.figure.canvas.restore_region(self.hemisphereBack)
+            if self.starsCatalog is not None:
+                axe.draw_artist(self.starsCatalog)
             axe.draw_artist(self.starsAlign)
             for annotation in self.starsAlignAnnotate:
                 axe.draw_artist(annotation)
@@ -565,28 +572,64 @@ class HemisphereWindow(widget.MWidget, HemisphereWindowExt):
         axes = self.hemisphereMat.figure.axes[0]
         hip = self.app.hipparcos
         hip.calculateAlignStarPositionsAltAz()
+
+        # the catalogue stars are calculated in the background and shown in the slot
+        worker = Worker(hip.workerCatalogPositions)
+        worker.signals.result.connect(self.updateCatalogStars)
+        self.app.executor.start(worker, lane='compute', key='catalogPositions')
+
+        # if the star list changed, we have to generate the annotations completely new
+        if len(self.starsAlignAnnotate) != len(hip.name):
+            self.drawAlignmentStars(axes=axes)
+            return True
+
+        # only the annotations, which moved at least one pixel on screen are updated
+        # and if nothing moved, there is no need to blit the stars layer again. the
+        # positions are stored only for the moved stars, so slow stars are compared to
+        # the position their annotation really has and move after some updates.
+        pos = axes.transData.transform(np.column_stack((hip.az, hip.alt)))
+        if self.starsAlignPos is None or len(self.starsAlignPos) != len(pos):
+            moved = np.ones(len(pos), dtype=bool)
+            self.starsAlignPos = pos.copy()
+        else:
+            moved = np.any(np.abs(pos - self.starsAlignPos) >= 1, axis=1)
+            self.starsAlignPos[moved] = pos[moved]
+
+        if not moved.any():
+            return True
+
         self.starsAlign.set_data(hip.az, hip.alt)
-        for i, starAnnotation in enumerate(self.starsAlignAnnotate):
-            starAnnotation.remove()
-        self.starsAlignAnnotate = list()
+        for i in np.nonzero(moved)[0]:
+            self.starsAlignAnnotate[i].xy = (hip.az[i], hip.alt[i])
+        self.drawBlitStars()
+        return True
 
-        # due to the fact that all annotation are only shown if in axes when coordinate
-        # are in data, after some time, no annotation will be shown, because just moved.
-        # therefore we add each time the annotation again.
+    def updateCatalogStars(self, result):
+        """
+        updateCatalogStars is the result slot of the catalogue star calculation. the
+        stars layer is only blit again, if the stars changed or moved at least one pixel
+        on screen.
 
-        visible = self.ui.checkShowAlignStar.isChecked()
-        for alt, az, name in zip(hip.alt, hip.az, hip.name):
-            annotation = axes.annotate(name,
-                                       xy=(az, alt),
-                                       xytext=(2, 2),
-                                       textcoords='offset points',
-                                       xycoords='data',
-                                       color='#808080',
-                                       fontsize=12,
-                                       clip_on=True,
-                                       visible=visible,
-                                       )
-            self.starsAlignAnnotate.append(annotation)
+        :param result: result of workerCatalogPositions
+        :return: success
+        """
+
+        hip = self.app.hipparcos
+        if not hip.applyCatalogPositions(result):
+            return False
+        if self.starsCatalog is None:
+            return False
+        if not self.hemisphereMat.figure.axes:
+            return False
+
+        axes = self.hemisphereMat.figure.axes[0]
+        pos = axes.transData.transform(np.column_stack((hip.catalogAz, hip.catalogAlt)))
+        isSame = self.starsCatalogPos is not None and len(self.starsCatalogPos) == len(pos)
+        if isSame and not np.any(np.abs(pos - self.starsCatalogPos) >= 1):
+            return False
+
+        self.starsCatalog.set_data(hip.catalogAz, hip.catalogAlt)
+        self.starsCatalogPos = pos
         self.drawBlitStars()
         return True
 
@@ -842,6 +885,17 @@ class HemisphereWindow(widget.MWidget, HemisphereWindowExt):
         self.starsAlignAnnotate = list()
         hip = self.app.hipparcos
         hip.calculateAlignStarPositionsAltAz()
+        # stars of the large catalogue are shown as faint background without names. the
+        # positions are updated in the background with updateAlignStar
+        self.starsCatalog, = axes.plot(hip.catalogAz,
+                                       hip.catalogAlt,
+                                       marker='.',
+                                       markersize=2,
+                                       linestyle='',
+                                       color='#606060',
+                                       zorder=-25,
+                                       visible=visible,
+                                       )
         self.starsAlign, = axes.plot(hip.az,
                                      hip.alt,
                                      marker=self.markerStar(),
@@ -863,6 +917,8 @@ class HemisphereWindow(widget.MWidget, HemisphereWindowExt):
                                        visible=visible,
                                        )
             self.starsAlignAnnotate.append(annotation)
+        self.starsAlignPos = None
+        self.starsCatalogPos = None
         self.drawBlitStars()
         return True
 
@@ -882,9 +938,11 @@ class HemisphereWindow(widget.MWidget, HemisphereWindowExt):
 
         # clearing axes before drawing, only static visible, dynamic only when content
         # is available. visibility is handled with their update method
+        timeStart = time.perf_counter()
         self.hemisphereMat.figure.canvas.draw()
         axes = self.setupAxes(widget=self.hemisphereMat)
         # calling renderer
         self.drawHemisphereStatic(axes=axes)
         self.drawHemisphereMoving(axes=axes)
         self.drawAlignmentStars(axes=axes)
+        widget.redrawTime.observe(time.perf_counter() - timeStart, window='hemisphere')
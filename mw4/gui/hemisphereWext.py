@@ -36,6 +36,9 @@ class HemisphereWindowExt(object):
     __all__ = ['HemisphereWindowExt',
                ]
 
+    # search radius in degrees on sphere for selecting points with the mouse
+    EPSILON_SPHERE = 3
+
     @staticmethod
     def markerPoint():
         """
@@ -125,36 +128,6 @@ class HemisphereWindowExt(object):
 
         return True
 
-    @staticmethod
-    def getIndexPoint(event=None, plane=None, epsilon=2):
-        """
-        getIndexPoint returns the index of the point which is nearest to the coordinate
-        of the mouse click when the click is in distance epsilon of the points. otherwise
-        no index will be returned.
-
-        :param event: data of the mouse clicked event
-        :param plane: coordinates as tuples (alt, az)
-        :param epsilon:
-        :return: index or none
-        """
-
-        if event is None:
-            return None
-        if plane is None:
-            return None
-        if len(plane) == 0:
-            return None
-
-        xt = np.asarray([i[1] for i in plane])
-        yt = np.asarray([i[0] for i in plane])
-        d = np.sqrt((xt - event.xdata)**2 / 16 + (yt - event.ydata)**2)
-        index = d.argsort()[:1][0]
-        # position to far away
-        if d[index] >= epsilon:
-            return None
-        index = int(index)
-        return index
-
     @staticmethod
     def getIndexPointX(event=None, plane=None):
         """
@@ -261,7 +234,9 @@ class HemisphereWindowExt(object):
         :return: success
         """
 
-        index = self.getIndexPoint(event=event, plane=data.horizonP)
+        index = data.getIndexHorizonP(alt=event.ydata,
+                                      az=event.xdata,
+                                      radius=self.EPSILON_SPHERE)
         suc = False
         if len(data.horizonP) > 2:
             suc = data.delHorizonP(position=index)
@@ -303,7 +278,7 @@ class HemisphereWindowExt(object):
         :return:
         """
 
-        index = self.getIndexPoint(event=event, plane=data.buildP, epsilon=360)
+        index = data.getIndexBuildP(alt=event.ydata, az=event.xdata)
         # if no point found, add at the end
         if index is None:
             index = len(data.buildP)
@@ -362,7 +337,11 @@ class HemisphereWindowExt(object):
         :return: success
         """
 
-        index = self.getIndexPoint(event=event, plane=data.buildP)
+        index = data.getIndexBuildP(alt=event.ydata,
+                                    az=event.xdata,
+                                    radius=self.EPSILON_SPHERE)
+        if index is None:
+            return False
         suc = data.delBuildP(position=index)
         if suc:
             self.pointsBuildAnnotate[index].remove()
@@ -446,13 +425,13 @@ class HemisphereWindowExt(object):
             return False
 
         hip = self.app.hipparcos
-        plane = list(zip(hip.alt, hip.az))
-        index = self.getIndexPoint(event=event, plane=plane, epsilon=2)
-        if index is None:
+        name = hip.getAlignStarNameFromAltAz(alt=event.ydata,
+                                             az=event.xdata,
+                                             radius=self.EPSILON_SPHERE)
+        if name is None:
             return False
 
-        name = hip.name[index]
-        ra, dec = hip.getAlignStarRaDecFromName(hip.name[index])
+        ra, dec = hip.getAlignStarRaDecFromName(name)
 
         textFormat = 'Align: {0}\nDo you want to slew the mount to:\n\n{1}'
         question = textFormat.format(alignType, name)
@@ -20,20 +20,21 @@
 # standard libraries
 import logging
 import os
+import time
 # external packages
 import PyQt5.QtWidgets
-from astropy.io import fits
 from astropy import wcs
-from astropy.nddata import Cutout2D
-from astropy.visualization import AsymmetricPercentileInterval
-from astropy.visualization import SqrtStretch
-from astropy.visualization import ImageNormalize
 import matplotlib.pyplot as plt
+import matplotlib.ticker as ticker
 from skyfield.api import Angle
-import numpy as np
 import cv2
 # local import
 from mw4.base.loggerMW import CustomLogger
+from mw4.base.tpool import Worker
+from mw4.base import fitsAccess
+from mw4.imaging.stackEngine import StackEngine
+from mw4.imaging.stretchEngine import StretchEngine
+from mw4.imaging.tilePyramid import TilePyramid
 from mw4.gui import widget
 from mw4.gui.widgets import image_ui
 from mw4.base import transform
@@ -79,13 +80,16 @@ class ImageWindow(widget.MWidget):
 
         self.imageFileName = ''
         self.imageFileNameOld = ''
-        self.imageStack = None
-        self.raStack = 0
-        self.decStack = 0
-        self.angleStack = 0
-        self.scaleStack = 0
+        self.stackEngine = StackEngine()
         self.numberStack = 0
         self.folder = ''
+        self.imageJob = 0
+        self.mutexFrame = PyQt5.QtCore.QMutex()
+        self.frame = None
+        self.stretchEngine = StretchEngine(processPool=self.app.processPool)
+        self.pyramid = TilePyramid()
+        self.imageCenter = None
+        self.imageOffset = (0, 0)
 
         self.deviceStat = {
             'expose': False,
@@ -115,6 +119,8 @@ class ImageWindow(widget.MWidget):
 
         self.imageMat = self.embedMatplot(self.ui.image, constrainedLayout=False)
         self.imageMat.parentWidget().setStyleSheet(self.BACK_BG)
+        self.imageMat.figure.canvas.mpl_connect('button_press_event',
+                                                self.onMouseImage)
 
         # cyclic updates
         self.app.update1s.connect(self.updateWindowsStats)
@@ -361,13 +367,36 @@ class ImageWindow(widget.MWidget):
 
         return True
 
-    def writeHeaderToGUI(self, header=None):
+    @staticmethod
+    def readWCS(header=None):
+        """
+        readWCS checks if there is a wcs solution in the header and builds the wcs object.
+        as this might take some time, it is done in the image processing worker.
+
+        :param header: header of fits file
+        :return: hasCelestial, hasDistortion, wcsObject
+        """
+
+        if 'CTYPE1' in header:
+            wcsObject = wcs.WCS(header, relax=True)
+            hasCelestial = wcsObject.has_celestial
+            hasDistortion = wcsObject.has_distortion
+        else:
+            wcsObject = None
+            hasCelestial = False
+            hasDistortion = False
+
+        return hasCelestial, hasDistortion, wcsObject
+
+    def writeHeaderToGUI(self, header=None, hasCelestial=False, hasDistortion=False):
         """
         writeHeaderToGUI tries to read relevant values from FITS header and possible
         replace values and write them to the imageW gui
 
         :param header: header of fits file
-        :return: hasCelestial, hasDistortion
+        :param hasCelestial: wcs solution found in header
+        :param hasDistortion: wcs distortion found in header
+        :return: true for test purpose
         """
 
         name = header.get('OBJECT', '').upper()
@@ -410,76 +439,10 @@ class ImageWindow(widget.MWidget):
         flipped = bool(header.get('FLIPPED', False))
         self.ui.isFlipped.setEnabled(flipped)
 
-        # check if distortion is in header
-        if 'CTYPE1' in header:
-            wcsObject = wcs.WCS(header, relax=True)
-            hasCelestial = wcsObject.has_celestial
-            hasDistortion = wcsObject.has_distortion
-        else:
-            wcsObject = None
-            hasCelestial = False
-            hasDistortion = False
-
         self.ui.hasDistortion.setEnabled(hasDistortion)
         self.ui.hasWCS.setEnabled(hasCelestial)
 
-        return hasDistortion, wcsObject
-
-    def zoomImage(self, image=None, wcsObject=None):
-        """
-        zoomImage cutouts a portion of the original image to zoom in the image itself.
-        it returns a copy of the image with an updated wcs content. we have to be careful
-        about the use of Cutout2D, because they are mixing x and y coordinates. so position
-        is in (x, y), but size ind in (y, x)
-
-        :param image:
-        :param wcsObject:
-        :return:
-        """
-
-        if image is None:
-            return None
-
-        sizeY, sizeX = image.shape
-        factor = self.zoomLevel[self.ui.zoom.currentText()]
-        position = (int(sizeX / 2), int(sizeY / 2))
-        size = (int(sizeY / factor), int(sizeX / factor))
-
-        cutout = Cutout2D(image,
-                          position=position,
-                          size=size,
-                          wcs=wcsObject,
-                          copy=True,
-                          )
-
-        return cutout.data
-
-    def stretchImage(self, image=None):
-        """
-        stretchImage take the actual image and calculated norm based on the min, max
-        derived from interval which is calculated with AsymmetricPercentileInterval.
-
-        :param image: image
-        :return: norm for plot
-        """
-
-        if image is None:
-            return None
-
-        values = self.stretchValues[self.ui.stretch.currentText()]
-        interval = AsymmetricPercentileInterval(*values)
-        vmin, vmax = interval.get_limits(image)
-        # cutout the noise
-        delta = vmax - vmin
-        vmin = min(vmin + delta * 0.01, vmax)
-
-        norm = ImageNormalize(image,
-                              vmin=vmin,
-                              vmax=vmax,
-                              stretch=SqrtStretch(),
-                              )
-
-        return norm, vmin, vmax
+        return True
 
     def colorImage(self):
         """
@@ -544,7 +507,8 @@ class ImageWindow(widget.MWidget):
     def setupNormal(self, figure=None, header=None):
         """
         setupNormal build the image widget to show it with pixels as axes. the center of
-        the image will have coordinates 0,0.
+        the image will have coordinates 0,0. the image itself is placed with its extent,
+        so the axes show the right pixels for every zoom and pan position.
 
         :param figure:
         :param header:
@@ -564,28 +528,13 @@ class ImageWindow(widget.MWidget):
         axe.tick_params(axis='x', which='major', colors=self.M_BLUE, labelsize=12)
         axe.tick_params(axis='y', which='major', colors=self.M_BLUE, labelsize=12)
 
-        factor = self.zoomLevel[self.ui.zoom.currentText()]
-        sizeX = header.get('NAXIS1', 1) / factor
-        sizeY = header.get('NAXIS2', 1) / factor
-        midX = int(sizeX / 2)
-        midY = int(sizeY / 2)
         number = 10
-
-        valueX, _ = np.linspace(-midX, midX, num=number, retstep=True)
-        textX = list((str(int(x)) for x in valueX))
-        ticksX = list((x + midX for x in valueX))
-        axe.set_xticklabels(textX)
-        axe.set_xticks(ticksX)
-
-        valueY, _ = np.linspace(-midY, midY, num=number, retstep=True)
-        textY = list((str(int(x)) for x in valueY))
-        ticksY = list((x + midY for x in valueY))
-        axe.set_yticklabels(textY)
-        axe.set_yticks(ticksY)
+        axe.xaxis.set_major_locator(ticker.MaxNLocator(number))
+        axe.yaxis.set_major_locator(ticker.MaxNLocator(number))
 
         if self.ui.checkShowCrosshair.isChecked():
-            axe.axvline(midX, color=self.M_RED)
-            axe.axhline(midY, color=self.M_RED)
+            axe.axvline(0, color=self.M_RED)
+            axe.axhline(0, color=self.M_RED)
         if self.ui.checkShowGrid.isChecked():
             axe.grid(True, color=self.M_BLUE, ls='solid', alpha=0.5)
 
@@ -595,47 +544,48 @@ class ImageWindow(widget.MWidget):
 
     def stackImages(self, imageData=None, header=None):
         """
+        stackImages adds the image to the live stack. the frames are aligned to the
+        first frame of the stack by wcs or star field and the running mean is returned.
+        it is called from the image worker, so it runs outside the gui thread.
 
         :param imageData:
-        :param header: is only used, when stacking with alignment
-        :return:
+        :param header: used for alignment by wcs
+        :return: mean of the stack
         """
 
-        if np.shape(imageData) != np.shape(self.imageStack):
-            self.imageStack = None
-
-        # if first image, we just store the data as reference frame
-        if self.imageStack is None:
-            self.imageStack = imageData
-            self.numberStack = 1
-            return imageData
+        imageData = self.stackEngine.add(image=imageData, header=header)
+        self.numberStack = self.stackEngine.number
+        return imageData
 
-        # now we are going to stack the results
-        self.numberStack += 1
-        self.imageStack = np.add(self.imageStack, imageData)
-        return self.imageStack / self.numberStack
-
-    def showImage(self, imagePath=''):
+    def isStaleJob(self, job):
         """
-        showImage shows the fits image. therefore it calculates color map, stretch,
-        zoom and other topics.
+        isStaleJob checks if a newer image was requested in the meantime. in this case the
+        running processing could stop as the result will never be shown.
 
-        :param imagePath:
-        :return: success
+        :param job: number of the processing job
+        :return: status
         """
 
-        if not imagePath:
-            return False
-        if not os.path.isfile(imagePath):
-            return False
+        return job != self.imageJob
 
-        self.imageFileName = imagePath
-        full, short, ext = self.extractNames([imagePath])
-        self.ui.imageFileName.setText(short)
+    def loadFrame(self, imagePath='', params=None):
+        """
+        loadFrame loads the fits file, applies debayering, header corrections and
+        stacking, parses the wcs data and hands the frame over to the stretch engine.
+        the result is stored in self.frame and reused as long as the file is not changed,
+        so changing zoom, stretch or color does not need to load the file again.
+
+        :param imagePath: full path to fits file
+        :param params: settings from gui
+        :return: frame dict
+        """
 
-        with fits.open(imagePath, mode='update') as fitsHandle:
-            imageData = fitsHandle[0].data
-            header = fitsHandle[0].header
+        frameKey = (imagePath, os.path.getmtime(imagePath), params['stack'])
+        if self.frame is not None and self.frame['key'] == frameKey:
+            return self.frame
+
+        # the data is memory mapped, only the pages needed are read from disk
+        imageData, header = fitsAccess.readImage(imagePath)
 
         # check the bayer options, i normally us only RGGB pattern
         # todo: if it's an exposure directly, I get a bayer mosaic ??
@@ -649,38 +599,204 @@ class ImageWindow(widget.MWidget):
         if header.get('CTYPE2', '').endswith('DEF'):
             header['CTYPE2'] = header['CTYPE2'].replace('DEF', 'TAN')
 
-        if self.ui.checkStackImages.isChecked():
+        if params['stack']:
             imageData = self.stackImages(imageData=imageData, header=header)
-            self.ui.numberStacks.setText(f'mean of: {self.numberStack:4.0f}')
         else:
-            self.imageStack = None
-            self.ui.numberStacks.setText('single')
+            self.stackEngine.reset()
 
         # check the data content and capabilities
-        hasDistortion, wcsObject = self.writeHeaderToGUI(header=header)
+        hasCelestial, hasDistortion, wcsObject = self.readWCS(header=header)
+
+        # the histogram for stretching and the pyramid for zooming are built once
+        self.stretchEngine.setImage(imageData)
+        self.pyramid.build(self.stretchEngine.image)
+
+        self.frame = {
+            'key': frameKey,
+            'header': header,
+            'numberStack': self.numberStack,
+            'hasCelestial': hasCelestial,
+            'hasDistortion': hasDistortion,
+            'wcsObject': wcsObject,
+        }
+        return self.frame
+
+    def showImageWorker(self, job=0, imagePath='', params=None):
+        """
+        showImageWorker does the whole image processing in a thread. it gets the frame
+        data, selects the visible part from the tile pyramid and applies stretch and color
+        map via the lookup table of the stretch engine. the result is a rgba buffer, which
+        could be shown directly.
+        as reading the gui elements is not allowed in a thread, all settings are given in
+        params. the processing stops as early as possible, if a newer image is requested.
+
+        :param job: number of the processing job
+        :param imagePath: full path to fits file
+        :param params: settings from gui
+        :return: result dict or None if job is stale
+        """
+
+        # frame data and stretch engine are shared, so only one job could work on them
+        self.mutexFrame.lock()
+        try:
+            if self.isStaleJob(job):
+                return None
+
+            frame = self.loadFrame(imagePath=imagePath, params=params)
+
+            if self.isStaleJob(job):
+                return None
+
+            # zooming and panning selects a slice of the matching pyramid level
+            imageData, extent = self.pyramid.view(factor=params['zoom'],
+                                                  center=params['center'],
+                                                  displaySize=params['display'])
+            if imageData is None:
+                imageData = self.stretchEngine.image
+
+            # stretching and coloring in one pass through the lookup table
+            imageRGBA = self.stretchEngine.apply(values=params['stretch'],
+                                                 colorMap=params['color'],
+                                                 image=imageData)
+        finally:
+            self.mutexFrame.unlock()
+
+        result = {
+            'job': job,
+            'imagePath': imagePath,
+            'header': frame['header'],
+            'image': imageRGBA,
+            'extent': extent,
+            'numberStack': frame['numberStack'],
+            'hasCelestial': frame['hasCelestial'],
+            'hasDistortion': frame['hasDistortion'],
+            'wcsObject': frame['wcsObject'],
+        }
+        return result
 
-        # process the image for viewing: stretching
-        imageData = self.zoomImage(image=imageData, wcsObject=wcsObject)
+    def showImageResult(self, result=None):
+        """
+        showImageResult is the partner method of showImageWorker and runs in the gui
+        thread. it writes the header data to the gui, sets up the axes and shows the
+        prepared rgba buffer. results of stale jobs are dropped.
 
-        # normalization
-        norm, iMin, iMax = self.stretchImage(image=imageData)
+        :param result: result dict of showImageWorker
+        :return: success
+        """
 
-        # we process a colormap if we have a greyscale image
-        colorMap = self.colorImage()
+        if not result:
+            return False
+        if self.isStaleJob(result['job']):
+            return False
+
+        timeStart = time.perf_counter()
+        if self.ui.checkStackImages.isChecked():
+            self.ui.numberStacks.setText(f'mean of: {result["numberStack"]:4.0f}')
+        else:
+            self.ui.numberStacks.setText('single')
+
+        header = result['header']
+        self.writeHeaderToGUI(header=header,
+                              hasCelestial=result['hasCelestial'],
+                              hasDistortion=result['hasDistortion'],
+                              )
 
         # check the data content and capabilities
         useWCS = self.ui.checkUseWCS.isChecked()
 
         # check which type of presentation we would like to have
-        if hasDistortion and useWCS:
-            fig, axe = self.setupDistorted(figure=self.imageMat.figure, wcsObject=wcsObject)
+        # wcs axes need the raw pixel coordinates, normal axes are centered
+        if result['hasDistortion'] and useWCS:
+            fig, axe = self.setupDistorted(figure=self.imageMat.figure,
+                                           wcsObject=result['wcsObject'])
+            self.imageOffset = (0, 0)
         else:
             fig, axe = self.setupNormal(figure=self.imageMat.figure, header=header)
+            self.imageOffset = (header.get('NAXIS1', 0) / 2, header.get('NAXIS2', 0) / 2)
+
+        extent = result.get('extent')
+        if extent is not None:
+            offX, offY = self.imageOffset
+            extent = (extent[0] - offX, extent[1] - offX,
+                      extent[2] - offY, extent[3] - offY)
 
         # finally show it
-        axe.imshow(imageData, norm=norm, cmap=colorMap, origin='lower')
+        axe.imshow(result['image'], origin='lower', extent=extent)
         axe.figure.canvas.draw()
 
+        widget.redrawTime.observe(time.perf_counter() - timeStart, window='image')
+        return True
+
+    def showImageError(self, errorString=''):
+        """
+        showImageError reports a failed processing of the image, e.g. for a corrupt file.
+
+        :param errorString: error of the worker
+        :return: true for test purpose
+        """
+
+        self.app.message.emit(f'Could not show image: {errorString}', 2)
+        return True
+
+    def showImage(self, imagePath=''):
+        """
+        showImage shows the fits image. the processing of the image is done in a thread
+        and therefore showImage only collects the settings from the gui and starts the
+        worker. each call gets a new job number, so older jobs still running could be
+        dropped.
+
+        :param imagePath:
+        :return: success
+        """
+
+        if not imagePath:
+            return False
+        if not os.path.isfile(imagePath):
+            return False
+
+        self.imageFileName = imagePath
+        full, short, ext = self.extractNames([imagePath])
+        self.ui.imageFileName.setText(short)
+
+        params = {
+            'stack': self.ui.checkStackImages.isChecked(),
+            'zoom': self.zoomLevel[self.ui.zoom.currentText()],
+            'stretch': self.stretchValues[self.ui.stretch.currentText()],
+            'color': self.colorImage(),
+            'center': self.imageCenter,
+            'display': self.imageMat.figure.canvas.get_width_height(),
+        }
+
+        self.imageJob += 1
+        worker = Worker(self.showImageWorker,
+                        job=self.imageJob,
+                        imagePath=imagePath,
+                        params=params,
+                        )
+        worker.signals.result.connect(self.showImageResult)
+        worker.signals.error.connect(self.showImageError)
+        # no key: the newest job has to run, older ones are dropped by their job number
+        self.app.executor.start(worker, lane='compute')
+
+        return True
+
+    def onMouseImage(self, event):
+        """
+        onMouseImage handles the mouse events on the image. a double click sets the
+        clicked pixel as new center for the zoomed view.
+
+        :param event: mouse events
+        :return: success
+        """
+
+        if not event.inaxes:
+            return False
+        if event.button != 1 or not event.dblclick:
+            return False
+
+        offX, offY = self.imageOffset
+        self.imageCenter = (event.xdata + offX, event.ydata + offY)
+        self.showCurrent()
         return True
 
     def showCurrent(self):
@@ -752,7 +868,7 @@ class ImageWindow(widget.MWidget):
         :return: success
         """
 
-        self.imageStack = None
+        self.stackEngine.reset()
         self.deviceStat['expose'] = True
         self.ui.checkStackImages.setChecked(False)
         self.app.camera.signals.saved.connect(self.exposeImageDone)
@@ -790,7 +906,7 @@ class ImageWindow(widget.MWidget):
         :return: success
         """
 
-        self.imageStack = None
+        self.stackEngine.reset()
         self.deviceStat['exposeN'] = True
         self.app.camera.signals.saved.connect(self.exposeImageNDone)
         self.exposeRaw()
@@ -524,7 +524,9 @@ class MainWindow(MWidget,
             text = 'Internet Online Mode'
         else:
             text = 'Offline Mode'
-        text = f'{self.threadPool.activeThreadCount():2d} - {text}'
+        threads = self.threadPool.activeThreadCount()
+        threads += self.app.executor.activeThreadCount()
+        text = f'{threads:2d} - {text}'
         self.ui.statusOnline.setTitle(text)
 
     def updateAstrometryStatus(self, text):
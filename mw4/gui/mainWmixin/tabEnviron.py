@@ -18,19 +18,22 @@
 #
 ###########################################################
 # standard libraries
+import time
 
 # external packages
 import PyQt5.QtCore
 import PyQt5.QtGui
 import PyQt5.QtWidgets
 import PyQt5.uic
-import requests
 import numpy as np
 import qimage2ndarray
 from skyfield import almanac
 
 # local import
 from mw4.base.tpool import Worker
+from mw4.base.streamFilter import FilterChain
+from mw4.base.streamFilter import OutlierFilter
+from mw4.base.streamFilter import RunningMean
 
 
 class EnvironGui(object):
@@ -54,8 +57,11 @@ class EnvironGui(object):
 
         self.refractionSource = ''
         self.moonPhasePercent = 0
-        self.filteredTemperature = None
-        self.filteredPressure = None
+        self.filterTemperature = FilterChain(OutlierFilter(minDeviation=0.5),
+                                             RunningMean(size=100))
+        self.filterPressure = FilterChain(OutlierFilter(minDeviation=1),
+                                          RunningMean(size=100))
+        self.clearOutsideKey = None
 
         # environment functions
         signals = self.app.sensorWeather.signals
@@ -204,8 +210,8 @@ class EnvironGui(object):
                 self.refractionSource = ''
 
         if old != self.refractionSource:
-            self.filteredTemperature = None
-            self.filteredPressure = None
+            self.filterTemperature.reset()
+            self.filterPressure.reset()
 
         self.setRefractionSourceGui()
         self.setRefractionUpdateType()
@@ -215,16 +221,21 @@ class EnvironGui(object):
     def updateFilterRefractionParameters(self):
         """
         updateFilter initializes the filter with the first values or is rolling the
-        moving average
+        moving average. for online weather the values are interpolated from the forecast
+        series to the actual time, so they change smoothly between the downloads. if
+        there is no forecast for the actual time, the first forecast entry is used.
 
         :return:
         """
 
         if self.refractionSource == 'onlineWeather':
-            if not self.app.onlineWeather.data:
+            values = self.app.onlineWeather.forecast.interpolate(time.time())
+            if values is None:
+                values = self.app.onlineWeather.data
+            if not values:
                 return False
-            temp = self.app.onlineWeather.data['temperature']
-            press = self.app.onlineWeather.data['pressure']
+            temp = values['temperature']
+            press = values['pressure']
         elif self.refractionSource == 'sensorWeather':
             key = 'WEATHER_PARAMETERS.WEATHER_TEMPERATURE'
             temp = self.app.sensorWeather.data.get(key, None)
@@ -235,38 +246,31 @@ class EnvironGui(object):
             press = None
 
         if temp is None or press is None:
-            self.filteredTemperature = None
-            self.filteredPressure = None
+            self.filterTemperature.reset()
+            self.filterPressure.reset()
             return False
 
-        if self.filteredTemperature is None:
-            self.filteredTemperature = np.full(100, temp)
-        else:
-            self.filteredTemperature = np.roll(self.filteredTemperature, 1)
-            self.filteredTemperature[0] = temp
-        if self.filteredPressure is None:
-            self.filteredPressure = np.full(100, press)
-        else:
-            self.filteredPressure = np.roll(self.filteredPressure, 1)
-            self.filteredPressure[0] = press
+        self.filterTemperature.add(temp)
+        self.filterPressure.add(press)
 
         return True
 
     def movingAverageRefractionParameters(self):
         """
-        getFilteredRefracParams filters local temperature and pressure with and moving
-        average filter over 100 seconds and returns the filtered values.
+        getFilteredRefracParams returns the filtered local temperature and pressure. the
+        filters reject single glitches of the sensors and build a moving average over
+        100 seconds.
 
         :return:  temperature and pressure
         """
 
-        if self.filteredTemperature is not None and self.filteredPressure is not None:
-            temp = np.mean(self.filteredTemperature)
-            press = np.mean(self.filteredPressure)
-            return temp, press
-        else:
+        temp = self.filterTemperature.value
+        press = self.filterPressure.value
+        if temp is None or press is None:
             return None, None
 
+        return temp, press
+
     def updateRefractionParameters(self):
         """
         updateRefractionParameters takes the actual conditions for update into account and
@@ -360,7 +364,8 @@ class EnvironGui(object):
 
     def getWebDataWorker(self, url=''):
         """
-        getOpenWeatherMapDataWorker fetches a given url and does the error handling.
+        getWebDataWorker fetches a given url through the shared web cache, which does
+        the conditional requests and the error handling.
 
         :param url:
         :return: data
@@ -369,80 +374,66 @@ class EnvironGui(object):
         if not url:
             return None
 
-        try:
-            data = requests.get(url, timeout=30)
-        except TimeoutError:
-            self.log.error(f'{url} not reachable')
-            return None
-        except Exception as e:
-            self.log.critical(f'{url} general exception: {e}')
-            return None
-
-        if data.status_code != 200:
-            self.log.error(f'{url}: status nok')
-            return None
-        self.log.debug(f'{url}: {data.status_code}')
+        data = self.app.webCache.get(url=url, source='clearOutside')
         return data
 
+    @staticmethod
+    def keepLines(background, margin=15):
+        """
+        keepLines decides which rows (or columns) of the clear outside image are kept.
+        a line which is pure background is removed if it is beyond margin, but the first
+        line after a line with content is always kept as separator.
+
+        :param background: boolean array, true for lines with background only
+        :param margin: number of lines at the beginning which are always kept
+        :return: boolean array, true for lines to be kept
+        """
+
+        keep = np.ones(len(background), dtype=bool)
+        separator = True
+        for i, isBackground in enumerate(background):
+            if separator:
+                separator = False
+            elif isBackground and i > margin:
+                keep[i] = False
+            elif not isBackground:
+                separator = True
+        return keep
+
     @staticmethod
     def processClearOutsideImage(image=None):
         """
-        processClearOutsideImage takes the image, split it and puts the image
-        to the Gui. for the transformation qimage2ndarray is used because of the speed
-        for the calculations. dim is a factor which reduces the lightness of the overall
-        image
+        processClearOutsideImage takes the image, crops it and converts it to the dark
+        theme. grey pixels are inverted with a minimum of 32, so the background becomes
+        [32, 32, 32]. empty rows and columns are found on masks of the image and removed
+        with a single indexing step. dim is a factor which reduces the lightness of the
+        overall image
 
         :param image:
-        :return: success
+        :return: pixmap
         """
 
         dim = 0.85
-        image.convertToFormat(PyQt5.QtGui.QImage.Format_RGB32)
+        image = image.convertToFormat(PyQt5.QtGui.QImage.Format_RGB32)
         imageBase = image.copy(0, 84, 624, 141)
 
         # transformation are done in numpy, because it's much faster
-        width = imageBase.width()
-        height = imageBase.height()
         imgArr = qimage2ndarray.rgb_view(imageBase)
-        imgArr = imgArr.reshape(width * height, 3)
-        img_Max = np.maximum(255 - imgArr, [32, 32, 32])
-        temp = imgArr[:, 0] == imgArr[:, 1]
-        check = np.array([temp, temp, temp]).transpose()
-
-        # do the transform light to dark theme
-        imgArr = np.where(check, img_Max, imgArr)
-
-        # transforming back
-        imgArr = imgArr.reshape(height, width, 3)
-
-        # Compressing the image as the widget content is a png
-        # removing some rows
-        m = np.isin(imgArr, [[32, 32, 32], [255, 0, 0]])
-        toDelete = []
-        maxRow = 1
-        line = maxRow
-        for i in range(0, len(m[:, 1])):
-            if not line and m[i, :].all() and i > 15:
-                toDelete.append(i)
-            elif line:
-                line -= 1
-            elif not m[i][:].all():
-                line = maxRow
-        imgArr = np.delete(imgArr, toDelete, axis=0)
-
-        # removing some columns
-        m = np.isin(imgArr, [[32, 32, 32]])
-        toDelete = []
-        maxCol = 1
-        col = maxCol
-        for i in range(0, len(m[1, :])):
-            if not col and m[:, i].all() and i > 15:
-                toDelete.append(i)
-            elif col:
-                col -= 1
-            elif not m[:, i].all():
-                col = maxCol
-        imgArr = np.delete(imgArr, toDelete, axis=1)
+
+        # do the transform light to dark theme for all grey pixels
+        isGrey = imgArr[:, :, 0] == imgArr[:, :, 1]
+        imgArr = np.where(isGrey[:, :, np.newaxis],
+                          np.maximum(255 - imgArr, 32),
+                          imgArr)
+
+        # rows are background, if all values are 0, 32 or 255 (dark grey or red lines)
+        isBackground = (imgArr == 0) | (imgArr == 32) | (imgArr == 255)
+        keepRows = EnvironGui.keepLines(isBackground.all(axis=(1, 2)))
+
+        # columns are background, if all kept rows have the value 32
+        isDarkGrey = (imgArr[keepRows] == 32).all(axis=2)
+        keepCols = EnvironGui.keepLines(isDarkGrey.all(axis=0))
+        imgArr = imgArr[np.ix_(keepRows, keepCols)]
 
         # re transfer to QImage from numpy array
         imageBase = qimage2ndarray.array2qimage(dim * imgArr)
@@ -466,13 +457,20 @@ class EnvironGui(object):
 
         if not hasattr(data, 'content'):
             return False
-        if not isinstance(data.content, bytearray):
+        if not isinstance(data.content, (bytes, bytearray)):
             return False
 
+        # the image is only processed again, if the source has changed
+        validators = getattr(data, 'headers', dict())
+        key = (validators.get('ETag'), validators.get('Last-Modified'))
+        if any(key) and key == self.clearOutsideKey:
+            return True
+
         image.loadFromData(data.content)
 
         pixmapBase = self.processClearOutsideImage(image=image)
         self.ui.picClearOutside.setPixmap(pixmapBase)
+        self.clearOutsideKey = key
 
         return True
 
@@ -481,11 +479,12 @@ class EnvironGui(object):
         getClearOutside initiates the worker thread to get the web data fetched
 
         :param url:
-        :return:
+        :return: success
         """
         worker = Worker(self.getWebDataWorker, url)
         worker.signals.result.connect(self.updateClearOutsideImage)
-        self.threadPool.start(worker)
+        suc = self.app.executor.start(worker, lane='io', key='clearOutside')
+        return suc
 
     def updateClearOutside(self):
         """
@@ -652,6 +651,10 @@ class EnvironGui(object):
             },
         }
 
+        # planets are loaded in background during startup
+        if self.app.planets is None:
+            return False
+
         # todo: is the calculation of the moon phase better separate ?
         sun = self.app.planets['sun']
         moon = self.app.planets['moon']
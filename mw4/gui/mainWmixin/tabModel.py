@@ -31,6 +31,14 @@ from PyQt5.QtTest import QTest
 from mountcontrol.alignStar import AlignStar
 # local import
 from mw4.base import transform
+from mw4.base.metrics import registry
+
+queueDepth = registry.gauge('mw4_model_queue_depth',
+                            'model points waiting in the queues of the model build',
+                            ['queue'])
+modelPoints = registry.counter('mw4_model_points_total',
+                               'processed model points',
+                               ['result'])
 
 
 class QMultiWait(PyQt5.QtCore.QObject):
@@ -90,6 +98,11 @@ class Model(object):
         self.solveQueue = queue.Queue()
         self.resultQueue = queue.Queue()
         self.modelQueue = queue.Queue()
+        queueDepth.setFunction(self.slewQueue.qsize, queue='slew')
+        queueDepth.setFunction(self.imageQueue.qsize, queue='image')
+        queueDepth.setFunction(self.solveQueue.qsize, queue='solve')
+        queueDepth.setFunction(self.resultQueue.qsize, queue='result')
+        queueDepth.setFunction(self.modelQueue.qsize, queue='model')
         self.collector = QMultiWait()
         self.startModeling = None
         self.modelName = ''
@@ -294,9 +307,11 @@ class Model(object):
             if mPoint['errorRMS_S'] < self.MAX_ERROR_MODEL_POINT:
                 self.log.info(f'put to final model [{mPoint}]')
                 self.modelQueue.put(mPoint)
+                modelPoints.inc(result='accepted')
             else:
                 text = f'Solving failed for image-{count:03d}'
                 self.app.message.emit(text, 2)
+                modelPoints.inc(result='rejected')
 
             text = f'Solved   image-{count:03d}: '
             text += f'Ra: {transform.convertToHMS(mPoint["raJ2000S"])} '
@@ -312,6 +327,7 @@ class Model(object):
         else:
             text = f'Solving  image-{count:03d}: solving error: {mPoint.get("message")}'
             self.app.message.emit(text, 2)
+            modelPoints.inc(result='failed')
 
         self.updateProgress(number=number,
                             count=count,
@@ -873,8 +889,8 @@ class Model(object):
             return False
 
         # check if imaging in window is running and abort it if necessary
-        if self.app.uiWindows['showImageW']['class']:
-            self.app.uiWindows['showImageW']['class'].abortImage()
+        if self.app.uiWindows['showImageW']['classObj']:
+            self.app.uiWindows['showImageW']['classObj'].abortImage()
 
         self.changeStyleDynamic(self.ui.runModel, 'running', True)
         self.changeStyleDynamic(self.ui.cancelModel, 'cancel', True)
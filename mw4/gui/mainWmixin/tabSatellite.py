@@ -19,12 +19,61 @@
 ###########################################################
 # standard libraries
 import os
+import functools
 # external packages
 import PyQt5
+from skyfield.api import EarthSatellite
+from skyfield.api import Loader
+from skyfield.api import Topos
 # local import
 from mw4.base.tpool import Worker
 
 
+@functools.lru_cache(maxsize=4)
+def loadTimescale(dataDir):
+    """
+    loadTimescale loads the timescale once per process from the data dir
+
+    :param dataDir:
+    :return: timescale
+    """
+
+    return Loader(dataDir, verbose=False).timescale()
+
+
+def findSatellitePasses(name, line1, line2, dataDir, latitude, longitude, elevation,
+                        tt, days=3, minAlt=5):
+    """
+    findSatellitePasses searches the rise, culmination and set events of the satellite
+    for the next days. it is defined on module level and works only on simple types, so
+    it could run in the process pool.
+
+    :param name: name of satellite
+    :param line1: first line of TLE
+    :param line2: second line of TLE
+    :param dataDir: dir of the timescale data
+    :param latitude: of location in degrees
+    :param longitude: of location in degrees
+    :param elevation: of location in meters
+    :param tt: start time as julian date tt
+    :param days: search period
+    :param minAlt: min altitude for rise and set in degrees
+    :return: name, list of event time tt and event type
+    """
+
+    ts = loadTimescale(dataDir)
+    satellite = EarthSatellite(line1, line2, name=name, ts=ts)
+    location = Topos(latitude_degrees=latitude,
+                     longitude_degrees=longitude,
+                     elevation_m=elevation)
+    t, events = satellite.find_events(location,
+                                      ts.tt_jd(tt),
+                                      ts.tt_jd(tt + days),
+                                      altitude_degrees=minAlt)
+    passes = [(float(ti.tt), int(event)) for ti, event in zip(t, events)]
+    return name, passes
+
+
 class Satellite(object):
     """
     the Satellite window class handles the main menu as well as the show and no show part of
@@ -150,8 +199,9 @@ class Satellite(object):
         loadTLEDataFromSourceURLsWorker selects from a drop down list of possible satellite
         data sources on the web and once selected downloads the data. depending of the
         setting of reload is true setting, it takes an already loaded file from local disk.
-        after loading or opening the source file, it updates the satellite list in the list
-        view widget for the selection of satellites.
+        the download goes through the shared web cache, so an unchanged TLE set is not
+        transferred again. after loading or opening the source file, it updates the
+        satellite list in the list view widget for the selection of satellites.
 
         :return: success
         """
@@ -159,13 +209,24 @@ class Satellite(object):
         if not source:
             return False
 
-        satellites = self.app.mount.obsSite.loader.tle_file(source, reload=reload)
-        self.satellites = {sat.name: sat for sat in satellites}
-
         fileName = os.path.basename(source)
         dirPath = self.app.mwGlob['dataDir']
         filePath = f'{dirPath}/{fileName}'
 
+        if reload:
+            data = self.app.webCache.get(url=source, source='tle')
+            if data is not None:
+                with open(filePath + '.tmp', 'wb') as tleFile:
+                    tleFile.write(data.content)
+                os.replace(filePath + '.tmp', filePath)
+
+        if os.path.isfile(filePath):
+            loader = self.app.mount.obsSite.loader
+            satellites = loader.tle_file(os.path.abspath(filePath))
+        else:
+            satellites = self.app.mount.obsSite.loader.tle_file(source, reload=False)
+        self.satellites = {sat.name: sat for sat in satellites}
+
         if not os.path.isfile(filePath):
             return False
 
@@ -199,7 +260,7 @@ class Satellite(object):
                         source=source,
                         reload=reload)
         worker.signals.result.connect(self.setupSatelliteNameList)
-        self.threadPool.start(worker)
+        self.app.executor.start(worker, lane='io', key='loadTLEData')
 
         return True
 
@@ -315,20 +376,48 @@ class Satellite(object):
 
     def showRises(self):
         """
-        showRises calculated the next three satellite passes for the presentation in the gui.
-        the times shown might differ from the calculation of the mount as we dont know, how
-        the mount calculates is timings.
+        showRises starts the calculation of the next satellite passes for the
+        presentation in the gui. the search runs in the process pool, as it takes some
+        time. the times shown might differ from the calculation of the mount as we dont
+        know, how the mount calculates is timings.
 
-        :return: True for test purpose
+        :return: success
         """
 
-        minAlt = 5
+        if self.satellite is None:
+            return False
+        if self.satellite.name not in self.satellitesRawTLE:
+            return False
 
-        loc = self.app.mount.obsSite.location
+        data = self.satellitesRawTLE[self.satellite.name]
         obs = self.app.mount.obsSite
-        t0 = obs.timeJD
-        t1 = obs.ts.tt_jd(obs.timeJD.tt + 3)
-        t, events = self.satellite.find_events(loc, t0, t1, altitude_degrees=minAlt)
+        loc = obs.location
+        worker = self.app.processPool.worker(findSatellitePasses,
+                                             self.satellite.name,
+                                             data['line1'],
+                                             data['line2'],
+                                             self.app.mwGlob['dataDir'],
+                                             loc.latitude.degrees,
+                                             loc.longitude.degrees,
+                                             loc.elevation.m,
+                                             obs.timeJD.tt,
+                                             )
+        worker.signals.result.connect(self.showRisesResult)
+        suc = self.app.executor.start(worker, lane='compute')
+        return suc
+
+    def showRisesResult(self, result):
+        """
+        showRisesResult writes the next three satellite passes to the gui. results for a
+        satellite, which is not selected any more, are dropped.
+
+        :param result: name of satellite, list of event time tt and event type
+        :return: success
+        """
+
+        name, passes = result
+        if self.satellite is None or self.satellite.name != name:
+            return False
 
         passUI = {
             0:
@@ -346,11 +435,13 @@ class Satellite(object):
         }
 
         fString = "%Y-%m-%d  %H:%M"
+        ts = self.app.mount.obsSite.ts
 
         index = 0
-        for ti, event in zip(t, events):
+        for tt, event in passes:
             if index > 2:
                 break
+            ti = ts.tt_jd(tt)
             if event == 0:
                 passUI[index]['rise'].setText(f'{ti.utc_strftime(fString)}')
             elif event == 1:
@@ -27,7 +27,6 @@ import platform
 import PyQt5
 if platform.machine() != 'armv7l':
     import PyQt5.QtMultimedia
-import requests
 from importlib_metadata import version
 from astropy.utils import iers
 
@@ -170,7 +169,7 @@ class SettMisc(object):
 
         url = f'https://pypi.python.org/pypi/{packageName}/json'
         try:
-            response = requests.get(url).json()
+            response = self.app.webCache.get(url=url, source='pypi').json()
         except Exception as e:
             self.log.critical(f'Cannot determine package version: {e}')
             return None
@@ -360,7 +359,8 @@ class SettMisc(object):
                               versionPackage=versionPackage)
 
         worker.signals.result.connect(self.installFinished)
-        self.threadPool.start(worker)
+        # the install mutex already allows only one run, so no key is needed
+        self.app.executor.start(worker, lane='io')
 
         return True
 
@@ -92,6 +92,7 @@ class SettRelay(object):
             relayButtonText.editingFinished.connect(self.updateRelayButtonText)
         for button in self.relayButtons:
             button.clicked.connect(self.relayButtonPressed)
+        self.app.relay.commandFailed.connect(self.relayCommandFailed)
 
     def initConfig(self):
         """
@@ -164,9 +165,9 @@ class SettRelay(object):
 
         action = self.relayDropDowns[relayIndex].currentIndex()
         if action == 0:
-            suc = self.app.relay.switch(relayIndex)
+            suc = self.app.relay.queueCommand('switch', relayIndex)
         elif action == 1:
-            suc = self.app.relay.pulse(relayIndex)
+            suc = self.app.relay.queueCommand('pulse', relayIndex)
         else:
             suc = False
         return suc
@@ -188,6 +189,18 @@ class SettRelay(object):
             return False
         return True
 
+    def relayCommandFailed(self, relayIndex):
+        """
+        relayCommandFailed shows the message for a queued relay command, which could not
+        be performed by the box.
+
+        :param relayIndex: relayIndex of the failed command
+        :return: true for test purpose
+        """
+
+        self.app.message.emit(f'Relay action cannot be performed: {relayIndex}', 2)
+        return True
+
     def relayHost(self):
         self.app.relay.host = self.ui.relayHost.text()
 
@@ -19,11 +19,11 @@
 ###########################################################
 # standard libraries
 import os
-from pathlib import Path
 # external packages
 import PyQt5
-from astropy.io import fits
 # local import
+from mw4.base.tpool import Worker
+from mw4.base.renameEngine import RenameEngine
 
 
 class Tools(object):
@@ -60,11 +60,13 @@ class Tools(object):
                                'low': self.app.mount.setting.setSlewSpeedLow,
                                }
         self.slewSpeedSelected = None
+        self.renameEngine = RenameEngine()
 
         self.setupSelectorGui()
 
         # matching gui signals
         self.ui.renameStart.clicked.connect(self.renameRunGUI)
+        self.ui.renameUndo.clicked.connect(self.renameUndoGUI)
         self.ui.renameInputSelect.clicked.connect(self.chooseDir)
         self.ui.stopMoveAll.clicked.connect(self.stopMoveAll)
         self.ui.moveNorth.clicked.connect(self.moveNorth)
@@ -94,6 +96,7 @@ class Tools(object):
         self.ui.renameText.setText(config.get('renameText', ''))
         self.ui.newObjectName.setText(config.get('newObjectName', ''))
         self.ui.checkIncludeSubdirs.setChecked(config.get('checkIncludeSubdirs', False))
+        self.ui.checkRenameDryRun.setChecked(config.get('checkRenameDryRun', False))
         for name, ui in self.selectorsDropDowns.items():
             ui.setCurrentIndex(config.get(name, 0))
 
@@ -118,6 +121,7 @@ class Tools(object):
         config['renameText'] = self.ui.renameText.text()
         config['newObjectName'] = self.ui.newObjectName.text()
         config['checkIncludeSubdirs'] = self.ui.checkIncludeSubdirs.isChecked()
+        config['checkRenameDryRun'] = self.ui.checkRenameDryRun.isChecked()
         for name, ui in self.selectorsDropDowns.items():
             config[name] = ui.currentIndex()
         config['slewSpeed'] = self.slewSpeedSelected
@@ -139,26 +143,6 @@ class Tools(object):
 
         return True
 
-    @staticmethod
-    def getNumberFiles(pathDir='', search=''):
-        """
-        getNumberFiles counts the number of files to be valid for the renaming.
-
-        :param pathDir: path to root directory to be scanned
-        :param search: search string
-        :return: number of files found
-        """
-
-        if not pathDir:
-            return 0
-        if not os.path.isdir(pathDir):
-            return 0
-        if not search:
-            return 0
-
-        number = sum(1 for _ in Path(pathDir).glob(search))
-        return number
-
     def convertHeaderEntry(self, entry='', fitsKey=''):
         """
         convertHeaderEntry takes the fitsHeader entry and reformat it to a reasonable
@@ -221,52 +205,149 @@ class Tools(object):
             break
         return nameChunk
 
-    def renameFile(self, fileName=''):
+    def buildFileName(self, fitsHeader=None, objectName='', selections=None):
         """
-        renameFile opens the given FITS file and retrieves it's header. if valid it
-        runs through selectors of the drop down lists and checks all header keys to
-        get the new filename build. afterwards it renames the given file.
+        buildFileName runs through the selections of the drop down lists and checks all
+        header keys to get the new filename build. as it does not access the gui, it
+        could be used from a thread.
 
-        :param fileName: fits file to be renamed
-        :return: success
+        :param fitsHeader: fits header of the file
+        :param objectName: object name from gui, if empty the header entry is used
+        :param selections: list of selections from the drop down lists
+        :return: new file name
         """
 
-        if not fileName:
-            return False
+        # object should be in lower case. if not, it will be set
+        if objectName:
+            newFilename = objectName.upper()
+        else:
+            if 'OBJECT' in fitsHeader:
+                newFilename = fitsHeader['OBJECT'].upper()
+            else:
+                newFilename = 'UNKNOWN'
 
-        with fits.open(name=fileName) as fd:
-            fitsHeader = fd[0].header
+        for selection in selections or list():
+            chunk = self.processSelectors(fitsHeader=fitsHeader,
+                                          selection=selection
+                                          )
+            if chunk:
+                newFilename += f'_{chunk}'
 
-            # object should be in lower case. if not, it will be set
-            newObjectName = self.ui.newObjectName.text().upper()
-            if newObjectName:
-                newFilename = newObjectName
-            else:
-                if 'OBJECT' in fitsHeader:
-                    newFilename = fitsHeader['OBJECT'].upper()
-                else:
-                    newFilename = 'UNKNOWN'
+        newFilename += '.fits'
+        return newFilename
 
-            for _, selector in self.selectorsDropDowns.items():
-                selection = selector.currentText()
-                chunk = self.processSelectors(fitsHeader=fitsHeader,
-                                              selection=selection
-                                              )
-                if chunk:
-                    newFilename += f'_{chunk}'
+    def getSelections(self):
+        """
+        getSelections collects the actual selections of the drop down lists
 
-            newFilename += '.fits'
+        :return: list of selections
+        """
 
-            dirName = os.path.dirname(fileName)
-            newFilename = f'{dirName}/{newFilename}'
-            os.rename(fileName, newFilename)
+        return [x.currentText() for x in self.selectorsDropDowns.values()]
 
+    def renameWorker(self, pathDir='', search='', objectName='', selections=None,
+                     dryRun=False):
+        """
+        renameWorker runs in a thread. it collects the files, reads all headers in
+        parallel, builds the rename plan and applies it, if it is no dry run and has no
+        conflicts.
+
+        :param pathDir: path to root directory
+        :param search: search string
+        :param objectName: object name from gui
+        :param selections: list of selections from the drop down lists
+        :param dryRun: only build the plan
+        :return: result dict
+        """
+
+        def nameFunc(header):
+            return self.buildFileName(fitsHeader=header,
+                                      objectName=objectName,
+                                      selections=selections)
+
+        files = self.renameEngine.scanFiles(pathDir=pathDir, search=search)
+        plan = self.renameEngine.buildPlan(files, nameFunc)
+
+        applied = False
+        if not dryRun and not self.renameEngine.hasConflicts(plan):
+            applied = self.renameEngine.apply(plan)
+
+        result = {
+            'plan': plan,
+            'dryRun': dryRun,
+            'applied': applied,
+        }
+        return result
+
+    def updateRenameProgress(self):
+        """
+        updateRenameProgress shows the progress of the running rename worker
+
+        :return: True for test purpose
+        """
+
+        self.ui.renameProgress.setValue(int(self.renameEngine.progress))
+        return True
+
+    def renameFinished(self):
+        """
+        renameFinished resets the gui after the rename worker has finished, even if the
+        worker failed.
+
+        :return: True for test purpose
+        """
+
+        self.app.update0_1s.disconnect(self.updateRenameProgress)
+        self.ui.renameStart.setEnabled(True)
+        self.ui.renameUndo.setEnabled(True)
+        self.ui.renameProgress.setValue(100)
+        return True
+
+    def renameResult(self, result=None):
+        """
+        renameResult is the partner method of renameWorker and reports the plan and the
+        outcome of the renaming to the gui.
+
+        :param result: result dict of renameWorker
+        :return: success
+        """
+
+        plan = result['plan']
+        if not plan:
+            self.app.message.emit('No files to rename', 0)
+            return False
+
+        number = {}
+        for entry in plan:
+            number[entry['status']] = number.get(entry['status'], 0) + 1
+            if entry['status'] == 'conflict':
+                self.app.message.emit(f'Conflict: {os.path.basename(entry["source"])} '
+                                      f'-> {os.path.basename(entry["target"])}', 2)
+            elif entry['status'] == 'error':
+                self.app.message.emit(f'{entry["source"]} could not be renamed', 2)
+
+        numberRename = number.get('rename', 0)
+        numberConflict = number.get('conflict', 0)
+        if result['dryRun']:
+            self.app.message.emit(f'Dry run: {numberRename:d} to rename, '
+                                  f'{number.get("unchanged", 0):d} unchanged, '
+                                  f'{numberConflict:d} conflicts', 0)
+            return True
+
+        if numberConflict:
+            self.app.message.emit(f'{numberConflict:d} conflicts, no image was renamed', 2)
+            return False
+        if not result['applied']:
+            self.app.message.emit('Renaming failed, all images restored', 2)
+            return False
+
+        self.app.message.emit(f'{numberRename:d} images were renamed', 0)
         return True
 
     def renameRunGUI(self):
         """
-        renameRunGUI retrieves a full list of files to be renamed and renames
-        them on by one.
+        renameRunGUI collects the settings from the gui and starts the rename worker
+        in a thread, so the gui stays responsive for large numbers of files.
 
         :return: True for test purpose
         """
@@ -283,20 +364,44 @@ class Tools(object):
         else:
             search = '*.fit*'
 
-        numberFiles = self.getNumberFiles(pathDir, search=search)
-        if not numberFiles:
-            self.app.message.emit('No files to rename', 0)
-            return False
+        self.ui.renameStart.setEnabled(False)
+        self.ui.renameUndo.setEnabled(False)
+        self.ui.renameProgress.setValue(0)
+        self.renameEngine.progress = 0
+        self.app.update0_1s.connect(self.updateRenameProgress)
+
+        worker = Worker(self.renameWorker,
+                        pathDir=pathDir,
+                        search=search,
+                        objectName=self.ui.newObjectName.text(),
+                        selections=self.getSelections(),
+                        dryRun=self.ui.checkRenameDryRun.isChecked(),
+                        )
+        worker.signals.result.connect(self.renameResult)
+        worker.signals.finished.connect(self.renameFinished)
+        # the start button is disabled until the run is finished, so no key is needed
+        self.app.executor.start(worker, lane='io')
 
-        for i, fileName in enumerate(Path(pathDir).glob(search)):
-            self.ui.renameProgress.setValue(int(100 * (i + 1) / numberFiles))
-            PyQt5.QtWidgets.QApplication.processEvents()
-            suc = self.renameFile(fileName=fileName)
-            if not suc:
-                self.app.message.emit(f'{fileName} could not be renamed', 2)
+        return True
 
-        self.app.message.emit(f'{numberFiles:d} images were renamed', 0)
+    def renameUndoGUI(self):
+        """
+        renameUndoGUI reverts the last renaming process
+
+        :return: success
+        """
+
+        number = len(self.renameEngine.journal)
+        if not number:
+            self.app.message.emit('Nothing to undo', 0)
+            return False
+
+        suc = self.renameEngine.undo()
+        if not suc:
+            self.app.message.emit('Undo of renaming failed', 2)
+            return False
 
+        self.app.message.emit(f'{number:d} images were restored', 0)
         return True
 
     def chooseDir(self):
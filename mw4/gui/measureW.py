@@ -19,6 +19,7 @@
 ###########################################################
 # standard libraries
 import logging
+import time
 from datetime import datetime as dt
 import gc
 # external packages
@@ -871,6 +872,7 @@ class MeasureWindow(widget.MWidget):
         :return: success
         """
 
+        timeStart = time.perf_counter()
         data = self.app.measure.data
 
         if 'time' not in data:
@@ -920,4 +922,5 @@ class MeasureWindow(widget.MWidget):
                                cycle=cycle)
             axe.figure.canvas.draw()
 
+        widget.redrawTime.observe(time.perf_counter() - timeStart, window='measure')
         return True
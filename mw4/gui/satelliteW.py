@@ -19,6 +19,7 @@
 ###########################################################
 # standard libraries
 import logging
+import time
 import pickle
 from io import BytesIO
 # external packages
@@ -729,6 +730,7 @@ class SatelliteWindow(widget.MWidget):
         :return: True for test purpose
         """
 
+        timeStart = time.perf_counter()
         timescale = self.app.mount.obsSite.ts
         forecast = np.arange(0, self.FORECAST_TIME, 0.005 * self.FORECAST_TIME / 3) / 24
         now = timescale.now()
@@ -746,4 +748,5 @@ class SatelliteWindow(widget.MWidget):
         self.drawEarth(subpoint=subpoint)
         self.drawHorizonView(difference=difference)
 
+        widget.redrawTime.observe(time.perf_counter() - timeStart, window='satellite')
         return True
@@ -33,11 +33,16 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
 
 # local imports
 from . import styles
+from mw4.base.metrics import registry
 
 __all__ = [
     'MWidget',
 ]
 
+redrawTime = registry.histogram('mw4_redraw_seconds',
+                                'duration of redrawing window content',
+                                ['window'])
+
 
 class MWidget(PyQt5.QtWidgets.QWidget, styles.MWStyles):
     """
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'mw4/gui/widgets/diagnostics.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_DiagnosticsDialog(object):
+    def setupUi(self, DiagnosticsDialog):
+        DiagnosticsDialog.setObjectName("DiagnosticsDialog")
+        DiagnosticsDialog.resize(800, 600)
+        DiagnosticsDialog.setMinimumSize(QtCore.QSize(800, 200))
+        DiagnosticsDialog.setMaximumSize(QtCore.QSize(800, 1200))
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        DiagnosticsDialog.setFont(font)
+        self.verticalLayout = QtWidgets.QVBoxLayout(DiagnosticsDialog)
+        self.verticalLayout.setContentsMargins(4, 4, 4, 4)
+        self.verticalLayout.setSpacing(4)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setContentsMargins(4, 4, 4, 4)
+        self.horizontalLayout.setSpacing(4)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.filterText = QtWidgets.QLineEdit(DiagnosticsDialog)
+        self.filterText.setMinimumSize(QtCore.QSize(200, 25))
+        self.filterText.setMaximumSize(QtCore.QSize(300, 25))
+        self.filterText.setObjectName("filterText")
+        self.horizontalLayout.addWidget(self.filterText)
+        self.metricsUrl = QtWidgets.QLabel(DiagnosticsDialog)
+        self.metricsUrl.setObjectName("metricsUrl")
+        self.horizontalLayout.addWidget(self.metricsUrl)
+        self.dumpTrace = QtWidgets.QPushButton(DiagnosticsDialog)
+        self.dumpTrace.setMinimumSize(QtCore.QSize(80, 25))
+        self.dumpTrace.setMaximumSize(QtCore.QSize(100, 25))
+        self.dumpTrace.setObjectName("dumpTrace")
+        self.horizontalLayout.addWidget(self.dumpTrace)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+        self.line = QtWidgets.QFrame(DiagnosticsDialog)
+        self.line.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.line.setLineWidth(2)
+        self.line.setMidLineWidth(1)
+        self.line.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line.setObjectName("line")
+        self.verticalLayout.addWidget(self.line)
+        self.metrics = QtWidgets.QTableWidget(DiagnosticsDialog)
+        font = QtGui.QFont()
+        font.setFamily("Courier New")
+        font.setPointSize(10)
+        self.metrics.setFont(font)
+        self.metrics.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.metrics.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.metrics.setColumnCount(3)
+        self.metrics.setObjectName("metrics")
+        self.metrics.setRowCount(0)
+        item = QtWidgets.QTableWidgetItem()
+        self.metrics.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.metrics.setHorizontalHeaderItem(1, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.metrics.setHorizontalHeaderItem(2, item)
+        self.metrics.horizontalHeader().setStretchLastSection(True)
+        self.metrics.verticalHeader().setVisible(False)
+        self.verticalLayout.addWidget(self.metrics)
+        self.verticalLayout.setStretch(2, 1)
+
+        self.retranslateUi(DiagnosticsDialog)
+        QtCore.QMetaObject.connectSlotsByName(DiagnosticsDialog)
+
+    def retranslateUi(self, DiagnosticsDialog):
+        _translate = QtCore.QCoreApplication.translate
+        DiagnosticsDialog.setWindowTitle(_translate("DiagnosticsDialog", "Diagnostics"))
+        self.filterText.setToolTip(_translate("DiagnosticsDialog", "Shows only metrics, which contain the text in name or labels."))
+        self.filterText.setPlaceholderText(_translate("DiagnosticsDialog", "filter metrics"))
+        self.metricsUrl.setToolTip(_translate("DiagnosticsDialog", "Address of the metrics in prometheus text format"))
+        self.metricsUrl.setText(_translate("DiagnosticsDialog", "-"))
+        self.dumpTrace.setToolTip(_translate("DiagnosticsDialog", "Writes the trace of the device communication to the work dir."))
+        self.dumpTrace.setText(_translate("DiagnosticsDialog", "Dump trace"))
+        item = self.metrics.horizontalHeaderItem(0)
+        item.setText(_translate("DiagnosticsDialog", "Metric"))
+        item = self.metrics.horizontalHeaderItem(1)
+        item.setText(_translate("DiagnosticsDialog", "Labels"))
+        item = self.metrics.horizontalHeaderItem(2)
+        item.setText(_translate("DiagnosticsDialog", "Value"))
+
+
+if __name__ == "__main__":
+    import sys
+    app = QtWidgets.QApplication(sys.argv)
+    DiagnosticsDialog = QtWidgets.QWidget()
+    ui = Ui_DiagnosticsDialog()
+    ui.setupUi(DiagnosticsDialog)
+    DiagnosticsDialog.show()
+    sys.exit(app.exec_())
@@ -30,6 +30,7 @@ from mw4.base.loggerMW import CustomLogger
 from mw4.base.alpacaClass import AlpacaClass
 from mw4.base.alpacaBase import Camera
 from mw4.base.tpool import Worker
+from mw4.base.tpool import CancelToken
 
 
 class CameraAlpaca(AlpacaClass):
@@ -103,8 +104,8 @@ class CameraAlpaca(AlpacaClass):
             return False
 
         worker = Worker(self.workerPollData)
-        self.threadPool.start(worker)
-        return True
+        suc = self.app.executor.start(worker, lane='control', key=f'{self.name}:pollData')
+        return suc
 
     def sendDownloadMode(self, fastReadout=False):
         """
@@ -130,6 +131,7 @@ class CameraAlpaca(AlpacaClass):
                      posY=0,
                      width=1,
                      height=1,
+                     token=None,
                      ):
         """
 
@@ -141,6 +143,7 @@ class CameraAlpaca(AlpacaClass):
         :param posY:
         :param width:
         :param height:
+        :param token: cancel token of the executor
         :return: success
         """
 
@@ -171,6 +174,8 @@ class CameraAlpaca(AlpacaClass):
         # wait for finishing
         timeLeft = expTime
         while not self.client.imageready():
+            if token is not None:
+                token.check()
             text = f'expose {timeLeft:3.0f} s'
             time.sleep(1)
             if timeLeft >= 1:
@@ -237,6 +242,7 @@ class CameraAlpaca(AlpacaClass):
         if not self.deviceConnected:
             return False
 
+        token = CancelToken()
         worker = Worker(self.workerExpose,
                         imagePath=imagePath,
                         expTime=expTime,
@@ -245,10 +251,11 @@ class CameraAlpaca(AlpacaClass):
                         posX=posX,
                         posY=posY,
                         width=width,
-                        height=height)
+                        height=height,
+                        token=token)
         # worker.signals.result.connect(self.emitStatus)
-        self.threadPool.start(worker)
-        return True
+        suc = self.app.executor.start(worker, lane='io', key=f'{self.name}:expose')
+        return suc
 
     def abort(self):
         """
@@ -260,6 +267,7 @@ class CameraAlpaca(AlpacaClass):
         if not self.deviceConnected:
             return False
 
+        self.app.executor.cancel(f'{self.name}:expose')
         canAbort = self.data.get('CAN_ABORT', False)
         if canAbort:
             self.client.stopexposure()
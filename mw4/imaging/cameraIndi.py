@@ -175,7 +175,9 @@ class CameraIndi(IndiClass):
 
         if data['format'] == '.fits.fz':
             HDU = fits.HDUList.fromstring(data['value'])
-            fits.writeto(self.imagePath, HDU[0].data, HDU[0].header, overwrite=True)
+            # fpack stores the image in the first extension behind an empty primary
+            imageHDU = HDU[1] if len(HDU) > 1 else HDU[0]
+            fits.writeto(self.imagePath, imageHDU.data, imageHDU.header, overwrite=True)
             self.log.warning('Image BLOB is in FPacked format')
 
         elif data['format'] == '.fits.z':
@@ -0,0 +1,322 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import logging
+from threading import Lock
+# external packages
+import numpy as np
+import cv2
+from astropy import wcs
+# local imports
+from mw4.base.loggerMW import CustomLogger
+
+__all__ = ['StackEngine',
+           ]
+
+
+class StackEngine(object):
+    """
+    The class StackEngine implements a live stack for images. every new frame is aligned
+    to the first (reference) frame and accumulated in float32 with the welford method,
+    so mean and variance per pixel are available at any time. memory is bounded to three
+    arrays (count, mean, sum of squared deviations), independent of the number of frames.
+
+    alignment is done by the wcs solutions of reference and frame if both have one
+    (translation, rotation and scale), otherwise the translation is measured by phase
+    correlation of the star field. once enough frames are stacked, pixels deviating more
+    than KAPPA sigma from the running mean are rejected (streaming sigma clipping), which
+    removes satellite trails, hot pixels and cosmic rays.
+
+        >>> engine = StackEngine()
+        >>> engine.add(image, header)
+        >>> mean = engine.mean
+    """
+
+    __all__ = ['StackEngine',
+               'reset',
+               'add',
+               'align',
+               'variance',
+               ]
+
+    logger = logging.getLogger(__name__)
+    log = CustomLogger(logger, {})
+
+    # rejection threshold and number of frames before rejection starts
+    KAPPA = 3
+    MIN_FRAMES_CLIP = 3
+    # binning and crop size for the measurement of the translation
+    BINNING = 4
+    REFINE_SIZE = 1024
+
+    def __init__(self):
+        self.lock = Lock()
+        self.referenceShape = None
+        self.referenceWCS = None
+        self.referenceBinned = None
+        self.referenceCrop = None
+        self.count = None
+        self._mean = None
+        self.m2 = None
+        self.number = 0
+        self.numberRejected = 0
+
+    def reset(self):
+        """
+        reset removes all stacked data, the next frame will be the new reference
+
+        :return: true for test purpose
+        """
+
+        with self.lock:
+            self.referenceShape = None
+            self.referenceWCS = None
+            self.referenceBinned = None
+            self.referenceCrop = None
+            self.count = None
+            self._mean = None
+            self.m2 = None
+            self.number = 0
+            self.numberRejected = 0
+
+        return True
+
+    @property
+    def mean(self):
+        if self._mean is None:
+            return None
+        return self._mean.copy()
+
+    @property
+    def variance(self):
+        """
+        variance returns the sample variance per pixel of all accepted values
+
+        :return: variance as float32 or None
+        """
+
+        if self.m2 is None:
+            return None
+        return self.m2 / np.maximum(self.count - 1, 1)
+
+    @staticmethod
+    def celestialWCS(header=None):
+        """
+        celestialWCS builds the celestial wcs object out of the header if there is a wcs
+        solution present.
+
+        :param header: fits header
+        :return: wcs object or None
+        """
+
+        if header is None:
+            return None
+        if 'CTYPE1' not in header:
+            return None
+
+        try:
+            wcsObject = wcs.WCS(header, naxis=2, relax=True)
+        except Exception:
+            return None
+
+        if not wcsObject.has_celestial:
+            return None
+        return wcsObject.celestial
+
+    def transformWCS(self, frameWCS):
+        """
+        transformWCS calculates the affine transformation from reference pixels to frame
+        pixels by mapping three points of the reference frame over the sky to the frame.
+
+        :param frameWCS: wcs object of the frame
+        :return: 2x3 matrix for cv2.warpAffine with inverse map or None
+        """
+
+        sizeY, sizeX = self.referenceShape
+        src = np.array([[0, 0], [sizeX - 1, 0], [0, sizeY - 1]], dtype=np.float64)
+
+        try:
+            world = self.referenceWCS.all_pix2world(src, 0)
+            dst = frameWCS.all_world2pix(world, 0)
+        except Exception as e:
+            self.log.warning(f'WCS transformation failed: {e}')
+            return None
+
+        if not np.all(np.isfinite(dst)):
+            return None
+        return cv2.getAffineTransform(src.astype(np.float32), dst.astype(np.float32))
+
+    def binImage(self, image):
+        """
+        binImage reduces the image by BINNING for a fast first measurement of the shift
+
+        :param image: float32 image
+        :return: binned image
+        """
+
+        b = self.BINNING
+        sizeY = image.shape[0] // b * b
+        sizeX = image.shape[1] // b * b
+        binned = image[:sizeY, :sizeX].reshape(sizeY // b, b, sizeX // b, b)
+        return binned.mean(axis=(1, 3), dtype=np.float32)
+
+    def cropRegion(self, shape):
+        """
+        cropRegion returns the origin and size of the crop in the middle of the image,
+        which is used for refining the measured shift.
+
+        :param shape: shape of the image
+        :return: x0, y0, size
+        """
+
+        sizeY, sizeX = shape
+        size = min(self.REFINE_SIZE, sizeX // 2, sizeY // 2)
+        x0 = int(sizeX / 2 - size / 2)
+        y0 = int(sizeY / 2 - size / 2)
+        return x0, y0, size
+
+    @staticmethod
+    def measureShift(reference, image):
+        """
+        measureShift measures the translation between two images of same size by phase
+        correlation. a hanning window suppresses the influence of the image borders.
+
+        :param reference: float32 image
+        :param image: float32 image
+        :return: dx, dy of image against reference
+        """
+
+        window = cv2.createHanningWindow(reference.shape[::-1], cv2.CV_32F)
+        (dx, dy), _ = cv2.phaseCorrelate(reference, image, window)
+        return dx, dy
+
+    def transformShift(self, image):
+        """
+        transformShift measures the translation of the frame against the reference. the
+        shift is measured first on binned images over the whole field and then refined
+        on a crop in the middle of the full resolution images.
+
+        :param image: float32 image
+        :return: 2x3 matrix for cv2.warpAffine with inverse map
+        """
+
+        dx, dy = self.measureShift(self.referenceBinned, self.binImage(image))
+        dx *= self.BINNING
+        dy *= self.BINNING
+
+        x0, y0, size = self.cropRegion(image.shape)
+        xs = x0 + int(round(dx))
+        ys = y0 + int(round(dy))
+        inside = (0 <= xs and xs + size <= image.shape[1]
+                  and 0 <= ys and ys + size <= image.shape[0])
+        if inside and size > 0:
+            crop = np.ascontiguousarray(image[ys:ys + size, xs:xs + size])
+            fineX, fineY = self.measureShift(self.referenceCrop, crop)
+            if abs(fineX) < self.BINNING and abs(fineY) < self.BINNING:
+                dx = xs - x0 + fineX
+                dy = ys - y0 + fineY
+
+        return np.float32([[1, 0, dx], [0, 1, dy]])
+
+    def align(self, image, header=None):
+        """
+        align transforms the frame into the pixel grid of the reference frame. pixels
+        outside the frame are set to nan.
+
+        :param image: 2 dim image data as float32
+        :param header: fits header of the frame
+        :return: aligned image
+        """
+
+        frameWCS = self.celestialWCS(header)
+        matrix = None
+        if frameWCS is not None and self.referenceWCS is not None:
+            matrix = self.transformWCS(frameWCS)
+        if matrix is None:
+            matrix = self.transformShift(image)
+
+        sizeY, sizeX = self.referenceShape
+        aligned = cv2.warpAffine(image, matrix, (sizeX, sizeY),
+                                 flags=cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP,
+                                 borderMode=cv2.BORDER_CONSTANT,
+                                 borderValue=np.nan)
+        return aligned
+
+    def setReference(self, image, header=None):
+        """
+        setReference stores the first frame as reference and starts the statistics
+
+        :param image: float32 image
+        :param header: fits header of the frame
+        :return: nothing
+        """
+
+        self.referenceShape = image.shape
+        self.referenceWCS = self.celestialWCS(header)
+        if image.ndim == 2:
+            self.referenceBinned = self.binImage(np.nan_to_num(image))
+            x0, y0, size = self.cropRegion(image.shape)
+            self.referenceCrop = np.nan_to_num(image[y0:y0 + size, x0:x0 + size])
+        valid = np.isfinite(image)
+        self.count = valid.astype(np.int32)
+        self._mean = np.where(valid, image, 0).astype(np.float32)
+        self.m2 = np.zeros(image.shape, dtype=np.float32)
+        self.number = 1
+        self.numberRejected = 0
+
+    def add(self, image=None, header=None):
+        """
+        add aligns a new frame and updates the running mean and variance per pixel. a
+        frame with another size than the reference starts a new stack.
+
+        :param image: image data
+        :param header: fits header of the frame
+        :return: mean image as float32
+        """
+
+        if image is None:
+            return None
+
+        image = np.asarray(image, dtype=np.float32)
+
+        with self.lock:
+            if self.referenceShape is None or image.shape != self.referenceShape:
+                self.setReference(image, header)
+                return self.mean
+
+            if image.ndim == 2:
+                image = self.align(np.nan_to_num(image), header)
+
+            valid = np.isfinite(image)
+            if self.number >= self.MIN_FRAMES_CLIP:
+                sigma = np.sqrt(self.m2 / np.maximum(self.count - 1, 1))
+                reject = valid & (self.count >= self.MIN_FRAMES_CLIP)
+                reject &= np.abs(image - self._mean) > self.KAPPA * sigma
+                reject &= sigma > 0
+                self.numberRejected += int(np.count_nonzero(reject))
+                valid &= ~reject
+
+            self.count += valid
+            delta = np.where(valid, image - self._mean, 0)
+            self._mean += delta / np.maximum(self.count, 1)
+            self.m2 += delta * np.where(valid, image - self._mean, 0)
+            self.number += 1
+
+        return self.mean
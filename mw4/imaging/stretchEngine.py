@@ -0,0 +1,222 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import logging
+# external packages
+import numpy as np
+import matplotlib.pyplot as plt
+# local imports
+from mw4.base.loggerMW import CustomLogger
+
+__all__ = ['StretchEngine',
+           'convertImage16',
+           ]
+
+
+def convertImage16(image):
+    """
+    convertImage16 scales the image data from min to max to 16 bit unsigned integers.
+    not finite values are set to 0. it is defined on module level, so it could run in
+    the process pool.
+
+    :param image: image data
+    :return: image as 16 bit data, offset, scale
+    """
+
+    numberValues = StretchEngine.NUMBER_VALUES
+    valid = np.isfinite(image)
+    if not valid.any():
+        return np.zeros(image.shape, dtype=np.uint16), 0, 1
+
+    vMin = np.min(image, where=valid, initial=np.inf)
+    vMax = np.max(image, where=valid, initial=-np.inf)
+    scale = (numberValues - 1) / max(vMax - vMin, 1e-12)
+
+    image16 = (image - vMin) * scale
+    image16 = np.nan_to_num(image16, nan=0, posinf=numberValues - 1, neginf=0)
+    image16 = np.clip(image16, 0, numberValues - 1).astype(np.uint16)
+    return image16, vMin, scale
+
+
+class StretchEngine(object):
+    """
+    The class StretchEngine prepares an image for display. for each new frame the image
+    is converted once to 16 bit values and a histogram is built from a strided sample of
+    the image. the percentile limits of the stretch are derived from the cumulated
+    histogram and the stretch (sqrt) together with the color map is stored in a lookup
+    table for all 16 bit values. changing the stretch or the color map only needs a new
+    lookup table and one indexing pass over the image. if a process pool is given,
+    the conversion of large float images runs there.
+
+        >>> engine = StretchEngine(processPool=app.processPool)
+        >>> engine.setImage(image)
+        >>> imageRGBA = engine.apply(values=(98, 99.999), colorMap='gray')
+    """
+
+    __all__ = ['StretchEngine',
+               'setImage',
+               'limits',
+               'lut',
+               'apply',
+               ]
+
+    logger = logging.getLogger(__name__)
+    log = CustomLogger(logger, {})
+
+    # max number of pixels used for building the histogram
+    MAX_SAMPLE = 1000000
+    NUMBER_VALUES = 65536
+    # min number of pixels for converting in the process pool
+    MIN_PROCESS_SIZE = 1000000
+
+    def __init__(self, processPool=None):
+        self.processPool = processPool
+        self.image = None
+        self.offset = 0
+        self.scale = 1
+        self.histogram = None
+        self.cdf = None
+        self.luts = dict()
+
+    def convertImage(self, image):
+        """
+        convertImage converts the image data to 16 bit unsigned integers, which are used as
+        index for the lookup table. integer images which fit into 16 bit are used directly,
+        all others are scaled from min to max.
+
+        :param image: image data
+        :return: image as 16 bit data
+        """
+
+        if image.dtype in [np.uint8, np.uint16]:
+            self.offset = 0
+            self.scale = 1
+            return image
+
+        if self.processPool is not None and image.size >= self.MIN_PROCESS_SIZE:
+            image16, self.offset, self.scale = self.processPool.run(convertImage16,
+                                                                    image)
+        else:
+            image16, self.offset, self.scale = convertImage16(image)
+        return image16
+
+    def setImage(self, image=None):
+        """
+        setImage stores a new frame and builds the histogram. if the image has more
+        pixels than MAX_SAMPLE, only every n-th pixel in both axes is used.
+
+        :param image: image data
+        :return: success
+        """
+
+        self.luts = dict()
+        if image is None:
+            self.image = None
+            self.histogram = None
+            self.cdf = None
+            return False
+
+        self.image = self.convertImage(np.asarray(image))
+
+        step = max(1, int(np.sqrt(self.image.size / self.MAX_SAMPLE)))
+        if self.image.ndim == 2:
+            sample = self.image[::step, ::step]
+        else:
+            sample = self.image.ravel()[::step * step]
+
+        self.histogram = np.bincount(sample.ravel(), minlength=self.NUMBER_VALUES)
+        self.cdf = np.cumsum(self.histogram) / max(sample.size, 1)
+        return True
+
+    def toData(self, value):
+        """
+        toData converts a 16 bit index value back to the original data value
+
+        :param value: 16 bit value
+        :return: data value
+        """
+
+        return value / self.scale + self.offset
+
+    def limits(self, values=(98, 99.999)):
+        """
+        limits calculates the lower and upper limit in 16 bit values from the percentiles
+        given in values. as for the former AsymmetricPercentileInterval the lowest 1% of
+        the range is cut off to remove the noise.
+
+        :param values: lower and upper percentile
+        :return: vmin, vmax in 16 bit values
+        """
+
+        if self.cdf is None:
+            return 0, self.NUMBER_VALUES - 1
+
+        low, high = values
+        vmin = int(np.searchsorted(self.cdf, low / 100, side='left'))
+        vmax = int(np.searchsorted(self.cdf, high / 100, side='left'))
+        vmin = min(vmin, self.NUMBER_VALUES - 1)
+        vmax = min(vmax, self.NUMBER_VALUES - 1)
+
+        # cutout the noise
+        delta = vmax - vmin
+        vmin = min(vmin + delta * 0.01, vmax)
+        return vmin, vmax
+
+    def lut(self, values=(98, 99.999), colorMap='gray'):
+        """
+        lut builds the lookup table for all 16 bit values with a sqrt stretch between the
+        limits and the color map applied. the tables are cached for the actual frame.
+
+        :param values: lower and upper percentile
+        :param colorMap: name of the matplotlib color map
+        :return: lookup table with rgba values as uint8
+        """
+
+        key = (tuple(values), colorMap)
+        if key in self.luts:
+            return self.luts[key]
+
+        vmin, vmax = self.limits(values=values)
+        x = np.arange(self.NUMBER_VALUES, dtype=np.float64)
+        norm = np.clip((x - vmin) / max(vmax - vmin, 1), 0, 1)
+        norm = np.sqrt(norm)
+        lut = plt.get_cmap(colorMap)(norm, bytes=True)
+
+        self.luts[key] = lut
+        return lut
+
+    def apply(self, values=(98, 99.999), colorMap='gray', image=None):
+        """
+        apply generates the rgba image by looking up the 16 bit values in the lookup
+        table. if an image is given (e.g. a cutout of the 16 bit frame), this one is
+        used instead of the whole frame.
+
+        :param values: lower and upper percentile
+        :param colorMap: name of the matplotlib color map
+        :param image: 16 bit image data or None
+        :return: rgba image as uint8
+        """
+
+        if image is None:
+            image = self.image
+        if image is None:
+            return None
+
+        return self.lut(values=values, colorMap=colorMap)[image]
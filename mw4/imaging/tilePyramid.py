@@ -0,0 +1,179 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import logging
+# external packages
+import numpy as np
+# local imports
+from mw4.base.loggerMW import CustomLogger
+
+__all__ = ['TilePyramid',
+           ]
+
+
+class TilePyramid(object):
+    """
+    The class TilePyramid holds an image together with versions of reduced resolution
+    (1/2, 1/4, 1/8). the pyramid is built once per frame. for zooming and panning the
+    level is selected, which still has enough pixels for the display, and only a slice
+    (a numpy view, no copy) of this level is handed out together with the extent in full
+    resolution pixel coordinates. so any center point of the image could be shown
+    without copying the full resolution data.
+
+        >>> pyramid = TilePyramid()
+        >>> pyramid.build(image)
+        >>> data, extent = pyramid.view(factor=4, center=(100, 200), displaySize=(800, 600))
+    """
+
+    __all__ = ['TilePyramid',
+               'build',
+               'clear',
+               'view',
+               ]
+
+    logger = logging.getLogger(__name__)
+    log = CustomLogger(logger, {})
+
+    # number of reduced levels, each level halves the resolution
+    NUMBER_LEVELS = 3
+
+    def __init__(self):
+        self.levels = list()
+
+    @property
+    def shape(self):
+        if not self.levels:
+            return None
+        return self.levels[0].shape
+
+    def clear(self):
+        """
+        clear removes all levels
+
+        :return: true for test purpose
+        """
+
+        self.levels = list()
+        return True
+
+    @staticmethod
+    def downsample(image):
+        """
+        downsample halves the resolution of the image by averaging blocks of 2x2 pixels.
+        an odd last row or column is dropped.
+
+        :param image: 2 dim image data
+        :return: image with half resolution and same data type
+        """
+
+        sizeY = image.shape[0] // 2 * 2
+        sizeX = image.shape[1] // 2 * 2
+        blocks = image[:sizeY, :sizeX].reshape(sizeY // 2, 2, sizeX // 2, 2)
+        reduced = blocks.sum(axis=(1, 3), dtype=np.uint32) // 4
+        return reduced.astype(image.dtype)
+
+    def build(self, image=None):
+        """
+        build stores the full resolution image as level 0 (without copy) and calculates
+        the reduced levels out of it. levels stop, when the image gets smaller than 2
+        pixels in one axis.
+
+        :param image: 2 dim image data
+        :return: success
+        """
+
+        self.levels = list()
+        if image is None:
+            return False
+        if image.ndim != 2:
+            return False
+
+        self.levels.append(image)
+        for _ in range(self.NUMBER_LEVELS):
+            if min(self.levels[-1].shape) < 2:
+                break
+            self.levels.append(self.downsample(self.levels[-1]))
+
+        return True
+
+    def selectLevel(self, visible, displaySize=None):
+        """
+        selectLevel returns the coarsest level, which still has at least one pixel per
+        display pixel for the visible part of the image.
+
+        :param visible: tuple of visible width and height in full resolution pixels
+        :param displaySize: tuple of width and height of the display in pixels
+        :return: level number
+        """
+
+        if displaySize is None:
+            return 0
+
+        level = 0
+        for number in range(1, len(self.levels)):
+            scale = 2 ** number
+            if visible[0] / scale < displaySize[0] or visible[1] / scale < displaySize[1]:
+                break
+            level = number
+        return level
+
+    def view(self, factor=1, center=None, displaySize=None):
+        """
+        view returns the part of the image for the given zoom factor around center. the
+        window is shifted to stay inside the image. the returned data is a slice of the
+        selected level and the extent (left, right, bottom, top) is given in full
+        resolution pixel coordinates for use in imshow.
+
+        :param factor: zoom factor
+        :param center: tuple of x, y in full resolution pixels or None for image center
+        :param displaySize: tuple of width and height of the display in pixels
+        :return: data, extent
+        """
+
+        if not self.levels:
+            return None, None
+
+        sizeY, sizeX = self.shape
+        width = max(int(sizeX / factor), 1)
+        height = max(int(sizeY / factor), 1)
+
+        if center is None:
+            centerX, centerY = sizeX / 2, sizeY / 2
+        else:
+            centerX, centerY = center
+
+        x0 = int(min(max(centerX - width / 2, 0), sizeX - width))
+        y0 = int(min(max(centerY - height / 2, 0), sizeY - height))
+
+        level = self.selectLevel((width, height), displaySize=displaySize)
+        scale = 2 ** level
+        data = self.levels[level]
+        levelX0 = x0 // scale
+        levelY0 = y0 // scale
+        levelX1 = max(min((x0 + width) // scale, data.shape[1]), levelX0 + 1)
+        levelY1 = max(min((y0 + height) // scale, data.shape[0]), levelY0 + 1)
+
+        data = data[levelY0:levelY1, levelX0:levelX1]
+        extent = (levelX0 * scale - 0.5,
+                  levelX1 * scale - 0.5,
+                  levelY0 * scale - 0.5,
+                  levelY1 * scale - 0.5,
+                  )
+        return data, extent
@@ -27,25 +27,36 @@ import socket
 import traceback
 import locale
 import html
+import multiprocessing
 from importlib_metadata import version
-
-# external packages
-import matplotlib
-matplotlib.use('Qt5Agg')
-import PyQt5.QtCore
-import PyQt5.QtGui
-import PyQt5.QtWidgets
-import astropy
-from astropy.utils import iers
-astropy.log.setLevel('ERROR')
-iers.conf.auto_download = False
-
-# local import
-from mw4.base.loggerMW import CustomLogger
-from mw4.base.loggerMW import setupLogging
-from mw4 import mainApp
-from mw4.gui import splash
-from mw4.resource import resources
+from mw4.base.startupProfiler import StartupProfiler
+from mw4.base.startupProfiler import parseArguments
+
+# the profiler has to start before the imports to get the import times
+options = parseArguments(sys.argv[1:])
+profiler = StartupProfiler(enabled=options.profileStartup,
+                           updateBaseline=options.profileBaseline)
+profiler.start()
+
+with profiler.phase('imports'):
+    # external packages
+    import matplotlib
+    matplotlib.use('Qt5Agg')
+    import PyQt5.QtCore
+    import PyQt5.QtGui
+    import PyQt5.QtWidgets
+    import astropy
+    from astropy.utils import iers
+    astropy.log.setLevel('ERROR')
+    iers.conf.auto_download = False
+
+    # local import
+    from mw4.base.loggerMW import CustomLogger
+    from mw4.base.loggerMW import setupLogging
+    from mw4.base.traceRecorder import recorder
+    from mw4 import mainApp
+    from mw4.gui import splash
+    from mw4.resource import resources
 
 global log
 logger = logging.getLogger()
@@ -221,6 +232,10 @@ class MyApp(PyQt5.QtWidgets.QApplication):
         if not event.button():
             return returnValue
 
+        # the clicks are only written, if the level is enabled
+        if not self.log.isEnabledFor(logging.WARNING):
+            return returnValue
+
         returnValue = self.handleButtons(obj, returnValue)
 
         return returnValue
@@ -244,6 +259,7 @@ def except_hook(typeException, valueException, tbackException):
     for i in range(0, len(result)):
         log.critical(result[i].replace('\n', ''))
     log.critical('----------------------------------------------------')
+    recorder.dumpOnError(reason='uncaught exception')
     sys.__excepthook__(typeException, valueException, tbackException)
 
 
@@ -391,19 +407,24 @@ def main():
     main prepares the loading of mountwizzard application. it prepares a splash screen
     and handler the setup of the logger, bundle handling etc. in addition some information
     about the system are written into the logfile to be able to debug in different conditions
-    the system environment.
+    the system environment. with the command line option --profile-startup the times
+    of the startup phases are written to a report in the work dir.
 
     :return: nothing
     """
+    # needed for the process pool in the frozen app
+    multiprocessing.freeze_support()
+
     # setting locale
     locale.setlocale(locale.LC_ALL, '')
 
     # initiating the main app
-    app = MyApp(sys.argv)
-    # app = PyQt5.QtWidgets.QApplication(sys.argv)
+    with profiler.phase('qtApplication'):
+        app = MyApp(sys.argv)
+        # app = PyQt5.QtWidgets.QApplication(sys.argv)
 
-    # generating splash screen
-    splashW = splash.SplashScreen(application=app)
+        # generating splash screen
+        splashW = splash.SplashScreen(application=app)
 
     # and start with a first splash screen
     splashW.showMessage('Start initialising')
@@ -411,22 +432,26 @@ def main():
 
     # checking workdir and if the system is started from frozen app
     mwGlob = checkFrozen()
-    mwGlob = setupWorkDirs(mwGlob)
+    with profiler.phase('setupWorkDirs'):
+        mwGlob = setupWorkDirs(mwGlob)
 
     # now setup the logging environment
     splashW.showMessage('Setup logging')
     splashW.setValue(20)
-    setupLogging()
+    with profiler.phase('setupLogging'):
+        setupLogging()
 
     # start logging with basic system data for information
     splashW.showMessage('Write system info to log')
     splashW.setValue(40)
-    writeSystemInfo(mwGlob=mwGlob)
+    with profiler.phase('writeSystemInfo'):
+        writeSystemInfo(mwGlob=mwGlob)
 
     # loading leap seconds, spice kernel and hipparcos catalogue
     splashW.showMessage('Loading star and time data')
     splashW.setValue(60)
-    extractDataFiles(mwGlob=mwGlob, splashW=splashW)
+    with profiler.phase('extractDataFiles'):
+        extractDataFiles(mwGlob=mwGlob, splashW=splashW)
 
     # and finally starting the application
     splashW.showMessage('Loading Data')
@@ -435,20 +460,29 @@ def main():
     # setting except hook for saving some data of errors
     sys.excepthook = except_hook
 
+    # device trace could be written on demand with SIGUSR1
+    recorder.enableSignalDump()
+
     # adding a icon
     app.setWindowIcon(PyQt5.QtGui.QIcon(':/icon/mw4.ico'))
 
     # adding event filter for formatting the tooltips nicely
     app.installEventFilter(QAwesomeTooltipEventFilter(app))
 
-    mountApp = mainApp.MountWizzard4(mwGlob)
-    mountApp.mainW.show()
+    with profiler.phase('mainApp'):
+        mountApp = mainApp.MountWizzard4(mwGlob)
+        mountApp.mainW.show()
 
     # end of splash screen
     splashW.showMessage('Finishing loading')
     splashW.setValue(100)
     splashW.close()
 
+    # write the startup profile if enabled by command line
+    profiler.addMarks(mountApp.timeline.marks, prefix='mainApp: ')
+    profiler.stop()
+    profiler.writeReport(pathDir=mwGlob['workDir'])
+
     # quit app
     sys.exit(app.exec_())
 
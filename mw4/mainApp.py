@@ -35,18 +35,16 @@ from importlib_metadata import version
 # local import
 from mw4.base.loggerMW import CustomLogger
 from mw4.base.loggerMW import setCustomLoggingLevel
+from mw4.base.serviceRegistry import ServiceRegistry
+from mw4.base.serviceRegistry import StartupTimeline
+from mw4.base.tpool import Worker
+from mw4.base.taskExecutor import TaskExecutor
+from mw4.base.processPool import ProcessPool
 from mw4.gui.mainW import MainWindow
-from mw4.gui.messageW import MessageWindow
-from mw4.gui.hemisphereW import HemisphereWindow
-from mw4.gui.measureW import MeasureWindow
-from mw4.gui.imageW import ImageWindow
-from mw4.gui.satelliteW import SatelliteWindow
-if platform.machine() != 'armv7l':
-    # todo: there is actually no compiled version of PyQtWebEngine, so we have to remove it
-    from mw4.gui.keypadW import KeypadWindow
 from mw4.powerswitch.kmRelay import KMRelay
 from mw4.modeldata.buildpoints import DataPoint
 from mw4.modeldata.hipparcos import Hipparcos
+from mw4.modeldata.starCatalog import StarCatalog
 from mw4.dome.dome import Dome
 from mw4.imaging.camera import Camera
 from mw4.imaging.filter import Filter
@@ -61,6 +59,11 @@ from mw4.powerswitch.pegasusUPB import PegasusUPB
 from mw4.measure.measure import MeasureData
 from mw4.remote.remote import Remote
 from mw4.astrometry.astrometry import Astrometry
+from mw4.base.headerIndex import HeaderIndex
+from mw4.base.webCache import WebCache
+from mw4.base.traceRecorder import recorder
+from mw4.base.metrics import registry
+from mw4.base.metrics import MetricsServer
 
 
 class MountWizzard4(PyQt5.QtCore.QObject):
@@ -99,6 +102,9 @@ class MountWizzard4(PyQt5.QtCore.QObject):
                  mwGlob=None,
                  ):
         super().__init__()
+        self.timeline = StartupTimeline()
+        self.services = ServiceRegistry(timeline=self.timeline)
+        self.registerServices()
         self.expireData = False
         self.mountUp = False
         self.mwGlob = mwGlob
@@ -106,11 +112,19 @@ class MountWizzard4(PyQt5.QtCore.QObject):
         self.mainW = None
         self.threadPool = PyQt5.QtCore.QThreadPool()
         self.threadPool.setMaxThreadCount(20)
+        self.executor = TaskExecutor()
+        self.processPool = ProcessPool()
         self.message.connect(self.writeMessageQueue)
 
         # persistence management through dict
         self.config = {}
         self.loadConfig()
+        self.timeline.mark('config loaded')
+
+        # metrics are served on localhost for monitoring, port 0 disables the server
+        self.metricsPort = self.config.get('metricsPort', 9464)
+        self.metricsServer = MetricsServer(registry=registry)
+        self.setupMetrics()
 
         # write basic data to message window
         profile = self.config.get('profileName', '-')
@@ -133,14 +147,14 @@ class MountWizzard4(PyQt5.QtCore.QObject):
         self.mount.obsSite.location = topo
         self.mount.signals.mountUp.connect(self.loadMountData)
 
-        # get all planets for calculation
-        try:
-            self.planets = self.mount.obsSite.loader('de421_23.bsp')
-        except Exception as e:
-            self.log.critical(f'Failed loading planets: {e}')
-            self.planets = None
+        self.timeline.mark('mount created')
+
+        # planets are loaded in background after the gui is shown
+        self.planets = None
 
-        self.relay = KMRelay(host='localhost')
+        self.webCache = WebCache(self, pathDir=self.mwGlob['dataDir'] + '/webcache')
+        recorder.pathDir = self.mwGlob['workDir']
+        self.relay = KMRelay(app=self, host='localhost')
         self.sensorWeather = SensorWeather(self)
         self.onlineWeather = OnlineWeather(self)
         self.directWeather = DirectWeather(self)
@@ -154,12 +168,20 @@ class MountWizzard4(PyQt5.QtCore.QObject):
         self.power = PegasusUPB(self)
         self.data = DataPoint(self, configDir=self.mwGlob['configDir'])
         self.hipparcos = Hipparcos(self)
+        pathCatalog = os.path.join(self.mwGlob['dataDir'], 'hipparcos')
+        self.hipparcos.catalog = StarCatalog(pathDir=pathCatalog)
         self.measure = MeasureData(self)
         self.remote = Remote(self)
         self.astrometry = Astrometry(self, tempDir=mwGlob['tempDir'])
+        self.headerIndex = HeaderIndex(self,
+                                       dbPath=self.mwGlob['dataDir'] + '/headerIndex.db')
+        self.headerIndex.watchDir(self.mwGlob['imageDir'])
+        self.astrometry.signals.done.connect(self.headerIndex.updateSolved)
+        self.timeline.mark('devices created')
 
         # get the window widgets up
         self.mainW = MainWindow(self)
+        self.timeline.mark('main window created')
 
         # link cross widget gui signals as all ui widgets have to be present
         self.uiWindows = {
@@ -167,31 +189,37 @@ class MountWizzard4(PyQt5.QtCore.QObject):
                 'button': self.mainW.ui.openMessageW,
                 'classObj': None,
                 'name': 'MessageDialog',
-                'class': MessageWindow,
+                'class': 'MessageWindow',
             },
             'showHemisphereW': {
                 'button': self.mainW.ui.openHemisphereW,
                 'classObj': None,
                 'name': 'HemisphereDialog',
-                'class': HemisphereWindow,
+                'class': 'HemisphereWindow',
             },
             'showImageW': {
                 'button': self.mainW.ui.openImageW,
                 'classObj': None,
                 'name': 'ImageDialog',
-                'class': ImageWindow,
+                'class': 'ImageWindow',
             },
             'showMeasureW': {
                 'button': self.mainW.ui.openMeasureW,
                 'classObj': None,
                 'name': 'MeasureDialog',
-                'class': MeasureWindow,
+                'class': 'MeasureWindow',
             },
             'showSatelliteW': {
                 'button': self.mainW.ui.openSatelliteW,
                 'classObj': None,
                 'name': 'SatelliteDialog',
-                'class': SatelliteWindow,
+                'class': 'SatelliteWindow',
+            },
+            'showDiagnosticsW': {
+                'button': self.mainW.ui.openDiagnosticsW,
+                'classObj': None,
+                'name': 'DiagnosticsDialog',
+                'class': 'DiagnosticsWindow',
             },
         }
         # todo: we can only add keypad on arm when we have compiled version
@@ -200,11 +228,12 @@ class MountWizzard4(PyQt5.QtCore.QObject):
                 'button': self.mainW.ui.openKeypadW,
                 'classObj': None,
                 'name': 'KeypadDialog',
-                'class': KeypadWindow,
+                'class': 'KeypadWindow',
             }
 
         # show all sub windows
         self.showWindows()
+        self.timeline.mark('windows shown')
 
         # connecting buttons to window open close
         for win in self.uiWindows:
@@ -218,6 +247,9 @@ class MountWizzard4(PyQt5.QtCore.QObject):
         self.timer0_1s.timeout.connect(self.sendUpdate)
         self.timer0_1s.start(100)
 
+        # heavy data is loaded after the gui is up
+        self.loadData()
+
         # finishing for test: MW4 runs with keyword 'test' for 10 seconds an terminates
         if not hasattr(sys, 'argv'):
             return
@@ -226,6 +258,116 @@ class MountWizzard4(PyQt5.QtCore.QObject):
         if sys.argv[1] == 'test':
             self.update10s.connect(self.quitSave)
 
+    def registerServices(self):
+        """
+        registerServices adds the factories of all services, which are built on first
+        use. the window modules are only imported, when the window is opened the first
+        time. the keypad needs QtWebEngine, which is not available on arm.
+
+        :return: true for test purpose
+        """
+
+        windows = {
+            'MessageWindow': 'mw4.gui.messageW.MessageWindow',
+            'HemisphereWindow': 'mw4.gui.hemisphereW.HemisphereWindow',
+            'ImageWindow': 'mw4.gui.imageW.ImageWindow',
+            'MeasureWindow': 'mw4.gui.measureW.MeasureWindow',
+            'SatelliteWindow': 'mw4.gui.satelliteW.SatelliteWindow',
+            'DiagnosticsWindow': 'mw4.gui.diagnosticsW.DiagnosticsWindow',
+        }
+        if platform.machine() != 'armv7l':
+            windows['KeypadWindow'] = 'mw4.gui.keypadW.KeypadWindow'
+
+        for name, path in windows.items():
+            self.services.register(name, self.services.lazyClass(path))
+
+        self.services.register('planets',
+                               lambda: self.mount.obsSite.loader('de421_23.bsp'))
+        return True
+
+    def setupMetrics(self):
+        """
+        setupMetrics adds the load of the thread pools and the lanes of the executor to
+        the metrics. the values are read when the metrics are requested. the metrics
+        server is started on the port from the config.
+
+        :return: success of starting the server
+        """
+
+        threads = registry.gauge('mw4_threads',
+                                 'threads of the thread pools',
+                                 ['pool', 'state'])
+        threads.setFunction(self.threadPool.activeThreadCount, pool='main', state='active')
+        threads.setFunction(self.threadPool.maxThreadCount, pool='main', state='max')
+
+        tasks = registry.gauge('mw4_executor_tasks',
+                               'tasks of the executor lanes',
+                               ['lane', 'state'])
+        tasksTotal = registry.counter('mw4_executor_tasks_total',
+                                      'finished and rejected tasks of the executor lanes',
+                                      ['lane', 'state'])
+        for lane in self.executor.metrics():
+            for state in ['limit', 'queued', 'running', 'maxQueued']:
+                tasks.setFunction(lambda lane=lane, state=state:
+                                  self.executor.metrics()[lane][state],
+                                  lane=lane, state=state)
+            for state in ['finished', 'rejected']:
+                tasksTotal.setFunction(lambda lane=lane, state=state:
+                                       self.executor.metrics()[lane][state],
+                                       lane=lane, state=state)
+
+        if not self.metricsPort:
+            return False
+
+        return self.metricsServer.start(port=self.metricsPort)
+
+    def loadDataWorker(self):
+        """
+        loadDataWorker loads the planets ephemeris and calculates the positions of the
+        alignment stars and of the large star catalogue in a worker thread. the catalogue
+        is imported from hip_main.dat in the data dir, if it was not generated yet.
+
+        :return: planets
+        """
+
+        planets = self.services.get('planets')
+        self.hipparcos.calculateAlignStarPositionsAltAz()
+
+        # the large star catalogue is generated once from hip_main.dat if provided
+        catalog = self.hipparcos.catalog
+        fileName = os.path.join(self.mwGlob['dataDir'], 'hip_main.dat')
+        if not catalog.available() and os.path.isfile(fileName):
+            catalog.importHipparcos(fileName)
+        self.hipparcos.calculateCatalogPositionsAltAz()
+        return planets
+
+    def loadDataResult(self, planets):
+        """
+        loadDataResult stores the planets and writes the startup timeline to the log
+
+        :param planets:
+        :return: true for test purpose
+        """
+
+        self.planets = planets
+        if planets is None:
+            self.log.critical('Failed loading planets')
+        self.timeline.mark('background data loaded')
+        self.timeline.logTimeline()
+        return True
+
+    def loadData(self):
+        """
+        loadData starts the loading of heavy data in background
+
+        :return: true for test purpose
+        """
+
+        worker = Worker(self.loadDataWorker)
+        worker.signals.result.connect(self.loadDataResult)
+        self.executor.start(worker, lane='compute', key='loadData')
+        return True
+
     def toggleWindow(self, windowTag=''):
         """
         togglePowerPort  toggles the state of the power switch
@@ -241,7 +383,10 @@ class MountWizzard4(PyQt5.QtCore.QObject):
 
             winObj = self.uiWindows[win]
             if not winObj['classObj']:
-                newWindow = winObj['class'](self)
+                windowClass = self.services.get(winObj['class'])
+                if windowClass is None:
+                    continue
+                newWindow = windowClass(self)
                 # make new object instance from window
                 winObj['classObj'] = newWindow
                 winObj['classObj'].destroyed.connect(self.deleteWindow)
@@ -313,6 +458,7 @@ class MountWizzard4(PyQt5.QtCore.QObject):
             config['topoLat'] = location.latitude.degrees
             config['topoLon'] = location.longitude.degrees
             config['topoElev'] = location.elevation.m
+        config['metricsPort'] = self.metricsPort
         self.mainW.storeConfig()
 
         for win in self.uiWindows:
@@ -374,6 +520,10 @@ class MountWizzard4(PyQt5.QtCore.QObject):
         self.mount.stopTimers()
         self.measure.timerTask.stop()
         self.relay.timerTask.stop()
+        self.executor.cancelAll()
+        self.processPool.close()
+        self.metricsServer.stop()
+        self.headerIndex.close()
         self.timer0_1s.stop()
         self.message.emit('MountWizzard4 manual stopped with quit', 1)
         PyQt5.QtCore.QCoreApplication.quit()
@@ -391,11 +541,25 @@ class MountWizzard4(PyQt5.QtCore.QObject):
         self.relay.timerTask.stop()
         self.storeConfig()
         self.saveConfig()
+        self.executor.cancelAll()
+        self.processPool.close()
+        self.metricsServer.stop()
+        self.headerIndex.close()
         self.timer0_1s.stop()
         self.message.emit('MountWizzard4 manual stopped with quit/save', 1)
         PyQt5.QtCore.QCoreApplication.quit()
         return True
 
+    @staticmethod
+    def dumpTrace():
+        """
+        dumpTrace writes the trace of the device communication to the work dir
+
+        :return: file path or None
+        """
+
+        return recorder.dump(reason='manual')
+
     @staticmethod
     def defaultConfig(config=None):
         """
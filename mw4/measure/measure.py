@@ -19,6 +19,7 @@
 ###########################################################
 # standard libraries
 import logging
+import time
 
 # external packages
 import PyQt5
@@ -26,6 +27,11 @@ import numpy as np
 
 # local imports
 from mw4.base.loggerMW import CustomLogger
+from mw4.base.streamFilter import OutlierFilter
+from mw4.base.metrics import registry
+
+measureTime = registry.histogram('mw4_measure_task_seconds',
+                                 'duration of one measure cycle')
 
 
 class MeasureData(object):
@@ -62,6 +68,7 @@ class MeasureData(object):
 
         self.data = {}
         self.devices = {}
+        self.filters = {}
 
         # this property will be set from main
         self.deviceStat = None
@@ -135,6 +142,15 @@ class MeasureData(object):
             self.data['skyTemp'] = np.empty(shape=[0, 1])
             self.data['skySQR'] = np.empty(shape=[0, 1])
 
+        # glitches of the mount weather sensors and the skymeter are removed
+        self.filters = {
+            'directWeatherTemp': OutlierFilter(minDeviation=0.5),
+            'directWeatherHum': OutlierFilter(minDeviation=2),
+            'directWeatherPress': OutlierFilter(minDeviation=1),
+            'directWeatherDew': OutlierFilter(minDeviation=0.5),
+            'skySQR': OutlierFilter(minDeviation=0.2),
+        }
+
         if 'filterwheel' in self.devices:
             self.data['filterNumber'] = np.empty(shape=[0, 1])
 
@@ -233,6 +249,26 @@ class MeasureData(object):
             self.data[measure] = np.split(self.data[measure], 2)[1]
         return True
 
+    def filterValue(self, key, value):
+        """
+        filterValue runs the value through the outlier filter of the key. if the value
+        is rejected, the last accepted value is used instead.
+
+        :param key: name of the measurement
+        :param value:
+        :return: filtered value
+        """
+
+        outlier = self.filters.get(key)
+        if outlier is None:
+            return value
+
+        result = outlier.add(value)
+        if result is None:
+            return outlier.value
+
+        return result
+
     def getDirectWeather(self):
         """
         getDirectWeather checks if data is already collected and send 0 in case of missing
@@ -274,6 +310,7 @@ class MeasureData(object):
             self.log.info('overrun in measure')
             return False
 
+        timeStart = time.perf_counter()
         lenData = len(self.data['time'])
         self.checkStart(lenData)
         self.checkSize(lenData)
@@ -311,6 +348,10 @@ class MeasureData(object):
 
         if 'directWeather' in self.devices:
             temp, press, dew, hum = self.getDirectWeather()
+            temp = self.filterValue('directWeatherTemp', temp)
+            hum = self.filterValue('directWeatherHum', hum)
+            press = self.filterValue('directWeatherPress', press)
+            dew = self.filterValue('directWeatherDew', dew)
             dat['directWeatherTemp'] = np.append(dat['directWeatherTemp'], temp)
             dat['directWeatherHum'] = np.append(dat['directWeatherHum'], hum)
             dat['directWeatherPress'] = np.append(dat['directWeatherPress'], press)
@@ -318,6 +359,7 @@ class MeasureData(object):
 
         if 'skymeter' in self.devices:
             skySQR = self.app.skymeter.data.get('SKY_QUALITY.SKY_BRIGHTNESS', 0)
+            skySQR = self.filterValue('skySQR', skySQR)
             skyTemp = self.app.skymeter.data.get('SKY_QUALITY.SKY_TEMPERATURE', 0)
             dat['skySQR'] = np.append(dat['skySQR'], skySQR)
             dat['skyTemp'] = np.append(dat['skyTemp'], skyTemp)
@@ -350,5 +392,6 @@ class MeasureData(object):
             dat['powDew'] = np.append(dat['powDew'], powDew)
             dat['powHum'] = np.append(dat['powHum'], powHum)
 
+        measureTime.observe(time.perf_counter() - timeStart)
         self.mutexMeasure.unlock()
         return True
@@ -28,6 +28,7 @@ import skyfield.api
 # local imports
 from mw4.base.loggerMW import CustomLogger
 from mw4.base import transform
+from mw4.base.sphereIndex import SphereIndex
 
 __all__ = ['HaDecToAltAz',
            'DataPoint',
@@ -89,6 +90,8 @@ class DataPoint(object):
                'generateGoldenSpiral',
                'genAlign',
                'hip',
+               'getIndexBuildP',
+               'getIndexHorizonP',
                ]
 
     logger = logging.getLogger(__name__)
@@ -133,6 +136,9 @@ class DataPoint(object):
         self.configDir = configDir
         self._horizonP = [(0, 0), (0, 360)]
         self._buildP = list()
+        self.buildPIndex = SphereIndex()
+        self.horizonPIndex = SphereIndex()
+        self.horizonPIndex.build(self._horizonP)
 
     @property
     def buildP(self):
@@ -142,12 +148,15 @@ class DataPoint(object):
     def buildP(self, value):
         if not isinstance(value, list):
             self._buildP = list()
+            self.buildPIndex.clear()
             return
         if not all([isinstance(x, tuple) for x in value]):
             self.log.warning('malformed value: {0}'.format(value))
             self._buildP = list()
+            self.buildPIndex.clear()
             return
         self._buildP = value
+        self.buildPIndex.build(value)
 
     def addBuildP(self, value=None, position=None):
         """
@@ -188,6 +197,7 @@ class DataPoint(object):
         position = min(len(self._buildP), position)
         position = max(0, position)
         self._buildP.insert(position, value)
+        self.buildPIndex.add(value)
         return True
 
     def delBuildP(self, position):
@@ -205,18 +215,55 @@ class DataPoint(object):
         if position < 0 or position > len(self._buildP) - 1:
             self.log.warning('invalid position: {0}'.format(position))
             return False
-        self._buildP.pop(position)
+        value = self._buildP.pop(position)
+        self.buildPIndex.remove(value)
         return True
 
     def clearBuildP(self):
         self._buildP = list()
+        self.buildPIndex.clear()
+
+    @staticmethod
+    def getIndex(points, sphereIndex, alt, az, radius):
+        """
+        getIndex searches the nearest point with the help of the spatial index and
+        returns the position of this point in the list of points. all methods changing
+        the points keep the index up to date.
+
+        :param points: list of points in tuples (alt, az)
+        :param sphereIndex: spatial index of the points
+        :param alt: altitude of search position in degrees
+        :param az: azimuth of search position in degrees
+        :param radius: max great circle distance in degrees
+        :return: index or none
+        """
+
+        point = sphereIndex.nearest(alt, az, radius=radius)
+        if point is None or point not in points:
+            return None
+        return points.index(point)
+
+    def getIndexBuildP(self, alt, az, radius=180):
+        """
+        getIndexBuildP returns the position of the build point which is nearest to the
+        given coordinate if it is in a distance up to radius.
+
+        :param alt: altitude of search position in degrees
+        :param az: azimuth of search position in degrees
+        :param radius: max great circle distance in degrees
+        :return: index or none
+        """
+
+        return self.getIndex(self._buildP, self.buildPIndex, alt, az, radius)
 
     def checkHorizonBoundaries(self):
         if self._horizonP[0] != (0, 0):
             self._horizonP.insert(0, (0, 0))
+            self.horizonPIndex.add((0, 0))
         horMax = len(self._horizonP)
         if self._horizonP[horMax - 1] != (0, 360):
             self._horizonP.insert(horMax, (0, 360))
+            self.horizonPIndex.add((0, 360))
 
     @property
     def horizonP(self):
@@ -235,6 +282,7 @@ class DataPoint(object):
             return
         self._horizonP = value
         self.checkHorizonBoundaries()
+        self.horizonPIndex.build(self._horizonP)
 
     @staticmethod
     def checkFormat(value):
@@ -273,6 +321,7 @@ class DataPoint(object):
         position = min(len(self._horizonP), position)
         position = max(0, position)
         self._horizonP.insert(position, value)
+        self.horizonPIndex.add(value)
         return True
 
     def delHorizonP(self, position):
@@ -294,11 +343,27 @@ class DataPoint(object):
             return False
         if self._horizonP[position] == (0, 360):
             return False
-        self._horizonP.pop(position)
+        value = self._horizonP.pop(position)
+        self.horizonPIndex.remove(value)
         return True
 
     def clearHorizonP(self):
         self._horizonP = [(0, 0), (0, 360)]
+        self.horizonPIndex.build(self._horizonP)
+
+    def getIndexHorizonP(self, alt, az, radius=180):
+        """
+        getIndexHorizonP returns the position of the horizon point which is nearest to the
+        given coordinate if it is in a distance up to radius. the position refers to the
+        horizon points sorted by azimuth as delivered by horizonP.
+
+        :param alt: altitude of search position in degrees
+        :param az: azimuth of search position in degrees
+        :param radius: max great circle distance in degrees
+        :return: index or none
+        """
+
+        return self.getIndex(self.horizonP, self.horizonPIndex, alt, az, radius)
 
     def isAboveHorizon(self, point):
         """
@@ -354,6 +419,7 @@ class DataPoint(object):
         :return: true for test purpose
         """
         self._buildP = [x for x in self._buildP if self.isAboveHorizon(x)]
+        self.buildPIndex.build(self._buildP)
         return True
 
     def deleteCloseMeridian(self):
@@ -364,6 +430,7 @@ class DataPoint(object):
         :return: true for test purpose
         """
         self._buildP = [x for x in self._buildP if self.isCloseMeridian(x)]
+        self.buildPIndex.build(self._buildP)
         return True
 
     def sort(self, eastwest=False, highlow=False):
@@ -390,6 +457,7 @@ class DataPoint(object):
             east = sorted(east, key=lambda x: -x[0])
             west = sorted(west, key=lambda x: -x[0])
 
+        # the index uses the points as keys, so the new order needs no update
         self._buildP = east + west
         return True
 
@@ -422,6 +490,7 @@ class DataPoint(object):
         # json makes list out of tuple, was to be reversed
         value = [tuple(x) for x in value]
         self._buildP = value
+        self.buildPIndex.build(value)
         return True
 
     def saveBuildP(self, fileName=None):
@@ -470,6 +539,7 @@ class DataPoint(object):
         # json makes list out of tuple, was to be reversed
         value = [tuple(x) for x in value]
         self._horizonP = value
+        self.horizonPIndex.build(value)
         return True
 
     @staticmethod
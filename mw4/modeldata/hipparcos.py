@@ -19,14 +19,38 @@
 ###########################################################
 # standard libraries
 import logging
+import threading
 # external packages
 import numpy as np
 import astropy._erfa as erfa
 # local imports
 from mw4.base.loggerMW import CustomLogger
+from mw4.base.sphereIndex import SphereIndex
 from mw4.modeldata.alignstars import generateAlignStars
 
 
+def rotateToAltAz(ra, dec, era, longitude, latitude):
+    """
+    rotateToAltAz rotates CIRS coordinates with the earth rotation angle to the
+    horizontal system of the observer without refraction.
+
+    :param ra: CIRS right ascension in radians
+    :param dec: CIRS declination in radians
+    :param era: earth rotation angle in radians
+    :param longitude: in radians
+    :param latitude: in radians
+    :return: alt, az in degrees
+    """
+
+    ha = era + longitude - ra
+    sinAlt = np.sin(dec) * np.sin(latitude) + np.cos(dec) * np.cos(latitude) * np.cos(ha)
+    alt = np.arcsin(np.clip(sinAlt, -1, 1))
+    az = np.arctan2(-np.cos(dec) * np.sin(ha),
+                    np.sin(dec) * np.cos(latitude)
+                    - np.cos(dec) * np.sin(latitude) * np.cos(ha))
+    return np.degrees(alt), np.degrees(az) % 360
+
+
 class Hipparcos(object):
     """
     The class Data inherits all information and handling of hipparcos data and other
@@ -42,11 +66,18 @@ class Hipparcos(object):
     __all__ = ['Hipparcos',
                'calculateAlignStarsPositionsAltAz',
                'getAlignStarRaDecFromIndex',
+               'getAlignStarNameFromAltAz',
+               'calculateCatalogPositionsAltAz',
+               'workerCatalogPositions',
+               'applyCatalogPositions',
                ]
 
     logger = logging.getLogger(__name__)
     log = CustomLogger(logger, {})
 
+    # validity of the apparent places in days when using incremental updates
+    APPARENT_VALIDITY = 0.5
+
     def __init__(self,
                  app=None,
                  ):
@@ -56,8 +87,26 @@ class Hipparcos(object):
         self.name = list()
         self.alt = list()
         self.az = list()
+        self.starIndex = SphereIndex()
+        self.starIndexValid = False
+        self.catalog = None
+        self.catalogHip = np.zeros(0, dtype=int)
+        self.catalogMag = np.zeros(0)
+        self.catalogAlt = np.zeros(0)
+        self.catalogAz = np.zeros(0)
+        self.catalogLock = threading.Lock()
+        self.catalogQuery = None
+        self.catalogStars = None
+        self.catalogTime = 0
+        self.catalogRa = np.zeros(0)
+        self.catalogDec = np.zeros(0)
+        self.incremental = True
+        self.apparentStars = None
+        self.apparentLocation = None
+        self.apparentTime = 0
+        self.apparentRa = np.zeros(0)
+        self.apparentDec = np.zeros(0)
         self.alignStars = generateAlignStars()
-        self.calculateAlignStarPositionsAltAz()
 
     def calculateAlignStarPositionsAltAz(self):
         """
@@ -69,6 +118,9 @@ class Hipparcos(object):
         the alignstars file. there is no refraction data taken into account, because we need
         this only for display purpose and for this, the accuracy is more than sufficient.
 
+        in incremental mode the apparent places are calculated only once in a while and
+        the alt az coordinates are derived with the actual earth rotation angle.
+
         :return: lists for alt, az and name of star
         """
 
@@ -76,6 +128,10 @@ class Hipparcos(object):
         if location is None:
             return False
         t = self.app.mount.obsSite.timeJD
+
+        if self.incremental:
+            return self.calculateAlignStarPositionsIncremental(location, t)
+
         star = list(self.alignStars.values())
         self.name = list(self.alignStars.keys())
 
@@ -99,8 +155,88 @@ class Hipparcos(object):
                                                   0.0)
         self.az = aob * 360 / 2 / np.pi
         self.alt = 90.0 - zob * 360 / 2 / np.pi
+        self.starIndexValid = False
         return True
 
+    def calculateApparentPlaces(self, location, t):
+        """
+        calculateApparentPlaces does calculate the CIRS coordinates of the alignment stars
+        with erfa atci13. this includes proper motion, parallax, radial velocity,
+        precession, nutation and aberration, which all change very slowly, so the
+        result could be used for the whole night.
+
+        :param location: observer location
+        :param t: time of calculation
+        :return: true for test purpose
+        """
+
+        star = list(self.alignStars.values())
+        self.name = list(self.alignStars.keys())
+        ra, dec, eo = erfa.atci13([x[0] for x in star],
+                                  [x[1] for x in star],
+                                  [x[2] for x in star],
+                                  [x[3] for x in star],
+                                  [x[4] for x in star],
+                                  [x[5] for x in star],
+                                  t.ut1,
+                                  0.0,
+                                  )
+        self.apparentRa = np.asarray(ra)
+        self.apparentDec = np.asarray(dec)
+        self.apparentTime = t.ut1
+        self.apparentStars = self.alignStars
+        self.apparentLocation = (location.latitude.degrees,
+                                 location.longitude.degrees)
+        return True
+
+    def calculateAlignStarPositionsIncremental(self, location, t):
+        """
+        calculateAlignStarPositionsIncremental does calculate the star coordinates out of
+        the stored apparent places. only the earth rotation angle is calculated for each
+        call and the hour angle is rotated to alt az. the apparent places are renewed if
+        the star list or the location changed or if they are older than
+        APPARENT_VALIDITY. the result differs from atco13 without refraction only by
+        diurnal aberration and polar motion, which is far below display resolution.
+
+        :param location: observer location
+        :param t: time of calculation
+        :return: success
+        """
+
+        loc = (location.latitude.degrees, location.longitude.degrees)
+        isOld = abs(t.ut1 - self.apparentTime) > self.APPARENT_VALIDITY
+        isChanged = self.apparentStars is not self.alignStars
+        isMoved = self.apparentLocation != loc
+        if isOld or isChanged or isMoved:
+            self.calculateApparentPlaces(location, t)
+
+        self.alt, self.az = rotateToAltAz(self.apparentRa,
+                                          self.apparentDec,
+                                          erfa.era00(t.ut1, 0.0),
+                                          location.longitude.radians,
+                                          location.latitude.radians)
+        self.starIndexValid = False
+        return True
+
+    def getAlignStarNameFromAltAz(self, alt, az, radius=2):
+        """
+        getAlignStarNameFromAltAz searches the alignment star which is nearest to the given
+        position. the spatial index is only rebuilt when the star positions were
+        recalculated in between, so the positions calculated every 10s do not cost
+        anything as long as nobody is selecting stars.
+
+        :param alt: altitude of search position in degrees
+        :param az: azimuth of search position in degrees
+        :param radius: max great circle distance in degrees
+        :return: name of star or None
+        """
+
+        if not self.starIndexValid:
+            self.starIndex.build(zip(self.alt, self.az), keys=self.name)
+            self.starIndexValid = True
+
+        return self.starIndex.nearest(alt, az, radius=radius)
+
     def getAlignStarRaDecFromName(self, name):
         """
         getAlignStarRaDecFromName does calculate the star coordinates from give data
@@ -135,3 +271,102 @@ class Hipparcos(object):
         dec = dec * 360 / 2 / np.pi
 
         return ra, dec
+
+    def workerCatalogPositions(self, magLimit=6):
+        """
+        workerCatalogPositions does calculate the alt az coordinates of the stars in the
+        large star catalogue if one is present. only the tiles of the catalogue which are
+        around zenith (visible part of the sky) are loaded. the same way as for the
+        alignment stars, the apparent places are calculated only if the tiles, the
+        location or the magnitude limit changed or if they are older than
+        APPARENT_VALIDITY. for each call only the earth rotation is applied. it runs in a
+        worker thread, the result is taken over by applyCatalogPositions.
+
+        :param magLimit: faintest magnitude to be used
+        :return: dict with hip, mag, alt, az or None
+        """
+
+        if self.catalog is None:
+            return None
+        location = self.app.mount.obsSite.location
+        if location is None:
+            return None
+        t = self.app.mount.obsSite.timeJD
+
+        # zenith in equatorial coordinates is the center of the visible sky
+        era = erfa.era00(t.ut1, 0.0)
+        raZenith = era + location.longitude.radians
+        decZenith = location.latitude.radians
+        radius = np.radians(95)
+        regions = self.catalog.tilesForRegion(ra=raZenith, dec=decZenith, radius=radius)
+        query = (frozenset(regions),
+                 magLimit,
+                 location.latitude.degrees,
+                 location.longitude.degrees)
+
+        with self.catalogLock:
+            isOld = abs(t.ut1 - self.catalogTime) > self.APPARENT_VALIDITY
+            if isOld or query != self.catalogQuery:
+                stars = self.catalog.query(magLimit=magLimit,
+                                           ra=raZenith,
+                                           dec=decZenith,
+                                           radius=radius)
+                ra, dec, eo = erfa.atci13(stars['ra'],
+                                          stars['dec'],
+                                          stars['pmRA'],
+                                          stars['pmDec'],
+                                          stars['parallax'],
+                                          stars['radVel'],
+                                          t.ut1,
+                                          0.0,
+                                          )
+                self.catalogStars = stars
+                self.catalogRa = np.asarray(ra)
+                self.catalogDec = np.asarray(dec)
+                self.catalogTime = t.ut1
+                self.catalogQuery = query
+
+            stars = self.catalogStars
+            alt, az = rotateToAltAz(self.catalogRa,
+                                    self.catalogDec,
+                                    era,
+                                    location.longitude.radians,
+                                    location.latitude.radians)
+
+        return {'hip': stars['hip'],
+                'mag': stars['mag'],
+                'alt': alt,
+                'az': az,
+                }
+
+    def applyCatalogPositions(self, result):
+        """
+        applyCatalogPositions takes over the result of workerCatalogPositions.
+
+        :param result: dict with hip, mag, alt, az or None
+        :return: changed
+        """
+
+        if result is None:
+            return False
+
+        sameStars = np.array_equal(result['hip'], self.catalogHip)
+        samePos = (np.array_equal(result['alt'], self.catalogAlt)
+                   and np.array_equal(result['az'], self.catalogAz))
+        self.catalogHip = result['hip']
+        self.catalogMag = result['mag']
+        self.catalogAlt = result['alt']
+        self.catalogAz = result['az']
+        return not (sameStars and samePos)
+
+    def calculateCatalogPositionsAltAz(self, magLimit=6):
+        """
+        calculateCatalogPositionsAltAz does calculate the alt az coordinates of the stars
+        in the large star catalogue in the calling thread.
+
+        :param magLimit: faintest magnitude to be used
+        :return: changed
+        """
+
+        result = self.workerCatalogPositions(magLimit=magLimit)
+        return self.applyCatalogPositions(result)
@@ -0,0 +1,322 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import logging
+import os
+# external packages
+import numpy as np
+# local imports
+from mw4.base.loggerMW import CustomLogger
+
+__all__ = ['StarCatalog',
+           ]
+
+
+class StarCatalog(object):
+    """
+    The class StarCatalog handles a large star catalogue (e.g. all hipparcos stars up to
+    magnitude 8) which is stored on disk as numpy structured array. the stars are sorted
+    by tiles of magnitude and sky region, so each tile is a contiguous slice of the file.
+    the file is opened memory mapped, therefore only the tiles, which are needed for a
+    query are read from disk.
+
+    the data is written in the units erfa needs (same as in alignstars):
+    [hip no, ra, dec, ra proper motion, dec proper motion, parallax, radial velocity, mag]
+    [int, radians, radians, radians / year, radians / year, arc sec, km / s, mag]
+    based on J2000 epoch.
+
+        >>> catalog = StarCatalog(
+        >>>                       pathDir=pathDir,
+        >>>                       )
+    """
+
+    __all__ = ['StarCatalog',
+               'available',
+               'writeCatalog',
+               'importHipparcos',
+               'tilesForRegion',
+               'query',
+               ]
+
+    logger = logging.getLogger(__name__)
+    log = CustomLogger(logger, {})
+
+    DTYPE = np.dtype([('hip', 'i4'),
+                      ('ra', 'f8'),
+                      ('dec', 'f8'),
+                      ('pmRA', 'f8'),
+                      ('pmDec', 'f8'),
+                      ('parallax', 'f8'),
+                      ('radVel', 'f8'),
+                      ('mag', 'f4'),
+                      ])
+    TILE_DTYPE = np.dtype([('mag', 'i2'),
+                           ('region', 'i2'),
+                           ('start', 'i8'),
+                           ('stop', 'i8'),
+                           ])
+
+    # upper magnitude limits of the tiles, brighter tiles first
+    MAG_EDGES = [2, 4, 6, 7, 8, 99]
+    # size of the sky regions in degrees
+    DEC_STEP = 30
+    RA_STEP = 30
+
+    FILE_STARS = 'stars.npy'
+    FILE_TILES = 'tiles.npy'
+
+    def __init__(self,
+                 pathDir='',
+                 ):
+
+        self.pathDir = pathDir
+        self.stars = None
+        self.tiles = None
+
+    @property
+    def numberRa(self):
+        return int(360 / self.RA_STEP)
+
+    @property
+    def numberDec(self):
+        return int(180 / self.DEC_STEP)
+
+    def available(self):
+        """
+        available checks if the catalogue files are present
+
+        :return: status
+        """
+
+        fileStars = os.path.join(self.pathDir, self.FILE_STARS)
+        fileTiles = os.path.join(self.pathDir, self.FILE_TILES)
+        return os.path.isfile(fileStars) and os.path.isfile(fileTiles)
+
+    def open(self):
+        """
+        open loads the tile table and opens the star data memory mapped. no star data is
+        read from disk at that point.
+
+        :return: success
+        """
+
+        if self.stars is not None:
+            return True
+        if not self.available():
+            return False
+
+        try:
+            self.tiles = np.load(os.path.join(self.pathDir, self.FILE_TILES))
+            self.stars = np.load(os.path.join(self.pathDir, self.FILE_STARS),
+                                 mmap_mode='r')
+        except Exception as e:
+            self.log.critical(f'Cannot load catalogue from {self.pathDir}, error: {e}')
+            self.stars = None
+            self.tiles = None
+            return False
+
+        return True
+
+    def close(self):
+        """
+        close releases the memory map
+
+        :return: true for test purpose
+        """
+
+        self.stars = None
+        self.tiles = None
+        return True
+
+    def magTile(self, mag):
+        """
+        magTile returns the magnitude tile number for given magnitudes
+
+        :param mag: value or array of magnitudes
+        :return: tile number
+        """
+
+        return np.searchsorted(self.MAG_EDGES, mag, side='right')
+
+    def regionTile(self, ra, dec):
+        """
+        regionTile returns the region tile number for given coordinates. regions are
+        bands in declination, which are split in sectors of right ascension.
+
+        :param ra: value or array of right ascension in radians
+        :param dec: value or array of declination in radians
+        :return: tile number
+        """
+
+        ra = np.degrees(ra) % 360
+        dec = np.degrees(dec)
+        raIndex = np.clip((ra // self.RA_STEP).astype(int), 0, self.numberRa - 1)
+        decIndex = np.clip(((dec + 90) // self.DEC_STEP).astype(int), 0, self.numberDec - 1)
+        return decIndex * self.numberRa + raIndex
+
+    def writeCatalog(self, stars):
+        """
+        writeCatalog sorts the stars by magnitude and region tiles and writes the star
+        data together with the tile table to the catalogue directory.
+
+        :param stars: numpy structured array with DTYPE
+        :return: success
+        """
+
+        if stars.dtype != self.DTYPE:
+            self.log.warning(f'Wrong data type for catalogue: {stars.dtype}')
+            return False
+
+        os.makedirs(self.pathDir, exist_ok=True)
+        magTiles = self.magTile(stars['mag'])
+        regionTiles = self.regionTile(stars['ra'], stars['dec'])
+        order = np.lexsort((stars['mag'], regionTiles, magTiles))
+        stars = stars[order]
+        magTiles = magTiles[order]
+        regionTiles = regionTiles[order]
+
+        keys = magTiles * self.numberRa * self.numberDec + regionTiles
+        unique, start = np.unique(keys, return_index=True)
+        stop = np.append(start[1:], len(stars))
+        tiles = np.zeros(len(unique), dtype=self.TILE_DTYPE)
+        tiles['mag'] = magTiles[start]
+        tiles['region'] = regionTiles[start]
+        tiles['start'] = start
+        tiles['stop'] = stop
+
+        self.close()
+        np.save(os.path.join(self.pathDir, self.FILE_STARS), stars)
+        np.save(os.path.join(self.pathDir, self.FILE_TILES), tiles)
+        return True
+
+    def importHipparcos(self, fileName, magLimit=8):
+        """
+        importHipparcos converts the hipparcos main catalogue (hip_main.dat from CDS,
+        I/239) to the tiled catalogue format. the hipparcos positions are based on epoch
+        J1991,25, so the positions are moved with the proper motion to J2000. there are no
+        radial velocities in the catalogue, so they are set to zero.
+
+        :param fileName: path to hip_main.dat
+        :param magLimit: faintest magnitude to be imported
+        :return: success
+        """
+
+        if not os.path.isfile(fileName):
+            return False
+
+        masToRad = np.radians(1 / 3600 / 1000)
+        data = list()
+        with open(fileName, 'r') as inFile:
+            for line in inFile:
+                fields = line.split('|')
+                try:
+                    hip = int(fields[1])
+                    mag = float(fields[5])
+                    ra = np.radians(float(fields[8]))
+                    dec = np.radians(float(fields[9]))
+                    parallax = float(fields[11]) / 1000
+                    pmRA = float(fields[12]) * masToRad / np.cos(dec)
+                    pmDec = float(fields[13]) * masToRad
+                except (ValueError, IndexError):
+                    continue
+                if mag > magLimit:
+                    continue
+                ra = (ra + pmRA * 8.75) % (2 * np.pi)
+                dec = dec + pmDec * 8.75
+                data.append((hip, ra, dec, pmRA, pmDec, parallax, 0.0, mag))
+
+        stars = np.array(data, dtype=self.DTYPE)
+        return self.writeCatalog(stars)
+
+    def tilesForRegion(self, ra=None, dec=None, radius=None):
+        """
+        tilesForRegion returns the region tile numbers which overlap with a spherical cap
+        around ra, dec with radius. the selection is conservative, so some stars outside
+        the cap will be included.
+
+        :param ra: center right ascension in radians
+        :param dec: center declination in radians
+        :param radius: radius of cap in radians
+        :return: set of region tile numbers
+        """
+
+        allRegions = set(range(self.numberRa * self.numberDec))
+        if ra is None or dec is None or radius is None:
+            return allRegions
+
+        raDeg = np.degrees(ra) % 360
+        decDeg = np.degrees(dec)
+        radiusDeg = np.degrees(radius)
+        if radiusDeg >= 180:
+            return allRegions
+
+        decMin = max(decDeg - radiusDeg, -90)
+        decMax = min(decDeg + radiusDeg, 90)
+        decBands = [i for i in range(self.numberDec)
+                    if i * self.DEC_STEP - 90 <= decMax
+                    and (i + 1) * self.DEC_STEP - 90 >= decMin]
+
+        # if the cap contains a pole, all right ascensions are needed
+        if decDeg + radiusDeg >= 90 or decDeg - radiusDeg <= -90:
+            raSectors = list(range(self.numberRa))
+        else:
+            ratio = np.sin(radius) / np.cos(dec)
+            if ratio >= 1:
+                raSectors = list(range(self.numberRa))
+            else:
+                width = np.degrees(np.arcsin(ratio))
+                first = int((raDeg - width) // self.RA_STEP)
+                last = int((raDeg + width) // self.RA_STEP)
+                raSectors = sorted({i % self.numberRa for i in range(first, last + 1)})
+
+        return {band * self.numberRa + sector for band in decBands for sector in raSectors}
+
+    def query(self, magLimit=6, ra=None, dec=None, radius=None):
+        """
+        query collects all stars up to magLimit in the region around ra, dec. only the
+        matching tiles are read from the memory mapped file and copied to memory.
+
+        :param magLimit: faintest magnitude
+        :param ra: center right ascension in radians
+        :param dec: center declination in radians
+        :param radius: radius of cap in radians
+        :return: numpy structured array of stars
+        """
+
+        if not self.open():
+            return np.zeros(0, dtype=self.DTYPE)
+
+        regions = self.tilesForRegion(ra=ra, dec=dec, radius=radius)
+        maxMagTile = self.magTile(magLimit)
+
+        parts = list()
+        for tile in self.tiles:
+            if tile['mag'] > maxMagTile:
+                continue
+            if tile['region'] not in regions:
+                continue
+            parts.append(self.stars[tile['start']:tile['stop']])
+
+        if not parts:
+            return np.zeros(0, dtype=self.DTYPE)
+
+        stars = np.concatenate(parts)
+        stars = stars[stars['mag'] <= magLimit]
+        return stars
@@ -19,13 +19,17 @@
 ###########################################################
 # standard libraries
 import logging
-import re
 import time
+import collections
+import xml.etree.ElementTree as ElementTree
 # external packages
 import PyQt5
 import requests
 # local imports
 from mw4.base.loggerMW import CustomLogger
+from mw4.base.tpool import Worker
+from mw4.base.taskExecutor import TaskExecutor
+from mw4.base.traceRecorder import recorder
 
 
 class KMRelay(PyQt5.QtCore.QObject):
@@ -33,7 +37,14 @@ class KMRelay(PyQt5.QtCore.QObject):
     The class KMRelay inherits all information and handling of KMtronic relay board
     attributes of the connected board and provides the abstracted interface.
 
-        >>> relay = KMRelay(host=None, user='', password='')
+    all requests run in the control lane of the executor on a persistent session, so
+    the connection to the box is kept alive and a box which does not answer never blocks
+    the gui. polling is skipped as long as the last poll is not finished. relay
+    commands are queued and executed one after the other, commands which are
+    overwritten by a later one for the same relay are removed from the queue before they
+    are sent.
+
+        >>> relay = KMRelay(app=app, host=None, user='', password='')
 
     """
 
@@ -41,6 +52,7 @@ class KMRelay(PyQt5.QtCore.QObject):
                'startCommunication',
                'stopCommunication',
                'cyclePolling',
+               'queueCommand',
                'pulse',
                'switch',
                'set',
@@ -55,18 +67,29 @@ class KMRelay(PyQt5.QtCore.QObject):
     DEFAULT_PORT = 80
     # timeout for requests
     TIMEOUT = 0.5
+    # max time in ms to wait for a running request before sending a new one
+    LOCK_TIMEOUT = 1500
     # width for pulse
     PULSEWIDTH = 0.5
     # signal if correct status received and decoded
     statusReady = PyQt5.QtCore.pyqtSignal()
+    # signal if a queued command could not be performed
+    commandFailed = PyQt5.QtCore.pyqtSignal(int)
 
     def __init__(self,
+                 app=None,
                  host=None,
                  user=None,
                  password=None,
                  ):
         super().__init__()
 
+        self.app = app
+        if app is not None:
+            self.executor = app.executor
+        else:
+            self.executor = TaskExecutor()
+
         # minimum set for driver package built in
         self.framework = None
         self.run = {
@@ -74,11 +97,18 @@ class KMRelay(PyQt5.QtCore.QObject):
         }
         self.name = ''
 
+        self.session = requests.Session()
+        self._user = None
+        self._password = None
         self.host = host
         self.mutexPoll = PyQt5.QtCore.QMutex()
+        self.mutexCommand = PyQt5.QtCore.QMutex()
         self.user = user
         self.password = password
         self.status = [0] * 8
+        self.statusText = None
+        self.commands = collections.deque()
+        self.commandRunning = False
 
         self.timerTask = PyQt5.QtCore.QTimer()
         self.timerTask.setSingleShot(False)
@@ -113,6 +143,7 @@ class KMRelay(PyQt5.QtCore.QObject):
     @user.setter
     def user(self, value):
         self._user = value
+        self.session.auth = requests.auth.HTTPBasicAuth(value, self.password)
 
     @property
     def password(self):
@@ -121,6 +152,7 @@ class KMRelay(PyQt5.QtCore.QObject):
     @password.setter
     def password(self, value):
         self._password = value
+        self.session.auth = requests.auth.HTTPBasicAuth(self.user, value)
 
     def startCommunication(self):
         """
@@ -161,20 +193,27 @@ class KMRelay(PyQt5.QtCore.QObject):
             self.log.warning('No valid result')
             return False
 
+        # the output is only prepared, if it is written
+        if not self.log.isEnabledFor(logging.DEBUG):
+            return True
+
         text = result.text.replace('\r\n', ', ')
         reason = result.reason
         status = result.status_code
         url = result.url
         elapsed = result.elapsed
 
-        self.log.debug(f'Result: {url}, {reason}, {status}, {elapsed}, {text}')
+        self.log.debug('Result: %s, %s, %s, %s, %.500s',
+                       url, reason, status, elapsed, text)
 
         return True
 
     def getRelay(self, url='/status.xml', debug=True):
         """
         getRelay sets and reads data from the given host ip using the given
-        user and password
+        user and password. the request uses the persistent session, so the connection to
+        the box is reused. if there is a request running, it waits for it up to
+        LOCK_TIMEOUT.
 
         :param url: web address of relay box
         :param debug: write extended debug output
@@ -184,23 +223,36 @@ class KMRelay(PyQt5.QtCore.QObject):
         if self.host is None:
             return None
 
-        if not self.mutexPoll.tryLock():
+        if not self.mutexPoll.tryLock(self.LOCK_TIMEOUT):
             return None
 
-        auth = requests.auth.HTTPBasicAuth(self.user,
-                                           self.password,
-                                           )
+        path = url
+        kind = 'poll' if path == '/status.xml' else 'command'
         url = f'http://{self._host[0]}:{self._host[1]}{url}'
         result = None
+        status = 0
 
+        timeStart = time.perf_counter()
         try:
-            result = requests.get(url, auth=auth, timeout=self.TIMEOUT)
+            result = self.session.get(url, timeout=self.TIMEOUT)
         except requests.exceptions.Timeout:
             self.log.info(f'Connection timeout: [{url}]')
+            status = -1
         except requests.exceptions.ConnectionError:
             self.log.info(f'Connection error: [{url}]')
+            status = -2
         except Exception as e:
             self.log.critical(f'Error in request: {e}')
+            status = -3
+
+        latency = time.perf_counter() - timeStart
+        if result is not None:
+            recorder.record('kmRelay', path, kind=kind, latency=latency,
+                            size=len(getattr(result, 'content', None) or b''),
+                            status=result.status_code)
+        else:
+            recorder.record('kmRelay', path, kind=kind, latency=latency, status=status)
+            recorder.dumpOnError(reason=f'kmRelay {path} failed')
 
         if debug:
             self.debugOutput(result=result)
@@ -208,32 +260,161 @@ class KMRelay(PyQt5.QtCore.QObject):
         self.mutexPoll.unlock()
         return result
 
-    def cyclePolling(self):
+    def parseStatus(self, text):
         """
-        cyclePolling reads the status of the relay status of each single relay.
-        with success the statusReady single is sent.
+        parseStatus reads the relay states out of the status xml of the box. the relays
+        are named relay1 to relay8. if the text is the same as in the last poll, the
+        cached states are used.
 
-        :return: success
+        :param text: status xml
+        :return: list of relay states or None
+        """
+
+        if text == self.statusText:
+            return list(self.status)
+
+        try:
+            root = ElementTree.fromstring(text)
+        except ElementTree.ParseError:
+            self.log.warning(f'Cannot parse status: [{text}]')
+            return None
+
+        status = list(self.status)
+        for element in root:
+            if not element.tag.startswith('relay'):
+                continue
+            try:
+                number = int(element.tag[5:])
+                value = int(element.text)
+            except (ValueError, TypeError):
+                continue
+            if 1 <= number <= len(status):
+                status[number - 1] = value
+
+        self.statusText = text
+        return status
+
+    def pollWorker(self):
+        """
+        pollWorker reads the status of the box and parses it in the worker thread
+
+        :return: list of relay states or None
         """
 
         value = self.getRelay('/status.xml', debug=False)
 
         if value is None:
-            return False
+            return None
         if value.reason != 'OK':
-            return False
+            return None
 
-        lines = value.text.splitlines()
-        for line in lines:
-            value = re.findall(r'\d', line)
-            if not value:
-                continue
-            value = [int(s) for s in value]
-            self.status[value[0] - 1] = value[1]
+        return self.parseStatus(value.text)
+
+    def pollResult(self, status):
+        """
+        pollResult stores the relay states and sends the statusReady signal
+
+        :param status: list of relay states or None
+        :return: success
+        """
+
+        if status is None:
+            return False
 
+        self.status = status
         self.statusReady.emit()
         return True
 
+    def cyclePolling(self):
+        """
+        cyclePolling starts reading the status of each single relay in the control lane
+        of the executor. if the last poll did not finish (e.g. the box does not answer),
+        no further poll is started. with success the statusReady single is sent.
+
+        :return: success
+        """
+
+        if self.host is None:
+            return False
+
+        worker = Worker(self.pollWorker)
+        worker.signals.result.connect(self.pollResult)
+        suc = self.executor.start(worker, lane='control', key='kmRelay:poll')
+        return suc
+
+    def queueCommand(self, command, relayNumber, value=None):
+        """
+        queueCommand puts a relay command (pulse, switch, set) into the command queue.
+        queued commands for the same relay, which are overwritten by the new one, are
+        removed: set and pulse replace waiting set and switch commands, a second switch
+        cancels a waiting switch.
+
+        :param command: name of the command
+        :param relayNumber: number of relay, counting from 0 onwards
+        :param value: relay state for set
+        :return: success
+        """
+
+        if command not in ['pulse', 'switch', 'set']:
+            return False
+        if self.host is None:
+            return False
+
+        self.mutexCommand.lock()
+        queued = [x for x in self.commands if x[1] == relayNumber]
+        if command in ['set', 'pulse']:
+            for item in queued:
+                if item[0] in ['set', 'switch']:
+                    self.commands.remove(item)
+            self.commands.append((command, relayNumber, value))
+        else:
+            switches = [x for x in queued if x[0] == 'switch']
+            if switches:
+                self.commands.remove(switches[-1])
+            else:
+                self.commands.append((command, relayNumber, value))
+
+        startWorker = not self.commandRunning and bool(self.commands)
+        if startWorker:
+            self.commandRunning = True
+        self.mutexCommand.unlock()
+
+        if startWorker:
+            # commandRunning is set under the command mutex, so no key is needed
+            worker = Worker(self.commandWorker)
+            self.executor.start(worker, lane='control')
+
+        return True
+
+    def commandWorker(self):
+        """
+        commandWorker sends the queued commands one after the other until the queue is
+        empty.
+
+        :return: true for test purpose
+        """
+
+        while True:
+            self.mutexCommand.lock()
+            if not self.commands:
+                self.commandRunning = False
+                self.mutexCommand.unlock()
+                break
+            command, relayNumber, value = self.commands.popleft()
+            self.mutexCommand.unlock()
+
+            if command == 'pulse':
+                suc = self.pulse(relayNumber)
+            elif command == 'switch':
+                suc = self.switch(relayNumber)
+            else:
+                suc = self.set(relayNumber, value)
+
+            if not suc:
+                self.commandFailed.emit(relayNumber)
+
+        return True
+
     def getByte(self, relayNumber=0, state=False):
         """
         getByte generates the right bit mask for setting or resetting the relay mask
@@ -278,6 +459,7 @@ class KMRelay(PyQt5.QtCore.QObject):
             self.log.error(f'Relay:{relayNumber}')
             return False
 
+        self.status[relayNumber] = 0
         return True
 
     def switch(self, relayNumber):
@@ -298,6 +480,7 @@ class KMRelay(PyQt5.QtCore.QObject):
             self.log.error(f'Relay:{relayNumber}')
             return False
 
+        self.status[relayNumber] = int(not self.status[relayNumber])
         return True
 
     def set(self, relayNumber, value):
@@ -311,13 +494,14 @@ class KMRelay(PyQt5.QtCore.QObject):
 
         self.log.info(f'Set relay:{relayNumber}')
         byteOn = self.getByte(relayNumber=relayNumber, state=value)
-        value = self.getRelay(f'/FFE0{byteOn:02X}')
+        result = self.getRelay(f'/FFE0{byteOn:02X}')
 
-        if value is None:
+        if result is None:
             self.log.error(f'Relay:{relayNumber}')
             return False
-        elif value.reason != 'OK':
+        elif result.reason != 'OK':
             self.log.error(f'Relay:{relayNumber}')
             return False
 
+        self.status[relayNumber] = int(bool(value))
         return True
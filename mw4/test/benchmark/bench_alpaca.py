@@ -0,0 +1,167 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import os
+import pytest
+
+# external packages
+import PyQt5
+from PyQt5.QtCore import QObject
+from PyQt5.QtCore import pyqtSignal
+
+# local import
+from mw4.base.taskExecutor import TaskExecutor
+from mw4.dome.domeAlpaca import DomeAlpaca
+from mw4.imaging.cameraAlpaca import CameraAlpaca
+from mw4.test.simulator.alpacaSimulator import AlpacaSimulator
+
+# load scenarios against the alpaca simulator: polling many devices on a fast and on a
+# slow network, image download and the delay from polling to the update in the gui
+# thread. the drivers of mw4 are used unchanged.
+
+NUMBER_DOMES = 24
+IMAGE_SIZE = (1000, 800)
+
+
+@pytest.fixture(autouse=True, scope='module')
+def module_setup_teardown(qapp, mount):
+    class MainW:
+        deviceStat = {'mount': False}
+
+    class Test(QObject):
+        message = pyqtSignal(object, object)
+        threadPool = PyQt5.QtCore.QThreadPool()
+        executor = TaskExecutor()
+        mainW = MainW()
+
+    class Signals(QObject):
+        message = pyqtSignal(object)
+        azimuth = pyqtSignal(object)
+        slewFinished = pyqtSignal()
+        integrated = pyqtSignal()
+        saved = pyqtSignal(object)
+
+    Test.mount = mount
+
+    global app, simulator, domes, camera, signals
+    app = Test()
+    signals = Signals()
+    simulator = AlpacaSimulator()
+    simulator.addDevices('dome', number=NUMBER_DOMES)
+    device = simulator.addDevice('camera')
+    device.values.update({'cameraxsize': IMAGE_SIZE[0], 'cameraysize': IMAGE_SIZE[1]})
+    simulator.start(port=0)
+
+    domes = list()
+    for i in range(NUMBER_DOMES):
+        dome = DomeAlpaca(app=app, signals=signals, data={})
+        dome.host = ('localhost', simulator.port)
+        dome.name = f'dome:{i}'
+        domes.append(dome)
+
+    camera = CameraAlpaca(app=app, signals=signals, data={})
+    camera.host = ('localhost', simulator.port)
+    camera.name = 'camera:0'
+    camera.getInitialConfig()
+    yield
+    app.threadPool.waitForDone(5000)
+    app.executor.waitForDone(5000)
+    simulator.stop()
+    del app
+
+
+@pytest.fixture(autouse=True, scope='function')
+def function_setup_teardown():
+    for device in simulator.devices.values():
+        device.latency = 0
+        device.jitter = 0
+    yield
+
+
+def pollRound(devices):
+    for device in devices:
+        device.workerPollData()
+
+
+def pollRoundPool(devices):
+    for device in devices:
+        app.threadPool.start(PyQt5.QtCore.QRunnable.create(device.workerPollData))
+    app.threadPool.waitForDone()
+
+
+def pollToGui(devices):
+    """
+    pollToGui polls the devices in the executor like the cyclic timer does and waits
+    until all results are shown in the gui thread. the time is the delay between the
+    start of polling and the update of the gui.
+    """
+
+    loop = PyQt5.QtCore.QEventLoop()
+    count = [0]
+
+    def received(value):
+        count[0] += 1
+        if count[0] == len(devices):
+            loop.quit()
+
+    signals.azimuth.connect(received)
+    for device in devices:
+        device.deviceConnected = True
+        device.pollData()
+    loop.exec_()
+    signals.azimuth.disconnect(received)
+    # the polls are keyed in the executor, so the next round needs them finished
+    app.executor.waitForDone()
+
+
+def test_poll(bench):
+    bench(pollRound, domes)
+
+
+def test_poll_slowNetwork(bench):
+    for device in simulator.devices.values():
+        device.latency = 0.02
+        device.jitter = 0.02
+    bench(pollRound, domes[:6])
+
+
+def test_poll_threadPool(bench):
+    for device in simulator.devices.values():
+        device.latency = 0.02
+        device.jitter = 0.02
+    bench(pollRoundPool, domes[:6])
+
+
+def test_download(bench):
+    imagePath = os.path.join('mw4/test/temp', 'benchAlpaca.fits')
+    bench(camera.workerExpose,
+          imagePath=imagePath,
+          expTime=0,
+          width=IMAGE_SIZE[0],
+          height=IMAGE_SIZE[1],
+          rounds=3)
+    os.remove(imagePath)
+
+
+def test_guiResponsiveness(bench):
+    for device in simulator.devices.values():
+        device.latency = 0.02
+        device.jitter = 0.02
+    bench(pollToGui, domes, rounds=3)
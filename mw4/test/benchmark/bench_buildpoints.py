@@ -0,0 +1,81 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import random
+import pytest
+
+# external packages
+import numpy as np
+from skyfield.api import Angle
+
+# local import
+from mw4.modeldata.buildpoints import DataPoint
+
+
+@pytest.fixture(autouse=True, scope='module')
+def module_setup_teardown(mount):
+    class Test:
+        pass
+
+    Test.mount = mount
+
+    global app, horizon
+    app = DataPoint(app=Test(), configDir='mw4/test/config')
+    azimuth = np.linspace(0, 360, 361)
+    altitude = 15 + 10 * np.sin(np.radians(azimuth * 3))
+    horizon = [(alt, az) for alt, az in zip(altitude, azimuth)]
+    yield
+    del app
+
+
+def test_genGreaterCircle(bench):
+    random.seed(0)
+    assert bench(app.genGreaterCircle, 'max')
+
+
+def test_genGrid(bench):
+    assert bench(app.genGrid, minAlt=5, maxAlt=85, numbRows=8, numbCols=14)
+
+
+def test_generateGoldenSpiral(bench):
+    assert bench(app.generateGoldenSpiral, numberPoints=1000)
+
+
+def test_generateDSOPath(bench):
+    obsSite = app.app.mount.obsSite
+    assert bench(app.generateDSOPath,
+                 ra=Angle(hours=6),
+                 dec=Angle(degrees=40),
+                 timeJD=obsSite.timeJD,
+                 location=obsSite.location,
+                 numberPoints=50,
+                 duration=6)
+
+
+def test_generateCelestialEquator(bench):
+    bench(app.generateCelestialEquator)
+
+
+def test_deleteBelowHorizon(bench):
+    def setup():
+        app.horizonP = list(horizon)
+        app.generateGoldenSpiral(numberPoints=1000)
+
+    assert bench(app.deleteBelowHorizon, setup=setup)
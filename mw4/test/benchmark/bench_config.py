@@ -0,0 +1,89 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import os
+import shutil
+import logging
+import pytest
+
+# external packages
+
+# local import
+from mw4.mainApp import MountWizzard4
+from mw4.base.loggerMW import CustomLogger
+
+
+@pytest.fixture(autouse=True, scope='module')
+def module_setup_teardown():
+    class Test:
+        mwGlob = {'configDir': os.path.join('mw4/test/temp', 'benchConfig')}
+        config = dict()
+        log = CustomLogger(logging.getLogger(__name__), {})
+        defaultConfig = staticmethod(MountWizzard4.defaultConfig)
+        convertData = staticmethod(MountWizzard4.convertData)
+        loadConfig = MountWizzard4.loadConfig
+        saveConfig = MountWizzard4.saveConfig
+
+    global app
+    app = Test()
+    os.makedirs(app.mwGlob['configDir'], exist_ok=True)
+    app.config = genConfig()
+    yield
+    shutil.rmtree(app.mwGlob['configDir'])
+    del app
+
+
+def genConfig():
+    """
+    genConfig generates a config in the size of a fully used setup: all windows with
+    their gui settings and the device settings of all drivers
+    """
+
+    config = MountWizzard4.defaultConfig()
+    for window in ['mainW', 'hemisphereW', 'imageW', 'measureW', 'satelliteW',
+                   'messageW', 'keypadW', 'diagnosticsW']:
+        config[window] = {'winPosX': 100, 'winPosY': 100, 'height': 600, 'width': 800}
+        for i in range(100):
+            config[window][f'check{i}'] = bool(i % 2)
+            config[window][f'value{i}'] = i * 1.5
+            config[window][f'text{i}'] = f'setting {i}'
+
+    config['mainW']['driversData'] = {
+        f'driver{i}': {'deviceType': 'indi',
+                       'indi': {'deviceName': f'device {i}',
+                                'deviceList': [f'device {j}' for j in range(10)],
+                                'host': 'localhost',
+                                'port': 7624},
+                       'alpaca': {'deviceName': f'device:{i}',
+                                  'host': 'localhost',
+                                  'port': 11111},
+                       }
+        for i in range(20)
+    }
+    return config
+
+
+def test_saveConfig(bench):
+    assert bench(app.saveConfig, rounds=20)
+
+
+def test_loadConfig(bench):
+    app.saveConfig()
+    assert bench(app.loadConfig, rounds=20)
@@ -0,0 +1,99 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import os
+import shutil
+import pytest
+
+# external packages
+import numpy as np
+
+# local import
+from mw4.modeldata.hipparcos import Hipparcos
+from mw4.modeldata.starCatalog import StarCatalog
+
+
+@pytest.fixture(autouse=True, scope='module')
+def module_setup_teardown(mount):
+    class Test:
+        pass
+
+    Test.mount = mount
+
+    global app, pathDir
+    pathDir = os.path.join('mw4/test/temp', 'benchCatalog')
+    if os.path.isdir(pathDir):
+        shutil.rmtree(pathDir)
+    app = Hipparcos(app=Test())
+    yield
+    if app.catalog is not None:
+        app.catalog.close()
+    shutil.rmtree(pathDir, ignore_errors=True)
+    del app
+
+
+def genStars(number):
+    random = np.random.RandomState(0)
+    stars = np.zeros(number, dtype=StarCatalog.DTYPE)
+    stars['hip'] = np.arange(number)
+    stars['ra'] = random.uniform(0, 2 * np.pi, number)
+    stars['dec'] = np.arcsin(random.uniform(-1, 1, number))
+    stars['mag'] = random.uniform(-1, 8, number)
+    return stars
+
+
+def test_alignStars_full(bench):
+    app.incremental = False
+    assert bench(app.calculateAlignStarPositionsAltAz)
+
+
+def test_alignStars_incremental(bench):
+    app.incremental = True
+    assert bench(app.calculateAlignStarPositionsAltAz)
+
+
+def test_alignStars_nameFromAltAz(bench):
+    app.incremental = True
+
+    def setup():
+        app.calculateAlignStarPositionsAltAz()
+
+    bench(app.getAlignStarNameFromAltAz, 45, 180, setup=setup)
+
+
+def test_catalog(bench):
+    catalog = StarCatalog(pathDir=pathDir)
+    catalog.writeCatalog(genStars(20000))
+    catalog.open()
+    app.catalog = catalog
+
+    def setup():
+        app.catalogQuery = None
+
+    bench(app.calculateCatalogPositionsAltAz, magLimit=8, rounds=3, setup=setup)
+
+
+def test_catalog_incremental(bench):
+    catalog = StarCatalog(pathDir=pathDir)
+    catalog.writeCatalog(genStars(20000))
+    catalog.open()
+    app.catalog = catalog
+    app.calculateCatalogPositionsAltAz(magLimit=8)
+    bench(app.workerCatalogPositions, magLimit=8)
@@ -0,0 +1,113 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import os
+import pytest
+
+# external packages
+import numpy as np
+from astropy.io import fits
+import PyQt5
+from PyQt5.QtCore import QObject
+from PyQt5.QtCore import pyqtSignal
+
+# local import
+from mw4.gui.imageW import ImageWindow
+from mw4.base.processPool import ProcessPool
+
+
+@pytest.fixture(autouse=True, scope='module')
+def module_setup_teardown(qapp):
+    class Test(QObject):
+        config = {}
+        mwGlob = {'imageDir': 'mw4/test/image'}
+        update1s = pyqtSignal()
+        message = pyqtSignal(object, object)
+        processPool = ProcessPool(workers=0)
+        threadPool = PyQt5.QtCore.QThreadPool()
+
+    global app, imagePath, params
+    imagePath = os.path.join('mw4/test/temp', 'bench.fits')
+    writeImage(imagePath)
+    params = {
+        'stack': False,
+        'zoom': 1,
+        'stretch': (98, 99.999),
+        'color': 'gray',
+        'center': None,
+        'display': (800, 600),
+    }
+    app = ImageWindow(app=Test())
+    yield
+    app.close()
+    os.remove(imagePath)
+    del app
+
+
+def writeImage(filePath, width=3000, height=2000, numberStars=500):
+    """
+    writeImage writes a 16 bit fits image with noise and gaussian stars in the size of
+    a typical astro camera
+    """
+
+    random = np.random.RandomState(0)
+    imageData = random.normal(1000, 30, (height, width))
+    y, x = np.mgrid[-5:6, -5:6]
+    star = np.exp(-(x ** 2 + y ** 2) / 4)
+    for posX, posY, flux in zip(random.randint(5, width - 6, numberStars),
+                                random.randint(5, height - 6, numberStars),
+                                random.uniform(500, 40000, numberStars)):
+        imageData[posY - 5:posY + 6, posX - 5:posX + 6] += star * flux
+
+    imageData = np.clip(imageData, 0, 65535).astype(np.uint16)
+    fits.PrimaryHDU(data=imageData).writeto(filePath, overwrite=True)
+
+
+def resetFrame():
+    app.frame = None
+
+
+def test_showImageWorker_load(bench):
+    result = bench(app.showImageWorker,
+                   job=app.imageJob,
+                   imagePath=imagePath,
+                   params=params,
+                   setup=resetFrame)
+    assert result['image'] is not None
+
+
+def test_showImageWorker_stretch(bench):
+    stretch = dict(params, stretch=(1, 99.8), color='plasma')
+    result = bench(app.showImageWorker,
+                   job=app.imageJob,
+                   imagePath=imagePath,
+                   params=stretch,
+                   rounds=10)
+    assert result['image'] is not None
+
+
+def test_showImageWorker_zoom(bench):
+    zoom = dict(params, zoom=4, center=(1500, 1000))
+    result = bench(app.showImageWorker,
+                   job=app.imageJob,
+                   imagePath=imagePath,
+                   params=zoom,
+                   rounds=10)
+    assert result['image'] is not None
@@ -0,0 +1,182 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import os
+import time
+import threading
+import pytest
+
+# external packages
+import PyQt5
+from PyQt5.QtCore import QObject
+from PyQt5.QtCore import pyqtSignal
+
+# local import
+from mw4.environment.sensorWeatherIndi import SensorWeatherIndi
+from mw4.imaging.cameraIndi import CameraIndi
+from mw4.imaging.camera import CameraSignals
+from mw4.test.simulator.indiSimulator import IndiSimulator
+from mw4.test.simulator.indiSimulator import SimIndiDevice
+from mw4.test.simulator.indiSimulator import fitsBlob
+from mw4.test.benchmark.conftest import TEMP_DIR
+
+# throughput of the indi drivers: dispatch of property updates as sent by a weather
+# station with 10Hz, decoding and writing of large image BLOBs in all formats a camera
+# could send and the complete path from the socket through the indi client against
+# the indi simulator.
+
+UPDATES = 600
+IMAGE_SIZE = (3000, 2000)
+
+
+class StubDevice(object):
+    """
+    StubDevice replaces the indi device of the client and returns the values of a
+    simulated device, so only the dispatch in the driver is measured.
+    """
+
+    def __init__(self, simDevice):
+        self.simDevice = simDevice
+        self.blob = dict()
+
+    def elements(self, propertyName):
+        return dict(self.simDevice.properties[propertyName]['elements'])
+
+    def getNumber(self, propertyName):
+        return self.elements(propertyName)
+
+    def getSwitch(self, propertyName):
+        return self.elements(propertyName)
+
+    def getText(self, propertyName):
+        return self.elements(propertyName)
+
+    def getLight(self, propertyName):
+        return self.elements(propertyName)
+
+    def getBlob(self, propertyName):
+        return self.blob
+
+
+@pytest.fixture(autouse=True, scope='module')
+def module_setup_teardown(qapp):
+    class Test(QObject):
+        message = pyqtSignal(object, object)
+        threadPool = PyQt5.QtCore.QThreadPool()
+
+    class Signals(QObject):
+        message = pyqtSignal(object)
+
+    global app, simulator, weather, camera, sensor
+    app = Test()
+    simulator = IndiSimulator()
+    simDevice = simulator.addDevice('Weather Simulator', deviceType='weather')
+    simulator.start(port=0)
+
+    weather = SensorWeatherIndi(app=app, signals=Signals(), data={})
+    weather.name = 'Weather Simulator'
+    weather.device = StubDevice(simDevice)
+
+    camera = CameraIndi(app=app, signals=CameraSignals(), data={})
+    camera.name = 'Camera Simulator'
+    camera.device = StubDevice(SimIndiDevice(name=camera.name, deviceType='camera'))
+    camera.imagePath = os.path.join(TEMP_DIR, 'benchIndi.fits')
+
+    sensor = SensorWeatherIndi(app=app, signals=Signals(), data={})
+    sensor.name = 'Weather Simulator'
+    sensor.host = ('localhost', simulator.port)
+    yield
+    sensor.stopCommunication()
+    simulator.stop()
+    if os.path.isfile(camera.imagePath):
+        os.remove(camera.imagePath)
+    del app
+
+
+def processUntil(condition, timeout=10):
+    timeEnd = time.perf_counter() + timeout
+    while not condition() and time.perf_counter() < timeEnd:
+        PyQt5.QtCore.QCoreApplication.processEvents(
+            PyQt5.QtCore.QEventLoop.AllEvents, 10)
+    return condition()
+
+
+def dispatchNumbers(driver, number):
+    for i in range(number):
+        driver.updateNumber(driver.name, 'WEATHER_PARAMETERS')
+
+
+def dispatchStorm(driver, number):
+    for i in range(number):
+        driver.updateNumber(driver.name, 'WEATHER_PARAMETERS')
+        driver.updateNumber(driver.name, 'WEATHER_UPDATE')
+        driver.updateSwitch(driver.name, 'WEATHER_OVERRIDE')
+        driver.updateText(driver.name, 'WEATHER_FORECAST')
+        driver.updateLight(driver.name, 'WEATHER_STATUS')
+
+
+def decodeBlob(driver):
+    driver.updateBLOB(driver.name, 'CCD1')
+
+
+def stormToDriver(driver, number):
+    """
+    stormToDriver lets the simulator send number updates of the weather parameters and
+    waits until the indi client of the driver signalled all of them.
+    """
+
+    count = [0]
+
+    def received(deviceName, propertyName):
+        count[0] += 1
+
+    driver.client.signals.newNumber.connect(received)
+    thread = threading.Thread(target=simulator.storm,
+                              args=[driver.name],
+                              kwargs={'kinds': ['number'], 'count': number // 2})
+    thread.start()
+    assert processUntil(lambda: count[0] >= number)
+    thread.join()
+    driver.client.signals.newNumber.disconnect(received)
+
+
+def test_updateNumber(bench):
+    bench(dispatchNumbers, weather, UPDATES)
+    assert len(weather.data) == 10
+
+
+def test_updateStorm(bench):
+    bench(dispatchStorm, weather, UPDATES // 5)
+
+
+@pytest.mark.parametrize('blobFormat', ['.fits', '.fits.z', '.fits.fz'])
+def test_updateBLOB(bench, blobFormat):
+    camera.device.blob = {'name': 'CCD1',
+                          'format': blobFormat,
+                          'value': fitsBlob(blobFormat, *IMAGE_SIZE),
+                          }
+    bench(decodeBlob, camera, rounds=3)
+    assert os.path.isfile(camera.imagePath)
+
+
+def test_clientThroughput(bench):
+    sensor.startCommunication()
+    assert processUntil(lambda: 'WEATHER_PARAMETERS.WEATHER_TEMPERATURE' in sensor.data)
+    bench(stormToDriver, sensor, UPDATES, rounds=3)
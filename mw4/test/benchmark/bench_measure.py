@@ -0,0 +1,85 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import pytest
+
+# external packages
+import numpy as np
+
+# local import
+from mw4.measure.measure import MeasureData
+from mw4.test.benchmark.conftest import Device
+
+
+@pytest.fixture(autouse=True, scope='module')
+def module_setup_teardown(mount):
+    class Test:
+        sensorWeather = Device({'WEATHER_PARAMETERS.WEATHER_TEMPERATURE': 10,
+                                'WEATHER_PARAMETERS.WEATHER_PRESSURE': 980,
+                                'WEATHER_PARAMETERS.WEATHER_DEWPOINT': 5,
+                                'WEATHER_PARAMETERS.WEATHER_HUMIDITY': 60})
+        onlineWeather = Device({'temperature': 10,
+                                'pressure': 980,
+                                'dewPoint': 5,
+                                'humidity': 60})
+        skymeter = Device({'SKY_QUALITY.SKY_BRIGHTNESS': 19.5,
+                           'SKY_QUALITY.SKY_TEMPERATURE': -10})
+        filterwheel = Device({'FILTER_SLOT.FILTER_SLOT_VALUE': 1})
+        focuser = Device({'ABS_FOCUS_POSITION.FOCUS_ABSOLUTE_POSITION': 1000})
+        power = Device({'POWER_CURRENT.POWER_CURRENT_1': 1})
+
+    Test.mount = mount
+
+    global app
+    app = MeasureData(app=Test())
+    app.devices = ['mount', 'sensorWeather', 'onlineWeather', 'directWeather',
+                   'skymeter', 'filterwheel', 'focuser', 'power']
+    yield
+    del app
+
+
+def fillData(number):
+    """
+    fillData sets all measurements to number entries, which is the state of the
+    measurement after running number seconds
+    """
+
+    app.setEmptyData()
+    app.shorteningStart = False
+    app.raRef = None
+    app.decRef = None
+    timeStart = np.datetime64('2020-03-01T00:00:00')
+    for key in app.data:
+        if key == 'time':
+            app.data[key] = timeStart + np.arange(number).astype('timedelta64[s]')
+        else:
+            app.data[key] = np.zeros(number)
+
+
+def test_measureTask_start(bench):
+    bench(app.measureTask, rounds=20, setup=lambda: fillData(10))
+
+
+def test_measureTask_24h(bench):
+    bench(app.measureTask, rounds=20, setup=lambda: fillData(app.MAXSIZE - 1))
+
+
+def test_measureTask_split(bench):
+    bench(app.measureTask, rounds=10, setup=lambda: fillData(app.MAXSIZE))
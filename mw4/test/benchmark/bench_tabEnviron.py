@@ -0,0 +1,39 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import pytest
+
+# external packages
+import PyQt5.QtGui
+
+# local import
+from mw4.gui.mainWmixin.tabEnviron import EnvironGui
+
+
+@pytest.fixture(autouse=True, scope='module')
+def module_setup_teardown(qapp):
+    global image
+    image = PyQt5.QtGui.QImage('mw4/test/testData/forecast.png')
+    yield
+
+
+def test_processClearOutsideImage(bench):
+    pixmap = bench(EnvironGui.processClearOutsideImage, image, rounds=20)
+    assert not pixmap.isNull()
@@ -0,0 +1,64 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import os
+import pytest
+
+# external packages
+
+# local import
+from mw4.gui.mainWmixin.tabSatellite import Satellite
+from mw4.gui.mainWmixin.tabSatellite import findSatellitePasses
+from mw4.test.benchmark.conftest import DATA_DIR
+from mw4.test.benchmark.conftest import TIME_TT
+
+
+@pytest.fixture(autouse=True, scope='module')
+def module_setup_teardown(mount):
+    global obsSite, filePath
+    obsSite = mount.obsSite
+    filePath = os.path.abspath(os.path.join(DATA_DIR, 'active.txt'))
+    yield
+
+
+def test_loadRawTLEData(bench):
+    data = bench(Satellite.loadRawTLEData, filePath=filePath)
+    assert len(data) > 2000
+
+
+def test_tleFile(bench):
+    satellites = bench(obsSite.loader.tle_file, filePath)
+    assert len(satellites) > 2000
+
+
+def test_findSatellitePasses(bench):
+    data = Satellite.loadRawTLEData(filePath=filePath)
+    tle = data['ISS (ZARYA)']
+    name, passes = bench(findSatellitePasses,
+                         'ISS (ZARYA)',
+                         tle['line1'],
+                         tle['line2'],
+                         DATA_DIR,
+                         obsSite.location.latitude.degrees,
+                         obsSite.location.longitude.degrees,
+                         obsSite.location.elevation.m,
+                         TIME_TT,
+                         days=3)
+    assert passes
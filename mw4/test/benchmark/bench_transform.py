@@ -0,0 +1,65 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import pytest
+
+# external packages
+import numpy as np
+from skyfield.api import Angle
+
+# local import
+from mw4.base import transform
+
+
+@pytest.fixture(autouse=True, scope='module')
+def module_setup_teardown(mount):
+    global obsSite, coordinates
+    obsSite = mount.obsSite
+    ra = np.random.RandomState(0).uniform(0, 24, 100)
+    dec = np.random.RandomState(1).uniform(-60, 80, 100)
+    coordinates = [(Angle(hours=x), Angle(degrees=y)) for x, y in zip(ra, dec)]
+    yield
+
+
+def convert(func, *args):
+    for ra, dec in coordinates:
+        func(ra, dec, *args)
+
+
+def test_JNowToJ2000(bench):
+    bench(convert, transform.JNowToJ2000, obsSite.timeJD)
+
+
+def test_J2000ToJNow(bench):
+    bench(convert, transform.J2000ToJNow, obsSite.timeJD)
+
+
+def test_J2000ToAltAz(bench):
+    bench(convert, transform.J2000ToAltAz, obsSite.timeJD, obsSite.location)
+
+
+def test_convertToAngle(bench):
+    values = ['12 30 45.5', '-45 30 12.3', '+12:30:00', '12.5'] * 250
+    bench(lambda: [transform.convertToAngle(x) for x in values])
+
+
+def test_convertToHMS_DMS(bench):
+    bench(lambda: [(transform.convertToHMS(ra), transform.convertToDMS(dec))
+                   for ra, dec in coordinates * 10])
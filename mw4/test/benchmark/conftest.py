@@ -0,0 +1,282 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import gc
+import os
+import json
+import time
+import platform
+import statistics
+
+# external packages
+import pytest
+import numpy as np
+from skyfield.api import Angle
+from skyfield.api import Loader
+from skyfield.api import Topos
+
+# local import
+
+# benchmarks for the hot paths of mw4. the modules are named bench_*.py, so they are not
+# collected with the functional tests. they run headless with:
+#
+#     pytest mw4/test/benchmark -o python_files=bench_*.py
+#
+# each benchmark measures several rounds after a warm up round. the best round is used
+# for judging, as it is least disturbed by other load on the machine. to compare results
+# of different machines, it is divided by the best time of a fixed calibration workload,
+# which runs directly before the benchmark. the relative value is compared to the one
+# stored in baseline.json and the benchmark fails, if it is slower than the baseline by
+# more than the threshold factor. with --bench-update the baseline is written from the
+# actual results. a benchmark without baseline entry is skipped, as it could never fail.
+
+DATA_DIR = 'mw4/test/data'
+TEMP_DIR = 'mw4/test/temp'
+BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+# julian date tt of the stubbed mount time (2020-03-01 22:00 utc)
+TIME_TT = 2458910.4175
+# differences below this time in seconds are not judged as regression
+MIN_DELTA = 0.002
+
+results = dict()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('benchmark')
+    group.addoption('--bench-update',
+                    action='store_true',
+                    default=False,
+                    help='write the results of the run as new baseline')
+    group.addoption('--bench-threshold',
+                    action='store',
+                    type=float,
+                    default=1.5,
+                    help='factor to the baseline, which is judged as regression')
+
+
+def loadBaseline():
+    """
+    loadBaseline reads the stored baseline
+
+    :return: baseline dict
+    """
+
+    if not os.path.isfile(BASELINE):
+        return {'results': {}}
+    with open(BASELINE, 'r') as baseFile:
+        return json.load(baseFile)
+
+
+def calibrationWork():
+    """
+    calibrationWork is a fixed mix of numpy and pure python work, which is used as unit
+    for the benchmark times.
+
+    :return: nothing
+    """
+
+    values = np.random.RandomState(0).uniform(size=200000)
+    np.sort(values)
+    sum(x * x for x in range(200000))
+
+
+def measureCalibration(rounds=3):
+    """
+    measureCalibration returns the best time of the calibration workload
+
+    :param rounds:
+    :return: time in seconds
+    """
+
+    times = list()
+    for _ in range(rounds):
+        timeStart = time.perf_counter()
+        calibrationWork()
+        times.append(time.perf_counter() - timeStart)
+    return min(times)
+
+
+class Benchmark(object):
+    """
+    The class Benchmark runs a function several times and compares the best time to
+    the baseline. setup is called before each round and is not part of the measured
+    time.
+
+        >>> result = bench(func, *args, rounds=5, setup=None, **kwargs)
+    """
+
+    # a regression is confirmed by a second measurement before the benchmark fails
+    ATTEMPTS = 2
+
+    def __init__(self, name='', reference=None, threshold=1.5, update=False):
+        self.name = name
+        self.reference = reference
+        self.threshold = threshold
+        self.update = update
+
+    def measure(self, func, args, kwargs, rounds, setup):
+        """
+        measure runs the rounds and returns the times and the calibration. like timeit,
+        garbage collection is not part of the measured time.
+        """
+
+        gc.collect()
+        calibration = measureCalibration()
+        times = list()
+        gc.disable()
+        try:
+            for _ in range(rounds):
+                if setup is not None:
+                    setup()
+                timeStart = time.perf_counter()
+                result = func(*args, **kwargs)
+                times.append(time.perf_counter() - timeStart)
+        finally:
+            gc.enable()
+
+        return result, times, calibration
+
+    def __call__(self, func, *args, rounds=5, setup=None, **kwargs):
+        if self.reference is None and not self.update:
+            pytest.skip(f'{self.name}: no baseline, record it with --bench-update')
+
+        if setup is not None:
+            setup()
+        func(*args, **kwargs)
+
+        for attempt in range(self.ATTEMPTS):
+            result, times, calibration = self.measure(func, args, kwargs, rounds, setup)
+            best = min(times)
+            relative = best / calibration
+            if attempt == 0 or relative < results[self.name]['relative']:
+                results[self.name] = {'best': best,
+                                      'median': statistics.median(times),
+                                      'relative': relative,
+                                      'rounds': rounds,
+                                      }
+
+            if self.update:
+                return result
+
+            limit = max(self.reference * self.threshold,
+                        self.reference + MIN_DELTA / calibration)
+            if relative <= limit:
+                return result
+
+        pytest.fail(f'{self.name}: {best * 1000:.2f}ms, relative {relative:.3f} '
+                    f'exceeds baseline {self.reference:.3f} by more than factor '
+                    f'{self.threshold}')
+
+
+@pytest.fixture(scope='session')
+def baseline(request):
+    values = loadBaseline()
+    yield values
+
+    if not request.config.getoption('--bench-update') or not results:
+        return
+    values['calibration'] = measureCalibration()
+    values['machine'] = platform.platform()
+    values['python'] = platform.python_version()
+    values['results'].update(results)
+    with open(BASELINE, 'w') as baseFile:
+        json.dump(values, baseFile, sort_keys=True, indent=4)
+
+
+@pytest.fixture(scope='function')
+def bench(request, baseline):
+    module = request.module.__name__.split('.')[-1]
+    name = f'{module}::{request.node.name}'
+    reference = baseline['results'].get(name, {}).get('relative')
+    return Benchmark(name=name,
+                     reference=reference,
+                     threshold=request.config.getoption('--bench-threshold'),
+                     update=request.config.getoption('--bench-update'),
+                     )
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not results:
+        return
+    terminalreporter.section('benchmark results')
+    terminalreporter.write_line(f'{"name":55s} {"best":>12s} {"median":>12s} '
+                                f'{"relative":>10s}')
+    for name, value in sorted(results.items()):
+        terminalreporter.write_line(f'{name:55s} {value["best"] * 1000:10.2f}ms '
+                                    f'{value["median"] * 1000:10.2f}ms '
+                                    f'{value["relative"]:10.3f}')
+
+
+class Setting(object):
+    """
+    stubbed mount settings with fixed weather and limit values
+    """
+
+    def __init__(self):
+        self.weatherTemperature = 10.0
+        self.weatherPressure = 980.0
+        self.weatherDewPoint = 5.0
+        self.weatherHumidity = 60.0
+        self.meridianLimitSlew = 5
+        self.meridianLimitTrack = 3
+        self.horizonLimitHigh = 90
+        self.horizonLimitLow = 0
+
+
+class ObsSite(object):
+    """
+    stubbed observation site of the mount at a fixed time and position, so the
+    benchmarks do not need a mount and always calculate the same sky
+    """
+
+    def __init__(self):
+        self.loader = Loader(DATA_DIR, verbose=False)
+        self.ts = self.loader.timescale()
+        self.timeJD = self.ts.tt_jd(TIME_TT)
+        self.location = Topos(latitude_degrees=48,
+                              longitude_degrees=11,
+                              elevation_m=500)
+        self.raJNow = Angle(hours=12)
+        self.decJNow = Angle(degrees=45)
+        self.status = 0
+
+
+class Mount(object):
+    """
+    stubbed mount
+    """
+
+    def __init__(self):
+        self.obsSite = ObsSite()
+        self.setting = Setting()
+
+
+class Device(object):
+    """
+    stubbed device with a fixed data dict
+    """
+
+    def __init__(self, data=None):
+        self.data = data or dict()
+
+
+@pytest.fixture(scope='session')
+def mount():
+    return Mount()
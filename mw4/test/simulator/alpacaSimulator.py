@@ -0,0 +1,804 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+import urllib.parse
+import http.server
+# external packages
+import numpy as np
+# local imports
+from mw4.base.metrics import ThreadingHTTPServer
+
+__all__ = ['SimDevice',
+           'AlpacaSimulator',
+           'main',
+           ]
+
+# properties, which are offered by all devices
+COMMON = {
+    'connected': False,
+    'description': 'mw4 alpaca simulator',
+    'driverinfo': 'mw4 alpaca simulator',
+    'driverversion': '1.0',
+    'interfaceversion': 1,
+    'supportedactions': [],
+}
+
+# start values of the properties per device type
+PROPERTIES = {
+    'camera': {
+        'cameraxsize': 1000,
+        'cameraysize': 800,
+        'pixelsizex': 3.8,
+        'pixelsizey': 3.8,
+        'maxbinx': 4,
+        'maxbiny': 4,
+        'binx': 1,
+        'biny': 1,
+        'startx': 0,
+        'starty': 0,
+        'numx': 1000,
+        'numy': 800,
+        'canfastreadout': True,
+        'canabortexposure': True,
+        'canstopexposure': True,
+        'fastreadout': False,
+        'camerastate': 0,
+        'ccdtemperature': -10.0,
+        'cooleron': True,
+        'coolerpower': 50.0,
+        'imageready': False,
+        'percentcompleted': 100,
+    },
+    'dome': {
+        'azimuth': 0.0,
+        'altitude': 0.0,
+        'slewing': False,
+        'shutterstatus': 1,
+        'athome': False,
+        'atpark': False,
+        'canfindhome': True,
+        'canpark': True,
+        'cansetaltitude': False,
+        'cansetazimuth': True,
+        'cansetpark': True,
+        'cansetshutter': True,
+        'canslave': False,
+        'cansyncazimuth': True,
+        'slaved': False,
+    },
+    'filterwheel': {
+        'names': ['L', 'R', 'G', 'B', 'Ha', 'OIII', 'SII'],
+        'focusoffsets': [0, 0, 0, 0, 0, 0, 0],
+        'position': 0,
+    },
+    'focuser': {
+        'position': 10000,
+        'maxstep': 100000,
+        'ismoving': False,
+        'temperature': 10.0,
+    },
+    'observingconditions': {
+        'temperature': 10.0,
+        'pressure': 980.0,
+        'humidity': 60.0,
+        'dewpoint': 2.5,
+        'cloudcover': 0.0,
+        'skyquality': 19.5,
+        'skytemperature': -15.0,
+        'windspeed': 1.0,
+    },
+    'safetymonitor': {
+        'issafe': True,
+    },
+    'switch': {
+        'maxswitch': 4,
+    },
+    'telescope': {
+        'rightascension': 12.0,
+        'declination': 45.0,
+        'altitude': 45.0,
+        'azimuth': 180.0,
+        'tracking': True,
+        'slewing': False,
+        'atpark': False,
+        'athome': False,
+    },
+}
+
+
+def parseValue(value):
+    """
+    parseValue converts a form value of a request to bool, int or float if possible
+
+    :param value: string
+    :return: value
+    """
+
+    if value.lower() in ['true', 'false']:
+        return value.lower() == 'true'
+    for converter in [int, float]:
+        try:
+            return converter(value)
+        except ValueError:
+            pass
+    return value
+
+
+class SimDevice(object):
+    """
+    The class SimDevice holds the state of one simulated alpaca device. get requests
+    return the property value, put requests store the value. exposures, slews and
+    moves are simulated in time. for each device latency, jitter and error rates could
+    be set and any property could be replaced by a script, which is called with the
+    device and the request parameters and returns the value.
+
+        >>> device = SimDevice(deviceType='dome', number=0, latency=0.02)
+        >>> device.script('azimuth', lambda device, params: 90)
+    """
+
+    __all__ = ['SimDevice',
+               'script',
+               'get',
+               'put',
+               'imageArray',
+               ]
+
+    # slew speed of dome and telescope in degrees per second
+    SLEW_SPEED = 30
+    # alpaca error number for an unspecified driver error
+    ERROR_NUMBER = 0x500
+
+    def __init__(self,
+                 deviceType='',
+                 number=0,
+                 latency=0,
+                 jitter=0,
+                 errorRate=0,
+                 httpErrorRate=0,
+                 seed=0,
+                 ):
+
+        self.deviceType = deviceType
+        self.number = number
+        self.latency = latency
+        self.jitter = jitter
+        self.errorRate = errorRate
+        self.httpErrorRate = httpErrorRate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.scripts = dict()
+        self.values = dict(COMMON)
+        self.values.update(PROPERTIES.get(deviceType, {}))
+        self.values['name'] = f'{deviceType} {number}'
+        self.exposureEnd = 0
+        self.slewTarget = None
+        self.images = dict()
+        # methods of the devices, which are not setting a property with the same name
+        self.methods = {
+            'startexposure': self.startExposure,
+            'abortexposure': self.stopExposure,
+            'stopexposure': self.stopExposure,
+            'slewtoazimuth': lambda p: self.startSlew('azimuth', p.get('azimuth', 0)),
+            'slewtoaltitude': lambda p: self.startSlew('altitude', p.get('altitude', 0)),
+            'synctoazimuth': self.syncToAzimuth,
+            'abortslew': self.stopSlew,
+            'halt': self.stopSlew,
+            'openshutter': lambda p: self.values.update(shutterstatus=0),
+            'closeshutter': lambda p: self.values.update(shutterstatus=1),
+            'park': lambda p: self.values.update(atpark=True),
+            'findhome': lambda p: self.values.update(athome=True),
+            'move': lambda p: self.values.update(position=int(p.get('position', 0))),
+            'setswitch': self.setSwitch,
+            'setswitchvalue': self.setSwitch,
+        }
+
+    @property
+    def name(self):
+        return f'{self.deviceType}:{self.number}'
+
+    def script(self, attr, func):
+        """
+        script replaces the property attr with a function, which is called with the
+        device and the request parameters. None removes the script.
+
+        :param attr: name of the property
+        :param func: function(device, params) returning the value
+        :return: true for test purpose
+        """
+
+        if func is None:
+            self.scripts.pop(attr, None)
+        else:
+            self.scripts[attr] = func
+        return True
+
+    def delay(self):
+        """
+        delay waits for the latency and a random part up to jitter
+
+        :return: delay in seconds
+        """
+
+        delay = self.latency + self.random.uniform(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def injectError(self):
+        """
+        injectError decides by the error rates, if the request fails
+
+        :return: None, 'http' or 'alpaca'
+        """
+
+        value = self.random.random()
+        if value < self.httpErrorRate:
+            return 'http'
+        if value < self.httpErrorRate + self.errorRate:
+            return 'alpaca'
+        return None
+
+    def updateState(self):
+        """
+        updateState moves the simulated time based states: a running exposure gets
+        ready, a slew gets nearer to the target.
+
+        :return: true for test purpose
+        """
+
+        now = time.monotonic()
+        if self.deviceType == 'camera' and self.values['camerastate'] == 2:
+            if now >= self.exposureEnd:
+                self.values['camerastate'] = 0
+                self.values['imageready'] = True
+                self.values['percentcompleted'] = 100
+
+        if self.slewTarget is not None:
+            attr, target, timeStart, start = self.slewTarget
+            distance = target - start
+            moved = (now - timeStart) * self.SLEW_SPEED
+            if moved >= abs(distance):
+                self.values[attr] = target
+                self.values['slewing'] = False
+                self.slewTarget = None
+            else:
+                self.values[attr] = start + np.sign(distance) * moved
+
+        return True
+
+    def startSlew(self, attr, target):
+        """
+        startSlew starts a simulated slew of attr to target
+
+        :param attr: name of the position property
+        :param target: target value
+        :return: true for test purpose
+        """
+
+        self.slewTarget = (attr, float(target), time.monotonic(), self.values[attr])
+        self.values['slewing'] = True
+        return True
+
+    def startExposure(self, params):
+        """
+        startExposure starts a simulated exposure with the duration of the request
+
+        :param params: request parameters with lower case keys
+        :return: true for test purpose
+        """
+
+        self.exposureEnd = time.monotonic() + float(params.get('duration', 0))
+        self.values['camerastate'] = 2
+        self.values['imageready'] = False
+        self.values['percentcompleted'] = 0
+        return True
+
+    def stopExposure(self, params):
+        """
+        stopExposure stops a running exposure
+
+        :param params: request parameters with lower case keys
+        :return: true for test purpose
+        """
+
+        self.values['camerastate'] = 0
+        return True
+
+    def syncToAzimuth(self, params):
+        """
+        syncToAzimuth sets the azimuth without slewing
+
+        :param params: request parameters with lower case keys
+        :return: true for test purpose
+        """
+
+        self.values['azimuth'] = float(params.get('azimuth', 0))
+        return True
+
+    def stopSlew(self, params):
+        """
+        stopSlew stops a running slew at the actual position
+
+        :param params: request parameters with lower case keys
+        :return: true for test purpose
+        """
+
+        self.slewTarget = None
+        self.values['slewing'] = False
+        return True
+
+    def setSwitch(self, params):
+        """
+        setSwitch sets the state or value of the switch with the id of the request
+
+        :param params: request parameters with lower case keys
+        :return: true for test purpose
+        """
+
+        value = params.get('state', params.get('value', False))
+        self.values[f'switch{params.get("id", 0)}'] = value
+        return True
+
+    def imageArray(self):
+        """
+        imageArray returns the json text of the image for the actual frame size and
+        binning. the text is generated once per size, as json encoding of large
+        arrays takes seconds. like alpaca, the array is indexed [x][y].
+
+        :return: json text of the array
+        """
+
+        width = max(int(self.values['numx']) // max(int(self.values['binx']), 1), 1)
+        height = max(int(self.values['numy']) // max(int(self.values['biny']), 1), 1)
+        if (width, height) in self.images:
+            return self.images[(width, height)]
+
+        generator = np.random.RandomState(self.number)
+        imageData = generator.normal(1000, 30, (width, height))
+        imageData = np.clip(imageData, 0, 65535).astype(np.uint16)
+        text = '[' + ','.join('[' + ','.join(map(str, column)) + ']'
+                              for column in imageData.tolist()) + ']'
+        self.images[(width, height)] = text
+        return text
+
+    def get(self, attr, params):
+        """
+        get returns the value of the property attr
+
+        :param attr: name of the property
+        :param params: request parameters with lower case keys
+        :return: value
+        """
+
+        if attr in self.scripts:
+            return self.scripts[attr](self, params)
+
+        self.updateState()
+        if attr == 'canwrite' or attr == 'getswitch':
+            return self.values.get(f'switch{params.get("id", 0)}', False)
+        if attr == 'getswitchvalue':
+            return float(self.values.get(f'switch{params.get("id", 0)}', False))
+        if attr == 'getswitchname':
+            return f'switch {params.get("id", 0)}'
+        if attr not in self.values:
+            raise KeyError(attr)
+        return self.values[attr]
+
+    def put(self, attr, params):
+        """
+        put sets the property attr or runs the method attr of the device
+
+        :param attr: name of the property or method
+        :param params: request parameters with lower case keys
+        :return: true for test purpose
+        """
+
+        if attr in self.scripts:
+            self.scripts[attr](self, params)
+            return True
+
+        self.updateState()
+        if attr in self.methods:
+            self.methods[attr](params)
+            return True
+
+        # a single parameter sets the property, other methods are accepted
+        values = [value for key, value in params.items()
+                  if key not in ['clienttransactionid', 'clientid']]
+        if len(values) == 1:
+            self.values[attr] = values[0]
+
+        return True
+
+
+class AlpacaHandler(http.server.BaseHTTPRequestHandler):
+    """
+    The class AlpacaHandler answers the requests of the alpaca api for the devices
+    of the simulator
+    """
+
+    simulator = None
+
+    def readParams(self):
+        """
+        readParams collects the parameters from the query and the form encoded body.
+        alpaca parameter names are case insensitive, so the keys are lower case.
+
+        :return: params
+        """
+
+        url = urllib.parse.urlsplit(self.path)
+        length = int(self.headers.get('Content-Length', 0) or 0)
+        body = self.rfile.read(length).decode('utf-8') if length else ''
+
+        params = dict()
+        for text in [url.query, body]:
+            for key, value in urllib.parse.parse_qsl(text):
+                params[key.lower()] = parseValue(value)
+        return url.path, params
+
+    def sendText(self, status, text, contentType='text/plain'):
+        content = text.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', contentType)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.simulator.count(status=status, size=len(content))
+        self.wfile.write(content)
+
+    def sendValue(self, params, value=None, hasValue=True, errorNumber=0, errorMessage=''):
+        response = {
+            'ClientTransactionID': params.get('clienttransactionid', 0),
+            'ServerTransactionID': self.simulator.transactionID(),
+            'ErrorNumber': errorNumber,
+            'ErrorMessage': errorMessage,
+        }
+        if hasValue:
+            response['Value'] = value
+        self.sendText(200, json.dumps(response), contentType='application/json')
+
+    def sendImage(self, params, device):
+        response = {
+            'Type': 2,
+            'Rank': 2,
+            'Value': None,
+            'ClientTransactionID': params.get('clienttransactionid', 0),
+            'ServerTransactionID': self.simulator.transactionID(),
+            'ErrorNumber': 0,
+            'ErrorMessage': '',
+        }
+        text = json.dumps(response).replace('null', device.imageArray(), 1)
+        self.sendText(200, text, contentType='application/json')
+
+    def handleManagement(self, path, params):
+        parts = path.strip('/').split('/')
+        if parts[-1] == 'apiversions':
+            self.sendValue(params, [1])
+        elif parts[-1] == 'description':
+            self.sendValue(params, {'ServerName': 'mw4 alpaca simulator',
+                                    'Manufacturer': 'mw4',
+                                    'ManufacturerVersion': '1.0',
+                                    'Location': 'localhost'})
+        elif parts[-1] == 'configureddevices':
+            self.sendValue(params, self.simulator.configuredDevices())
+        else:
+            self.sendText(400, f'unknown management request: {path}')
+
+    def handleRequest(self, method):
+        path, params = self.readParams()
+        if path.startswith('/management/'):
+            self.handleManagement(path, params)
+            return
+
+        parts = path.strip('/').split('/')
+        if len(parts) != 5 or parts[0] != 'api':
+            self.sendText(400, f'malformed request: {path}')
+            return
+
+        deviceType, number, attr = parts[2].lower(), parts[3], parts[4].lower()
+        device = self.simulator.devices.get(f'{deviceType}:{number}')
+        if device is None:
+            self.sendText(400, f'unknown device: {deviceType}:{number}')
+            return
+
+        device.delay()
+        error = device.injectError()
+        if error == 'http':
+            self.sendText(500, 'simulated server error')
+            return
+        if error == 'alpaca':
+            self.sendValue(params, hasValue=(method == 'GET'),
+                           errorNumber=device.ERROR_NUMBER,
+                           errorMessage='simulated driver error')
+            return
+
+        try:
+            with device.lock:
+                if method == 'GET' and attr in ['imagearray', 'imagearrayvariant']:
+                    self.sendImage(params, device)
+                    return
+                if method == 'GET':
+                    value = device.get(attr, params)
+                else:
+                    device.put(attr, params)
+        except KeyError:
+            self.sendText(400, f'unknown property: {attr}')
+            return
+
+        if method == 'GET':
+            self.sendValue(params, value)
+        else:
+            self.sendValue(params, hasValue=False)
+
+    def do_GET(self):
+        self.handleRequest('GET')
+
+    def do_PUT(self):
+        self.handleRequest('PUT')
+
+    def log_message(self, *args):
+        pass
+
+
+class AlpacaSimulator(object):
+    """
+    The class AlpacaSimulator is an alpaca server for simulated devices, so the alpaca
+    drivers of mw4 could be tested and load tested without hardware. it runs in its
+    own daemon thread and answers each request in a thread, so slow devices do not
+    block the others. requests, errors and sent bytes are counted for measuring
+    throughput.
+
+        >>> simulator = AlpacaSimulator()
+        >>> simulator.addDevices('dome', number=24, latency=0.05)
+        >>> simulator.start(port=11111)
+    """
+
+    __all__ = ['AlpacaSimulator',
+               'addDevice',
+               'addDevices',
+               'start',
+               'stop',
+               'statistics',
+               'resetStatistics',
+               ]
+
+    def __init__(self):
+        self.devices = dict()
+        self.server = None
+        self.thread = None
+        self.lock = threading.Lock()
+        self.serverTransactionID = 0
+        self.stats = dict()
+        self.resetStatistics()
+
+    @property
+    def port(self):
+        if self.server is None:
+            return 0
+        return self.server.server_port
+
+    def addDevice(self, deviceType='', **kwargs):
+        """
+        addDevice adds a device with the next free number of its type
+
+        :param deviceType: alpaca device type in lower case
+        :param kwargs: parameters of SimDevice
+        :return: device
+        """
+
+        number = len([x for x in self.devices.values() if x.deviceType == deviceType])
+        device = SimDevice(deviceType=deviceType, number=number, **kwargs)
+        self.devices[device.name] = device
+        return device
+
+    def addDevices(self, deviceType='', number=1, **kwargs):
+        """
+        addDevices adds number devices of the same type and settings
+
+        :param deviceType: alpaca device type in lower case
+        :param number: number of devices
+        :param kwargs: parameters of SimDevice
+        :return: list of devices
+        """
+
+        return [self.addDevice(deviceType=deviceType, **kwargs) for _ in range(number)]
+
+    def configuredDevices(self):
+        """
+        configuredDevices returns the device list of the management api
+
+        :return: list of dicts
+        """
+
+        return [{'DeviceName': device.values['name'],
+                 'DeviceType': device.deviceType.capitalize(),
+                 'DeviceNumber': device.number,
+                 'UniqueID': f'mw4-sim-{device.deviceType}-{device.number}'}
+                for device in self.devices.values()]
+
+    def transactionID(self):
+        with self.lock:
+            self.serverTransactionID += 1
+            return self.serverTransactionID
+
+    def count(self, status=200, size=0):
+        """
+        count adds a request to the statistics
+
+        :param status: http status of the response
+        :param size: size of the response body in bytes
+        :return: true for test purpose
+        """
+
+        with self.lock:
+            self.stats['requests'] += 1
+            self.stats['bytes'] += size
+            if status != 200:
+                self.stats['errors'] += 1
+        return True
+
+    def statistics(self):
+        """
+        statistics returns the counters since the last reset together with the rates
+
+        :return: dict of statistics
+        """
+
+        with self.lock:
+            stats = dict(self.stats)
+        duration = max(time.perf_counter() - stats['timeStart'], 1e-9)
+        stats['duration'] = duration
+        stats['requestRate'] = stats['requests'] / duration
+        stats['byteRate'] = stats['bytes'] / duration
+        return stats
+
+    def resetStatistics(self):
+        """
+        resetStatistics sets the counters to zero
+
+        :return: true for test purpose
+        """
+
+        with self.lock:
+            self.stats = {'requests': 0,
+                          'errors': 0,
+                          'bytes': 0,
+                          'timeStart': time.perf_counter(),
+                          }
+        return True
+
+    def start(self, port=0, host='127.0.0.1'):
+        """
+        start runs the alpaca server
+
+        :param port: port number, 0 for a free port
+        :param host: address to bind to
+        :return: success
+        """
+
+        if self.server is not None:
+            return False
+
+        handler = type('Handler', (AlpacaHandler, ), {'simulator': self})
+        try:
+            self.server = ThreadingHTTPServer((host, port), handler)
+        except OSError:
+            return False
+
+        self.thread = threading.Thread(target=self.server.serve_forever,
+                                       kwargs={'poll_interval': 0.05},
+                                       name='alpacaSimulator',
+                                       daemon=True)
+        self.thread.start()
+        return True
+
+    def stop(self):
+        """
+        stop shuts the server down
+
+        :return: true for test purpose
+        """
+
+        if self.server is None:
+            return True
+
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join(timeout=1)
+        self.server = None
+        self.thread = None
+        return True
+
+
+def main(argv=None):
+    """
+    main runs the simulator until it is interrupted
+
+        python -m mw4.test.simulator.alpacaSimulator --devices dome:24,camera:1
+               --latency 0.05 --jitter 0.1 --error-rate 0.01
+
+    :param argv:
+    :return: exit code
+    """
+
+    parser = argparse.ArgumentParser(description='simulate alpaca devices')
+    parser.add_argument('--port', type=int, default=11111)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--devices', default='camera:1,dome:1',
+                        help='comma separated list of type:count')
+    parser.add_argument('--latency', type=float, default=0,
+                        help='latency of each request in seconds')
+    parser.add_argument('--jitter', type=float, default=0,
+                        help='max random latency added in seconds')
+    parser.add_argument('--error-rate', type=float, default=0,
+                        help='fraction of requests answered with an alpaca error')
+    parser.add_argument('--http-error-rate', type=float, default=0,
+                        help='fraction of requests answered with http 500')
+    parser.add_argument('--image-size', default='1000x800',
+                        help='camera size as widthxheight')
+    args = parser.parse_args(argv)
+
+    try:
+        width, height = [int(x) for x in args.image_size.split('x')]
+        devices = [(x.split(':')[0], int(x.split(':')[1]))
+                   for x in args.devices.split(',')]
+    except (ValueError, IndexError):
+        print('malformed --devices or --image-size', file=sys.stderr)
+        return 2
+
+    simulator = AlpacaSimulator()
+    for deviceType, number in devices:
+        for device in simulator.addDevices(deviceType=deviceType,
+                                           number=number,
+                                           latency=args.latency,
+                                           jitter=args.jitter,
+                                           errorRate=args.error_rate,
+                                           httpErrorRate=args.http_error_rate):
+            if deviceType == 'camera':
+                device.values.update({'cameraxsize': width, 'numx': width,
+                                      'cameraysize': height, 'numy': height})
+
+    if not simulator.start(port=args.port, host=args.host):
+        print(f'cannot start simulator on {args.host}:{args.port}', file=sys.stderr)
+        return 1
+
+    print(f'alpaca simulator on http://{args.host}:{simulator.port} with '
+          f'{len(simulator.devices)} devices')
+    try:
+        while True:
+            time.sleep(10)
+            stats = simulator.statistics()
+            print(f'{stats["requestRate"]:8.1f} requests/s '
+                  f'{stats["byteRate"] / 1e6:8.2f} MB/s {stats["errors"]} errors')
+            simulator.resetStatistics()
+    except KeyboardInterrupt:
+        pass
+    simulator.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
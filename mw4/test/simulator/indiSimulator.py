@@ -0,0 +1,774 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import io
+import sys
+import time
+import zlib
+import base64
+import random
+import argparse
+import datetime
+import threading
+import socketserver
+import xml.etree.ElementTree as ElementTree
+from xml.sax.saxutils import escape
+from xml.sax.saxutils import quoteattr
+# external packages
+import numpy as np
+from astropy.io import fits
+# local imports
+
+__all__ = ['fitsBlob',
+           'SimIndiDevice',
+           'IndiSimulator',
+           'main',
+           ]
+
+# property templates per device type: name -> (type, elements)
+COMMON = {
+    'CONNECTION': ('switch', {'CONNECT': False, 'DISCONNECT': True}),
+    'DRIVER_INFO': ('text', {'DRIVER_NAME': 'mw4 indi simulator',
+                             'DRIVER_EXEC': 'indi_simulator',
+                             'DRIVER_VERSION': '1.0',
+                             'DRIVER_INTERFACE': '0'}),
+}
+
+PROPERTIES = {
+    'weather': {
+        'WEATHER_PARAMETERS': ('number', {'WEATHER_TEMPERATURE': 10.0,
+                                          'WEATHER_PRESSURE': 980.0,
+                                          'WEATHER_HUMIDITY': 60.0,
+                                          'WEATHER_DEWPOINT': 2.5,
+                                          'WEATHER_WIND_SPEED': 1.0,
+                                          'WEATHER_WIND_GUST': 2.0,
+                                          'WEATHER_RAIN_HOUR': 0.0,
+                                          'WEATHER_CLOUD_COVER': 0.0,
+                                          'WEATHER_SKY_TEMPERATURE': -15.0,
+                                          'WEATHER_SKY_BRIGHTNESS': 19.5}),
+        'WEATHER_UPDATE': ('number', {'PERIOD': 0.1}),
+        'WEATHER_STATUS': ('light', {'WEATHER_TEMPERATURE': 'Ok',
+                                     'WEATHER_HUMIDITY': 'Ok',
+                                     'WEATHER_WIND_SPEED': 'Ok',
+                                     'WEATHER_RAIN_HOUR': 'Ok'}),
+        'WEATHER_OVERRIDE': ('switch', {'OVERRIDE': False}),
+        'WEATHER_FORECAST': ('text', {'FORECAST': 'clear'}),
+    },
+    'camera': {
+        'CCD_EXPOSURE': ('number', {'CCD_EXPOSURE_VALUE': 0.0}),
+        'CCD_INFO': ('number', {'CCD_MAX_X': 1000,
+                                'CCD_MAX_Y': 800,
+                                'CCD_PIXEL_SIZE': 3.8,
+                                'CCD_PIXEL_SIZE_X': 3.8,
+                                'CCD_PIXEL_SIZE_Y': 3.8,
+                                'CCD_BITSPERPIXEL': 16}),
+        'CCD_FRAME': ('number', {'X': 0, 'Y': 0, 'WIDTH': 1000, 'HEIGHT': 800}),
+        'CCD_BINNING': ('number', {'HOR_BIN': 1, 'VERT_BIN': 1}),
+        'CCD_TEMPERATURE': ('number', {'CCD_TEMPERATURE_VALUE': -10.0}),
+        'READOUT_QUALITY': ('switch', {'QUALITY_LOW': False, 'QUALITY_HIGH': True}),
+        'CCD1': ('blob', {'CCD1': b''}),
+    },
+}
+
+
+def fitsBlob(blobFormat='.fits', width=1000, height=800, seed=0):
+    """
+    fitsBlob generates a 16 bit fits image with noise in the format of an indi camera
+    BLOB: plain fits, zlib compressed fits (.fits.z) or fpack rice compressed fits
+    (.fits.fz), where the image is stored in the first extension.
+
+    :param blobFormat: .fits, .fits.z or .fits.fz
+    :param width:
+    :param height:
+    :param seed:
+    :return: bytes of the BLOB
+    """
+
+    imageData = np.random.RandomState(seed).normal(1000, 30, (height, width))
+    imageData = np.clip(imageData, 0, 65535).astype(np.uint16)
+
+    if blobFormat == '.fits.fz':
+        hduList = fits.HDUList([fits.PrimaryHDU(),
+                                fits.CompImageHDU(data=imageData,
+                                                  compression_type='RICE_1')])
+    else:
+        hduList = fits.HDUList([fits.PrimaryHDU(data=imageData)])
+
+    hduList[0].header['OBSERVER'] = 'MW4'
+    buffer = io.BytesIO()
+    hduList.writeto(buffer)
+    content = buffer.getvalue()
+
+    if blobFormat == '.fits.z':
+        content = zlib.compress(content)
+    return content
+
+
+def formatValue(kind, value):
+    """
+    formatValue converts a value to the text of an indi element
+
+    :param kind: number, switch, text or light
+    :param value:
+    :return: text
+    """
+
+    if kind == 'switch':
+        return 'On' if value else 'Off'
+    if kind == 'number':
+        return f'{value:.6g}' if isinstance(value, float) else str(value)
+    return escape(str(value))
+
+
+def timestamp():
+    return datetime.datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3]
+
+
+class SimIndiDevice(object):
+    """
+    The class SimIndiDevice holds the properties of one simulated indi device and
+    builds the xml messages for them. numbers do a random walk on each update,
+    switches toggle and lights cycle, so every message carries new values.
+
+        >>> device = SimIndiDevice(name='Weather Simulator', deviceType='weather')
+        >>> text = device.setMessage('WEATHER_PARAMETERS')
+    """
+
+    __all__ = ['SimIndiDevice',
+               'defMessages',
+               'setMessage',
+               'update',
+               'blobMessage',
+               ]
+
+    LIGHTS = ['Idle', 'Ok', 'Busy', 'Alert']
+
+    def __init__(self, name='', deviceType='', blobFormat='.fits', seed=0):
+        self.name = name
+        self.deviceType = deviceType
+        self.blobFormat = blobFormat
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.properties = dict()
+        for propertyName, (kind, elements) in dict(COMMON,
+                                                   **PROPERTIES.get(deviceType, {})).items():
+            self.properties[propertyName] = {'type': kind,
+                                             'state': 'Idle',
+                                             'elements': dict(elements)}
+
+    def names(self, kinds=None):
+        """
+        names returns the property names of the given types
+
+        :param kinds: list of types or None for all
+        :return: list of property names
+        """
+
+        return [name for name, prop in self.properties.items()
+                if kinds is None or prop['type'] in kinds]
+
+    def update(self, propertyName):
+        """
+        update changes the values of a property, so each update message carries new
+        values
+
+        :param propertyName:
+        :return: true for test purpose
+        """
+
+        prop = self.properties[propertyName]
+        elements = prop['elements']
+        with self.lock:
+            for element, value in elements.items():
+                if prop['type'] == 'number' and isinstance(value, float):
+                    elements[element] = value + self.random.gauss(0, 0.1)
+                elif prop['type'] == 'switch':
+                    elements[element] = not value
+                elif prop['type'] == 'light':
+                    index = self.LIGHTS.index(value) + 1
+                    elements[element] = self.LIGHTS[index % len(self.LIGHTS)]
+                elif prop['type'] == 'text':
+                    elements[element] = f'{element.lower()} {self.random.randint(0, 9999)}'
+        return True
+
+    def defMessages(self):
+        """
+        defMessages returns the def*Vector messages of all properties, which are the
+        answer to getProperties
+
+        :return: list of xml texts
+        """
+
+        messages = list()
+        for propertyName, prop in self.properties.items():
+            kind = prop['type'].capitalize()
+            if kind == 'Blob':
+                kind = 'BLOB'
+            attributes = (f'device={quoteattr(self.name)} name={quoteattr(propertyName)} '
+                          f'label={quoteattr(propertyName)} group="Main" '
+                          f'state="{prop["state"]}" timestamp="{timestamp()}"')
+            if kind != 'Light':
+                attributes += ' perm="rw" timeout="60"'
+            if kind == 'Switch':
+                attributes += ' rule="AnyOfMany"'
+
+            text = f'<def{kind}Vector {attributes}>\n'
+            for element, value in prop['elements'].items():
+                if kind == 'BLOB':
+                    text += f'<defBLOB name={quoteattr(element)} label={quoteattr(element)}/>\n'
+                    continue
+                extra = ' format="%g" min="-1000000" max="1000000" step="0"'
+                text += (f'<def{kind} name={quoteattr(element)} label={quoteattr(element)}'
+                         f'{extra if kind == "Number" else ""}>'
+                         f'{formatValue(prop["type"], value)}</def{kind}>\n')
+            text += f'</def{kind}Vector>\n'
+            messages.append(text)
+        return messages
+
+    def setMessage(self, propertyName, state=None):
+        """
+        setMessage returns the set*Vector message with the actual values of a property
+
+        :param propertyName:
+        :param state: new state of the property or None
+        :return: xml text
+        """
+
+        prop = self.properties[propertyName]
+        if state is not None:
+            prop['state'] = state
+        kind = prop['type'].capitalize()
+        with self.lock:
+            elements = ''.join(f'<one{kind} name={quoteattr(element)}>'
+                               f'{formatValue(prop["type"], value)}</one{kind}>\n'
+                               for element, value in prop['elements'].items())
+        return (f'<set{kind}Vector device={quoteattr(self.name)} '
+                f'name={quoteattr(propertyName)} state="{prop["state"]}" '
+                f'timestamp="{timestamp()}">\n{elements}</set{kind}Vector>\n')
+
+    def blobMessage(self, content, blobFormat=None):
+        """
+        blobMessage returns the setBLOBVector message for an image
+
+        :param content: bytes of the BLOB
+        :param blobFormat: format of the BLOB, default is the format of the device
+        :return: xml text
+        """
+
+        blobFormat = blobFormat or self.blobFormat
+        encoded = base64.b64encode(content).decode('ascii')
+        return (f'<setBLOBVector device={quoteattr(self.name)} name="CCD1" state="Ok" '
+                f'timestamp="{timestamp()}">\n'
+                f'<oneBLOB name="CCD1" size="{len(content)}" format="{blobFormat}">'
+                f'{encoded}</oneBLOB>\n</setBLOBVector>\n')
+
+    def imageSize(self):
+        """
+        imageSize returns the size of the image for the actual frame and binning
+
+        :return: width, height
+        """
+
+        frame = self.properties['CCD_FRAME']['elements']
+        binning = self.properties['CCD_BINNING']['elements']
+        width = max(int(frame['WIDTH']) // max(int(binning['HOR_BIN']), 1), 1)
+        height = max(int(frame['HEIGHT']) // max(int(binning['VERT_BIN']), 1), 1)
+        return width, height
+
+
+class IndiHandler(socketserver.StreamRequestHandler):
+    """
+    The class IndiHandler reads the xml stream of one client and hands the messages
+    to the simulator
+    """
+
+    simulator = None
+
+    def setup(self):
+        super().setup()
+        self.writeLock = threading.Lock()
+        self.blobMode = dict()
+        self.simulator.addClient(self)
+
+    def finish(self):
+        self.simulator.removeClient(self)
+        super().finish()
+
+    def send(self, text):
+        """
+        send writes a message to the client
+
+        :param text: xml text
+        :return: success
+        """
+
+        try:
+            with self.writeLock:
+                self.wfile.write(text.encode('utf-8'))
+                self.wfile.flush()
+        except (OSError, ValueError):
+            # writing to a stream closed by finish raises ValueError
+            return False
+        return True
+
+    def handle(self):
+        # the stream has no root element, so a virtual one is added for the parser
+        parser = ElementTree.XMLPullParser(events=['start', 'end'])
+        parser.feed('<indi>')
+        depth = 0
+        while True:
+            try:
+                chunk = self.connection.recv(65536)
+            except OSError:
+                break
+            if not chunk:
+                break
+            try:
+                parser.feed(chunk)
+                for event, element in parser.read_events():
+                    if event == 'start':
+                        depth += 1
+                        continue
+                    depth -= 1
+                    if depth == 1:
+                        self.simulator.receive(self, element)
+            except ElementTree.ParseError:
+                break
+
+
+class ThreadingTCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class IndiSimulator(object):
+    """
+    The class IndiSimulator is an indi server for simulated devices talking the indi
+    xml protocol, so the indi drivers of mw4 could be tested and load tested without
+    an indiserver. beside answering getProperties and new*Vector requests it sends
+    storms of property updates with a given rate and camera images as BLOB in the
+    formats .fits, .fits.z and .fits.fz.
+
+        >>> simulator = IndiSimulator()
+        >>> simulator.addDevice('Weather Simulator', deviceType='weather')
+        >>> simulator.start(port=7624)
+        >>> simulator.storm('Weather Simulator', kinds=['number'], count=1000, rate=10)
+    """
+
+    __all__ = ['IndiSimulator',
+               'addDevice',
+               'start',
+               'stop',
+               'storm',
+               'sendBlob',
+               'statistics',
+               'resetStatistics',
+               ]
+
+    def __init__(self):
+        self.devices = dict()
+        self.clients = list()
+        self.server = None
+        self.thread = None
+        self.lock = threading.Lock()
+        self.stats = dict()
+        self.timers = list()
+        self.resetStatistics()
+        # messages of the clients, which are not changing a property
+        self.messages = {
+            'getProperties': self.sendProperties,
+            'enableBLOB': self.enableBlob,
+        }
+
+    @property
+    def port(self):
+        if self.server is None:
+            return 0
+        return self.server.server_address[1]
+
+    def addDevice(self, name='', deviceType='', **kwargs):
+        """
+        addDevice adds a simulated device
+
+        :param name: indi device name
+        :param deviceType: weather or camera, other types have only the common properties
+        :param kwargs: parameters of SimIndiDevice
+        :return: device
+        """
+
+        device = SimIndiDevice(name=name, deviceType=deviceType, **kwargs)
+        self.devices[name] = device
+        return device
+
+    def addClient(self, client):
+        with self.lock:
+            self.clients.append(client)
+
+    def removeClient(self, client):
+        with self.lock:
+            if client in self.clients:
+                self.clients.remove(client)
+
+    def numberClients(self):
+        with self.lock:
+            return len(self.clients)
+
+    def count(self, text):
+        with self.lock:
+            self.stats['messages'] += 1
+            self.stats['bytes'] += len(text)
+
+    def statistics(self):
+        """
+        statistics returns the counters since the last reset together with the rates
+
+        :return: dict of statistics
+        """
+
+        with self.lock:
+            stats = dict(self.stats)
+        duration = max(time.perf_counter() - stats['timeStart'], 1e-9)
+        stats['duration'] = duration
+        stats['messageRate'] = stats['messages'] / duration
+        stats['byteRate'] = stats['bytes'] / duration
+        return stats
+
+    def resetStatistics(self):
+        """
+        resetStatistics sets the counters to zero
+
+        :return: true for test purpose
+        """
+
+        with self.lock:
+            self.stats = {'messages': 0,
+                          'bytes': 0,
+                          'timeStart': time.perf_counter(),
+                          }
+        return True
+
+    def broadcast(self, text, deviceName='', isBlob=False):
+        """
+        broadcast sends a message to all clients. BLOBs are only sent to clients, which
+        enabled them for the device.
+
+        :param text: xml text
+        :param deviceName:
+        :param isBlob:
+        :return: number of clients reached
+        """
+
+        with self.lock:
+            clients = list(self.clients)
+
+        number = 0
+        for client in clients:
+            mode = client.blobMode.get(deviceName, client.blobMode.get('', 'Never'))
+            if isBlob and mode == 'Never':
+                continue
+            if not isBlob and mode == 'Only':
+                continue
+            if client.send(text):
+                number += 1
+                self.count(text)
+        return number
+
+    def sendProperties(self, client, element):
+        """
+        sendProperties answers getProperties with the def*Vector messages of the
+        requested device or of all devices
+
+        :param client: handler of the client
+        :param element: xml element of the message
+        :return: true for test purpose
+        """
+
+        deviceName = element.get('device', '')
+        devices = [self.devices[deviceName]] if deviceName in self.devices else []
+        if not deviceName:
+            devices = list(self.devices.values())
+        for device in devices:
+            for text in device.defMessages():
+                client.send(text)
+        return True
+
+    def enableBlob(self, client, element):
+        """
+        enableBlob stores the BLOB mode (Never, Also, Only) of the client for the device
+
+        :param client: handler of the client
+        :param element: xml element of the message
+        :return: true for test purpose
+        """
+
+        client.blobMode[element.get('device', '')] = (element.text or 'Never').strip()
+        return True
+
+    @staticmethod
+    def updateElements(device, prop, element):
+        """
+        updateElements sets the values of a new*Vector message to the elements of the
+        property. unknown elements and malformed numbers are skipped.
+
+        :param device:
+        :param prop: property of the device
+        :param element: xml element of the message
+        :return: true for test purpose
+        """
+
+        elements = prop['elements']
+        with device.lock:
+            for child in element:
+                name = child.get('name')
+                if name not in elements:
+                    continue
+                text = (child.text or '').strip()
+                if prop['type'] == 'switch':
+                    elements[name] = text == 'On'
+                elif prop['type'] != 'number':
+                    elements[name] = text
+                else:
+                    try:
+                        elements[name] = float(text)
+                    except ValueError:
+                        continue
+        return True
+
+    def startExposure(self, device):
+        """
+        startExposure starts a timer for the exposure. the timers are kept to stop them
+        together with the simulator.
+
+        :param device:
+        :return: true for test purpose
+        """
+
+        duration = device.properties['CCD_EXPOSURE']['elements']['CCD_EXPOSURE_VALUE']
+        self.broadcast(device.setMessage('CCD_EXPOSURE', state='Busy'), device.name)
+        timer = threading.Timer(duration, self.finishExposure, args=[device])
+        timer.daemon = True
+        with self.lock:
+            self.timers = [x for x in self.timers if x.is_alive()]
+            self.timers.append(timer)
+        timer.start()
+        return True
+
+    def receive(self, client, element):
+        """
+        receive handles a message of a client
+
+        :param client: handler of the client
+        :param element: xml element of the message
+        :return: true for test purpose
+        """
+
+        if element.tag in self.messages:
+            return self.messages[element.tag](client, element)
+
+        device = self.devices.get(element.get('device', ''))
+        propertyName = element.get('name', '')
+        if device is None or propertyName not in device.properties:
+            return False
+        if not element.tag.startswith('new'):
+            return False
+
+        self.updateElements(device, device.properties[propertyName], element)
+        if propertyName == 'CCD_EXPOSURE':
+            self.startExposure(device)
+        else:
+            self.broadcast(device.setMessage(propertyName, state='Ok'), device.name)
+        return True
+
+    def finishExposure(self, device):
+        """
+        finishExposure sends the image of a finished exposure
+
+        :param device:
+        :return: true for test purpose
+        """
+
+        width, height = device.imageSize()
+        self.sendBlob(device.name, width=width, height=height)
+        device.properties['CCD_EXPOSURE']['elements']['CCD_EXPOSURE_VALUE'] = 0.0
+        self.broadcast(device.setMessage('CCD_EXPOSURE', state='Ok'), device.name)
+        return True
+
+    def sendBlob(self, deviceName, width=1000, height=800, blobFormat=None):
+        """
+        sendBlob sends an image as BLOB to the clients
+
+        :param deviceName:
+        :param width:
+        :param height:
+        :param blobFormat: format, default is the format of the device
+        :return: number of clients reached
+        """
+
+        device = self.devices[deviceName]
+        blobFormat = blobFormat or device.blobFormat
+        content = fitsBlob(blobFormat=blobFormat, width=width, height=height)
+        text = device.blobMessage(content, blobFormat=blobFormat)
+        return self.broadcast(text, deviceName, isBlob=True)
+
+    def storm(self, deviceName, kinds=None, count=100, rate=0):
+        """
+        storm sends count rounds of updates for all properties of the given types of a
+        device. with rate the rounds are sent with this frequency, otherwise as fast as
+        possible.
+
+        :param deviceName:
+        :param kinds: list of number, switch, text, light or None for all but BLOBs
+        :param count: number of rounds
+        :param rate: rounds per second or 0
+        :return: number of messages sent
+        """
+
+        device = self.devices[deviceName]
+        kinds = kinds or ['number', 'switch', 'text', 'light']
+        names = device.names(kinds=[x for x in kinds if x != 'blob'])
+        number = 0
+        timeStart = time.perf_counter()
+        for i in range(count):
+            for propertyName in names:
+                device.update(propertyName)
+                self.broadcast(device.setMessage(propertyName, state='Ok'), deviceName)
+                number += 1
+            if rate:
+                delay = timeStart + (i + 1) / rate - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+        return number
+
+    def start(self, port=0, host='127.0.0.1'):
+        """
+        start runs the indi server
+
+        :param port: port number, 0 for a free port
+        :param host: address to bind to
+        :return: success
+        """
+
+        if self.server is not None:
+            return False
+
+        handler = type('Handler', (IndiHandler, ), {'simulator': self})
+        try:
+            self.server = ThreadingTCPServer((host, port), handler)
+        except OSError:
+            return False
+
+        self.thread = threading.Thread(target=self.server.serve_forever,
+                                       kwargs={'poll_interval': 0.05},
+                                       name='indiSimulator',
+                                       daemon=True)
+        self.thread.start()
+        return True
+
+    def stop(self):
+        """
+        stop shuts the server down, cancels pending exposures and closes the client
+        connections
+
+        :return: true for test purpose
+        """
+
+        with self.lock:
+            timers = self.timers
+            self.timers = list()
+        for timer in timers:
+            timer.cancel()
+
+        if self.server is None:
+            return True
+
+        self.server.shutdown()
+        with self.lock:
+            clients = list(self.clients)
+        for client in clients:
+            try:
+                client.connection.shutdown(socketserver.socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self.server.server_close()
+        self.thread.join(timeout=1)
+        self.server = None
+        self.thread = None
+        return True
+
+
+def main(argv=None):
+    """
+    main runs the simulator until it is interrupted. all weather devices send their
+    numbers with the given rate.
+
+        python -m mw4.test.simulator.indiSimulator --devices weather:2,camera:1
+               --rate 10 --blob-format .fits.fz
+
+    :param argv:
+    :return: exit code
+    """
+
+    parser = argparse.ArgumentParser(description='simulate indi devices')
+    parser.add_argument('--port', type=int, default=7624)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--devices', default='weather:1,camera:1',
+                        help='comma separated list of type:count')
+    parser.add_argument('--rate', type=float, default=10,
+                        help='updates per second of the weather devices')
+    parser.add_argument('--blob-format', default='.fits',
+                        choices=['.fits', '.fits.z', '.fits.fz'])
+    args = parser.parse_args(argv)
+
+    try:
+        devices = [(x.split(':')[0], int(x.split(':')[1]))
+                   for x in args.devices.split(',')]
+    except (ValueError, IndexError):
+        print('malformed --devices', file=sys.stderr)
+        return 2
+
+    simulator = IndiSimulator()
+    for deviceType, number in devices:
+        for i in range(number):
+            simulator.addDevice(name=f'{deviceType.capitalize()} Simulator {i}',
+                                deviceType=deviceType,
+                                blobFormat=args.blob_format,
+                                seed=i)
+
+    if not simulator.start(port=args.port, host=args.host):
+        print(f'cannot start simulator on {args.host}:{args.port}', file=sys.stderr)
+        return 1
+
+    print(f'indi simulator on {args.host}:{simulator.port} with '
+          f'{len(simulator.devices)} devices')
+    weather = [x.name for x in simulator.devices.values() if x.deviceType == 'weather']
+    try:
+        while True:
+            timeStart = time.perf_counter()
+            for name in weather:
+                simulator.storm(name, kinds=['number'], count=1)
+            time.sleep(max(1 / args.rate - (time.perf_counter() - timeStart), 0))
+    except KeyboardInterrupt:
+        pass
+    simulator.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -32,12 +32,16 @@ from PyQt5.QtCore import QThreadPool
 
 # local import
 from mw4.astrometry.astrometry import Astrometry
+from mw4.astrometry.astrometry import solveTime
+from mw4.base import tpool
+from mw4.base.taskExecutor import TaskExecutor
 
 
 @pytest.fixture(autouse=True, scope='function')
 def module_setup_teardown():
     class Test:
         threadPool = QThreadPool()
+        executor = TaskExecutor()
 
     global app
     shutil.copy('mw4/test/testData/astrometry.cfg', 'mw4/test/temp/astrometry.cfg')
@@ -46,6 +50,7 @@ def module_setup_teardown():
 
     yield
 
+    app.app.executor.waitForDone(1000)
     del app
 
 
@@ -239,6 +244,32 @@ def test_getSolutionFromWCS_4():
     assert header['DEC'] == header['CRVAL2']
 
 
+def test_solutionFromFits_1():
+    header = fits.Header()
+    header.set('CRVAL1', 180.0)
+    header.set('CRVAL2', 60.0)
+    with fits.open('mw4/test/image/m51.fit') as hdu:
+        before = hdu[0].header.tostring()
+    solve = app.solutionFromFits(fitsPath='mw4/test/image/m51.fit',
+                                 wcsHeader=header)
+    assert solve['raJ2000S'].hours == 12
+    with fits.open('mw4/test/image/m51.fit') as hdu:
+        assert hdu[0].header.tostring() == before
+
+
+def test_solutionFromFits_2():
+    header = fits.Header()
+    header.set('CRVAL1', 180.0)
+    header.set('CRVAL2', 60.0)
+    solve = app.solutionFromFits(fitsPath='mw4/test/image/m51.fit',
+                                 wcsHeader=header,
+                                 updateFits=True)
+    assert solve['decJ2000S'].degrees == 60
+    with fits.open('mw4/test/image/m51.fit') as hdu:
+        assert hdu[0].header['CRVAL1'] == 180.0
+        assert 'SCALE' in hdu[0].header
+
+
 def test_solveClear_1():
     app.framework = 'Test'
     suc = app.solveClear()
@@ -252,6 +283,17 @@ def test_solveClear_2():
     assert suc
 
 
+def test_solveClear_3():
+    app.framework = 'CloudMakers'
+    app.solveStart = 0
+    number = solveTime.count(framework='CloudMakers', success=False)
+    app.mutexSolve.lock()
+    suc = app.solveClear()
+    assert suc
+    assert app.solveStart is None
+    assert solveTime.count(framework='CloudMakers', success=False) == number + 1
+
+
 def test_solveThreading_1():
     app.framework = 'Test'
     suc = app.solveThreading()
@@ -301,6 +343,27 @@ def test_solveThreading_5():
     assert not suc
 
 
+def test_solveThreading_6():
+    home = os.environ.get('HOME')
+    app.solverEnviron = {
+        'KStars': {
+            'programPath': '/Applications/Astrometry.app/Contents/MacOS',
+            'indexPath': home + '/Library/Application Support/Astrometry',
+            'solver': app.solverNET,
+        }
+    }
+    app.framework = 'KStars'
+    file = 'mw4/test/image/m51.fits'
+    with mock.patch.object(app.app.executor,
+                           'start',
+                           return_value=False):
+        suc = app.solveThreading(fitsPath=file)
+        assert not suc
+    assert app.solveStart is None
+    assert app.mutexSolve.tryLock()
+    app.mutexSolve.unlock()
+
+
 def test_abort_1():
     app.solverEnviron = {
         'KStars': {
@@ -327,8 +390,11 @@ def test_abort_2():
     with mock.patch.object(app.solverNET,
                            'abort',
                            return_value=True):
-        suc = app.abort()
-        assert suc
+        with mock.patch.object(app.app.executor,
+                               'cancel') as cancel:
+            suc = app.abort()
+            assert suc
+    cancel.assert_called_once_with('solve')
 
 
 def test_startCommunication():
@@ -339,3 +405,20 @@ def test_startCommunication():
 def test_stopCommunication():
     suc = app.stopCommunication()
     assert suc
+
+
+def test_checkCancelled_1():
+    result = {'success': False}
+    app.checkCancelled(token=None, result=result)
+    token = tpool.CancelToken()
+    app.checkCancelled(token=token, result=result)
+    assert 'message' not in result
+
+
+def test_checkCancelled_2():
+    result = {'success': False}
+    token = tpool.CancelToken()
+    token.cancel()
+    with pytest.raises(tpool.TaskCancelled):
+        app.checkCancelled(token=token, result=result)
+    assert result['message'] == 'solve aborted'
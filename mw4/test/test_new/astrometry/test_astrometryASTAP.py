@@ -30,6 +30,7 @@ from astropy.io import fits
 import numpy as np
 
 # local import
+from mw4.base.taskExecutor import TaskExecutor
 from mw4.astrometry.astrometry import AstrometryASTAP, Astrometry
 
 
@@ -37,6 +38,7 @@ from mw4.astrometry.astrometry import AstrometryASTAP, Astrometry
 def module_setup_teardown():
     class Test:
         threadPool = QThreadPool()
+        executor = TaskExecutor()
 
     global app, parent
     parent = Astrometry(app=Test(), tempDir='mw4/test/temp')
@@ -26,6 +26,7 @@ import requests
 
 # local import
 from mw4.base.alpacaBase import AlpacaBase
+from mw4.base.traceRecorder import recorder
 
 
 @pytest.fixture(autouse=True, scope='function')
@@ -247,3 +248,28 @@ def test_nameDevice():
 def test_supportedActions():
     val = app.supportedActions()
     assert val is None
+
+
+def test_traceRequest_1():
+    class Test:
+        status_code = 200
+        content = b'test'
+
+    app.name = 'test'
+    with mock.patch.object(recorder,
+                           'record') as record:
+        suc = app.traceRequest('attr', 'get', 0, response=Test())
+        assert suc
+        assert record.call_args[1]['size'] == 4
+        assert record.call_args[1]['status'] == 200
+
+
+def test_traceRequest_2():
+    app.name = 'test'
+    with mock.patch.object(recorder,
+                           'record'):
+        with mock.patch.object(recorder,
+                               'dumpOnError') as dump:
+            suc = app.traceRequest('attr', 'put', 0, status=-1)
+            assert suc
+            assert dump.called
@@ -19,6 +19,7 @@
 ###########################################################
 # standard libraries
 from unittest import mock
+import threading
 
 # external packages
 import pytest
@@ -30,12 +31,15 @@ from PyQt5.QtCore import QObject
 
 # local import
 from mw4.base.alpacaClass import AlpacaClass
+from mw4.base.alpacaClass import pollTime
+from mw4.base.taskExecutor import TaskExecutor
 
 
 @pytest.fixture(autouse=True, scope='function')
 def module_setup_teardown():
     class Test(QObject):
         threadPool = QThreadPool()
+        executor = TaskExecutor()
         message = pyqtSignal(str, int)
     global app
     app = AlpacaClass(app=Test())
@@ -43,6 +47,7 @@ def module_setup_teardown():
     yield
 
     app.threadPool.waitForDone(1000)
+    app.app.executor.waitForDone(1000)
     del app
 
 
@@ -185,14 +190,70 @@ def test_pollData_2():
     assert suc
 
 
+def test_pollData_3():
+    event = threading.Event()
+    app.deviceConnected = True
+    app.name = 'test:0'
+    with mock.patch.object(app,
+                           'workerPollDataTimed',
+                           side_effect=lambda: event.wait(5)):
+        suc = app.pollData()
+        assert suc
+        suc = app.pollData()
+        assert not suc
+        assert app.app.executor.isActive('test:0:pollData')
+        event.set()
+        app.app.executor.waitForDone(1000)
+    assert not app.app.executor.isActive('test:0:pollData')
+
+
+def test_workerPollDataTimed_1():
+    app.name = 'test:0'
+    number = pollTime.count(framework='alpaca', device='test:0')
+    with mock.patch.object(app,
+                           'workerPollData',
+                           return_value=True):
+        suc = app.workerPollDataTimed()
+        assert suc
+    assert pollTime.count(framework='alpaca', device='test:0') == number + 1
+
+
 def test_startPollStatus():
     suc = app.startPollStatus()
     assert suc
 
 
 def test_startCommunication():
-    suc = app.startCommunication()
-    assert suc
+    with mock.patch.object(app.app.executor,
+                           'start',
+                           return_value=True) as start:
+        suc = app.startCommunication()
+        assert suc
+    assert start.call_args[1]['lane'] == 'control'
+
+
+def test_startCommunication_2():
+    event = threading.Event()
+    app.name = 'test:0'
+    with mock.patch.object(app,
+                           'getInitialConfig',
+                           side_effect=lambda: event.wait(5)):
+        suc = app.startCommunication()
+        assert suc
+        suc = app.startCommunication()
+        assert not suc
+        event.set()
+        app.app.executor.waitForDone(1000)
+    assert not app.app.executor.isActive('test:0:connect')
+
+
+def test_stopCommunication_2():
+    app.name = 'test:0'
+    with mock.patch.object(app.app.executor,
+                           'start') as start:
+        suc = app.stopCommunication()
+        assert suc
+    assert start.call_args[1]['key'] == 'test:0:disconnect'
 
 
 def test_stopCommunication():
@@ -0,0 +1,95 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import os
+import unittest.mock as mock
+import pytest
+
+# external packages
+import numpy as np
+from astropy.io import fits
+
+# local import
+from mw4.base import fitsAccess
+
+
+@pytest.fixture(autouse=True, scope='function')
+def module_setup_teardown():
+    global fileFloat, fileUint
+    fileFloat = 'mw4/test/temp/float.fits'
+    fileUint = 'mw4/test/temp/uint.fits'
+    data = np.arange(200 * 300, dtype=np.float32).reshape(200, 300)
+    hdu = fits.PrimaryHDU(data)
+    hdu.header['OBJECT'] = 'M51'
+    hdu.writeto(fileFloat, overwrite=True)
+    data = np.arange(200 * 300, dtype=np.uint16).reshape(200, 300)
+    fits.PrimaryHDU(data).writeto(fileUint, overwrite=True)
+    yield
+    for file in [fileFloat, fileUint]:
+        if os.path.isfile(file):
+            os.remove(file)
+
+
+def test_readHeader_1():
+    header = fitsAccess.readHeader(fileFloat)
+    assert header['OBJECT'] == 'M51'
+    assert header['NAXIS1'] == 300
+
+
+def test_readHeader_2():
+    with mock.patch.object(fits.PrimaryHDU,
+                           'data',
+                           new_callable=mock.PropertyMock) as data:
+        fitsAccess.readHeader(fileFloat)
+        assert not data.called
+
+
+def test_readImage_1():
+    data, header = fitsAccess.readImage(fileFloat)
+    assert data.shape == (200, 300)
+    assert data[100, 10] == 30010
+    assert header['OBJECT'] == 'M51'
+
+
+def test_readImage_2():
+    data, header = fitsAccess.readImage(fileUint)
+    assert data.dtype == np.uint16
+    assert data[199, 299] == 59999
+
+
+def test_writeHeader_1():
+    header = fitsAccess.readHeader(fileUint)
+    header['OBJECT'] = 'M42'
+    size = os.path.getsize(fileUint)
+    suc = fitsAccess.writeHeader(fileUint, header)
+    assert suc
+    assert fitsAccess.readHeader(fileUint)['OBJECT'] == 'M42'
+    assert os.path.getsize(fileUint) == size
+
+
+def test_writeHeader_2():
+    header = fitsAccess.readHeader(fileUint)
+    for i in range(60):
+        header[f'KEY{i}'] = 'value'
+    suc = fitsAccess.writeHeader(fileUint, header)
+    assert suc
+    data, header = fitsAccess.readImage(fileUint)
+    assert header['KEY59'] == 'value'
+    assert data[199, 299] == 59999
@@ -0,0 +1,352 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import os
+import shutil
+import threading
+import unittest.mock as mock
+import pytest
+
+# external packages
+import PyQt5
+import numpy as np
+from astropy.io import fits
+
+# local import
+from mw4.base.headerIndex import HeaderIndex
+from mw4.base.taskExecutor import TaskExecutor
+
+
+@pytest.fixture(autouse=True, scope='function')
+def module_setup_teardown():
+    class Test:
+        threadPool = PyQt5.QtCore.QThreadPool()
+        executor = TaskExecutor()
+
+    global app, pathDir
+    pathDir = 'mw4/test/temp/index'
+    if os.path.isdir(pathDir):
+        shutil.rmtree(pathDir)
+    os.makedirs(pathDir + '/sub')
+    app = HeaderIndex(app=Test())
+    yield
+    app.close()
+    shutil.rmtree(pathDir)
+    del app
+
+
+def writeFile(name, **kwargs):
+    hdu = fits.PrimaryHDU(np.zeros((2, 2), dtype=np.uint16))
+    for key, value in kwargs.items():
+        hdu.header[key.replace('_', '-')] = value
+    hdu.writeto(f'{pathDir}/{name}', overwrite=True)
+    return os.path.abspath(f'{pathDir}/{name}')
+
+
+def test_createTables_1():
+    suc = app.createTables()
+    assert suc
+
+
+def test_convertCoordinates_1():
+    header = fits.PrimaryHDU().header
+    value = app.convertCoordinates(header)
+    assert value == (None, None, 0, None, None)
+
+
+def test_convertCoordinates_2():
+    header = fits.PrimaryHDU().header
+    header['RA'] = '12:00:00'
+    header['DEC'] = '-10:30:00'
+    header['CRVAL1'] = 180.5
+    header['CRVAL2'] = -10.4
+    ra, dec, solved, raSolved, decSolved = app.convertCoordinates(header)
+    assert np.isclose(ra, 180)
+    assert np.isclose(dec, -10.5)
+    assert solved == 1
+    assert raSolved == 180.5
+    assert decSolved == -10.4
+
+
+def test_updateFile_1():
+    file = writeFile('a.fit', OBJECT='M51', EXPTIME=30, DATE_OBS='2020-03-01T20:00:00')
+    suc = app.updateFile(file)
+    assert suc
+    rows = app.query()
+    assert len(rows) == 1
+    assert rows[0]['object'] == 'M51'
+    assert rows[0]['expTime'] == 30
+    assert rows[0]['solved'] == 0
+
+
+def test_updateFile_2():
+    file = writeFile('a.fit', OBJECT='M51')
+    app.updateFile(file)
+    with mock.patch.object(HeaderIndex,
+                           'buildRow') as buildRow:
+        suc = app.updateFile(file)
+        assert not suc
+        assert not buildRow.called
+
+
+def test_updateFile_3():
+    file = writeFile('a.fit', OBJECT='M51')
+    app.updateFile(file)
+    os.remove(file)
+    suc = app.updateFile(file)
+    assert suc
+    assert app.query() == []
+
+
+def test_updateFile_4():
+    file = os.path.abspath(pathDir + '/a.fit')
+    with open(file, 'w') as outFile:
+        outFile.write('test')
+    suc = app.updateFile(file)
+    assert not suc
+
+
+def test_updateFile_5():
+    file = writeFile('a.fit', EXPTIME='x')
+    app.updateFile(file)
+    assert app.query()[0]['expTime'] is None
+
+
+def test_updateDir_1():
+    writeFile('a.fit', OBJECT='A')
+    writeFile('sub/b.fits', OBJECT='B')
+    number = app.updateDir(pathDir)
+    assert number == 2
+    assert app.updateDir(pathDir) == 0
+    os.remove(pathDir + '/sub/b.fits')
+    assert app.updateDir(pathDir) == 1
+    assert [x['object'] for x in app.query()] == ['A']
+
+
+def test_updateDir_2():
+    writeFile('a.fit', OBJECT='A')
+    writeFile('sub/b.fits', OBJECT='B')
+    number = app.updateDir(pathDir, recursive=False)
+    assert number == 1
+
+
+def test_removeDir_1():
+    writeFile('sub/b.fits', OBJECT='B')
+    app.updateDir(pathDir)
+    number = app.removeDir(os.path.abspath(pathDir + '/sub'))
+    assert number == 1
+
+
+def test_removeDir_2():
+    os.makedirs(pathDir + '/sub/deep')
+    writeFile('a.fit', OBJECT='A')
+    writeFile('sub/b.fits', OBJECT='B')
+    writeFile('sub/deep/c.fits', OBJECT='C')
+    app.updateDir(pathDir)
+    number = app.removeDir(pathDir + '/sub')
+    assert number == 2
+    assert [x['object'] for x in app.query()] == ['A']
+
+
+def test_subDirPattern_1():
+    pattern = app.subDirPattern(os.path.join('m_1', '100%'))
+    assert pattern == os.path.join('m\\_1', '100\\%', '%')
+
+
+def test_updateDirs_1():
+    writeFile('a.fit', OBJECT='A')
+    writeFile('sub/b.fits', OBJECT='B')
+    app.updateDir(pathDir)
+    shutil.rmtree(pathDir + '/sub')
+    number = app.updateDirs([os.path.abspath(pathDir),
+                             os.path.abspath(pathDir + '/sub')])
+    assert number == 1
+
+
+def test_watchDir_1():
+    suc = app.watchDir('/xxx')
+    assert not suc
+
+
+def test_watchDir_2():
+    suc = app.watchDir(pathDir)
+    assert suc
+    assert len(app.watcher.directories()) == 2
+    assert os.path.abspath(pathDir) in app.changedDirs
+
+
+def test_dirChanged_1():
+    suc = app.dirChanged(pathDir)
+    assert suc
+    assert app.timerUpdate.isActive()
+
+
+def test_dirChanged_2():
+    app.watchDir(pathDir)
+    os.makedirs(pathDir + '/run/deep')
+    suc = app.dirChanged(pathDir)
+    assert suc
+    assert os.path.abspath(pathDir + '/run') in app.changedTrees
+    assert os.path.abspath(pathDir + '/run/deep') in app.watcher.directories()
+    app.changedTrees = set()
+    app.dirChanged(pathDir)
+    assert not app.changedTrees
+
+
+def test_dirChanged_3():
+    suc = app.dirChanged(pathDir + '/missing')
+    assert suc
+    assert not app.changedTrees
+
+
+def test_updateDirs_2():
+    os.makedirs(pathDir + '/run/deep')
+    writeFile('run/deep/a.fits')
+    number = app.updateDirs([], [os.path.abspath(pathDir + '/run')])
+    assert number == 1
+
+
+def test_watchDir_3(qtbot):
+    app.DELAY_UPDATE = 10
+    app.watchDir(pathDir)
+    qtbot.waitUntil(lambda: not app.app.executor.isActive('headerIndex'))
+    os.makedirs(pathDir + '/model')
+    path = writeFile('model/image-001.fits', OBJECT='M51')
+    qtbot.waitUntil(lambda: len(app.query(objectName='M51')) == 1, timeout=5000)
+    assert app.query(objectName='M51')[0]['path'] == path
+
+
+def test_processChanges_1():
+    suc = app.processChanges()
+    assert not suc
+
+
+def test_processChanges_2():
+    app.changedDirs = {pathDir}
+    with mock.patch.object(app.app.executor,
+                           'start') as start:
+        suc = app.processChanges()
+        assert suc
+        assert start.called
+    assert not app.changedDirs
+
+
+def test_processChanges_3():
+    app.changedDirs = {pathDir}
+    with mock.patch.object(app.app.executor,
+                           'isActive',
+                           return_value=True):
+        suc = app.processChanges()
+        assert not suc
+    assert app.changedDirs == {pathDir}
+    assert app.timerUpdate.isActive()
+
+
+def test_processChanges_4(qtbot):
+    app.DELAY_UPDATE = 10
+    event = threading.Event()
+    updateDirs = app.updateDirs
+
+    def slowUpdate(dirs, trees):
+        event.wait(5)
+        return updateDirs(dirs, trees)
+
+    with mock.patch.object(app,
+                           'updateDirs',
+                           side_effect=slowUpdate):
+        app.changedDirs = {os.path.abspath(pathDir + '/sub')}
+        assert app.processChanges()
+        writeFile('a.fits', OBJECT='M51')
+        app.dirChanged(pathDir)
+        qtbot.wait(100)
+        assert app.changedDirs == {os.path.abspath(pathDir)}
+        event.set()
+        qtbot.waitUntil(lambda: len(app.query(objectName='M51')) == 1, timeout=5000)
+    assert not app.changedDirs
+
+
+def test_updateResult_1(qtbot):
+    with qtbot.assertNotEmitted(app.updated):
+        app.updateResult(0)
+    with qtbot.waitSignal(app.updated):
+        app.updateResult(1)
+
+
+def test_updateSolved_1():
+    assert not app.updateSolved()
+    assert not app.updateSolved({'success': False})
+
+
+def test_updateSolved_2(qtbot):
+    file = writeFile('a.fit', OBJECT='A', CRVAL1=10, CRVAL2=20)
+    with qtbot.waitSignal(app.updated):
+        suc = app.updateSolved({'success': True, 'solvedPath': file})
+        assert suc
+    assert app.query(solved=True)[0]['decSolved'] == 20
+
+
+def test_updateSolved_3():
+    file = writeFile('a.fit', OBJECT='A', CRVAL1=10, CRVAL2=20)
+    with mock.patch.object(app.app.executor,
+                           'start',
+                           return_value=True) as start:
+        with mock.patch.object(app,
+                               'updateFile') as updateFile:
+            suc = app.updateSolved({'success': True, 'solvedPath': file})
+            assert suc
+            assert not updateFile.called
+    assert start.call_args[1]['lane'] == 'io'
+
+
+def test_query_1():
+    writeFile('a.fit', OBJECT='A', FILTER='L', DATE_OBS='2020-03-01T20:00:00')
+    writeFile('b.fit', OBJECT='B', FILTER='R', DATE_OBS='2020-03-02T20:00:00')
+    writeFile('sub/c.fit', OBJECT='A', FILTER='R', DATE_OBS='2020-03-03T20:00:00')
+    app.updateDir(pathDir)
+    assert len(app.query(objectName='A')) == 2
+    assert len(app.query(filterName='R')) == 2
+    assert len(app.query(dateFrom='2020-03-02')) == 2
+    assert len(app.query(dateFrom='2020-03-02', dateTo='2020-03-03')) == 1
+    assert len(app.query(pathDir=pathDir + '/sub')) == 1
+
+
+def test_query_3():
+    os.makedirs(pathDir + '/m_1/x')
+    os.makedirs(pathDir + '/mx1/x')
+    writeFile('m_1/x/a.fit', OBJECT='A')
+    writeFile('mx1/x/b.fit', OBJECT='B')
+    app.updateDir(pathDir)
+    assert [x['object'] for x in app.query(pathDir=pathDir + '/m_1')] == ['A']
+    app.removeDir(pathDir + '/m_1')
+    assert [x['object'] for x in app.query()] == ['B']
+
+
+def test_query_2():
+    writeFile('a.fit', RA=100.0, DEC=20.0)
+    writeFile('b.fit', RA=100.0, DEC=20.0, CRVAL1=101.5, CRVAL2=20.0)
+    writeFile('c.fit', RA=359.5, DEC=20.0, CRVAL1=359.5, CRVAL2=20.0)
+    writeFile('d.fit', OBJECT='D')
+    app.updateDir(pathDir)
+    rows = app.query(ra=100, dec=20, radius=1)
+    assert [os.path.basename(x['path']) for x in rows] == ['a.fit']
+    rows = app.query(solved=True, ra=101, dec=20, radius=1)
+    assert [os.path.basename(x['path']) for x in rows] == ['b.fit']
+    rows = app.query(solved=True, ra=0.2, dec=20, radius=1)
+    assert [os.path.basename(x['path']) for x in rows] == ['c.fit']
@@ -22,6 +22,9 @@ from unittest import mock
 import time
 import pytest
 import logging
+import os
+import gzip
+import shutil
 
 # external packages
 
@@ -43,6 +46,63 @@ def test_setupLogging():
     assert suc
 
 
+def test_setupLogging_1():
+    pathDir = 'mw4/test/temp/log'
+    os.makedirs(pathDir, exist_ok=True)
+    suc = loggerMW.setupLogging(pathDir=pathDir)
+    assert suc
+    assert loggerMW.listener is not None
+    logging.getLogger('test').critical('test %s', 'message')
+    assert loggerMW.stopLogging()
+    assert loggerMW.listener is None
+    fileName = f'{pathDir}/mw4-{loggerMW.LogFileHandler.today()}.log'
+    with open(fileName) as logFile:
+        assert 'test message' in logFile.read()
+    shutil.rmtree(pathDir)
+
+
+def test_stopLogging_1():
+    loggerMW.stopLogging()
+    assert not loggerMW.stopLogging()
+
+
+def test_logFileHandler_1():
+    pathDir = 'mw4/test/temp/log'
+    os.makedirs(pathDir, exist_ok=True)
+    handler = loggerMW.LogFileHandler(pathDir=pathDir, maxBytes=100, backupCount=2)
+    record = logging.LogRecord('test', logging.INFO, '', 0, 'x' * 60, None, None)
+    for i in range(5):
+        handler.emit(record)
+    handler.close()
+    names = sorted(os.listdir(pathDir))
+    base = f'mw4-{handler.day}.log'
+    assert names == [base, base + '.1.gz', base + '.2.gz']
+    with gzip.open(f'{pathDir}/{base}.1.gz', 'rt') as inFile:
+        assert 'x' * 60 in inFile.read()
+    shutil.rmtree(pathDir)
+
+
+def test_logFileHandler_2():
+    pathDir = 'mw4/test/temp/log'
+    os.makedirs(pathDir, exist_ok=True)
+    handler = loggerMW.LogFileHandler(pathDir=pathDir)
+    record = logging.LogRecord('test', logging.INFO, '', 0, 'test', None, None)
+    handler.day = '2020-01-01'
+    handler.baseFilename = os.path.abspath(handler.fileName(handler.day))
+    with open(handler.baseFilename, 'w') as logFile:
+        logFile.write('test')
+    assert handler.shouldRollover(record)
+    handler.emit(record)
+    handler.close()
+    names = sorted(os.listdir(pathDir))
+    assert names == ['mw4-2020-01-01.log.gz', f'mw4-{handler.today()}.log']
+    shutil.rmtree(pathDir)
+
+
+def test_logFileHandler_3():
+    assert not loggerMW.LogFileHandler.compress('notExisting', 'notExisting.gz')
+
+
 def test_setCustomLoggingLevel():
     suc = loggerMW.setCustomLoggingLevel()
     assert suc
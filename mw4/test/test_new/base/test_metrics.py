@@ -0,0 +1,155 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import pytest
+import requests
+
+# external packages
+
+# local import
+from mw4.base.metrics import MetricsRegistry
+from mw4.base.metrics import MetricsServer
+from mw4.base.metrics import formatValue
+
+
+@pytest.fixture(autouse=True, scope='function')
+def module_setup_teardown():
+    global app, server
+    app = MetricsRegistry()
+    server = MetricsServer(registry=app)
+    yield
+    server.stop()
+    del app, server
+
+
+def test_counter_1():
+    counter = app.counter('test_total', 'test', ['device'])
+    counter.inc(device='dome')
+    counter.inc(2, device='dome')
+    assert counter.value(device='dome') == 3
+    assert counter.value(device='camera') == 0
+
+
+def test_counter_2():
+    counter = app.counter('test_total', 'test')
+    assert app.counter('test_total') is counter
+    with pytest.raises(ValueError):
+        app.gauge('test_total')
+
+
+def test_gauge_1():
+    gauge = app.gauge('test', 'test', ['queue'])
+    gauge.set(5, queue='slew')
+    gauge.dec(queue='slew')
+    assert gauge.value(queue='slew') == 4
+
+
+def test_gauge_2():
+    gauge = app.gauge('test', 'test', ['queue'])
+    gauge.setFunction(lambda: 3, queue='slew')
+    gauge.setFunction(lambda: 1 / 0, queue='image')
+    assert gauge.value(queue='slew') == 3
+    assert gauge.value(queue='image') != gauge.value(queue='image')
+
+
+def test_histogram_1():
+    histogram = app.histogram('test_seconds', 'test', buckets=(0.1, 1))
+    histogram.observe(0.05)
+    histogram.observe(0.1)
+    histogram.observe(0.5)
+    histogram.observe(5)
+    assert histogram.count() == 4
+    assert histogram.sum() == pytest.approx(5.65)
+    assert histogram.percentile(0.5) == 0.1
+    assert histogram.percentile(0.75) == 1
+    assert histogram.percentile(1) == float('inf')
+
+
+def test_histogram_2():
+    histogram = app.histogram('test_seconds', 'test')
+    assert histogram.percentile(0.5) is None
+    with histogram.time():
+        pass
+    assert histogram.count() == 1
+
+
+def test_formatValue_1():
+    assert formatValue(1) == '1'
+    assert formatValue(2.0) == '2'
+    assert formatValue(0.25) == '0.25'
+    assert formatValue(float('inf')) == '+Inf'
+    assert formatValue(float('nan')) == 'NaN'
+
+
+def test_text_1():
+    app.counter('test_total', 'test counter', ['device']).inc(device='a"b')
+    app.histogram('test_seconds', 'test time', buckets=(1, )).observe(0.5)
+    text = app.text()
+    assert '# TYPE test_total counter' in text
+    assert 'test_total{device="a\\"b"} 1' in text
+    assert 'test_seconds_bucket{le="1"} 1' in text
+    assert 'test_seconds_bucket{le="+Inf"} 1' in text
+    assert 'test_seconds_count 1' in text
+
+
+def test_summary_1():
+    app.gauge('test', 'test', ['queue']).set(2, queue='slew')
+    app.histogram('test_seconds', 'test', ['window']).observe(0.5, window='image')
+    rows = app.summary()
+    assert rows[0] == ('test', 'queue=slew', '2')
+    assert rows[1][0] == 'test_seconds'
+    assert rows[1][2].startswith('n=1 mean=0.500s')
+
+
+def test_clear_1():
+    app.counter('test_total')
+    suc = app.clear()
+    assert suc
+    assert app.text() == '\n'
+
+
+def test_server_1():
+    app.counter('test_total', 'test').inc()
+    suc = server.start(port=0)
+    assert suc
+    assert not server.start(port=0)
+    response = requests.get(f'http://127.0.0.1:{server.port}/metrics', timeout=3)
+    assert response.status_code == 200
+    assert 'test_total 1' in response.text
+    assert response.headers['Content-Type'].startswith('text/plain; version=0.0.4')
+
+
+def test_server_2():
+    server.start(port=0)
+    response = requests.get(f'http://127.0.0.1:{server.port}/test', timeout=3)
+    assert response.status_code == 404
+
+
+def test_server_3():
+    server.start(port=0)
+    other = MetricsServer(registry=app)
+    suc = other.start(port=server.port)
+    assert not suc
+    assert other.port == 0
+
+
+def test_stop_1():
+    suc = server.stop()
+    assert suc
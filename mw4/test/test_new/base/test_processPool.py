@@ -0,0 +1,179 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import concurrent.futures
+import unittest.mock as mock
+import pytest
+
+# external packages
+import numpy as np
+
+# local import
+from mw4.base import processPool
+from mw4.base.processPool import ProcessPool
+from mw4.base.processPool import SharedArray
+
+
+def scaleArray(array, factor=1):
+    return {'scaled': array * factor, 'sum': float(array.sum())}
+
+
+def raiseError():
+    raise ValueError('test')
+
+
+@pytest.fixture(autouse=True, scope='function')
+def module_setup_teardown():
+    global app
+    app = ProcessPool(workers=1)
+    yield
+    app.close()
+    del app
+
+
+def test_sharedArray_1():
+    array = np.arange(12, dtype=np.float32).reshape(3, 4)
+    shared, memory = SharedArray.share(array)
+    value, memoryAttached = shared.attach()
+    assert np.array_equal(value, array)
+    assert value.dtype == np.float32
+    del value
+    processPool.release([memoryAttached])
+    processPool.release([memory], unlink=True)
+
+
+def test_pack_1():
+    memories = list()
+    small = np.arange(10)
+    large = np.zeros(SharedArray.MIN_SIZE)
+    value = processPool.pack((small, [large], {'a': 1}), memories)
+    assert value[0] is small
+    assert isinstance(value[1][0], SharedArray)
+    assert value[2] == {'a': 1}
+    assert len(memories) == 1
+
+    attached = list()
+    result = processPool.unpack(value, attached, copy=True)
+    assert np.array_equal(result[1][0], large)
+    processPool.release(attached)
+    processPool.release(memories, unlink=True)
+
+
+def test_pack_2():
+    memories = list()
+    small = np.arange(10)
+    value = processPool.pack(small, memories, copy=True)
+    assert value is not small
+    assert np.array_equal(value, small)
+
+
+def test_pack_3():
+    memories = list()
+    with mock.patch.object(processPool,
+                           'shared_memory',
+                           None):
+        large = np.zeros(SharedArray.MIN_SIZE)
+        value = processPool.pack(large, memories)
+    assert value is large
+    assert not memories
+
+
+def test_release_1():
+    class Memory:
+        @staticmethod
+        def close():
+            raise BufferError
+
+        @staticmethod
+        def unlink():
+            raise FileNotFoundError
+
+    assert processPool.release([Memory()], unlink=True)
+
+
+def test_runTask_1():
+    array = np.ones(SharedArray.MIN_SIZE // 8)
+    memories = list()
+    args, kwargs = processPool.pack(((array, ), {'factor': 2}), memories)
+    result = processPool.runTask(scaleArray, args, kwargs)
+    processPool.release(memories, unlink=True)
+
+    attached = list()
+    result = processPool.unpack(result, attached, copy=True)
+    processPool.release(attached, unlink=True)
+    assert result['sum'] == array.size
+    assert np.all(result['scaled'] == 2)
+
+
+def test_init_1():
+    pool = ProcessPool(workers=0)
+    assert not pool.enabled
+    assert pool.startPool() is None
+
+
+def test_run_1():
+    app.enabled = False
+    result = app.run(scaleArray, np.ones(4), factor=3)
+    assert result['sum'] == 4
+    assert app.pool is None
+
+
+def test_run_2():
+    array = np.ones((1024, 1024))
+    result = app.run(scaleArray, array, factor=2)
+    assert result['sum'] == array.size
+    assert np.all(result['scaled'] == 2)
+    assert app.pool is not None
+
+
+def test_run_3():
+    with pytest.raises(ValueError):
+        app.run(raiseError)
+
+
+def test_run_4():
+    with mock.patch.object(concurrent.futures.ProcessPoolExecutor,
+                           'submit',
+                           side_effect=concurrent.futures.process.BrokenProcessPool):
+        result = app.run(scaleArray, np.ones(4), factor=3)
+    assert result['sum'] == 4
+    assert not app.enabled
+
+
+def test_startPool_1():
+    with mock.patch.object(concurrent.futures,
+                           'ProcessPoolExecutor',
+                           side_effect=OSError):
+        assert app.startPool() is None
+    assert not app.enabled
+
+
+def test_worker_1(qtbot):
+    app.enabled = False
+    worker = app.worker(scaleArray, np.ones(4))
+    with qtbot.waitSignal(worker.signals.result) as blocker:
+        worker.run()
+    assert blocker.args[0]['sum'] == 4
+
+
+def test_close_1():
+    app.startPool()
+    assert app.close()
+    assert app.pool is None
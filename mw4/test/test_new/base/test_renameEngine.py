@@ -0,0 +1,179 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import os
+import shutil
+import unittest.mock as mock
+import pytest
+
+# external packages
+import numpy as np
+from astropy.io import fits
+
+# local import
+from mw4.base.renameEngine import RenameEngine
+
+
+@pytest.fixture(autouse=True, scope='function')
+def module_setup_teardown():
+    global app, pathDir
+    pathDir = 'mw4/test/temp/rename'
+    if os.path.isdir(pathDir):
+        shutil.rmtree(pathDir)
+    os.makedirs(pathDir + '/sub')
+    app = RenameEngine()
+    yield
+    shutil.rmtree(pathDir)
+    del app
+
+
+def writeFile(name, objectName):
+    hdu = fits.PrimaryHDU(np.zeros((2, 2), dtype=np.uint16))
+    hdu.header['OBJECT'] = objectName
+    hdu.writeto(f'{pathDir}/{name}')
+    return f'{pathDir}/{name}'
+
+
+def nameFunc(header):
+    return header['OBJECT'] + '.fits'
+
+
+def test_scanFiles_1():
+    assert app.scanFiles() == []
+    assert app.scanFiles(pathDir='/xxx', search='*.fit*') == []
+
+
+def test_scanFiles_2():
+    writeFile('a.fit', 'A')
+    writeFile('sub/b.fits', 'B')
+    assert len(app.scanFiles(pathDir=pathDir, search='*.fit*')) == 1
+    assert len(app.scanFiles(pathDir=pathDir, search='**/*.fit*')) == 2
+
+
+def test_readHeaders_1():
+    files = [writeFile('a.fit', 'A'), pathDir + '/missing.fit']
+    headers = app.readHeaders(files)
+    assert headers[0]['OBJECT'] == 'A'
+    assert headers[1] is None
+    assert app.progress == 100
+
+
+def test_buildPlan_1():
+    files = [writeFile('a.fit', 'X'), writeFile('b.fit', 'b')]
+    plan = app.buildPlan(files, nameFunc)
+    assert plan[0]['status'] == 'rename'
+    assert plan[0]['target'] == os.path.join(pathDir, 'X.fits')
+    assert plan[1]['status'] == 'rename'
+    assert app.plan is plan
+
+
+def test_buildPlan_2():
+    files = [writeFile('a.fits', 'a'), pathDir + '/missing.fit']
+    plan = app.buildPlan(files, nameFunc)
+    assert plan[0]['status'] == 'unchanged'
+    assert plan[1]['status'] == 'error'
+
+
+def test_buildPlan_3():
+    def badName(header):
+        raise KeyError('test')
+
+    files = [writeFile('a.fit', 'a')]
+    plan = app.buildPlan(files, badName)
+    assert plan[0]['status'] == 'error'
+
+
+def test_buildPlan_4():
+    files = [writeFile('a.fit', 'X'), writeFile('b.fit', 'X'), writeFile('c.fit', 'Y')]
+    plan = app.buildPlan(files, nameFunc)
+    assert [x['status'] for x in plan] == ['conflict', 'conflict', 'rename']
+    assert app.hasConflicts(plan)
+
+
+def test_buildPlan_5():
+    writeFile('X.fits', 'X')
+    files = [writeFile('a.fit', 'X')]
+    plan = app.buildPlan(files, nameFunc)
+    assert plan[0]['status'] == 'conflict'
+
+
+def test_buildPlan_6():
+    files = [writeFile('a.fits', 'b'), writeFile('b.fits', 'a')]
+    plan = app.buildPlan(files, nameFunc)
+    assert not app.hasConflicts(plan)
+
+
+def test_apply_1():
+    files = [writeFile('a.fit', 'X'), writeFile('b.fit', 'X')]
+    app.buildPlan(files, nameFunc)
+    suc = app.apply()
+    assert not suc
+    assert os.path.isfile(files[0])
+    assert os.path.isfile(files[1])
+
+
+def test_apply_2():
+    files = [writeFile('a.fits', 'b'), writeFile('b.fits', 'a'), writeFile('c.fit', 'C')]
+    plan = app.buildPlan(files, nameFunc)
+    suc = app.apply(plan)
+    assert suc
+    assert fits.getheader(pathDir + '/a.fits')['OBJECT'] == 'a'
+    assert fits.getheader(pathDir + '/b.fits')['OBJECT'] == 'b'
+    assert os.path.isfile(pathDir + '/C.fits')
+    assert len(app.journal) == 3
+
+
+def test_apply_3():
+    files = [writeFile('a.fit', 'X'), writeFile('b.fit', 'Y')]
+    plan = app.buildPlan(files, nameFunc)
+    rename = os.rename
+    calls = []
+
+    def failingRename(source, target):
+        calls.append(source)
+        if len(calls) == 4:
+            raise OSError('test')
+        rename(source, target)
+
+    with mock.patch.object(os,
+                           'rename',
+                           side_effect=failingRename):
+        suc = app.apply(plan)
+    assert not suc
+    assert os.path.isfile(files[0])
+    assert os.path.isfile(files[1])
+    assert sorted(os.listdir(pathDir)) == ['a.fit', 'b.fit', 'sub']
+    assert not app.journal
+
+
+def test_undo_1():
+    assert not app.undo()
+
+
+def test_undo_2():
+    files = [writeFile('a.fit', 'X'), writeFile('b.fit', 'Y')]
+    app.buildPlan(files, nameFunc)
+    app.apply()
+    suc = app.undo()
+    assert suc
+    assert os.path.isfile(files[0])
+    assert os.path.isfile(files[1])
+    assert not os.path.isfile(pathDir + '/X.fits')
+    assert not app.journal
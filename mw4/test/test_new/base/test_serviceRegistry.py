@@ -0,0 +1,102 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import pytest
+
+# external packages
+
+# local import
+from mw4.base.serviceRegistry import ServiceRegistry
+from mw4.base.serviceRegistry import StartupTimeline
+
+
+@pytest.fixture(autouse=True, scope='function')
+def module_setup_teardown():
+    global app, timeline
+    timeline = StartupTimeline()
+    app = ServiceRegistry(timeline=timeline)
+    yield
+    del app, timeline
+
+
+def test_mark_1():
+    elapsed = timeline.mark('test')
+    assert elapsed >= 0
+    assert timeline.marks[0] == ('test', elapsed)
+
+
+def test_logTimeline_1():
+    timeline.mark('test1')
+    timeline.mark('test2')
+    suc = timeline.logTimeline()
+    assert suc
+
+
+def test_lazyClass_1():
+    factory = app.lazyClass('mw4.base.serviceRegistry.StartupTimeline')
+    assert factory() is StartupTimeline
+
+
+def test_lazyClass_2():
+    factory = app.lazyClass('mw4.base.notExisting.Test')
+    with pytest.raises(ImportError):
+        factory()
+
+
+def test_get_1():
+    assert app.get('test') is None
+
+
+def test_get_2():
+    calls = list()
+
+    def factory():
+        calls.append(1)
+        return 'service'
+
+    app.register('test', factory)
+    assert not app.isLoaded('test')
+    assert app.get('test') == 'service'
+    assert app.get('test') == 'service'
+    assert app.isLoaded('test')
+    assert len(calls) == 1
+    assert timeline.marks[0][0] == 'test built'
+
+
+def test_get_3():
+    def factory():
+        raise ValueError('test')
+
+    app.register('test', factory)
+    assert app.get('test') is None
+    assert not app.isLoaded('test')
+
+
+def test_get_4():
+    app.register('test', app.lazyClass('mw4.base.notExisting.Test'))
+    assert app.get('test') is None
+
+
+def test_register_1():
+    app.register('test', lambda: 1)
+    assert app.get('test') == 1
+    app.register('test', lambda: 2)
+    assert not app.isLoaded('test')
+    assert app.get('test') == 2
@@ -0,0 +1,178 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import random
+import math
+import pytest
+
+# external packages
+
+# local import
+from mw4.base.sphereIndex import SphereIndex
+from mw4.base.sphereIndex import altAzToVector
+from mw4.base.sphereIndex import chordFromAngle
+
+
+@pytest.fixture(autouse=True, scope='function')
+def module_setup_teardown():
+    global app
+    app = SphereIndex()
+    yield
+    del app
+
+
+def angle(p1, p2):
+    v1 = altAzToVector(*p1)
+    v2 = altAzToVector(*p2)
+    value = sum(a * b for a, b in zip(v1, v2))
+    return math.degrees(math.acos(min(max(value, -1), 1)))
+
+
+def test_altAzToVector_1():
+    x, y, z = altAzToVector(90, 0)
+    assert round(z, 6) == 1
+
+
+def test_altAzToVector_2():
+    v1 = altAzToVector(20, 0)
+    v2 = altAzToVector(20, 360)
+    assert [round(a - b, 6) for a, b in zip(v1, v2)] == [0, 0, 0]
+
+
+def test_chordFromAngle_1():
+    assert chordFromAngle(0) == 0
+    assert round(chordFromAngle(180), 6) == 2
+    assert round(chordFromAngle(400), 6) == 2
+
+
+def test_nearest_1():
+    assert app.nearest(45, 180) is None
+
+
+def test_nearest_2():
+    app.build([(45, 180), (30, 90)])
+    assert app.nearest(44, 181) == (45, 180)
+    assert app.nearest(30, 92) == (30, 90)
+
+
+def test_nearest_3():
+    app.build([(45, 180), (30, 90)])
+    assert app.nearest(10, 270, radius=2) is None
+
+
+def test_nearest_4():
+    app.build([(10, 359.5), (10, 180)])
+    assert app.nearest(10, 0.5, radius=2) == (10, 359.5)
+
+
+def test_nearest_5():
+    app.build([(45, 180), (30, 90)], keys=['a', 'b'])
+    assert app.nearest(44, 181) == 'a'
+
+
+def test_nearest_6():
+    random.seed(0)
+    points = [(random.uniform(0, 90), random.uniform(0, 360)) for _ in range(500)]
+    app.build(points)
+    for _ in range(100):
+        search = (random.uniform(0, 90), random.uniform(0, 360))
+        ref = min(points, key=lambda x: angle(x, search))
+        assert app.nearest(*search) == ref
+
+
+def test_add_1():
+    app.add((45, 180))
+    assert len(app) == 1
+    assert app.nearest(45, 180) == (45, 180)
+
+
+def test_add_2():
+    random.seed(1)
+    points = [(random.uniform(0, 90), random.uniform(0, 360)) for _ in range(300)]
+    for point in points:
+        app.add(point)
+    assert len(app) == 300
+    for _ in range(50):
+        search = (random.uniform(0, 90), random.uniform(0, 360))
+        ref = min(points, key=lambda x: angle(x, search))
+        assert app.nearest(*search) == ref
+
+
+def test_add_3():
+    for i in range(200):
+        app.add((i * 0.4, 10))
+    assert len(app) == 200
+    assert app.nearest(40, 10) == (40.0, 10)
+
+
+def test_remove_1():
+    assert not app.remove((45, 180))
+
+
+def test_remove_2():
+    app.build([(45, 180), (30, 90)])
+    suc = app.remove((45, 180))
+    assert suc
+    assert len(app) == 1
+    assert app.nearest(45, 180) == (30, 90)
+
+
+def test_remove_3():
+    app.build([(45, 180), (45, 180)])
+    assert app.remove((45, 180))
+    assert app.nearest(45, 180) == (45, 180)
+    assert app.remove((45, 180))
+    assert app.nearest(45, 180) is None
+
+
+def test_remove_4():
+    points = [(i, 10) for i in range(50)]
+    app.build(points)
+    for point in points[:40]:
+        assert app.remove(point)
+    assert len(app) == 10
+    assert app.numberDeleted < len(app)
+    assert app.nearest(0, 10) == (40, 10)
+
+
+def test_clear_1():
+    app.build([(45, 180), (30, 90)])
+    app.clear()
+    assert len(app) == 0
+    assert app.nearest(45, 180) is None
+
+
+def test_inRadius_1():
+    assert app.inRadius(45, 180, 10) == []
+
+
+def test_inRadius_2():
+    app.build([(45, 180), (46, 180), (30, 90)])
+    assert app.inRadius(45, 180, 5) == [(45, 180), (46, 180)]
+
+
+def test_inRadius_3():
+    random.seed(2)
+    points = [(random.uniform(0, 90), random.uniform(0, 360)) for _ in range(300)]
+    app.build(points)
+    search = (45, 180)
+    ref = sorted([x for x in points if angle(x, search) <= 20],
+                 key=lambda x: angle(x, search))
+    assert app.inRadius(*search, 20) == ref
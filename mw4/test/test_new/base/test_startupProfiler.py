@@ -0,0 +1,200 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import os
+import sys
+import json
+import importlib
+import pytest
+
+# external packages
+
+# local import
+from mw4.base.startupProfiler import StartupProfiler
+from mw4.base.startupProfiler import ImportTimer
+from mw4.base.startupProfiler import parseArguments
+
+
+@pytest.fixture(autouse=True, scope='function')
+def module_setup_teardown():
+    global app, pathDir
+    pathDir = 'mw4/test/temp'
+    app = StartupProfiler(enabled=True)
+    yield
+    app.stop()
+    for name in [app.REPORT, app.BASELINE]:
+        if os.path.isfile(os.path.join(pathDir, name)):
+            os.remove(os.path.join(pathDir, name))
+    del app
+
+
+def test_parseArguments_1():
+    options = parseArguments([])
+    assert not options.profileStartup
+    assert not options.profileBaseline
+
+
+def test_parseArguments_2():
+    options = parseArguments(['--profile-startup', '-platform', 'offscreen'])
+    assert options.profileStartup
+    assert not options.profileBaseline
+
+
+def test_importTimer_1():
+    timer = ImportTimer()
+    timer.install()
+    timer.install()
+    assert sys.meta_path.count(timer) == 1
+    timer.uninstall()
+    assert timer not in sys.meta_path
+
+
+def test_importTimer_2():
+    sys.modules.pop('colorsys', None)
+    timer = ImportTimer()
+    timer.install()
+    try:
+        module = importlib.import_module('colorsys')
+    finally:
+        timer.uninstall()
+    assert 'colorsys' in timer.times
+    assert module.rgb_to_hsv(0, 0, 0) == (0, 0, 0)
+    assert not timer.stack
+
+
+def test_importTimer_3():
+    timer = ImportTimer()
+    timer.enter('a')
+    timer.enter('b')
+    assert timer.leave('b')
+    assert timer.leave('a')
+    assert not timer.leave('a')
+    assert timer.times['a']['cumulative'] >= timer.times['b']['cumulative']
+    assert timer.times['a']['self'] >= 0
+    top = timer.top(1)
+    assert len(top) == 1
+
+
+def test_start_1():
+    app.enabled = False
+    assert not app.start()
+    assert not app.stop()
+
+
+def test_start_2():
+    assert app.start()
+    assert app.imports in sys.meta_path
+    assert app.stop()
+    assert app.imports not in sys.meta_path
+    assert app.duration > 0
+
+
+def test_phase_1():
+    app.enabled = False
+    with app.phase('test'):
+        pass
+    assert not app.phases
+
+
+def test_phase_2():
+    with app.phase('test'):
+        pass
+    assert app.phases[0][0] == 'test'
+
+
+def test_phase_3():
+    with pytest.raises(ValueError):
+        with app.phase('test'):
+            raise ValueError
+    assert app.phases[0][0] == 'test'
+
+
+def test_addMarks_1():
+    app.enabled = False
+    assert not app.addMarks([('a', 1)])
+
+
+def test_addMarks_2():
+    assert app.addMarks([('a', 1), ('b', 3)], prefix='x: ')
+    assert app.phases == [('x: a', 1), ('x: b', 2)]
+
+
+def test_topFunctions_1():
+    assert app.topFunctions() == []
+
+
+def test_topFunctions_2():
+    app.start()
+    sorted(range(1000))
+    app.stop()
+    functions = app.topFunctions()
+    assert functions
+    assert 'cumulative' in functions[0]
+
+
+def test_compareBaseline_1():
+    report = {'total': 1.0, 'phases': {'a': 0.5, 'b': 2.0, 'c': 1}}
+    baseline = {'total': 1.0, 'phases': {'a': 0.4, 'b': 1.0}}
+    regressions = app.compareBaseline(report, baseline)
+    assert len(regressions) == 1
+    assert regressions[0]['phase'] == 'b'
+
+
+def test_writeReport_1():
+    app.enabled = False
+    assert app.writeReport(pathDir=pathDir) is None
+
+
+def test_writeReport_2():
+    app.start()
+    with app.phase('test'):
+        pass
+    app.stop()
+    report = app.writeReport(pathDir=pathDir)
+    assert report['regressions'] == []
+    assert os.path.isfile(os.path.join(pathDir, app.REPORT))
+    assert os.path.isfile(os.path.join(pathDir, app.BASELINE))
+
+
+def test_writeReport_3():
+    baseline = {'total': 0, 'phases': {'test': 0}}
+    with open(os.path.join(pathDir, app.BASELINE), 'w') as outFile:
+        json.dump(baseline, outFile)
+    app.phases = [('test', 1)]
+    report = app.writeReport(pathDir=pathDir)
+    assert report['regressions'][0]['phase'] == 'test'
+    with open(os.path.join(pathDir, app.BASELINE), 'r') as inFile:
+        assert json.load(inFile) == baseline
+
+
+def test_writeReport_4():
+    with open(os.path.join(pathDir, app.BASELINE), 'w') as outFile:
+        json.dump({'total': 0, 'phases': {'test': 0}}, outFile)
+    app.updateBaseline = True
+    app.phases = [('test', 1)]
+    report = app.writeReport(pathDir=pathDir)
+    assert report['regressions'] == []
+    with open(os.path.join(pathDir, app.BASELINE), 'r') as inFile:
+        assert json.load(inFile)['phases'] == {'test': 1}
+
+
+def test_writeReport_5():
+    report = app.writeReport(pathDir='mw4/test/notExisting')
+    assert report is None
@@ -0,0 +1,148 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import pytest
+
+# external packages
+import numpy as np
+
+# local import
+from mw4.base.streamFilter import RunningMean
+from mw4.base.streamFilter import ExponentialMean
+from mw4.base.streamFilter import MedianFilter
+from mw4.base.streamFilter import OutlierFilter
+from mw4.base.streamFilter import FilterChain
+
+
+def test_runningMean_1():
+    mean = RunningMean(size=4)
+    assert mean.value is None
+    assert mean.add(10) == 10
+    assert mean.add(14) == 11
+
+
+def test_runningMean_2():
+    mean = RunningMean(size=10)
+    values = np.random.default_rng(1).normal(10, 1, 95)
+    for value in values:
+        result = mean.add(value)
+    assert result == pytest.approx(np.mean(values[-10:]))
+
+
+def test_runningMean_3():
+    mean = RunningMean(size=4)
+    mean.add(10)
+    suc = mean.reset()
+    assert suc
+    assert mean.value is None
+    assert mean.add(2) == 2
+
+
+def test_exponentialMean_1():
+    mean = ExponentialMean(alpha=0.5)
+    assert mean.value is None
+    assert mean.add(10) == 10
+    assert mean.add(20) == 15
+    assert mean.add(15) == 15
+
+
+def test_exponentialMean_2():
+    mean = ExponentialMean(alpha=0.5)
+    mean.add(10)
+    suc = mean.reset()
+    assert suc
+    assert mean.value is None
+
+
+def test_medianFilter_1():
+    median = MedianFilter(size=3)
+    assert median.value is None
+    assert median.add(5) == 5
+    assert median.add(1) == 3
+    assert median.add(9) == 5
+    assert median.add(7) == 7
+    assert len(median) == 3
+
+
+def test_medianFilter_2():
+    median = MedianFilter(size=5)
+    values = np.random.default_rng(2).integers(0, 100, 50)
+    for i, value in enumerate(values):
+        result = median.add(value)
+        assert result == np.median(values[max(0, i - 4):i + 1])
+
+
+def test_medianFilter_3():
+    median = MedianFilter(size=3)
+    median.add(5)
+    suc = median.reset()
+    assert suc
+    assert median.value is None
+
+
+def test_outlierFilter_1():
+    outlier = OutlierFilter(minDeviation=0.5)
+    assert outlier.add(10) == 10
+    assert outlier.add(50) == 50
+
+
+def test_outlierFilter_2():
+    outlier = OutlierFilter(minDeviation=0.5)
+    for value in [10, 10.1, 9.9, 10]:
+        assert outlier.add(value) == value
+    assert outlier.add(50) is None
+    assert outlier.value == 10
+    assert outlier.add(10.5) == 10.5
+
+
+def test_outlierFilter_3():
+    outlier = OutlierFilter(minDeviation=0.5, maxReject=3)
+    for value in [10, 10, 10]:
+        outlier.add(value)
+    assert outlier.add(20) is None
+    assert outlier.add(20) is None
+    assert outlier.add(20) == 20
+    assert outlier.add(20) == 20
+
+
+def test_outlierFilter_4():
+    outlier = OutlierFilter()
+    outlier.add(10)
+    suc = outlier.reset()
+    assert suc
+    assert outlier.value is None
+
+
+def test_filterChain_1():
+    chain = FilterChain(OutlierFilter(minDeviation=0.5), RunningMean(size=4))
+    assert chain.value is None
+    for value in [10, 10, 10, 10]:
+        assert chain.add(value) == 10
+    assert chain.add(50) is None
+    assert chain.value == 10
+    assert chain.add(12) == 10.5
+
+
+def test_filterChain_2():
+    chain = FilterChain(OutlierFilter(), RunningMean(size=4))
+    chain.add(10)
+    suc = chain.reset()
+    assert suc
+    assert chain.value is None
@@ -0,0 +1,128 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import threading
+import pytest
+
+# external packages
+
+# local import
+from mw4.base.taskExecutor import TaskExecutor
+from mw4.base.tpool import Worker
+from mw4.base.tpool import CancelToken
+
+
+@pytest.fixture(autouse=True, scope='function')
+def module_setup_teardown():
+    global app
+    app = TaskExecutor(lanes={'control': 1, 'io': 2})
+    yield
+    app.cancelAll()
+    app.waitForDone(3000)
+    del app
+
+
+def test_start_1():
+    worker = Worker(lambda: 1)
+    suc = app.start(worker, lane='compute')
+    assert not suc
+
+
+def test_start_2():
+    event = threading.Event()
+    worker = Worker(event.set)
+    suc = app.start(worker, lane='io')
+    assert suc
+    assert event.wait(3)
+    app.waitForDone(3000)
+    metrics = app.metrics()
+    assert metrics['io']['finished'] == 1
+    assert metrics['io']['queued'] == 0
+    assert metrics['io']['running'] == 0
+
+
+def test_start_3():
+    event = threading.Event()
+    worker = Worker(event.wait, 3)
+    assert app.start(worker, lane='control', key='poll')
+    assert app.isActive('poll')
+    assert not app.start(Worker(lambda: 1), lane='control', key='poll')
+    assert app.metrics()['control']['rejected'] == 1
+    event.set()
+    app.waitForDone(3000)
+    assert not app.isActive('poll')
+    assert app.start(Worker(lambda: 1), lane='control', key='poll')
+
+
+def test_start_4():
+    event = threading.Event()
+    order = list()
+    assert app.start(Worker(event.wait, 3), lane='control')
+    assert app.start(Worker(order.append, 'low'), lane='control', priority=0)
+    assert app.start(Worker(order.append, 'high'), lane='control', priority=10)
+    assert app.metrics()['control']['maxQueued'] >= 2
+    event.set()
+    app.waitForDone(3000)
+    assert order == ['high', 'low']
+
+
+def test_cancel_1():
+    assert not app.cancel('test')
+
+
+def test_cancel_2():
+    event = threading.Event()
+    result = list()
+    assert app.start(Worker(event.wait, 3), lane='control')
+    worker = Worker(result.append, 1)
+    assert app.start(worker, lane='control', key='test')
+    assert app.cancel('test')
+    event.set()
+    app.waitForDone(3000)
+    assert not result
+    assert not app.isActive('test')
+
+
+def test_cancel_3():
+    started = threading.Event()
+
+    def testFunc(token=None):
+        started.set()
+        while True:
+            token.check()
+            token.event.wait(0.01)
+
+    worker = Worker(testFunc, token=CancelToken())
+    assert app.start(worker, lane='io', key='test')
+    assert started.wait(3)
+    assert app.cancelAll()
+    assert app.waitForDone(3000)
+    assert not app.isActive('test')
+
+
+def test_activeThreadCount_1():
+    assert app.activeThreadCount() == 0
+
+
+def test_metrics_1():
+    metrics = app.metrics()
+    assert metrics['control']['limit'] == 1
+    assert metrics['io']['limit'] == 2
+    assert 'compute' not in metrics
@@ -82,3 +82,38 @@ def test_Worker_5(qtbot):
 
     with qtbot.waitSignal(a.signals.error):
         a.run()
+
+
+def test_Worker_6(qtbot):
+    def testFunc():
+        return 'test'
+    a = tpool.Worker(testFunc)
+    a.cancel()
+
+    with qtbot.waitSignal(a.signals.cancelled):
+        with qtbot.assertNotEmitted(a.signals.result):
+            a.run()
+
+
+def test_Worker_7(qtbot):
+    def testFunc(token=None):
+        token.cancel()
+        token.check()
+        return 'test'
+    token = tpool.CancelToken()
+    a = tpool.Worker(testFunc, token=token)
+    assert a.token is token
+
+    with qtbot.waitSignal(a.signals.cancelled):
+        with qtbot.assertNotEmitted(a.signals.error):
+            a.run()
+
+
+def test_CancelToken_1():
+    a = tpool.CancelToken()
+    assert not a.cancelled
+    a.check()
+    assert a.cancel()
+    assert a.cancelled
+    with pytest.raises(tpool.TaskCancelled):
+        a.check()
@@ -0,0 +1,88 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import os
+import pytest
+
+# external packages
+
+# local import
+from mw4.base.traceRecorder import TraceRecorder
+from mw4.base.traceRecorder import loadTrace
+from mw4.base.traceAnalyzer import analyzeTrace
+from mw4.base.traceAnalyzer import formatReport
+from mw4.base.traceAnalyzer import main
+
+
+@pytest.fixture(autouse=True, scope='function')
+def module_setup_teardown():
+    global recorder, filePath
+    filePath = 'mw4/test/temp/trace.bin'
+    recorder = TraceRecorder(size=100)
+    for i in range(10):
+        recorder.record('telescope', 'ra', kind='get', latency=0.001 * (i + 1),
+                        size=100, status=200)
+    recorder.record('telescope', 'ra', kind='get', latency=5, status=-1)
+    recorder.record('dome', 'azimuth')
+    recorder.dump(filePath=filePath)
+    yield
+    if os.path.isfile(filePath):
+        os.remove(filePath)
+    del recorder
+
+
+def test_analyzeTrace_1():
+    trace = loadTrace(filePath)
+    trace['records'] = trace['records'][:0]
+    report = analyzeTrace(trace)
+    assert report == {}
+
+
+def test_analyzeTrace_2():
+    report = analyzeTrace(loadTrace(filePath))
+    stats = report['telescope']
+    assert stats['events'] == 11
+    assert stats['errors'] == 1
+    assert stats['bytes'] == 1000
+    assert stats['kinds'] == {'get': 11}
+    assert sum(stats['histogram']) == 11
+    assert stats['histogram'][-1] == 1
+    assert stats['max'] == pytest.approx(5)
+    assert stats['p50'] == pytest.approx(0.006)
+    assert 'p50' not in report['dome']
+    assert report['dome']['kinds'] == {'event': 1}
+
+
+def test_formatReport_1():
+    text = formatReport(analyzeTrace(loadTrace(filePath)))
+    assert 'telescope: 11 events, 1 errors' in text
+    assert 'dome: 1 events' in text
+    assert '>5000ms' in text
+
+
+def test_main_1(capsys):
+    ret = main([filePath])
+    assert ret == 0
+    assert 'telescope' in capsys.readouterr().out
+
+
+def test_main_2():
+    ret = main(['mw4/test/temp/notExist.bin'])
+    assert ret == 1
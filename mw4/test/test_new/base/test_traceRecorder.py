@@ -0,0 +1,191 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import os
+import signal
+import threading
+import pytest
+from unittest import mock
+
+# external packages
+
+# local import
+from mw4.base.traceRecorder import TraceRecorder
+from mw4.base.traceRecorder import loadTrace
+
+
+@pytest.fixture(autouse=True, scope='function')
+def module_setup_teardown():
+    global app, pathDir
+    pathDir = 'mw4/test/temp'
+    app = TraceRecorder(size=4, pathDir=pathDir)
+    yield
+    if app.pipeWrite is not None:
+        os.close(app.pipeWrite)
+    for name in os.listdir(pathDir):
+        if name.startswith('trace'):
+            os.remove(os.path.join(pathDir, name))
+    del app
+
+
+def test_record_1():
+    suc = app.record('telescope', 'ra', kind='get', latency=0.01, size=10, status=200)
+    assert suc
+    records, devices, properties = app.snapshot()
+    assert len(records) == 1
+    assert devices == ['telescope']
+    assert properties == ['ra']
+    assert records['kind'][0] == 0
+    assert records['size'][0] == 10
+    assert records['status'][0] == 200
+
+
+def test_record_2():
+    app.enabled = False
+    suc = app.record('telescope', 'ra')
+    assert not suc
+    assert app.count == 0
+
+
+def test_record_3():
+    for i in range(6):
+        app.record('telescope', f'prop{i}', size=i)
+    records, devices, properties = app.snapshot()
+    assert len(records) == 4
+    assert list(records['size']) == [2, 3, 4, 5]
+    assert properties[records['property'][0]] == 'prop2'
+
+
+def test_nameIndex_1():
+    app.MAX_NAMES = 2
+    assert app.nameIndex('device', 'a') == 0
+    assert app.nameIndex('device', 'b') == 1
+    assert app.nameIndex('device', 'c') == 1
+    assert app.nameIndex('device', 'a') == 0
+
+
+def test_nameIndex_2():
+    app.MAX_NAMES = 2
+    app.record('telescope', 'ra')
+    app.record('dome', 'azimuth')
+    records, devices, properties = app.snapshot()
+    assert devices == ['telescope', app.OVERFLOW]
+    assert devices[records['device'][1]] == app.OVERFLOW
+
+
+def test_dump_1():
+    app.record('telescope', 'ra', kind='put', latency=0.5, size=10)
+    app.record('dome', 'azimuth', kind='event')
+    filePath = app.dump(filePath=pathDir + '/trace.bin', reason='test')
+    assert filePath == pathDir + '/trace.bin'
+
+    trace = loadTrace(filePath)
+    assert trace['reason'] == 'test'
+    assert trace['devices'] == ['telescope', 'dome']
+    assert len(trace['records']) == 2
+    assert trace['records']['latency'][0] == pytest.approx(0.5)
+    assert trace['kinds'][trace['records']['kind'][0]] == 'put'
+
+
+def test_dump_2():
+    filePath = app.dump()
+    assert os.path.dirname(filePath) == pathDir
+    assert os.path.basename(filePath).startswith('trace-')
+    assert len(loadTrace(filePath)['records']) == 0
+
+
+def test_dump_3():
+    filePath = app.dump(filePath=pathDir + '/notExist/trace.bin')
+    assert filePath is None
+
+
+def test_dumpOnError_1():
+    app.pathDir = ''
+    filePath = app.dumpOnError(reason='test')
+    assert filePath is None
+
+
+def test_dumpOnError_2():
+    assert app.dumpOnError(reason='test')
+    assert app.dumpOnError(reason='test') is None
+    assert app.numberDumps == 1
+
+
+def test_dumpOnError_3():
+    app.MIN_DUMP_INTERVAL = 0
+    app.MAX_ERROR_DUMPS = 1
+    assert app.dumpOnError(reason='test')
+    assert app.dumpOnError(reason='test') is None
+
+
+def test_enableSignalDump_1():
+    with mock.patch.object(signal,
+                           'signal'):
+        suc = app.enableSignalDump()
+        assert suc == hasattr(signal, 'SIGUSR1')
+
+
+def test_signalDump_1():
+    suc = app.signalDump(signal.SIGINT, None)
+    assert not suc
+
+
+def test_signalDump_2():
+    if not hasattr(signal, 'SIGUSR1'):
+        return
+    app.record('telescope', 'ra')
+    with mock.patch.object(signal,
+                           'signal'):
+        app.enableSignalDump()
+    with mock.patch.object(app,
+                           'dump',
+                           side_effect=lambda reason: event.set()) as dump:
+        event = threading.Event()
+        with app.lock:
+            suc = app.signalDump(signal.SIGUSR1, None)
+            assert suc
+            assert not dump.called
+        assert event.wait(5)
+    dump.assert_called_once_with(reason='signal')
+
+
+def test_signalDumpWorker_1():
+    app.pipeRead, app.pipeWrite = os.pipe()
+    os.close(app.pipeWrite)
+    app.pipeWrite = None
+    suc = app.signalDumpWorker()
+    assert suc
+    os.close(app.pipeRead)
+
+
+def test_clear_1():
+    app.record('telescope', 'ra')
+    suc = app.clear()
+    assert suc
+    records, devices, properties = app.snapshot()
+    assert len(records) == 0
+    assert devices == []
+
+
+def test_loadTrace_1():
+    with open(pathDir + '/trace.bin', 'wb') as outFile:
+        outFile.write(b'test')
+    with pytest.raises(ValueError):
+        loadTrace(pathDir + '/trace.bin')
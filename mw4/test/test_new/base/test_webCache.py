@@ -0,0 +1,260 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import os
+import json
+import shutil
+import threading
+import http.server
+import unittest.mock as mock
+import pytest
+
+# external packages
+import PyQt5
+
+# local import
+from mw4.base.webCache import WebCache
+from mw4.base.webCache import CachedResponse
+from mw4.base.taskExecutor import TaskExecutor
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    content = b'test'
+    etag = '"1"'
+    status = 200
+    hits = 0
+    requestHeaders = dict()
+
+    def do_GET(self):
+        StubHandler.hits += 1
+        StubHandler.requestHeaders = dict(self.headers)
+        if self.status != 200:
+            self.send_response(self.status)
+            self.end_headers()
+            return
+        if self.headers.get('If-None-Match') == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('ETag', self.etag)
+        self.send_header('Last-Modified', 'Wed, 21 Oct 2020 07:28:00 GMT')
+        self.send_header('Content-Length', str(len(self.content)))
+        self.end_headers()
+        self.wfile.write(self.content)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(autouse=True, scope='function')
+def module_setup_teardown():
+    class Test:
+        threadPool = PyQt5.QtCore.QThreadPool()
+        executor = TaskExecutor()
+
+    global app, pathDir, server, url
+    pathDir = 'mw4/test/temp/webcache'
+    if os.path.isdir(pathDir):
+        shutil.rmtree(pathDir)
+
+    StubHandler.content = b'test'
+    StubHandler.etag = '"1"'
+    StubHandler.status = 200
+    StubHandler.hits = 0
+    StubHandler.requestHeaders = dict()
+    server = http.server.HTTPServer(('localhost', 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f'http://localhost:{server.server_port}/data.txt'
+
+    app = WebCache(app=Test(), pathDir=pathDir)
+    yield
+    app.executor.waitForDone(3000)
+    server.shutdown()
+    server.server_close()
+    shutil.rmtree(pathDir)
+    del app
+
+
+def ageEntry(seconds):
+    with open(app.entryPath(url) + '.json', 'r') as metaFile:
+        meta = json.load(metaFile)
+    meta['fetched'] -= seconds
+    with open(app.entryPath(url) + '.json', 'w') as metaFile:
+        json.dump(meta, metaFile)
+
+
+def test_cachedResponse_1():
+    response = CachedResponse(content=b'{"a": 1}')
+    assert response.status_code == 200
+    assert response.text == '{"a": 1}'
+    assert response.json() == {'a': 1}
+
+
+def test_get_1():
+    assert app.get() is None
+
+
+def test_get_2():
+    response = app.get(url=url)
+    assert response.status_code == 200
+    assert response.content == b'test'
+    assert StubHandler.hits == 1
+    assert os.path.isfile(app.entryPath(url) + '.data')
+    assert os.path.isfile(app.entryPath(url) + '.json')
+
+
+def test_get_3():
+    app.get(url=url, source='weather')
+    response = app.get(url=url, source='weather')
+    assert isinstance(response, CachedResponse)
+    assert not response.stale
+    assert response.content == b'test'
+    assert StubHandler.hits == 1
+
+
+def test_get_4():
+    app.get(url=url, source='weather')
+    ageEntry(10000)
+    response = app.get(url=url, source='weather')
+    assert isinstance(response, CachedResponse)
+    assert response.content == b'test'
+    assert StubHandler.hits == 2
+    assert StubHandler.requestHeaders['If-None-Match'] == '"1"'
+    assert 'If-Modified-Since' in StubHandler.requestHeaders
+
+    response = app.get(url=url, source='weather')
+    assert isinstance(response, CachedResponse)
+    assert StubHandler.hits == 2
+
+
+def test_get_5():
+    app.get(url=url, source='weather')
+    ageEntry(10000)
+    StubHandler.content = b'new'
+    StubHandler.etag = '"2"'
+    response = app.get(url=url, source='weather')
+    assert response.status_code == 200
+    assert response.content == b'new'
+    response = app.get(url=url, source='weather')
+    assert response.content == b'new'
+    assert StubHandler.hits == 2
+
+
+def test_get_6():
+    app.get(url=url, source='weather')
+    ageEntry(700)
+    StubHandler.content = b'new'
+    StubHandler.etag = '"2"'
+    response = app.get(url=url, source='weather')
+    assert response.stale
+    assert response.content == b'test'
+    app.executor.waitForDone(3000)
+    assert StubHandler.hits == 2
+    assert not app.executor.isActive(f'webCache:{app.entryKey(url)}')
+    response = app.get(url=url, source='weather')
+    assert not response.stale
+    assert response.content == b'new'
+
+
+def test_get_7():
+    app.get(url=url)
+    ageEntry(10000)
+    StubHandler.status = 500
+    response = app.get(url=url)
+    assert response.stale
+    assert response.content == b'test'
+
+
+def test_get_8():
+    app.get(url=url)
+    ageEntry(10000)
+    server.shutdown()
+    server.server_close()
+    response = app.get(url=url)
+    assert response.stale
+    assert response.content == b'test'
+
+
+def test_get_9():
+    StubHandler.status = 404
+    response = app.get(url=url)
+    assert response is None
+    assert not os.path.isfile(app.entryPath(url) + '.json')
+
+
+def test_loadEntry_1():
+    meta, content = app.loadEntry(url)
+    assert meta is None
+    assert content is None
+
+
+def test_loadEntry_2():
+    app.get(url=url)
+    with open(app.entryPath(url) + '.json', 'w') as metaFile:
+        json.dump({'key': 'other'}, metaFile)
+    meta, content = app.loadEntry(url)
+    assert meta is None
+
+
+def test_publicUrl_1():
+    value = app.publicUrl('http://user:pw@host/a?lat=1&APPID=secret&lon=2')
+    assert value == 'http://host/a?lat=1&lon=2'
+
+
+def test_hideSecrets_1():
+    value = app.hideSecrets('error in /a?APPID=secret&lon=2',
+                            'http://user:pw@host/a?APPID=secret&lon=2')
+    assert value == 'error in /a?APPID=***&lon=2'
+
+
+def test_entryKey_1():
+    assert app.entryKey(url + '?APPID=1') == app.entryKey(url + '?APPID=2')
+    assert app.entryKey(url + '?lat=1') != app.entryKey(url + '?lat=2')
+
+
+def test_storeEntry_1():
+    app.get(url=url + '?lat=1&APPID=secret')
+    for name in os.listdir(pathDir):
+        with open(os.path.join(pathDir, name), 'rb') as file:
+            assert b'secret' not in file.read()
+    meta, content = app.loadEntry(url + '?lat=1&APPID=other')
+    assert content == b'test'
+
+
+def test_revalidate_1():
+    event = threading.Event()
+    with mock.patch.object(app,
+                           'fetch',
+                           side_effect=lambda *args, **kwargs: event.wait(5)):
+        suc = app.revalidate(url, {}, b'')
+        assert suc
+        suc = app.revalidate(url + '?APPID=other', {}, b'')
+        assert not suc
+        event.set()
+        app.executor.waitForDone(3000)
+
+
+def test_clear_1():
+    app.get(url=url)
+    suc = app.clear()
+    assert suc
+    assert not os.listdir(pathDir)
@@ -0,0 +1,120 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import pytest
+
+# external packages
+
+# local import
+from mw4.environment.forecastSeries import ForecastSeries
+
+
+@pytest.fixture(autouse=True, scope='function')
+def module_setup_teardown():
+    global app
+    app = ForecastSeries()
+    yield
+    del app
+
+
+def dewPoint(temp, humidity):
+    return temp - 5
+
+
+def entry(dt, temp, press, humidity):
+    return {'dt': dt,
+            'main': {'temp': temp + 273.15,
+                     'grnd_level': press,
+                     'humidity': humidity}}
+
+
+def test_parseEntry_1():
+    timestamp, values = app.parseEntry({'main': {}}, dewPoint)
+    assert timestamp is None
+    assert values is None
+
+
+def test_parseEntry_2():
+    timestamp, values = app.parseEntry(entry(100, 10, 1000, 50), dewPoint)
+    assert timestamp == 100
+    assert values[0] == pytest.approx(10)
+    assert values[1] == 1000
+    assert values[2] == 50
+    assert values[3] == pytest.approx(5)
+
+
+def test_update_1():
+    suc = app.update([], dewPoint)
+    assert not suc
+    assert len(app) == 0
+
+
+def test_update_2():
+    entries = [entry(10800, 12, 1010, 60),
+               entry(0, 10, 1000, 50),
+               {'dt': 5000}]
+    suc = app.update(entries, dewPoint)
+    assert suc
+    assert len(app) == 2
+    assert list(app.time) == [0, 10800]
+    assert app.values['pressure'][0] == 1000
+
+
+def test_clear_1():
+    app.update([entry(0, 10, 1000, 50)], dewPoint)
+    suc = app.clear()
+    assert suc
+    assert len(app) == 0
+
+
+def test_interpolate_1():
+    assert app.interpolate(0) is None
+
+
+def test_interpolate_2():
+    app.update([entry(0, 10, 1000, 50),
+                entry(10800, 13, 1030, 80)], dewPoint)
+    values = app.interpolate(3600)
+    assert values['temperature'] == pytest.approx(11)
+    assert values['pressure'] == pytest.approx(1010)
+    assert values['humidity'] == pytest.approx(60)
+    assert values['dewPoint'] == pytest.approx(6)
+
+
+def test_interpolate_3():
+    app.update([entry(20000, 10, 1000, 50),
+                entry(30800, 13, 1030, 80)], dewPoint)
+    values = app.interpolate(20000 - 3600)
+    assert values['temperature'] == pytest.approx(10)
+    values = app.interpolate(30800 + 3600)
+    assert values['temperature'] == pytest.approx(13)
+
+
+def test_interpolate_4():
+    app.update([entry(20000, 10, 1000, 50),
+                entry(30800, 13, 1030, 80)], dewPoint)
+    assert app.interpolate(20000 - app.MAX_GAP - 1) is None
+    assert app.interpolate(30800 + app.MAX_GAP + 1) is None
+
+
+def test_interpolate_5():
+    app.update([entry(0, 10, 1000, 50)], dewPoint)
+    values = app.interpolate()
+    assert values is None
@@ -32,6 +32,8 @@ from mountcontrol.mount import Mount
 
 # local import
 from mw4.environment.onlineWeather import OnlineWeather
+from mw4.base.webCache import WebCache
+from mw4.base.taskExecutor import TaskExecutor
 
 
 @pytest.fixture(autouse=True, scope='function')
@@ -44,6 +46,8 @@ def module_setup_teardown():
         mount.obsSite.location = Topos(latitude_degrees=20,
                                        longitude_degrees=10,
                                        elevation_m=500)
+        webCache = WebCache(pathDir='mw4/test/temp/webcache')
+        executor = TaskExecutor()
     global app
     app = OnlineWeather(app=Test())
 
@@ -124,6 +128,25 @@ def test_updateOpenWeatherMapDataWorker_3():
     assert suc
 
 
+def test_updateOpenWeatherMapDataWorker_4():
+    entry = {'dt': 1000,
+             'main': {'temp': 290,
+                      'grnd_level': 1000,
+                      'humidity': 50},
+             }
+    data = {'list': [entry, dict(entry, dt=11800)]}
+    suc = app.updateOpenWeatherMapDataWorker(data=data)
+    assert suc
+    assert len(app.forecast) == 2
+
+
+def test_stopCommunication_2():
+    app.forecast.time = [1]
+    suc = app.stopCommunication()
+    assert suc
+    assert len(app.forecast) == 0
+
+
 def test_getOpenWeatherMapDataWorker_1():
     val = app.getOpenWeatherMapDataWorker()
     assert val is None
@@ -170,6 +193,15 @@ def test_getOpenWeatherMapDataWorker_5():
         assert val == 'test'
 
 
+def test_getOpenWeatherMapData_1():
+    with mock.patch.object(app.app.executor,
+                           'start',
+                           return_value=True) as start:
+        suc = app.getOpenWeatherMapData(url='http://localhost')
+        assert suc
+        assert start.call_args[1]['key'] == 'onlineWeather'
+
+
 def test_updateOpenWeatherMapData_1():
     suc = app.updateOpenWeatherMapData()
     assert not suc
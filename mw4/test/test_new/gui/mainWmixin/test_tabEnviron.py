@@ -33,6 +33,7 @@ from mountcontrol.qtmount import Mount
 import requests
 from skyfield.toposlib import Topos
 import numpy as np
+import qimage2ndarray
 
 # local import
 from mw4.gui.mainWmixin.tabEnviron import EnvironGui
@@ -42,6 +43,8 @@ from mw4.environment.sensorWeather import SensorWeather
 from mw4.environment.onlineWeather import OnlineWeather
 from mw4.environment.skymeter import Skymeter
 from mw4.base.loggerMW import CustomLogger
+from mw4.base.webCache import WebCache
+from mw4.base.taskExecutor import TaskExecutor
 
 
 @pytest.fixture(autouse=True, scope='function')
@@ -66,6 +69,9 @@ def module_setup_teardown(qtbot):
         sensorWeather = SensorWeather(app=Test1())
         onlineWeather = OnlineWeather(app=Test1())
         skymeter = Skymeter(app=Test1())
+        webCache = WebCache(pathDir='mw4/test/temp/webcache')
+        planets = None
+        executor = TaskExecutor()
 
     widget = QWidget()
     ui = Ui_MainWindow()
@@ -249,7 +255,7 @@ def test_updateFilterRefractionParameters_5():
 
 def test_updateFilterRefractionParameters_6():
     app.refractionSource = 'sensorWeather'
-    app.filteredTemperature = None
+    app.filterTemperature.reset()
     app.app.sensorWeather.data = {'WEATHER_PARAMETERS.WEATHER_TEMPERATURE': 10,
                                   'WEATHER_PARAMETERS.WEATHER_PRESSURE': 1000}
     suc = app.updateFilterRefractionParameters()
@@ -258,7 +264,7 @@ def test_updateFilterRefractionParameters_6():
 
 def test_updateFilterRefractionParameters_7():
     app.refractionSource = 'sensorWeather'
-    app.filteredPressure = None
+    app.filterPressure.reset()
     app.app.sensorWeather.data = {'WEATHER_PARAMETERS.WEATHER_TEMPERATURE': 10,
                                   'WEATHER_PARAMETERS.WEATHER_PRESSURE': 1000}
     suc = app.updateFilterRefractionParameters()
@@ -267,7 +273,7 @@ def test_updateFilterRefractionParameters_7():
 
 def test_updateFilterRefractionParameters_8():
     app.refractionSource = 'sensorWeather'
-    app.filteredTemperature = np.full(100, 10)
+    app.filterTemperature.add(10)
     app.app.sensorWeather.data = {'WEATHER_PARAMETERS.WEATHER_TEMPERATURE': 10,
                                   'WEATHER_PARAMETERS.WEATHER_PRESSURE': 1000}
     suc = app.updateFilterRefractionParameters()
@@ -276,13 +282,30 @@ def test_updateFilterRefractionParameters_8():
 
 def test_updateFilterRefractionParameters_9():
     app.refractionSource = 'sensorWeather'
-    app.filteredPressure = np.full(100, 1000)
+    app.filterPressure.add(1000)
     app.app.sensorWeather.data = {'WEATHER_PARAMETERS.WEATHER_TEMPERATURE': 10,
                                   'WEATHER_PARAMETERS.WEATHER_PRESSURE': 1000}
     suc = app.updateFilterRefractionParameters()
     assert suc
 
 
+def test_updateFilterRefractionParameters_10():
+    app.refractionSource = 'onlineWeather'
+    app.filterTemperature.reset()
+    app.filterPressure.reset()
+    app.app.onlineWeather.data = {'temperature': 10,
+                                  'pressure': 1000}
+    values = {'temperature': 12,
+              'pressure': 1010}
+    with mock.patch.object(app.app.onlineWeather.forecast,
+                           'interpolate',
+                           return_value=values):
+        suc = app.updateFilterRefractionParameters()
+        assert suc
+    assert app.filterTemperature.value == 12
+    assert app.filterPressure.value == 1010
+
+
 def test_movingAverageRefractionParameters_1():
     v1, v2 = app.movingAverageRefractionParameters()
     assert v1 is None
@@ -290,8 +313,19 @@ def test_movingAverageRefractionParameters_1():
 
 
 def test_movingAverageRefractionParameters_2():
-    app.filteredTemperature = np.full(100, 10)
-    app.filteredPressure = np.full(100, 1000)
+    app.filterTemperature.add(10)
+    app.filterPressure.add(1000)
+    v1, v2 = app.movingAverageRefractionParameters()
+    assert v1 == 10.0
+    assert v2 == 1000.0
+
+
+def test_movingAverageRefractionParameters_3():
+    app.refractionSource = 'sensorWeather'
+    for temp in [10, 10, 10, 10, 50, 10]:
+        app.app.sensorWeather.data = {'WEATHER_PARAMETERS.WEATHER_TEMPERATURE': temp,
+                                      'WEATHER_PARAMETERS.WEATHER_PRESSURE': 1000}
+        app.updateFilterRefractionParameters()
     v1, v2 = app.movingAverageRefractionParameters()
     assert v1 == 10.0
     assert v2 == 1000.0
@@ -447,28 +481,44 @@ def test_getWebDataRunner_1():
 
 
 def test_getWebDataRunner_2():
-    suc = app.getWebDataWorker(url='http://test')
-    assert not suc
-
-
-def test_getWebDataRunner_3():
-    class Test:
-        status_code = 300
-    with mock.patch.object(requests,
+    with mock.patch.object(app.app.webCache,
                            'get',
-                           return_value=Test()):
+                           return_value=None):
         suc = app.getWebDataWorker(url='http://test')
         assert not suc
 
 
-def test_getWebDataRunner_4():
-    class Test:
-        status_code = 200
-    with mock.patch.object(requests,
+def test_getWebDataRunner_3():
+    with mock.patch.object(app.app.webCache,
                            'get',
-                           return_value=Test()):
+                           return_value='test') as get:
         suc = app.getWebDataWorker(url='http://test')
-        assert suc
+        assert suc == 'test'
+        assert get.call_args[1]['source'] == 'clearOutside'
+
+
+def test_keepLines_1():
+    background = np.array([False, True, True, False, True, True])
+    keep = app.keepLines(background, margin=0)
+    assert list(keep) == [True, False, False, True, True, False]
+
+
+def test_keepLines_2():
+    background = np.array([True, True, True, True])
+    keep = app.keepLines(background, margin=2)
+    assert list(keep) == [True, True, True, False]
+
+
+def test_processClearOutsideImage_2():
+    imgArr = np.full((300, 700, 3), 255, dtype=np.uint8)
+    imgArr[100:110, 50:100] = [200, 200, 200]
+    imgArr[150:160, 300:320] = [0, 128, 255]
+    image = qimage2ndarray.array2qimage(imgArr)
+    pixmap = app.processClearOutsideImage(image=image)
+    result = qimage2ndarray.rgb_view(pixmap.toImage())
+    assert result.shape[0] < 141
+    assert result.shape[1] < 624
+    assert result[0, 0, 0] == int(0.85 * 32)
 
 
 def test_processClearOutsideImage_1():
@@ -511,6 +561,44 @@ def test_updateClearOutsideImage_3():
         assert suc
 
 
+def test_updateClearOutsideImage_4():
+    class Test:
+        content = bytearray(b'test')
+        headers = {'ETag': '"1234"'}
+
+    app.clearOutsideKey = ('"1234"', None)
+    with mock.patch.object(app,
+                           'processClearOutsideImage') as process:
+        suc = app.updateClearOutsideImage(Test())
+        assert suc
+        assert not process.called
+
+
+def test_updateClearOutsideImage_5():
+    pixmapBase = QPixmap()
+
+    class Test:
+        content = bytearray(b'test')
+        headers = {'ETag': '"5678"'}
+
+    app.clearOutsideKey = ('"1234"', None)
+    with mock.patch.object(app,
+                           'processClearOutsideImage',
+                           return_value=pixmapBase) as process:
+        suc = app.updateClearOutsideImage(Test())
+        assert suc
+        assert process.called
+    assert app.clearOutsideKey == ('"5678"', None)
+
+
+def test_getClearOutside_1():
+    with mock.patch.object(app.app.executor,
+                           'start',
+                           return_value=False):
+        suc = app.getClearOutside(url='http://localhost')
+        assert not suc
+
+
 def test_updateClearOutside_1():
     app.ui.isOnline.setChecked(False)
     suc = app.updateClearOutside()
@@ -578,3 +666,9 @@ def test_updateDirectWeatherGui_3():
     app.deviceStat['directWeather'] = True
     suc = app.updateDirectWeatherGui(setting=Test())
     assert suc
+
+
+def test_updateMoonPhase_1():
+    app.app.planets = None
+    suc = app.updateMoonPhase()
+    assert not suc
@@ -34,10 +34,15 @@ from skyfield.api import Angle
 
 # local import
 from mw4.gui.mainWmixin.tabSatellite import Satellite
+from mw4.gui.mainWmixin.tabSatellite import findSatellitePasses
 from mw4.gui.widgets.main_ui import Ui_MainWindow
 from mw4.gui.widget import MWidget
 from mw4.environment.skymeter import Skymeter
 from mw4.base.loggerMW import CustomLogger
+from mw4.base.webCache import WebCache
+from mw4.base.webCache import CachedResponse
+from mw4.base.processPool import ProcessPool
+from mw4.base.taskExecutor import TaskExecutor
 
 
 @pytest.fixture(autouse=True, scope='function')
@@ -62,6 +67,9 @@ def module_setup_teardown(qtbot):
                                        longitude_degrees=10,
                                        elevation_m=500)
         skymeter = Skymeter(app=Test1())
+        webCache = WebCache(pathDir='mw4/test/temp/webcache')
+        processPool = ProcessPool(workers=0)
+        executor = TaskExecutor()
 
     widget = QWidget()
     ui = Ui_MainWindow()
@@ -141,6 +149,28 @@ def test_loadSatelliteSourceWorker_3():
     assert suc
 
 
+def test_loadSatelliteSourceWorker_4():
+    source = 'http://www.celestrak.com/NORAD/elements/visual.txt'
+    with open('mw4/test/data/active.txt', 'rb') as tleFile:
+        content = tleFile.read()
+    response = CachedResponse(url=source, content=content)
+    with mock.patch.object(app.app.webCache,
+                           'get',
+                           return_value=response):
+        suc = app.loadTLEDataFromSourceURLsWorker(source=source, reload=True)
+        assert suc
+    assert app.satellites
+
+
+def test_loadSatelliteSourceWorker_5():
+    source = 'http://www.celestrak.com/NORAD/elements/visual.txt'
+    with mock.patch.object(app.app.webCache,
+                           'get',
+                           return_value=None):
+        suc = app.loadTLEDataFromSourceURLsWorker(source=source, reload=True)
+        assert suc
+
+
 def test_loadTLEDataFromSourceURLs_1():
     suc = app.loadTLEDataFromSourceURLs()
     assert not suc
@@ -148,8 +178,11 @@ def test_loadTLEDataFromSourceURLs_1():
 
 def test_loadTLEDataFromSourceURLs_2():
     app.ui.satelliteSource.addItem('Active')
-    suc = app.loadTLEDataFromSourceURLs()
-    assert suc
+    with mock.patch.object(app.app.executor,
+                           'start') as start:
+        suc = app.loadTLEDataFromSourceURLs()
+        assert suc
+    assert start.call_args[1]['key'] == 'loadTLEData'
 
 
 def test_updateOrbit_1():
@@ -279,50 +312,74 @@ def test_calcTLEParams_2():
 
 
 def test_showRises_1():
+    app.satellite = None
+    suc = app.showRises()
+    assert not suc
+
+
+def test_showRises_2():
     tle = ["NOAA 8",
            "1 13923U 83022A   20076.90417581  .00000005  00000-0  19448-4 0  9998",
            "2 13923  98.6122  63.2579 0016304  96.9736 263.3301 14.28696485924954"]
     app.satellite = EarthSatellite(*tle[1:3], name=tle[0])
-    with mock.patch.object(EarthSatellite,
-                           'find_events',
-                           return_value=(app.app.mount.obsSite.timeJD, [1])):
-        suc = app.showRises()
-        assert suc
-
+    app.satellitesRawTLE = {}
+    suc = app.showRises()
+    assert not suc
 
-def test_showRises_2():
-    t0 = app.app.mount.obsSite.timeJD
-    t1 = app.app.mount.obsSite.ts.tt_jd(app.app.mount.obsSite.timeJD.tt + 0.1)
-    t2 = app.app.mount.obsSite.ts.tt_jd(app.app.mount.obsSite.timeJD.tt + 0.2)
 
+def test_showRises_3():
     tle = ["NOAA 8",
            "1 13923U 83022A   20076.90417581  .00000005  00000-0  19448-4 0  9998",
            "2 13923  98.6122  63.2579 0016304  96.9736 263.3301 14.28696485924954"]
     app.satellite = EarthSatellite(*tle[1:3], name=tle[0])
-    with mock.patch.object(EarthSatellite,
-                           'find_events',
-                           return_value=([t0, t1, t2],
-                                         [0, 2, 1])):
+    app.satellitesRawTLE = {'NOAA 8': {'line0': tle[0],
+                                       'line1': tle[1],
+                                       'line2': tle[2]}}
+    with mock.patch.object(app.app.executor,
+                           'start',
+                           return_value=True) as start:
         suc = app.showRises()
         assert suc
+        assert start.call_args[1]['lane'] == 'compute'
 
 
-def test_showRises_3():
-    t0 = app.app.mount.obsSite.timeJD
-    t1 = app.app.mount.obsSite.ts.tt_jd(app.app.mount.obsSite.timeJD.tt + 0.1)
-    t2 = app.app.mount.obsSite.ts.tt_jd(app.app.mount.obsSite.timeJD.tt + 0.2)
-    t3 = app.app.mount.obsSite.ts.tt_jd(app.app.mount.obsSite.timeJD.tt + 0.3)
+def test_showRisesResult_1():
+    app.satellite = None
+    suc = app.showRisesResult(('NOAA 8', []))
+    assert not suc
 
+
+def test_showRisesResult_2():
+    tt = app.app.mount.obsSite.timeJD.tt
     tle = ["NOAA 8",
            "1 13923U 83022A   20076.90417581  .00000005  00000-0  19448-4 0  9998",
            "2 13923  98.6122  63.2579 0016304  96.9736 263.3301 14.28696485924954"]
     app.satellite = EarthSatellite(*tle[1:3], name=tle[0])
-    with mock.patch.object(EarthSatellite,
-                           'find_events',
-                           return_value=([t0, t1, t2, t3],
-                                         [2, 2, 2, 2])):
-        suc = app.showRises()
-        assert suc
+    suc = app.showRisesResult(('NOAA 8', [(tt, 0), (tt + 0.1, 2), (tt + 0.2, 1)]))
+    assert suc
+    assert app.ui.satTransitStartUTC_2.text() == '-'
+
+
+def test_showRisesResult_3():
+    tt = app.app.mount.obsSite.timeJD.tt
+    tle = ["NOAA 8",
+           "1 13923U 83022A   20076.90417581  .00000005  00000-0  19448-4 0  9998",
+           "2 13923  98.6122  63.2579 0016304  96.9736 263.3301 14.28696485924954"]
+    app.satellite = EarthSatellite(*tle[1:3], name=tle[0])
+    passes = [(tt, 2), (tt + 0.1, 2), (tt + 0.2, 2), (tt + 0.3, 2)]
+    suc = app.showRisesResult(('NOAA 8', passes))
+    assert suc
+
+
+def test_findSatellitePasses_1():
+    tle = ["NOAA 8",
+           "1 13923U 83022A   20076.90417581  .00000005  00000-0  19448-4 0  9998",
+           "2 13923  98.6122  63.2579 0016304  96.9736 263.3301 14.28696485924954"]
+    name, passes = findSatellitePasses(tle[0], tle[1], tle[2], 'mw4/test/data',
+                                       50, 10, 500, 2458930.5, days=1)
+    assert name == 'NOAA 8'
+    assert passes
+    assert passes[0][1] in [0, 1, 2]
 
 
 def test_signalExtractSatelliteData_1():
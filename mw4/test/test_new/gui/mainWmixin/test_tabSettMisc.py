@@ -42,6 +42,8 @@ from mw4.dome.dome import Dome
 from mw4.imaging.camera import Camera
 from mw4.astrometry.astrometry import Astrometry
 from mw4.environment.onlineWeather import OnlineWeather
+from mw4.base.webCache import WebCache
+from mw4.base.taskExecutor import TaskExecutor
 
 
 @pytest.fixture(autouse=True, scope='function')
@@ -64,6 +66,8 @@ def module_setup_teardown(qtbot):
         camera = Camera(app=Test1())
         astrometry = Astrometry(app=Test1())
         onlineWeather = OnlineWeather(app=Test1())
+        webCache = WebCache(pathDir='mw4/test/temp/webcache')
+        executor = TaskExecutor()
 
     widget = QWidget()
     ui = Ui_MainWindow()
@@ -380,11 +384,12 @@ def test_installVersion_3():
     with mock.patch.object(app,
                            'isVenv',
                            return_value=True):
-        with mock.patch.object(app.threadPool,
+        with mock.patch.object(app.app.executor,
                                'start',
-                               return_value=True):
+                               return_value=True) as start:
             suc = app.installVersion()
             assert suc
+        assert start.call_args[1]['lane'] == 'io'
 
 
 def test_setLoggingLevel1(qtbot):
@@ -0,0 +1,119 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import pytest
+
+# external packages
+from PyQt5.QtCore import QObject
+from PyQt5.QtCore import pyqtSignal
+
+# local import
+from mw4.gui.diagnosticsW import DiagnosticsWindow
+from mw4.base.metrics import registry
+
+
+@pytest.fixture(autouse=True, scope='function')
+def module_setup_teardown():
+    global Test
+
+    class MetricsServer:
+        port = 0
+
+    class Test(QObject):
+        config = {'mainW': {}}
+        update1s = pyqtSignal()
+        message = pyqtSignal(object, object)
+        metricsServer = MetricsServer()
+
+        @staticmethod
+        def dumpTrace():
+            return 'trace.bin'
+
+    registry.counter('mw4_test_total', 'test').inc()
+    yield
+    del Test
+
+
+def test_initConfig_1(qtbot):
+    app = DiagnosticsWindow(app=Test())
+    qtbot.addWidget(app)
+
+    app.app.config['diagnosticsW'] = {'winPosX': 10000, 'winPosY': 10000}
+    suc = app.initConfig()
+    assert suc
+
+
+def test_storeConfig_1(qtbot):
+    app = DiagnosticsWindow(app=Test())
+    qtbot.addWidget(app)
+
+    del app.app.config['diagnosticsW']
+    app.ui.filterText.setText('test')
+    suc = app.storeConfig()
+    assert suc
+    assert app.app.config['diagnosticsW']['filterText'] == 'test'
+
+
+def test_closeEvent_1(qtbot):
+    app = DiagnosticsWindow(app=Test())
+    qtbot.addWidget(app)
+
+    app.close()
+
+
+def test_updateMetrics_1(qtbot):
+    app = DiagnosticsWindow(app=Test())
+    qtbot.addWidget(app)
+
+    app.ui.filterText.setText('mw4_test')
+    number = app.updateMetrics()
+    assert number == 1
+    assert app.ui.metrics.item(0, 0).text() == 'mw4_test_total'
+    assert app.ui.metricsUrl.text() == 'metrics server not running'
+
+
+def test_updateMetrics_2(qtbot):
+    app = DiagnosticsWindow(app=Test())
+    qtbot.addWidget(app)
+
+    app.app.metricsServer.port = 9464
+    app.ui.filterText.setText('notExisting')
+    number = app.updateMetrics()
+    assert number == 0
+    assert app.ui.metricsUrl.text() == 'http://localhost:9464/metrics'
+
+
+def test_dumpTrace_1(qtbot):
+    app = DiagnosticsWindow(app=Test())
+    qtbot.addWidget(app)
+
+    with qtbot.waitSignal(app.app.message):
+        suc = app.dumpTrace()
+    assert suc
+
+
+def test_dumpTrace_2(qtbot):
+    app = DiagnosticsWindow(app=Test())
+    qtbot.addWidget(app)
+
+    app.app.dumpTrace = lambda: None
+    with qtbot.waitSignal(app.app.message):
+        suc = app.dumpTrace()
+    assert not suc
@@ -0,0 +1,168 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import pytest
+
+# external packages
+import numpy as np
+from astropy.io import fits
+
+# local import
+from mw4.imaging.stackEngine import StackEngine
+
+
+@pytest.fixture(autouse=True, scope='function')
+def module_setup_teardown():
+    global app
+    app = StackEngine()
+    yield
+    del app
+
+
+def starField(shiftX=0, shiftY=0, sizeX=400, sizeY=300):
+    rng = np.random.default_rng(1)
+    posX = rng.uniform(20, sizeX - 20, 80)
+    posY = rng.uniform(20, sizeY - 20, 80)
+    yy, xx = np.mgrid[0:sizeY, 0:sizeX]
+    image = np.full((sizeY, sizeX), 100, dtype=np.float32)
+    for x, y in zip(posX, posY):
+        image += 1000 * np.exp(-((xx - x - shiftX) ** 2 + (yy - y - shiftY) ** 2) / 4)
+    return image
+
+
+def wcsHeader(crpix1=200, crpix2=150, angle=0):
+    header = fits.PrimaryHDU().header
+    header['NAXIS'] = 2
+    header['NAXIS1'] = 400
+    header['NAXIS2'] = 300
+    header['CTYPE1'] = 'RA---TAN'
+    header['CTYPE2'] = 'DEC--TAN'
+    header['CRVAL1'] = 180
+    header['CRVAL2'] = 45
+    header['CRPIX1'] = crpix1
+    header['CRPIX2'] = crpix2
+    scale = 1 / 3600
+    header['CD1_1'] = scale * np.cos(np.radians(angle))
+    header['CD1_2'] = -scale * np.sin(np.radians(angle))
+    header['CD2_1'] = scale * np.sin(np.radians(angle))
+    header['CD2_2'] = scale * np.cos(np.radians(angle))
+    return header
+
+
+def test_reset_1():
+    app.add(np.ones((10, 10)))
+    suc = app.reset()
+    assert suc
+    assert app.number == 0
+    assert app.mean is None
+    assert app.variance is None
+
+
+def test_add_1():
+    assert app.add() is None
+    assert app.number == 0
+
+
+def test_add_2():
+    mean = app.add(np.full((10, 10), 5, dtype=np.uint16))
+    assert mean.dtype == np.float32
+    assert mean[0, 0] == 5
+    assert app.number == 1
+
+
+def test_add_3():
+    app.add(np.full((10, 10, 3), 5))
+    mean = app.add(np.full((10, 10, 3), 3))
+    assert mean[0, 0, 0] == 4
+    assert app.variance[0, 0, 0] == 2
+    assert app.number == 2
+
+
+def test_add_4():
+    app.add(np.full((10, 10, 3), 5))
+    mean = app.add(np.full((20, 10, 3), 3))
+    assert mean[0, 0, 0] == 3
+    assert app.number == 1
+
+
+def test_add_5():
+    values = [10, 12, 11, 9, 10, 11]
+    for value in values:
+        app.add(np.full((4, 4, 3), value))
+    app.add(np.full((4, 4, 3), 1000))
+    assert app.number == 7
+    assert app.numberRejected == 48
+    assert np.allclose(app.mean, np.mean(values))
+    assert np.allclose(app.variance, np.var(values, ddof=1))
+
+
+def test_add_6():
+    app.add(starField())
+    mean = app.add(starField(shiftX=5, shiftY=-3))
+    assert app.number == 2
+    assert np.nanmax(np.abs(mean - starField())[20:-20, 20:-20]) < 100
+
+
+def test_celestialWCS_1():
+    assert app.celestialWCS() is None
+
+
+def test_celestialWCS_2():
+    header = fits.PrimaryHDU().header
+    assert app.celestialWCS(header) is None
+
+
+def test_celestialWCS_3():
+    assert app.celestialWCS(wcsHeader()) is not None
+
+
+def test_measureShift_1():
+    dx, dy = app.measureShift(starField(), starField(shiftX=7.3, shiftY=-3.6))
+    assert abs(dx - 7.3) < 0.5
+    assert abs(dy + 3.6) < 0.5
+
+
+def test_transformShift_1():
+    app.add(starField())
+    matrix = app.transformShift(starField(shiftX=-12.2, shiftY=5.5))
+    assert abs(matrix[0, 2] + 12.2) < 0.5
+    assert abs(matrix[1, 2] - 5.5) < 0.5
+
+
+def test_transformWCS_1():
+    app.add(np.zeros((300, 400)), header=wcsHeader())
+    matrix = app.transformWCS(app.celestialWCS(wcsHeader(crpix1=210, crpix2=140)))
+    assert np.allclose(matrix, [[1, 0, 10], [0, 1, -10]], atol=1e-3)
+
+
+def test_align_1():
+    app.add(starField(), header=wcsHeader())
+    image = starField(shiftX=10, shiftY=-10)
+    aligned = app.align(image, header=wcsHeader(crpix1=210, crpix2=140))
+    assert np.isnan(aligned[-1, -1])
+    assert np.nanmax(np.abs(aligned - starField())[20:-20, 20:-20]) < 1
+
+
+def test_align_2():
+    app.add(np.zeros((300, 400)), header=wcsHeader())
+    image = np.zeros((300, 400), dtype=np.float32)
+    aligned = app.align(image, header=wcsHeader(angle=90))
+    assert np.isnan(aligned[0, 0])
+    assert aligned[150, 200] == 0
@@ -0,0 +1,146 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import unittest.mock as mock
+import pytest
+
+# external packages
+import numpy as np
+
+# local import
+from mw4.imaging.stretchEngine import StretchEngine
+
+
+@pytest.fixture(autouse=True, scope='function')
+def module_setup_teardown():
+    global app
+    app = StretchEngine()
+    yield
+    del app
+
+
+def test_convertImage_1():
+    image = np.array([[1, 2], [3, 4]], dtype=np.uint16)
+    value = app.convertImage(image)
+    assert value is image
+
+
+def test_convertImage_2():
+    image = np.array([[0, 1], [np.nan, 2]], dtype=np.float32)
+    value = app.convertImage(image)
+    assert value.dtype == np.uint16
+    assert value[1, 1] == 65535
+    assert value[1, 0] == 0
+    assert np.isclose(app.toData(65535), 2)
+
+
+def test_convertImage_3():
+    image = np.full((2, 2), np.nan)
+    value = app.convertImage(image)
+    assert value.dtype == np.uint16
+    assert not value.any()
+
+
+def test_convertImage_4():
+    class Pool:
+        @staticmethod
+        def run(fn, *args):
+            return fn(*args)
+
+    image = np.array([[0, 1], [3, 2]], dtype=np.float32)
+    app.processPool = Pool()
+    app.MIN_PROCESS_SIZE = 4
+    with mock.patch.object(Pool,
+                           'run',
+                           wraps=Pool.run) as run:
+        value = app.convertImage(image)
+        assert run.called
+    assert value[1, 0] == 65535
+    assert np.isclose(app.toData(65535), 3)
+
+
+def test_setImage_1():
+    suc = app.setImage()
+    assert not suc
+    assert app.apply() is None
+
+
+def test_setImage_2():
+    image = np.arange(100, dtype=np.uint16).reshape(10, 10)
+    suc = app.setImage(image)
+    assert suc
+    assert app.histogram.sum() == 100
+    assert app.cdf[-1] == 1
+
+
+def test_setImage_3():
+    image = np.arange(40000, dtype=np.uint16).reshape(200, 200)
+    with mock.patch.object(StretchEngine, 'MAX_SAMPLE', 10000):
+        app.setImage(image)
+    assert app.histogram.sum() == 10000
+
+
+def test_limits_1():
+    vmin, vmax = app.limits()
+    assert vmin == 0
+    assert vmax == 65535
+
+
+def test_limits_2():
+    image = np.arange(10000, dtype=np.uint16).reshape(100, 100)
+    app.setImage(image)
+    vmin, vmax = app.limits(values=(50, 99))
+    reference = np.percentile(image, [50, 99])
+    assert abs(vmax - reference[1]) <= 1
+    delta = vmax - 4999
+    assert abs(vmin - (4999 + delta * 0.01)) <= 1
+
+
+def test_lut_1():
+    image = np.arange(10000, dtype=np.uint16).reshape(100, 100)
+    app.setImage(image)
+    lut = app.lut(values=(50, 99), colorMap='gray')
+    assert lut.shape == (65536, 4)
+    assert lut.dtype == np.uint8
+    assert app.lut(values=(50, 99), colorMap='gray') is lut
+
+
+def test_lut_2():
+    image = np.arange(10000, dtype=np.uint16).reshape(100, 100)
+    app.setImage(image)
+    lut = app.lut(values=(50, 99), colorMap='gray')
+    assert tuple(lut[0]) == (0, 0, 0, 255)
+    assert tuple(lut[65535]) == (255, 255, 255, 255)
+
+
+def test_apply_1():
+    image = np.arange(10000, dtype=np.uint16).reshape(100, 100)
+    app.setImage(image)
+    rgba = app.apply(values=(50, 99), colorMap='gray')
+    assert rgba.shape == (100, 100, 4)
+    assert rgba[0, 0, 0] == 0
+    assert rgba[99, 99, 0] == 255
+
+
+def test_apply_2():
+    image = np.arange(10000, dtype=np.uint16).reshape(100, 100)
+    app.setImage(image)
+    rgba = app.apply(values=(50, 99), colorMap='gray', image=image[:10, :20])
+    assert rgba.shape == (10, 20, 4)
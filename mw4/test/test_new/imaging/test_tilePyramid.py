@@ -0,0 +1,138 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import pytest
+
+# external packages
+import numpy as np
+
+# local import
+from mw4.imaging.tilePyramid import TilePyramid
+
+
+@pytest.fixture(autouse=True, scope='function')
+def module_setup_teardown():
+    global app
+    app = TilePyramid()
+    yield
+    del app
+
+
+def test_shape_1():
+    assert app.shape is None
+
+
+def test_downsample_1():
+    image = np.array([[0, 2, 4, 6],
+                      [2, 4, 6, 8],
+                      [9, 9, 1, 1]], dtype=np.uint16)
+    value = app.downsample(image)
+    assert value.dtype == np.uint16
+    assert value.shape == (1, 2)
+    assert value[0, 0] == 2
+    assert value[0, 1] == 6
+
+
+def test_downsample_2():
+    image = np.full((4, 4), 65535, dtype=np.uint16)
+    value = app.downsample(image)
+    assert value[0, 0] == 65535
+
+
+def test_build_1():
+    suc = app.build()
+    assert not suc
+    assert app.view() == (None, None)
+
+
+def test_build_2():
+    suc = app.build(np.zeros((10, 10, 3), dtype=np.uint16))
+    assert not suc
+
+
+def test_build_3():
+    image = np.zeros((800, 1000), dtype=np.uint16)
+    suc = app.build(image)
+    assert suc
+    assert len(app.levels) == 4
+    assert app.levels[0] is image
+    assert app.levels[3].shape == (100, 125)
+
+
+def test_build_4():
+    suc = app.build(np.zeros((3, 3), dtype=np.uint16))
+    assert suc
+    assert len(app.levels) == 2
+
+
+def test_clear_1():
+    app.build(np.zeros((10, 10), dtype=np.uint16))
+    suc = app.clear()
+    assert suc
+    assert not app.levels
+
+
+def test_selectLevel_1():
+    app.build(np.zeros((800, 1000), dtype=np.uint16))
+    assert app.selectLevel((1000, 800)) == 0
+
+
+def test_selectLevel_2():
+    app.build(np.zeros((800, 1000), dtype=np.uint16))
+    assert app.selectLevel((1000, 800), displaySize=(250, 200)) == 2
+    assert app.selectLevel((1000, 800), displaySize=(251, 200)) == 1
+    assert app.selectLevel((1000, 800), displaySize=(10, 10)) == 3
+
+
+def test_view_1():
+    image = np.arange(800 * 1000, dtype=np.uint32).reshape(800, 1000)
+    app.build(image)
+    data, extent = app.view()
+    assert data.shape == (800, 1000)
+    assert np.shares_memory(data, image)
+    assert extent == (-0.5, 999.5, -0.5, 799.5)
+
+
+def test_view_2():
+    app.build(np.zeros((800, 1000), dtype=np.uint16))
+    data, extent = app.view(factor=4)
+    assert data.shape == (200, 250)
+    assert extent == (374.5, 624.5, 299.5, 499.5)
+
+
+def test_view_3():
+    app.build(np.zeros((800, 1000), dtype=np.uint16))
+    data, extent = app.view(factor=4, center=(0, 800))
+    assert data.shape == (200, 250)
+    assert extent == (-0.5, 249.5, 599.5, 799.5)
+
+
+def test_view_4():
+    app.build(np.zeros((800, 1000), dtype=np.uint16))
+    data, extent = app.view(factor=1, displaySize=(250, 200))
+    assert data.shape == (200, 250)
+    assert extent == (-0.5, 999.5, -0.5, 799.5)
+
+
+def test_view_5():
+    app.build(np.zeros((800, 1000), dtype=np.uint16))
+    data, extent = app.view(factor=2, center=(900, 100), displaySize=(250, 200))
+    assert data.shape == (200, 250)
+    assert extent == (499.5, 999.5, -0.5, 399.5)
@@ -201,6 +201,21 @@ def test_checkSize_2():
     assert suc
 
 
+def test_filterValue_1():
+    app.setEmptyData()
+    val = app.filterValue('test', 10)
+    assert val == 10
+
+
+def test_filterValue_2():
+    app.setEmptyData()
+    for value in [20, 20, 20, 20]:
+        val = app.filterValue('skySQR', value)
+        assert val == 20
+    val = app.filterValue('skySQR', 5)
+    assert val == 20
+
+
 def test_getDirectWeather():
     val = app.getDirectWeather()
     assert len(val) == 4
@@ -998,3 +998,51 @@ def test_generateGoldenSpiral_1():
 def test_generateGoldenSpiral_2():
     suc = app.generateGoldenSpiral(200)
     assert suc
+
+
+def test_getIndexBuildP_1():
+    app.buildP = [(10, 10), (20, 20), (30, 30)]
+    index = app.getIndexBuildP(21, 20, radius=3)
+    assert index == 1
+
+
+def test_getIndexBuildP_2():
+    app.buildP = [(10, 10), (20, 20), (30, 30)]
+    index = app.getIndexBuildP(60, 200, radius=3)
+    assert index is None
+
+
+def test_getIndexBuildP_3():
+    app.buildP = [(10, 10), (20, 20), (30, 30)]
+    app.addBuildP((25, 25), position=0)
+    app.delBuildP(2)
+    assert app.getIndexBuildP(25, 25, radius=3) == 0
+    assert app.getIndexBuildP(20, 20, radius=3) is None
+
+
+def test_getIndexBuildP_4():
+    app.buildP = [(10, 10), (20, 20), (30, 200)]
+    app.sort(highlow=True)
+    assert app.getIndexBuildP(20, 20, radius=3) == 0
+    assert app.getIndexBuildP(30, 200, radius=3) == 2
+
+
+def test_getIndexBuildP_5():
+    app.buildP = [(10, 10), (20, 20), (30, 30)]
+    app.clearBuildP()
+    assert app.getIndexBuildP(20, 20, radius=3) is None
+    app.addBuildP((20, 20))
+    assert app.getIndexBuildP(20, 20, radius=3) == 0
+
+
+def test_getIndexHorizonP_1():
+    app.horizonP = [(10, 20), (20, 40)]
+    index = app.getIndexHorizonP(20, 41, radius=3)
+    assert index == 2
+
+
+def test_getIndexHorizonP_2():
+    app.horizonP = [(10, 20), (20, 40)]
+    app.delHorizonP(2)
+    index = app.getIndexHorizonP(20, 41, radius=3)
+    assert index is None
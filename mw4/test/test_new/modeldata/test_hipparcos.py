@@ -19,13 +19,18 @@
 ###########################################################
 # standard libraries
 import pytest
+import unittest.mock as mock
 
 # external packages
+import numpy as np
+import astropy._erfa as erfa
 from skyfield.toposlib import Topos
 from mountcontrol.mount import Mount
 
 # local import
 from mw4.modeldata.hipparcos import Hipparcos
+from mw4.modeldata.starCatalog import StarCatalog
+from mw4.modeldata.hipparcos import rotateToAltAz
 
 
 @pytest.fixture(autouse=True, scope='function')
@@ -90,3 +95,159 @@ def test_getAlignStarRaDecFromName_2():
     ra, dec = app.getAlignStarRaDecFromName('Test')
     assert ra is None
     assert dec is None
+
+
+def test_getAlignStarNameFromAltAz_1():
+    app.name = ['Achernar', 'Acrux']
+    app.alt = [10, 40]
+    app.az = [100, 200]
+    app.starIndexValid = False
+    name = app.getAlignStarNameFromAltAz(41, 200)
+    assert name == 'Acrux'
+    assert app.starIndexValid
+
+
+def test_getAlignStarNameFromAltAz_2():
+    app.name = ['Achernar', 'Acrux']
+    app.alt = [10, 40]
+    app.az = [100, 200]
+    app.starIndexValid = False
+    name = app.getAlignStarNameFromAltAz(60, 300)
+    assert name is None
+
+
+def test_calculateCatalogPositionsAltAz_1():
+    app.catalog = None
+    suc = app.calculateCatalogPositionsAltAz()
+    assert not suc
+
+
+def test_calculateCatalogPositionsAltAz_2():
+    app.catalog = StarCatalog(pathDir='mw4/test/temp/notExisting')
+    suc = app.calculateCatalogPositionsAltAz()
+    assert not suc
+
+
+def test_calculateAlignStarPositionsAltAz_3():
+    app.incremental = False
+    suc = app.calculateAlignStarPositionsAltAz()
+    assert suc
+    assert len(app.alt) == len(app.alignStars)
+
+
+def test_calculateApparentPlaces_1():
+    location = app.app.mount.obsSite.location
+    t = app.app.mount.obsSite.timeJD
+    suc = app.calculateApparentPlaces(location, t)
+    assert suc
+    assert app.apparentStars is app.alignStars
+    assert len(app.apparentRa) == len(app.alignStars)
+
+
+def test_calculateAlignStarPositionsIncremental_1():
+    location = app.app.mount.obsSite.location
+    t = app.app.mount.obsSite.timeJD
+    app.apparentStars = None
+    with mock.patch.object(app,
+                           'calculateApparentPlaces',
+                           wraps=app.calculateApparentPlaces) as calc:
+        app.calculateAlignStarPositionsIncremental(location, t)
+        app.calculateAlignStarPositionsIncremental(location, t)
+        assert calc.call_count == 1
+
+
+def test_calculateAlignStarPositionsIncremental_2():
+    location = app.app.mount.obsSite.location
+    t = app.app.mount.obsSite.timeJD
+    app.incremental = True
+    app.calculateAlignStarPositionsAltAz()
+    altInc = np.array(app.alt)
+    azInc = np.array(app.az)
+    app.incremental = False
+    app.calculateAlignStarPositionsAltAz()
+    assert np.allclose(altInc, app.alt, atol=0.01)
+    diffAz = (azInc - app.az + 180) % 360 - 180
+    assert np.allclose(diffAz * np.cos(np.radians(app.alt)), 0, atol=0.01)
+
+
+class Catalog:
+    regions = {1, 2}
+
+    def tilesForRegion(self, **kwargs):
+        return self.regions
+
+    @staticmethod
+    def query(**kwargs):
+        return {'hip': np.array([1, 2]),
+                'mag': np.array([1.0, 2.0]),
+                'ra': np.array([0.0, 1.0]),
+                'dec': np.array([0.3, 0.4]),
+                'pmRA': np.zeros(2),
+                'pmDec': np.zeros(2),
+                'parallax': np.zeros(2),
+                'radVel': np.zeros(2),
+                }
+
+
+def test_calculateCatalogPositionsAltAz_3():
+    app.catalog = Catalog()
+    suc = app.calculateCatalogPositionsAltAz()
+    assert suc
+    assert len(app.catalogAlt) == 2
+    assert len(app.catalogAz) == 2
+    suc = app.calculateCatalogPositionsAltAz()
+    assert not suc
+
+
+def test_workerCatalogPositions_1():
+    app.catalog = Catalog()
+    with mock.patch.object(app.catalog,
+                           'query',
+                           wraps=app.catalog.query) as query:
+        app.workerCatalogPositions()
+        app.workerCatalogPositions()
+        assert query.call_count == 1
+        app.catalog.regions = {3}
+        result = app.workerCatalogPositions()
+        assert query.call_count == 2
+    assert len(result['alt']) == 2
+
+
+def test_workerCatalogPositions_2():
+    app.catalog = Catalog()
+    app.app.mount.obsSite.location = None
+    assert app.workerCatalogPositions() is None
+
+
+def test_applyCatalogPositions_1():
+    assert not app.applyCatalogPositions(None)
+
+
+def test_applyCatalogPositions_2():
+    result = {'hip': np.array([1]),
+              'mag': np.array([1.0]),
+              'alt': np.array([10.0]),
+              'az': np.array([20.0]),
+              }
+    assert app.applyCatalogPositions(result)
+    assert not app.applyCatalogPositions(dict(result))
+    result['az'] = np.array([20.1])
+    assert app.applyCatalogPositions(result)
+    assert app.catalogAz[0] == 20.1
+
+
+def test_rotateToAltAz_1():
+    ra = np.array([0.0, 1.0, 4.0])
+    dec = np.array([0.3, -0.4, 1.2])
+    ut1 = 2459000.7
+    lon = np.radians(10)
+    lat = np.radians(50)
+    zero = np.zeros(3)
+    raC, decC, eo = erfa.atci13(ra, dec, zero, zero, zero, zero, ut1, 0.0)
+    alt, az = rotateToAltAz(raC, decC, erfa.era00(ut1, 0.0), lon, lat)
+    aob, zob, hob, dob, rob, eo = erfa.atco13(ra, dec, zero, zero, zero, zero,
+                                              ut1, 0.0, 0.0, lon, lat, 0.0,
+                                              0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    assert np.allclose(alt, 90 - np.degrees(zob), atol=0.01)
+    diffAz = (az - np.degrees(aob) + 180) % 360 - 180
+    assert np.allclose(diffAz * np.cos(np.radians(alt)), 0, atol=0.01)
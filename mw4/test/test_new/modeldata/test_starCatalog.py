@@ -0,0 +1,166 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import os
+import shutil
+import pytest
+
+# external packages
+import numpy as np
+
+# local import
+from mw4.modeldata.starCatalog import StarCatalog
+
+
+@pytest.fixture(autouse=True, scope='function')
+def module_setup_teardown():
+    global app
+    pathDir = 'mw4/test/temp/catalog'
+    if os.path.isdir(pathDir):
+        shutil.rmtree(pathDir)
+    app = StarCatalog(pathDir=pathDir)
+    yield
+    app.close()
+    if os.path.isdir(pathDir):
+        shutil.rmtree(pathDir)
+    del app
+
+
+def genStars(number=1000):
+    np.random.seed(0)
+    stars = np.zeros(number, dtype=StarCatalog.DTYPE)
+    stars['hip'] = np.arange(number)
+    stars['ra'] = np.random.uniform(0, 2 * np.pi, number)
+    stars['dec'] = np.arcsin(np.random.uniform(-1, 1, number))
+    stars['mag'] = np.random.uniform(-1, 8, number)
+    return stars
+
+
+def test_available_1():
+    assert not app.available()
+
+
+def test_open_1():
+    assert not app.open()
+
+
+def test_query_1():
+    stars = app.query()
+    assert len(stars) == 0
+
+
+def test_magTile_1():
+    assert app.magTile(1) == 0
+    assert app.magTile(2) == 1
+    assert app.magTile(7.5) == 4
+
+
+def test_regionTile_1():
+    assert app.regionTile(0, np.radians(-90)) == 0
+    assert app.regionTile(np.radians(359), np.radians(90)) == 71
+
+
+def test_writeCatalog_1():
+    stars = np.zeros(3, dtype=[('hip', 'i4')])
+    suc = app.writeCatalog(stars)
+    assert not suc
+
+
+def test_writeCatalog_2():
+    suc = app.writeCatalog(genStars())
+    assert suc
+    assert app.available()
+    assert app.open()
+    assert len(app.stars) == 1000
+    assert isinstance(app.stars, np.memmap)
+    assert app.tiles['stop'][-1] == 1000
+
+
+def test_writeCatalog_3():
+    app.writeCatalog(genStars())
+    app.open()
+    for tile in app.tiles:
+        stars = app.stars[tile['start']:tile['stop']]
+        assert all(app.magTile(stars['mag']) == tile['mag'])
+        assert all(app.regionTile(stars['ra'], stars['dec']) == tile['region'])
+
+
+def test_tilesForRegion_1():
+    regions = app.tilesForRegion()
+    assert len(regions) == 72
+
+
+def test_tilesForRegion_2():
+    regions = app.tilesForRegion(ra=0, dec=np.radians(80), radius=np.radians(15))
+    assert len(regions) == 12
+
+
+def test_tilesForRegion_3():
+    regions = app.tilesForRegion(ra=np.radians(15), dec=np.radians(10), radius=np.radians(5))
+    assert regions == {36}
+
+
+def test_tilesForRegion_4():
+    regions = app.tilesForRegion(ra=np.radians(1), dec=np.radians(10), radius=np.radians(5))
+    assert regions == {36, 47}
+
+
+def test_query_2():
+    stars = genStars()
+    app.writeCatalog(stars)
+    result = app.query(magLimit=4)
+    assert len(result) == np.sum(stars['mag'] <= 4)
+    assert all(result['mag'] <= 4)
+
+
+def test_query_3():
+    stars = genStars()
+    app.writeCatalog(stars)
+    ra = np.radians(100)
+    dec = np.radians(20)
+    radius = np.radians(30)
+    result = app.query(magLimit=8, ra=ra, dec=dec, radius=radius)
+
+    dist = np.arccos(np.sin(dec) * np.sin(stars['dec'])
+                     + np.cos(dec) * np.cos(stars['dec']) * np.cos(stars['ra'] - ra))
+    inside = set(stars['hip'][dist <= radius])
+    assert inside.issubset(set(result['hip']))
+    assert len(result) < len(stars)
+
+
+def test_importHipparcos_1():
+    suc = app.importHipparcos('mw4/test/temp/hip_main.dat')
+    assert not suc
+
+
+def test_importHipparcos_2():
+    os.makedirs(app.pathDir)
+    fileName = app.pathDir + '/hip_main.dat'
+    with open(fileName, 'w') as outFile:
+        outFile.write('H|        1| |00 00 00.22|+01 05 20.4| 9.10| |H|000.00091185|'
+                      '+01.08901332| |   3.54|   -5.20|   -1.88|\n')
+        outFile.write('H|    32349| |06 45 09.25|-16 42 47.3|-1.44| |H|101.28854105|'
+                      '-16.71314306| | 379.21| -546.01|-1223.08|\n')
+        outFile.write('H|    99999| |broken line\n')
+    suc = app.importHipparcos(fileName)
+    assert suc
+    stars = app.query(magLimit=8)
+    assert list(stars['hip']) == [32349]
+    assert np.isclose(stars['parallax'][0], 0.37921)
@@ -20,9 +20,11 @@
 # standard libraries
 from unittest import mock
 import time
+import threading
 import pytest
 
 # external packages
+import xml.etree.ElementTree as ElementTree
 
 # local import
 from mw4.powerswitch.kmRelay import KMRelay
@@ -140,7 +142,8 @@ def test_cyclePolling_2():
     app.user = 'test'
     app.password = 'test'
     suc = app.cyclePolling()
-    assert not suc
+    assert suc
+    app.executor.waitForDone(3000)
 
 
 def test_cyclePolling_3():
@@ -178,6 +181,7 @@ def test_status1(qtbot):
     ret.reason = 'OK'
     ret.status_code = 200
 
+    app.host = ('localhost', 80)
     with mock.patch.object(app,
                            'getRelay',
                            return_value=ret):
@@ -210,6 +214,7 @@ def test_status2(qtbot):
     ret.reason = 'OK'
     ret.status_code = 200
 
+    app.host = ('localhost', 80)
     with mock.patch.object(app,
                            'getRelay',
                            return_value=ret):
@@ -242,6 +247,7 @@ def test_status3(qtbot):
     ret.reason = 'OK'
     ret.status_code = 200
 
+    app.host = ('localhost', 80)
     with mock.patch.object(app,
                            'getRelay',
                            return_value=ret):
@@ -274,6 +280,7 @@ def test_status4(qtbot):
     ret.reason = 'OK'
     ret.status_code = 200
 
+    app.host = ('localhost', 80)
     with mock.patch.object(app,
                            'getRelay',
                            return_value=ret):
@@ -294,7 +301,22 @@ def test_getRelay_1(qtbot):
     assert not suc
 
 
-def test_cyclePolling_1():
+def test_cyclePolling_4():
+    event = threading.Event()
+    app.host = ('localhost', 80)
+    with mock.patch.object(app,
+                           'pollWorker',
+                           side_effect=lambda: event.wait(5)):
+        suc = app.cyclePolling()
+        assert suc
+        suc = app.cyclePolling()
+        assert not suc
+        event.set()
+        app.executor.waitForDone(3000)
+    assert not app.executor.isActive('kmRelay:poll')
+
+
+def test_pollWorker_1():
     class Test:
         pass
     ret = Test()
@@ -304,8 +326,58 @@ def test_cyclePolling_1():
     with mock.patch.object(app,
                            'getRelay',
                            return_value=ret):
-        suc = app.cyclePolling()
-        assert not suc
+        val = app.pollWorker()
+        assert val is None
+
+
+def test_pollWorker_2():
+    with mock.patch.object(app,
+                           'getRelay',
+                           return_value=None):
+        val = app.pollWorker()
+        assert val is None
+
+
+def test_pollResult_1():
+    suc = app.pollResult(None)
+    assert not suc
+
+
+def test_pollResult_2(qtbot):
+    with qtbot.waitSignal(app.statusReady):
+        suc = app.pollResult([1, 0, 0, 0, 0, 0, 0, 0])
+        assert suc
+    assert app.status[0] == 1
+
+
+def test_parseStatus_1():
+    val = app.parseStatus('<response><relay1>1</relay1><relay8>1</relay8>'
+                          '<relay9>1</relay9><relayx>1</relayx><temp>5</temp>'
+                          '</response>')
+    assert val == [1, 0, 0, 0, 0, 0, 0, 1]
+
+
+def test_parseStatus_2():
+    val = app.parseStatus('<response><relay1>')
+    assert val is None
+
+
+def test_parseStatus_3():
+    text = '<response><relay2>1</relay2></response>'
+    app.parseStatus(text)
+    app.status = [0, 1, 0, 0, 0, 0, 0, 1]
+    with mock.patch.object(ElementTree,
+                           'fromstring') as parse:
+        val = app.parseStatus(text)
+        assert not parse.called
+    assert val == [0, 1, 0, 0, 0, 0, 0, 1]
+
+
+def test_session_1():
+    app.user = 'astro'
+    app.password = 'pass'
+    assert app.session.auth.username == 'astro'
+    assert app.session.auth.password == 'pass'
 
 
 def test_getByte_1():
@@ -438,3 +510,74 @@ def test_set_3(qtbot):
                            return_value=ret):
         suc = app.set(7, False)
         assert suc
+
+
+def test_queueCommand_1():
+    app.host = None
+    suc = app.queueCommand('pulse', 1)
+    assert not suc
+
+
+def test_queueCommand_2():
+    app.host = ('localhost', 80)
+    suc = app.queueCommand('test', 1)
+    assert not suc
+
+
+def test_queueCommand_3():
+    app.host = ('localhost', 80)
+    app.commandRunning = True
+    app.queueCommand('set', 1, True)
+    app.queueCommand('switch', 2)
+    app.queueCommand('pulse', 1)
+    assert list(app.commands) == [('switch', 2, None), ('pulse', 1, None)]
+
+
+def test_queueCommand_4():
+    app.host = ('localhost', 80)
+    app.commandRunning = True
+    app.queueCommand('switch', 1)
+    app.queueCommand('switch', 1)
+    assert not app.commands
+
+
+def test_queueCommand_5():
+    app.host = ('localhost', 80)
+    app.commandRunning = True
+    app.queueCommand('switch', 1)
+    app.queueCommand('set', 1, False)
+    app.queueCommand('set', 1, True)
+    assert list(app.commands) == [('set', 1, True)]
+
+
+def test_queueCommand_6():
+    app.host = ('localhost', 80)
+    with mock.patch.object(app,
+                           'set',
+                           return_value=True) as setRelay:
+        suc = app.queueCommand('set', 1, True)
+        assert suc
+        app.executor.waitForDone(3000)
+        setRelay.assert_called_once_with(1, True)
+    assert not app.commandRunning
+
+
+def test_commandWorker_1(qtbot):
+    app.commands.append(('pulse', 2, None))
+    app.commands.append(('switch', 3, None))
+    app.commands.append(('set', 4, True))
+    with mock.patch.object(app,
+                           'pulse',
+                           return_value=False):
+        with mock.patch.object(app,
+                               'switch',
+                               return_value=True):
+            with mock.patch.object(app,
+                                   'set',
+                                   return_value=True):
+                with qtbot.waitSignal(app.commandFailed) as blocker:
+                    suc = app.commandWorker()
+                    assert suc
+    assert blocker.args == [2]
+    assert not app.commands
+    assert not app.commandRunning
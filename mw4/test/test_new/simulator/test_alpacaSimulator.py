@@ -0,0 +1,253 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import time
+import pytest
+
+# external packages
+import numpy as np
+import requests
+
+# local import
+from mw4.base.alpacaBase import Camera
+from mw4.base.alpacaBase import Dome
+from mw4.base.alpacaBase import Switch
+from mw4.test.simulator.alpacaSimulator import AlpacaSimulator
+from mw4.test.simulator.alpacaSimulator import SimDevice
+from mw4.test.simulator.alpacaSimulator import parseValue
+from mw4.test.simulator.alpacaSimulator import main
+
+
+@pytest.fixture(autouse=True, scope='function')
+def module_setup_teardown():
+    global app
+    app = AlpacaSimulator()
+    app.addDevice('dome')
+    app.addDevice('camera')
+    app.start(port=0)
+    yield
+    app.stop()
+    del app
+
+
+def client(cls, name):
+    device = cls()
+    device.host = ('localhost', app.port)
+    device.name = name
+    return device
+
+
+def test_parseValue_1():
+    assert parseValue('True') is True
+    assert parseValue('false') is False
+    assert parseValue('12') == 12
+    assert parseValue('12.5') == 12.5
+    assert parseValue('abc') == 'abc'
+
+
+def test_addDevices_1():
+    devices = app.addDevices('dome', number=30)
+    assert len(devices) == 30
+    assert devices[-1].name == 'dome:30'
+    assert len(app.devices) == 32
+
+
+def test_start_1():
+    assert not app.start(port=0)
+
+
+def test_stop_1():
+    assert app.stop()
+    assert app.port == 0
+    assert app.stop()
+
+
+def test_get_1():
+    dome = client(Dome, 'dome:0')
+    assert dome.azimuth() == 0
+    assert dome.nameDevice() == 'dome 0'
+    assert dome.driverVersion() == '1.0'
+
+
+def test_get_2():
+    dome = client(Dome, 'dome:5')
+    assert dome.azimuth() is None
+
+
+def test_get_3():
+    dome = client(Dome, 'dome:0')
+    assert dome.get('unknown') is None
+
+
+def test_put_1():
+    dome = client(Dome, 'dome:0')
+    dome.connected(Connected=True)
+    assert dome.connected()
+    dome.slaved(Slaved=True)
+    assert dome.slaved()
+
+
+def test_put_2():
+    dome = client(Dome, 'dome:0')
+    dome.setpark()
+    dome.openshutter()
+    assert dome.shutterstatus() == 0
+
+
+def test_put_3():
+    device = SimDevice(deviceType='dome')
+    device.put('closeshutter', {})
+    device.put('park', {})
+    device.put('findhome', {})
+    device.put('synctoazimuth', {'azimuth': '45'})
+    assert device.values['shutterstatus'] == 1
+    assert device.values['atpark']
+    assert device.values['athome']
+    assert device.values['azimuth'] == 45
+    device.put('slewtoazimuth', {'azimuth': 90})
+    assert device.values['slewing']
+    device.put('halt', {})
+    assert not device.values['slewing']
+    assert device.slewTarget is None
+
+
+def test_put_4():
+    device = SimDevice(deviceType='camera')
+    device.put('startexposure', {'duration': 100})
+    assert device.values['camerastate'] == 2
+    device.put('abortexposure', {})
+    assert device.values['camerastate'] == 0
+    device.put('binx', {'binx': 2, 'clientid': 1})
+    assert device.values['binx'] == 2
+
+
+def test_put_5():
+    device = SimDevice(deviceType='focuser')
+    device.put('move', {'position': '100'})
+    assert device.values['position'] == 100
+
+
+def test_switch_1():
+    app.addDevice('switch')
+    switch = client(Switch, 'switch:0')
+    assert switch.maxswitch() == 4
+    switch.setswitch(Id=1, State=True)
+    assert switch.getswitch(Id=1)
+    assert not switch.getswitch(Id=0)
+
+
+def test_slew_1():
+    SimDevice.SLEW_SPEED = 1000
+    dome = client(Dome, 'dome:0')
+    dome.slewtoazimuth(Azimuth=90)
+    time.sleep(0.2)
+    assert not dome.slewing()
+    assert dome.azimuth() == 90
+    SimDevice.SLEW_SPEED = 30
+
+
+def test_slew_2():
+    dome = client(Dome, 'dome:0')
+    dome.slewtoazimuth(Azimuth=90)
+    assert dome.slewing()
+    dome.abortslew()
+    assert not dome.slewing()
+    assert 0 < dome.azimuth() < 90
+
+
+def test_exposure_1():
+    camera = client(Camera, 'camera:0')
+    camera.numx(NumX=40)
+    camera.numy(NumY=30)
+    camera.startexposure(Duration=0.1, Light=True)
+    assert camera.camerastate() == 2
+    assert not camera.imageready()
+    time.sleep(0.15)
+    assert camera.imageready()
+    data = np.array(camera.imagearray(), dtype=np.uint16)
+    assert data.shape == (40, 30)
+
+
+def test_exposure_2():
+    camera = client(Camera, 'camera:0')
+    camera.numx(NumX=40)
+    camera.numy(NumY=30)
+    camera.binx(BinX=2)
+    camera.biny(BinY=2)
+    data = np.array(camera.imagearray(), dtype=np.uint16)
+    assert data.shape == (20, 15)
+    assert data.mean() > 900
+
+
+def test_latency_1():
+    app.devices['dome:0'].latency = 0.1
+    dome = client(Dome, 'dome:0')
+    timeStart = time.perf_counter()
+    dome.azimuth()
+    assert time.perf_counter() - timeStart >= 0.1
+
+
+def test_errorRate_1():
+    app.devices['dome:0'].errorRate = 1
+    dome = client(Dome, 'dome:0')
+    assert dome.azimuth() is None
+
+
+def test_errorRate_2():
+    app.devices['dome:0'].httpErrorRate = 1
+    dome = client(Dome, 'dome:0')
+    assert dome.azimuth() is None
+    assert app.statistics()['errors'] == 1
+
+
+def test_script_1():
+    app.devices['dome:0'].script('azimuth', lambda device, params: 123)
+    dome = client(Dome, 'dome:0')
+    assert dome.azimuth() == 123
+    app.devices['dome:0'].script('azimuth', None)
+    assert dome.azimuth() == 0
+
+
+def test_management_1():
+    url = f'http://localhost:{app.port}/management/v1/configureddevices'
+    response = requests.get(url, timeout=5).json()
+    assert len(response['Value']) == 2
+    assert response['Value'][0]['DeviceType'] == 'Dome'
+
+
+def test_management_2():
+    url = f'http://localhost:{app.port}/management/apiversions'
+    response = requests.get(url, timeout=5).json()
+    assert response['Value'] == [1]
+
+
+def test_statistics_1():
+    dome = client(Dome, 'dome:0')
+    app.resetStatistics()
+    dome.azimuth()
+    dome.slewing()
+    stats = app.statistics()
+    assert stats['requests'] == 2
+    assert stats['bytes'] > 0
+    assert stats['requestRate'] > 0
+
+
+def test_main_1():
+    assert main(['--devices', 'dome']) == 2
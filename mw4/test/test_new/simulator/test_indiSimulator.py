@@ -0,0 +1,336 @@
+############################################################
+# -*- coding: utf-8 -*-
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10micron mounts
+# GUI with PyQT5 for python
+# Python  v3.7.5
+#
+# Michael Würtenberger
+# (c) 2020
+#
+# Licence APL2.0
+#
+###########################################################
+# standard libraries
+import io
+import time
+import zlib
+import socket
+import base64
+import xml.etree.ElementTree as ElementTree
+import pytest
+
+# external packages
+from astropy.io import fits
+
+# local import
+from mw4.test.simulator.indiSimulator import IndiSimulator
+from mw4.test.simulator.indiSimulator import SimIndiDevice
+from mw4.test.simulator.indiSimulator import fitsBlob
+from mw4.test.simulator.indiSimulator import main
+
+
+@pytest.fixture(autouse=True, scope='function')
+def module_setup_teardown():
+    global app
+    app = IndiSimulator()
+    app.addDevice('Weather', deviceType='weather')
+    app.addDevice('Camera', deviceType='camera', blobFormat='.fits.fz')
+    app.start(port=0)
+    yield
+    app.stop()
+    del app
+
+
+class Client(object):
+    def __init__(self):
+        self.socket = socket.create_connection(('localhost', app.port), timeout=5)
+        self.parser = ElementTree.XMLPullParser(events=['start', 'end'])
+        self.parser.feed('<indi>')
+        self.depth = 0
+        for i in range(100):
+            if app.numberClients():
+                break
+            time.sleep(0.01)
+
+    def send(self, text):
+        self.socket.sendall(text.encode('utf-8'))
+
+    def receive(self, number, timeout=5):
+        messages = list()
+        timeEnd = time.time() + timeout
+        while len(messages) < number and time.time() < timeEnd:
+            chunk = self.socket.recv(1 << 20)
+            if not chunk:
+                break
+            self.parser.feed(chunk)
+            for event, element in self.parser.read_events():
+                if event == 'start':
+                    self.depth += 1
+                    continue
+                self.depth -= 1
+                if self.depth == 1:
+                    messages.append(element)
+        return messages
+
+    def close(self):
+        self.socket.close()
+
+
+def test_fitsBlob_1():
+    content = fitsBlob('.fits', width=100, height=50)
+    with fits.open(io.BytesIO(content)) as hdu:
+        assert hdu[0].data.shape == (50, 100)
+        assert hdu[0].header['OBSERVER'] == 'MW4'
+
+
+def test_fitsBlob_2():
+    content = fitsBlob('.fits.z', width=100, height=50)
+    with fits.open(io.BytesIO(zlib.decompress(content))) as hdu:
+        assert hdu[0].data.shape == (50, 100)
+
+
+def test_fitsBlob_3():
+    content = fitsBlob('.fits.fz', width=100, height=50)
+    with fits.open(io.BytesIO(content)) as hdu:
+        assert len(hdu) == 2
+        assert hdu[0].data is None
+        assert hdu[1].data.shape == (50, 100)
+
+
+def test_update_1():
+    device = SimIndiDevice(name='test', deviceType='weather')
+    before = dict(device.properties['WEATHER_PARAMETERS']['elements'])
+    device.update('WEATHER_PARAMETERS')
+    after = device.properties['WEATHER_PARAMETERS']['elements']
+    assert before.keys() == after.keys()
+    assert before != after
+
+
+def test_update_2():
+    device = SimIndiDevice(name='test', deviceType='weather')
+    device.update('WEATHER_STATUS')
+    device.update('CONNECTION')
+    assert device.properties['WEATHER_STATUS']['elements']['WEATHER_HUMIDITY'] == 'Busy'
+    assert device.properties['CONNECTION']['elements']['CONNECT']
+
+
+def test_names_1():
+    device = SimIndiDevice(name='test', deviceType='camera')
+    assert device.names(kinds=['blob']) == ['CCD1']
+    assert 'CCD_EXPOSURE' in device.names(kinds=['number'])
+
+
+def test_setMessage_1():
+    device = SimIndiDevice(name='test', deviceType='weather')
+    element = ElementTree.fromstring(device.setMessage('WEATHER_PARAMETERS', state='Ok'))
+    assert element.tag == 'setNumberVector'
+    assert element.get('device') == 'test'
+    assert element.get('state') == 'Ok'
+    assert len(element) == 10
+    assert float(element[0].text) == 10
+
+
+def test_defMessages_1():
+    device = SimIndiDevice(name='test', deviceType='camera')
+    messages = [ElementTree.fromstring(x) for x in device.defMessages()]
+    tags = {x.get('name'): x.tag for x in messages}
+    assert tags['CONNECTION'] == 'defSwitchVector'
+    assert tags['DRIVER_INFO'] == 'defTextVector'
+    assert tags['CCD_EXPOSURE'] == 'defNumberVector'
+    assert tags['CCD1'] == 'defBLOBVector'
+
+
+def test_blobMessage_1():
+    device = SimIndiDevice(name='test', deviceType='camera')
+    element = ElementTree.fromstring(device.blobMessage(b'1234', blobFormat='.fits'))
+    assert element[0].get('format') == '.fits'
+    assert element[0].get('size') == '4'
+    assert base64.b64decode(element[0].text) == b'1234'
+
+
+def test_imageSize_1():
+    device = SimIndiDevice(name='test', deviceType='camera')
+    device.properties['CCD_BINNING']['elements']['HOR_BIN'] = 2
+    device.properties['CCD_BINNING']['elements']['VERT_BIN'] = 4
+    assert device.imageSize() == (500, 200)
+
+
+def test_start_1():
+    assert not app.start(port=0)
+
+
+def test_stop_1():
+    assert app.stop()
+    assert app.port == 0
+    assert app.stop()
+
+
+def test_getProperties_1():
+    client = Client()
+    client.send('<getProperties version="1.7"/>')
+    number = len(app.devices['Weather'].properties) + len(app.devices['Camera'].properties)
+    messages = client.receive(number)
+    client.close()
+    assert len(messages) == number
+    assert {x.get('device') for x in messages} == {'Weather', 'Camera'}
+
+
+def test_getProperties_2():
+    client = Client()
+    client.send('<getProperties version="1.7" device="Weather"/>')
+    number = len(app.devices['Weather'].properties)
+    messages = client.receive(number)
+    client.close()
+    assert {x.get('device') for x in messages} == {'Weather'}
+
+
+def test_newSwitch_1():
+    client = Client()
+    client.send('<newSwitchVector device="Weather" name="CONNECTION">'
+                '<oneSwitch name="CONNECT">On</oneSwitch>'
+                '<oneSwitch name="DISCONNECT">Off</oneSwitch>'
+                '</newSwitchVector>')
+    messages = client.receive(1)
+    client.close()
+    assert messages[0].tag == 'setSwitchVector'
+    assert messages[0][0].text.strip() == 'On'
+    assert app.devices['Weather'].properties['CONNECTION']['elements']['CONNECT']
+
+
+def test_newNumber_1():
+    client = Client()
+    client.send('<newNumberVector device="Weather" name="WEATHER_UPDATE">'
+                '<oneNumber name="PERIOD">5</oneNumber>'
+                '</newNumberVector>')
+    messages = client.receive(1)
+    client.close()
+    assert messages[0].tag == 'setNumberVector'
+    assert float(messages[0][0].text) == 5
+
+
+def test_receive_1():
+    element = ElementTree.fromstring('<newNumberVector device="Other" name="X"/>')
+    assert not app.receive(None, element)
+
+
+def test_receive_2():
+    element = ElementTree.fromstring('<setNumberVector device="Weather" '
+                                     'name="WEATHER_UPDATE"/>')
+    assert not app.receive(None, element)
+
+
+def test_receive_3():
+    element = ElementTree.fromstring('<newNumberVector device="Weather" '
+                                     'name="WEATHER_UPDATE">'
+                                     '<oneNumber name="PERIOD">fast</oneNumber>'
+                                     '<oneNumber name="OTHER">1</oneNumber>'
+                                     '</newNumberVector>')
+    assert app.receive(None, element)
+    elements = app.devices['Weather'].properties['WEATHER_UPDATE']['elements']
+    assert elements == {'PERIOD': 0.1}
+
+
+def test_enableBlob_1():
+    class Test:
+        blobMode = dict()
+
+    client = Test()
+    element = ElementTree.fromstring('<enableBLOB device="Camera">Only</enableBLOB>')
+    assert app.receive(client, element)
+    assert client.blobMode == {'Camera': 'Only'}
+
+
+def test_exposure_1():
+    app.devices['Camera'].properties['CCD_FRAME']['elements']['WIDTH'] = 64
+    app.devices['Camera'].properties['CCD_FRAME']['elements']['HEIGHT'] = 32
+    client = Client()
+    client.send('<enableBLOB device="Camera">Also</enableBLOB>')
+    client.send('<newNumberVector device="Camera" name="CCD_EXPOSURE">'
+                '<oneNumber name="CCD_EXPOSURE_VALUE">0.1</oneNumber>'
+                '</newNumberVector>')
+    messages = client.receive(3)
+    client.close()
+    assert [x.tag for x in messages] == ['setNumberVector',
+                                         'setBLOBVector',
+                                         'setNumberVector']
+    assert messages[0].get('state') == 'Busy'
+    assert messages[2].get('state') == 'Ok'
+    blob = messages[1][0]
+    assert blob.get('format') == '.fits.fz'
+    with fits.open(io.BytesIO(base64.b64decode(blob.text))) as hdu:
+        assert hdu[1].data.shape == (32, 64)
+
+
+def test_exposure_2():
+    device = app.devices['Camera']
+    device.properties['CCD_EXPOSURE']['elements']['CCD_EXPOSURE_VALUE'] = 10.0
+    assert app.startExposure(device)
+    timer = app.timers[0]
+    assert timer.is_alive()
+    assert app.stop()
+    timer.join(1)
+    assert not timer.is_alive()
+    assert app.timers == []
+
+
+def test_send_1():
+    client = Client()
+    for i in range(100):
+        if app.clients:
+            break
+        time.sleep(0.01)
+    handler = app.clients[0]
+    handler.wfile.close()
+    assert not handler.send('<test/>')
+    client.close()
+
+
+def test_sendBlob_1():
+    client = Client()
+    assert app.sendBlob('Camera', width=10, height=10) == 0
+    client.send('<enableBLOB device="Camera">Only</enableBLOB>')
+    time.sleep(0.1)
+    assert app.sendBlob('Camera', width=10, height=10, blobFormat='.fits.z') == 1
+    app.storm('Camera', kinds=['number'], count=1)
+    messages = client.receive(1)
+    client.close()
+    assert messages[0].tag == 'setBLOBVector'
+    assert messages[0][0].get('format') == '.fits.z'
+
+
+def test_storm_1():
+    client = Client()
+    number = app.storm('Weather', kinds=['number', 'switch', 'text', 'light'], count=20)
+    messages = client.receive(number)
+    client.close()
+    assert number == 20 * 7
+    assert len(messages) == number
+    assert {x.tag for x in messages} == {'setNumberVector', 'setSwitchVector',
+                                         'setTextVector', 'setLightVector'}
+    stats = app.statistics()
+    assert stats['messages'] == number
+    assert stats['bytes'] > 0
+
+
+def test_storm_2():
+    timeStart = time.perf_counter()
+    number = app.storm('Weather', kinds=['number'], count=5, rate=50)
+    assert number == 10
+    assert time.perf_counter() - timeStart >= 0.09
+
+
+def test_resetStatistics_1():
+    app.stats['messages'] = 10
+    assert app.resetStatistics()
+    assert app.statistics()['messages'] == 0
+
+
+def test_main_1():
+    assert main(['--devices', 'weather']) == 2
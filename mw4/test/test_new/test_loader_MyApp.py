@@ -111,3 +111,19 @@ def test_notify_3():
                            side_effect=Exception()):
         suc = app.notify(obj=ui, event=event)
         assert not suc
+
+
+def test_notify_4():
+    ui = QtWidgets.QPushButton()
+    event = PyQt5.QtGui.QMouseEvent(QEvent.MouseButtonPress,
+                                    PyQt5.QtCore.QPointF(0, 0),
+                                    PyQt5.QtCore.Qt.LeftButton,
+                                    PyQt5.QtCore.Qt.LeftButton,
+                                    PyQt5.QtCore.Qt.NoModifier)
+    with mock.patch.object(app.log,
+                           'isEnabledFor',
+                           return_value=False):
+        with mock.patch.object(app,
+                               'handleButtons') as handle:
+            app.notify(obj=ui, event=event)
+            assert not handle.called
@@ -74,7 +74,7 @@ def test_toggleRelay_1(qtbot):
 def test_toggleRelay_2(qtbot):
     app.mainW.ui.relayDevice.setCurrentIndex(1)
     with mock.patch.object(app.relay,
-                           'switch',
+                           'queueCommand',
                            return_value=False):
         with qtbot.waitSignal(app.message) as blocker:
             suc = app.mainW.relayButtonPressed()
@@ -82,6 +82,13 @@ def test_toggleRelay_2(qtbot):
         assert ['Relay action cannot be performed', 2] == blocker.args
 
 
+def test_relayCommandFailed(qtbot):
+    with qtbot.waitSignal(app.message) as blocker:
+        suc = app.mainW.relayCommandFailed(3)
+        assert suc
+    assert ['Relay action cannot be performed: 3', 2] == blocker.args
+
+
 def test_relayHost():
     app.mainW.ui.relayHost.setText('test')
     app.mainW.relayHost()
@@ -106,7 +113,7 @@ def test_relayPassword():
 def test_doRelayAction_1(qtbot):
     app.mainW.relayDropDowns[7].setCurrentIndex(0)
     with mock.patch.object(app.relay,
-                           'switch',
+                           'queueCommand',
                            return_value=False):
         suc = app.mainW.doRelayAction(7)
         assert not suc
@@ -115,7 +122,7 @@ def test_doRelayAction_1(qtbot):
 def test_doRelayAction_2(qtbot):
     app.mainW.relayDropDowns[7].setCurrentIndex(0)
     with mock.patch.object(app.relay,
-                           'switch',
+                           'queueCommand',
                            return_value=True):
         suc = app.mainW.doRelayAction(7)
         assert suc
@@ -130,7 +137,7 @@ def test_doRelayAction_3(qtbot):
 def test_doRelayAction_4(qtbot):
     app.mainW.relayDropDowns[7].setCurrentIndex(1)
     with mock.patch.object(app.relay,
-                           'pulse',
+                           'queueCommand',
                            return_value=False):
         suc = app.mainW.doRelayAction(7)
         assert not suc
@@ -139,7 +146,7 @@ def test_doRelayAction_4(qtbot):
 def test_doRelayAction_5(qtbot):
     app.mainW.relayDropDowns[7].setCurrentIndex(1)
     with mock.patch.object(app.relay,
-                           'pulse',
+                           'queueCommand',
                            return_value=True):
         suc = app.mainW.doRelayAction(7)
         assert suc
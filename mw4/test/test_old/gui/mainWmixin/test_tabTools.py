@@ -66,36 +66,6 @@ def test_selectorGui():
         assert ui.count() == 7
 
 
-def test_getNumberFiles_1():
-    number = app.mainW.getNumberFiles()
-    assert number == 0
-
-
-def test_getNumberFiles_2():
-    number = app.mainW.getNumberFiles(pathDir='/Users')
-    assert number == 0
-
-
-def test_getNumberFiles_3():
-    number = app.mainW.getNumberFiles(pathDir='.', search='**/*.fit*')
-    assert number > 0
-
-
-def test_getNumberFiles_4():
-    number = app.mainW.getNumberFiles(pathDir='/xxx', search='**/*.fit*')
-    assert number == 0
-
-
-def test_getNumberFiles_5():
-    number = app.mainW.getNumberFiles(pathDir=app.mwGlob['imageDir'], search='**/*.fit*')
-    assert number == 3
-
-
-def test_getNumberFiles_6():
-    number = app.mainW.getNumberFiles(pathDir=app.mwGlob['imageDir'], search='*.fit*')
-    assert number == 3
-
-
 def test_convertHeaderEntry_1():
     chunk = app.mainW.convertHeaderEntry(entry='', fitsKey='')
     assert not chunk
@@ -162,18 +132,6 @@ def test_processSelectors_4():
     assert not name
 
 
-def test_renameFile_1():
-    suc = app.mainW.renameFile()
-    assert not suc
-
-
-def test_renameFile_2():
-    with mock.patch.object(os,
-                           'rename'):
-        suc = app.mainW.renameFile(app.mwGlob['imageDir'] + '/m51.fit')
-        assert suc
-
-
 def test_renameRunGUI_1(qtbot):
     app.mainW.ui.renameDir.setText('')
     with qtbot.waitSignal(app.message) as blocker:
@@ -182,23 +140,137 @@ def test_renameRunGUI_1(qtbot):
     assert ['No valid input directory given', 2] == blocker.args
 
 
-def test_renameRunGUI_2(qtbot):
+def test_renameRunGUI_2():
     app.mainW.ui.renameDir.setText(app.mwGlob['tempDir'])
-    with qtbot.waitSignal(app.message) as blocker:
+    with mock.patch.object(app.executor,
+                           'start') as start:
         suc = app.mainW.renameRunGUI()
+        assert suc
+    assert start.call_args[1]['lane'] == 'io'
+    assert not app.mainW.ui.renameStart.isEnabled()
+    app.mainW.renameFinished()
+    assert app.mainW.ui.renameStart.isEnabled()
+
+
+def test_buildFileName_1():
+    header = fits.PrimaryHDU().header
+    name = app.mainW.buildFileName(fitsHeader=header)
+    assert name == 'UNKNOWN.fits'
+
+
+def test_buildFileName_2():
+    header = fits.PrimaryHDU().header
+    header['OBJECT'] = 'm51'
+    header['FILTER'] = 'L'
+    name = app.mainW.buildFileName(fitsHeader=header, selections=['Filter', 'None'])
+    assert name == 'M51_Filter-L.fits'
+
+
+def test_buildFileName_3():
+    header = fits.PrimaryHDU().header
+    header['OBJECT'] = 'm51'
+    name = app.mainW.buildFileName(fitsHeader=header, objectName='m42')
+    assert name == 'M42.fits'
+
+
+def test_renameWorker_1():
+    result = app.mainW.renameWorker(pathDir=app.mwGlob['tempDir'], search='*.fit*')
+    assert result['plan'] == []
+    assert not result['applied']
+
+
+def test_renameWorker_2():
+    with mock.patch.object(app.mainW.renameEngine,
+                           'apply') as apply:
+        result = app.mainW.renameWorker(pathDir=app.mwGlob['imageDir'],
+                                        search='*.fit*',
+                                        objectName='test',
+                                        dryRun=True)
+        assert not apply.called
+    assert result['dryRun']
+    assert not result['applied']
+
+
+def test_renameResult_1(qtbot):
+    with qtbot.waitSignal(app.message) as blocker:
+        suc = app.mainW.renameResult(result={'plan': [], 'dryRun': False,
+                                             'applied': False})
         assert not suc
     assert ['No files to rename', 0] == blocker.args
 
 
-def test_renameRunGUI_3(qtbot):
-    app.mainW.ui.renameDir.setText(app.mwGlob['imageDir'])
-    with mock.patch.object(app.mainW,
-                           'renameFile',
+def test_renameResult_2(qtbot):
+    plan = [{'source': 'a.fit', 'target': 'b.fits', 'status': 'rename'}]
+    with qtbot.waitSignal(app.message) as blocker:
+        suc = app.mainW.renameResult(result={'plan': plan, 'dryRun': True,
+                                             'applied': False})
+        assert suc
+    assert ['Dry run: 1 to rename, 0 unchanged, 0 conflicts', 0] == blocker.args
+
+
+def test_renameResult_3(qtbot):
+    plan = [{'source': 'a.fit', 'target': 'b.fits', 'status': 'conflict'}]
+    with qtbot.waitSignal(app.message) as blocker:
+        suc = app.mainW.renameResult(result={'plan': plan, 'dryRun': False,
+                                             'applied': False})
+        assert not suc
+    assert ['1 conflicts, no image was renamed', 2] == blocker.args
+
+
+def test_renameResult_4(qtbot):
+    plan = [{'source': 'a.fit', 'target': 'b.fits', 'status': 'rename'}]
+    with qtbot.waitSignal(app.message) as blocker:
+        suc = app.mainW.renameResult(result={'plan': plan, 'dryRun': False,
+                                             'applied': False})
+        assert not suc
+    assert ['Renaming failed, all images restored', 2] == blocker.args
+
+
+def test_renameResult_5(qtbot):
+    plan = [{'source': 'a.fit', 'target': 'b.fits', 'status': 'rename'},
+            {'source': 'c.fit', 'target': '', 'status': 'error'}]
+    with qtbot.waitSignal(app.message) as blocker:
+        suc = app.mainW.renameResult(result={'plan': plan, 'dryRun': False,
+                                             'applied': True})
+        assert suc
+    assert ['1 images were renamed', 0] == blocker.args
+
+
+def test_updateRenameProgress_1():
+    app.mainW.renameEngine.progress = 50
+    suc = app.mainW.updateRenameProgress()
+    assert suc
+    assert app.mainW.ui.renameProgress.value() == 50
+
+
+def test_renameUndoGUI_1(qtbot):
+    app.mainW.renameEngine.journal = []
+    with qtbot.waitSignal(app.message) as blocker:
+        suc = app.mainW.renameUndoGUI()
+        assert not suc
+    assert ['Nothing to undo', 0] == blocker.args
+
+
+def test_renameUndoGUI_2(qtbot):
+    app.mainW.renameEngine.journal = [('a.fit', 'b.fits')]
+    with mock.patch.object(app.mainW.renameEngine,
+                           'undo',
+                           return_value=False):
+        with qtbot.waitSignal(app.message) as blocker:
+            suc = app.mainW.renameUndoGUI()
+            assert not suc
+    assert ['Undo of renaming failed', 2] == blocker.args
+
+
+def test_renameUndoGUI_3(qtbot):
+    app.mainW.renameEngine.journal = [('a.fit', 'b.fits')]
+    with mock.patch.object(app.mainW.renameEngine,
+                           'undo',
                            return_value=True):
         with qtbot.waitSignal(app.message) as blocker:
-            suc = app.mainW.renameRunGUI()
+            suc = app.mainW.renameUndoGUI()
             assert suc
-        assert ['3 images were renamed', 0] == blocker.args
+    assert ['1 images were restored', 0] == blocker.args
 
 
 def test_moveNorth():
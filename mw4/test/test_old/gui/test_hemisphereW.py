@@ -26,6 +26,7 @@ import PyQt5.QtTest
 import PyQt5.QtCore
 import skyfield.api as api
 import matplotlib.path
+import numpy as np
 import mountcontrol
 # local import
 from mw4.test.test_old.setupQt import setupQt
@@ -246,6 +247,74 @@ def test_updateAlignStar_5(qtbot):
     assert not suc
 
 
+def test_updateAlignStar_6(qtbot):
+    app.uiWindows['showHemisphereW']['classObj'].drawHemisphere()
+    app.uiWindows['showHemisphereW']['classObj'].ui.checkShowAlignStar.setChecked(True)
+    with mock.patch.object(app.executor,
+                           'start',
+                           return_value=True) as start:
+        suc = app.uiWindows['showHemisphereW']['classObj'].updateAlignStar()
+    assert suc
+    assert start.call_args[1]['key'] == 'catalogPositions'
+
+
+def test_updateAlignStar_7(qtbot):
+    hemisphere = app.uiWindows['showHemisphereW']['classObj']
+    hemisphere.drawHemisphere()
+    hemisphere.ui.checkShowAlignStar.setChecked(True)
+    hip = app.hipparcos
+    axes = hemisphere.hemisphereMat.figure.axes[0]
+    position = {'az': 180.0}
+
+    def calc():
+        hip.name = ['Star']
+        hip.alt = np.array([45.0])
+        hip.az = np.array([position['az']])
+        return True
+
+    # each update moves the star 0.4 pixel on screen
+    pixel = axes.transData.transform((180, 45))
+    step = axes.transData.inverted().transform(pixel + (0.4, 0))[0] - 180
+    with mock.patch.object(hip,
+                           'calculateAlignStarPositionsAltAz',
+                           side_effect=calc):
+        with mock.patch.object(app.executor,
+                               'start'):
+            hemisphere.updateAlignStar()
+            hemisphere.updateAlignStar()
+            for i in range(5):
+                position['az'] += step
+                hemisphere.updateAlignStar()
+
+    annotation = hemisphere.starsAlignAnnotate[0]
+    assert annotation.xy[0] != 180
+    assert abs(annotation.xy[0] - position['az']) < 2.5 * abs(step)
+
+
+
+    app.uiWindows['showHemisphereW']['classObj'].drawHemisphere()
+    suc = app.uiWindows['showHemisphereW']['classObj'].updateCatalogStars(None)
+    assert not suc
+
+
+def test_updateCatalogStars_2(qtbot):
+    app.uiWindows['showHemisphereW']['classObj'].drawHemisphere()
+    app.uiWindows['showHemisphereW']['classObj'].ui.checkShowAlignStar.setChecked(True)
+    result = {'hip': np.array([1]),
+              'mag': np.array([1.0]),
+              'alt': np.array([45.0]),
+              'az': np.array([180.0]),
+              }
+    suc = app.uiWindows['showHemisphereW']['classObj'].updateCatalogStars(result)
+    assert suc
+    starsCatalog = app.uiWindows['showHemisphereW']['classObj'].starsCatalog
+    assert list(starsCatalog.get_xdata()) == [180.0]
+    result['az'] = np.array([180.00001])
+    suc = app.uiWindows['showHemisphereW']['classObj'].updateCatalogStars(result)
+    assert not suc
+    assert list(starsCatalog.get_xdata()) == [180.0]
+
+
 def test_markerPoint():
     val = app.uiWindows['showHemisphereW']['classObj'].markerPoint()
     assert isinstance(val, matplotlib.path.Path)
@@ -336,92 +405,6 @@ def test_setOperationMode_5():
     assert suc
 
 
-def test_getIndexPoint_0():
-    class Test:
-        pass
-    event = Test()
-    event.xdata = 180
-    event.ydata = 45
-    plane = []
-    epsilon = 0
-    index = app.uiWindows['showHemisphereW']['classObj'].getIndexPoint(event=event,
-                                          plane=plane,
-                                          epsilon=epsilon,
-                                          )
-    assert not index
-
-
-def test_getIndexPoint_1():
-    event = None
-    plane = None
-    epsilon = 0
-    index = app.uiWindows['showHemisphereW']['classObj'].getIndexPoint(event=event,
-                                          plane=plane,
-                                          epsilon=epsilon,
-                                          )
-    assert not index
-
-
-def test_getIndexPoint_2():
-    class Test:
-        pass
-    event = Test()
-    event.xdata = 180
-    event.ydata = 45
-    plane = None
-    epsilon = 0
-    index = app.uiWindows['showHemisphereW']['classObj'].getIndexPoint(event=event,
-                                          plane=plane,
-                                          epsilon=epsilon,
-                                          )
-    assert not index
-
-
-def test_getIndexPoint_3():
-    class Test:
-        pass
-    event = Test()
-    event.xdata = 180
-    event.ydata = 45
-    plane = [(45, 0), (45, 360)]
-    epsilon = 0
-    index = app.uiWindows['showHemisphereW']['classObj'].getIndexPoint(event=event,
-                                          plane=plane,
-                                          epsilon=epsilon,
-                                          )
-    assert not index
-
-
-def test_getIndexPoint_4():
-    class Test:
-        pass
-    event = Test()
-    event.xdata = 180
-    event.ydata = 45
-    plane = [(45, 0), (45, 360)]
-    epsilon = 200
-    index = app.uiWindows['showHemisphereW']['classObj'].getIndexPoint(event=event,
-                                          plane=plane,
-                                          epsilon=epsilon,
-                                          )
-    assert index == 0
-
-
-def test_getIndexPoint_5():
-    class Test:
-        pass
-    event = Test()
-    event.xdata = 182
-    event.ydata = 45
-    plane = [(45, 0), (45, 360)]
-    epsilon = 200
-    index = app.uiWindows['showHemisphereW']['classObj'].getIndexPoint(event=event,
-                                          plane=plane,
-                                          epsilon=epsilon,
-                                          )
-    assert index == 1
-
-
 def test_getIndexPointX_1():
     event = None
     plane = None
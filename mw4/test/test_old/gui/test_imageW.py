@@ -123,58 +123,61 @@ def test_selectImage_2(qtbot):
         assert app.uiWindows['showImageW']['classObj'].folder == 'c:/test'
 
 
-def test_writeHeaderToGUI_1():
+def test_readWCS_1():
     header = fits.PrimaryHDU().header
-    suc = app.uiWindows['showImageW']['classObj'].writeHeaderToGUI(header=header)
-    assert suc == (False, None)
+    suc = app.uiWindows['showImageW']['classObj'].readWCS(header=header)
+    assert suc == (False, False, None)
 
 
-def test_writeHeaderToGUI_2():
+def test_readWCS_2():
     header = fits.PrimaryHDU().header
     header['naxis'] = 2
-    suc = app.uiWindows['showImageW']['classObj'].writeHeaderToGUI(header=header)
-    assert not suc[0]
+    header['CTYPE1'] = 'RA---TAN'
+    header['CTYPE2'] = 'DEC--TAN'
+    hasCelestial, hasDistortion, wcsObject = app.uiWindows['showImageW'][
+        'classObj'].readWCS(header=header)
+    assert hasCelestial
+    assert not hasDistortion
+    assert wcsObject is not None
 
 
-def test_zoomImage_1():
-    image = None
-    header = fits.PrimaryHDU().header
-    header['naxis'] = 2
-    wcsObject = wcs.WCS(header)
-    suc = app.uiWindows['showImageW']['classObj'].zoomImage(image=image, wcsObject=wcsObject)
-    assert suc is None
-
-
-def test_zoomImage_2():
-    image = np.zeros([100, 100], dtype=np.uint8)
+def test_writeHeaderToGUI_1():
     header = fits.PrimaryHDU().header
-    header['naxis'] = 2
-    wcsObject = wcs.WCS(header)
-    app.uiWindows['showImageW']['classObj'].ui.zoom.setCurrentIndex(0)
-    suc = app.uiWindows['showImageW']['classObj'].zoomImage(image=image, wcsObject=wcsObject)
-    assert suc.shape == (100, 100)
+    suc = app.uiWindows['showImageW']['classObj'].writeHeaderToGUI(header=header)
+    assert suc
 
 
-def test_zoomImage_3():
-    image = np.zeros([100, 100], dtype=np.uint8)
+def test_writeHeaderToGUI_2():
     header = fits.PrimaryHDU().header
     header['naxis'] = 2
-    wcsObject = wcs.WCS(header)
-    app.uiWindows['showImageW']['classObj'].ui.zoom.setCurrentIndex(1)
-    suc = app.uiWindows['showImageW']['classObj'].zoomImage(image=image, wcsObject=wcsObject)
-    assert suc.shape == (50, 50)
+    suc = app.uiWindows['showImageW']['classObj'].writeHeaderToGUI(header=header,
+                                                                    hasCelestial=True)
+    assert suc
+    assert app.uiWindows['showImageW']['classObj'].ui.hasWCS.isEnabled()
 
 
-def test_stretchImage_1():
-    image = None
-    suc = app.uiWindows['showImageW']['classObj'].stretchImage(image=image)
-    assert suc is None
+def test_loadFrame_1():
+    params = {'stack': False, 'zoom': 1, 'stretch': (98, 99.999), 'color': 'gray',
+              'center': None, 'display': None}
+    app.uiWindows['showImageW']['classObj'].frame = None
+    frame = app.uiWindows['showImageW']['classObj'].loadFrame(
+        imagePath=mwGlob['imageDir'] + '/m51.fit', params=params)
+    assert frame['key'][0] == mwGlob['imageDir'] + '/m51.fit'
+    assert app.uiWindows['showImageW']['classObj'].stretchEngine.image is not None
 
 
-def test_stretchImage_2():
-    image = np.zeros([100, 100], dtype=np.uint8)
-    suc, a, b = app.uiWindows['showImageW']['classObj'].stretchImage(image=image)
-    assert isinstance(suc, astropy.visualization.mpl_normalize.ImageNormalize)
+def test_loadFrame_2():
+    params = {'stack': False, 'zoom': 1, 'stretch': (98, 99.999), 'color': 'gray',
+              'center': None, 'display': None}
+    app.uiWindows['showImageW']['classObj'].frame = None
+    frame1 = app.uiWindows['showImageW']['classObj'].loadFrame(
+        imagePath=mwGlob['imageDir'] + '/m51.fit', params=params)
+    with mock.patch.object(fits,
+                           'open') as fitsOpen:
+        frame2 = app.uiWindows['showImageW']['classObj'].loadFrame(
+            imagePath=mwGlob['imageDir'] + '/m51.fit', params=params)
+        assert not fitsOpen.called
+    assert frame1 is frame2
 
 
 def test_colorImage_1():
@@ -271,22 +274,24 @@ def test_setupNormal_4():
 
 
 def test_stackImages_1():
+    app.uiWindows['showImageW']['classObj'].stackEngine.reset()
     val = app.uiWindows['showImageW']['classObj'].stackImages()
     assert val is None
-    assert app.uiWindows['showImageW']['classObj'].numberStack == 1
+    assert app.uiWindows['showImageW']['classObj'].numberStack == 0
 
 
 def test_stackImages_2():
-    val = app.uiWindows['showImageW']['classObj'].stackImages(5)
-    assert val == 5
+    app.uiWindows['showImageW']['classObj'].stackEngine.reset()
+    val = app.uiWindows['showImageW']['classObj'].stackImages(np.full((10, 10), 5))
+    assert val[0, 0] == 5
     assert app.uiWindows['showImageW']['classObj'].numberStack == 1
 
 
 def test_stackImages_3():
-    app.uiWindows['showImageW']['classObj'].imageStack = None
-    app.uiWindows['showImageW']['classObj'].stackImages(5)
-    val = app.uiWindows['showImageW']['classObj'].stackImages(3)
-    assert val == 4
+    app.uiWindows['showImageW']['classObj'].stackEngine.reset()
+    app.uiWindows['showImageW']['classObj'].stackImages(np.full((10, 10, 3), 5))
+    val = app.uiWindows['showImageW']['classObj'].stackImages(np.full((10, 10, 3), 3))
+    assert val[0, 0, 0] == 4
     assert app.uiWindows['showImageW']['classObj'].numberStack == 2
 
 
@@ -315,6 +320,100 @@ def test_showImage_4():
     assert suc
 
 
+def test_showImage_5():
+    imagePath = mwGlob['imageDir'] + '/m51.fit'
+    with mock.patch.object(app.executor,
+                           'start') as start:
+        suc = app.uiWindows['showImageW']['classObj'].showImage(imagePath=imagePath)
+        assert suc
+    assert start.call_args[1]['lane'] == 'compute'
+
+
+def test_showImageError_1(qtbot):
+    with qtbot.waitSignal(app.message) as blocker:
+        suc = app.uiWindows['showImageW']['classObj'].showImageError('file, line 1 error')
+        assert suc
+    assert blocker.args[1] == 2
+
+
+def test_isStaleJob_1():
+    app.uiWindows['showImageW']['classObj'].imageJob = 3
+    assert app.uiWindows['showImageW']['classObj'].isStaleJob(2)
+    assert not app.uiWindows['showImageW']['classObj'].isStaleJob(3)
+
+
+def test_showImageWorker_1():
+    params = {'stack': False, 'zoom': 1, 'stretch': (98, 99.999), 'color': 'gray',
+              'center': None, 'display': None}
+    app.uiWindows['showImageW']['classObj'].imageJob = 2
+    result = app.uiWindows['showImageW']['classObj'].showImageWorker(
+        job=1, imagePath=mwGlob['imageDir'] + '/m51.fit', params=params)
+    assert result is None
+
+
+def test_showImageWorker_2():
+    params = {'stack': False, 'zoom': 2, 'stretch': (98, 99.999), 'color': 'gray',
+              'center': None, 'display': None}
+    app.uiWindows['showImageW']['classObj'].imageJob = 1
+    result = app.uiWindows['showImageW']['classObj'].showImageWorker(
+        job=1, imagePath=mwGlob['imageDir'] + '/m51.fit', params=params)
+    assert result['job'] == 1
+    assert result['image'].dtype == np.uint8
+    assert result['image'].shape[2] == 4
+
+
+def test_showImageResult_1():
+    suc = app.uiWindows['showImageW']['classObj'].showImageResult()
+    assert not suc
+
+
+def test_showImageResult_2():
+    app.uiWindows['showImageW']['classObj'].imageJob = 2
+    suc = app.uiWindows['showImageW']['classObj'].showImageResult(result={'job': 1})
+    assert not suc
+
+
+def test_showImageResult_3():
+    params = {'stack': False, 'zoom': 1, 'stretch': (98, 99.999), 'color': 'gray',
+              'center': None, 'display': None}
+    app.uiWindows['showImageW']['classObj'].imageJob = 1
+    result = app.uiWindows['showImageW']['classObj'].showImageWorker(
+        job=1, imagePath=mwGlob['imageDir'] + '/m51.fit', params=params)
+    suc = app.uiWindows['showImageW']['classObj'].showImageResult(result=result)
+    assert suc
+
+
+def test_onMouseImage_1():
+    class Event:
+        inaxes = False
+    suc = app.uiWindows['showImageW']['classObj'].onMouseImage(event=Event())
+    assert not suc
+
+
+def test_onMouseImage_2():
+    class Event:
+        inaxes = True
+        button = 1
+        dblclick = False
+    suc = app.uiWindows['showImageW']['classObj'].onMouseImage(event=Event())
+    assert not suc
+
+
+def test_onMouseImage_3():
+    class Event:
+        inaxes = True
+        button = 1
+        dblclick = True
+        xdata = 10
+        ydata = 20
+    app.uiWindows['showImageW']['classObj'].imageOffset = (100, 50)
+    with mock.patch.object(app.uiWindows['showImageW']['classObj'],
+                           'showCurrent'):
+        suc = app.uiWindows['showImageW']['classObj'].onMouseImage(event=Event())
+        assert suc
+    assert app.uiWindows['showImageW']['classObj'].imageCenter == (110, 70)
+
+
 def test_showCurrent_1():
     suc = app.uiWindows['showImageW']['classObj'].showCurrent()
     assert suc
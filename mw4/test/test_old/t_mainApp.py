@@ -29,6 +29,7 @@ import skyfield.api
 
 # local import
 from mw4.mainApp import MountWizzard4
+from mw4.base.metrics import registry
 
 
 @pytest.fixture(autouse=True, scope='function')
@@ -42,6 +43,7 @@ def module_setup_teardown():
                                     'tempDir': 'mw4/test/temp',
                                     })
     yield
+    app.metricsServer.stop()
     del app
     for item in testdir:
         if item.endswith('.cfg'):
@@ -431,3 +433,42 @@ def test_loadMountData_1():
 def test_loadMountData_2():
     suc = app.loadMountData(False)
     assert not suc
+
+
+def test_registerServices_1():
+    suc = app.registerServices()
+    assert suc
+    assert not app.services.isLoaded('ImageWindow')
+
+
+def test_loadDataResult_1():
+    suc = app.loadDataResult(None)
+    assert suc
+    assert app.planets is None
+
+
+def test_loadDataResult_2():
+    suc = app.loadDataResult({'sun': 1})
+    assert suc
+    assert app.planets == {'sun': 1}
+
+
+def test_setupMetrics_1():
+    app.metricsServer.stop()
+    app.metricsPort = 0
+    suc = app.setupMetrics()
+    assert not suc
+    text = registry.text()
+    assert 'mw4_threads{pool="main",state="max"} 20' in text
+    assert 'mw4_executor_tasks{lane="io",state="limit"}' in text
+
+
+def test_setupMetrics_2():
+    app.metricsServer.stop()
+    app.metricsPort = 9464
+    with mock.patch.object(app.metricsServer,
+                           'start',
+                           return_value=True) as start:
+        suc = app.setupMetrics()
+        assert suc
+        start.assert_called_with(port=9464)
@@ -43,7 +43,7 @@ def build_widgets(c):
     printMW('building widgets')
     widgetDir = './mw4/gui/widgets/'
     widgets = ['hemisphere', 'image', 'main', 'measure', 'message',
-               'satellite', 'keypad', 'devicePopup']
+               'satellite', 'keypad', 'devicePopup', 'diagnostics']
     for widget in widgets:
         name = widgetDir + widget
         runMW(c, f'python -m PyQt5.uic.pyuic -x {name}.ui -o {name}_ui.py')
@@ -72,6 +72,12 @@ def test_mw(c):
     runMW(c, 'pytest mw4/test/* --cov-config .coveragerc --cov mw4/')
 
 
+@task()
+def test_bench(c):
+    printMW('benchmarking mountwizzard')
+    runMW(c, 'pytest mw4/test/benchmark -o python_files=bench_*.py')
+
+
 @task(pre=[])
 def build_mc(c):
     printMW('building dist mountcontrol')